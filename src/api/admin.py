@@ -0,0 +1,27 @@
+"""Access guard for the diagnostic endpoints (/traces, /admin/*)."""
+
+import secrets
+
+from fastapi import Header, HTTPException
+
+from src.config import settings
+
+ADMIN_TOKEN_HEADER = "X-ITW-Admin-Token"
+
+
+def require_admin(
+    token: str | None = Header(default=None, alias=ADMIN_TOKEN_HEADER),
+) -> None:
+    """Allow diagnostic endpoints only to admins.
+
+    With ``ADMIN_TOKEN`` configured the request must carry it in the
+    ``X-ITW-Admin-Token`` header (403 otherwise). Without a token the
+    endpoints exist only while ``DEBUG`` is on (404 otherwise).
+    """
+    expected = settings.ADMIN_TOKEN
+    if expected:
+        if token is None or not secrets.compare_digest(token, expected):
+            raise HTTPException(status_code=403, detail="Admin token required")
+        return
+    if not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
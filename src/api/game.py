@@ -1,6 +1,8 @@
 """Game API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+import time
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 
 from src.api.schemas import (
     ActionRequest,
@@ -8,6 +10,8 @@ from src.api.schemas import (
     DirectionInfo,
     ErrorResponse,
     GameStateResponse,
+    GlobalEventFeedResponse,
+    GlobalEventInfo,
     LocationInfo,
     PlayerInfo,
     RegisterRequest,
@@ -16,6 +20,9 @@ from src.core.engine import ITWEngine
 from src.core.event_bus import EventBus, GameEvent
 from src.core.event_types import EventTypes
 from src.core.logging import get_logger
+from src.core.metrics import REGISTRY
+from src.core.profiler import PROFILER
+from src.core.tracing import TRACER
 from src.services.dialogue_service import DialogueService
 from src.services.item_service import ItemService
 from src.services.narrative_service import NarrativeService
@@ -26,6 +33,42 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/game", tags=["game"])
 
+# execute_action이 처리하는 액션 (그 외 값은 메트릭 라벨 "other")
+ACTIONS = frozenset(
+    {
+        "look",
+        "move",
+        "rest",
+        "investigate",
+        "harvest",
+        "enter",
+        "exit",
+        "talk",
+        "say",
+        "end_talk",
+        "inventory",
+        "pickup",
+        "drop",
+        "use",
+        "browse",
+        "give",
+        "quest_list",
+        "quest_detail",
+        "quest_abandon",
+        "recruit",
+        "dismiss",
+    }
+)
+
+ACTION_SECONDS = REGISTRY.histogram(
+    "itw_action_seconds",
+    "POST /game/action latency by action type and HTTP status",
+    ("action", "status"),
+)
+
+# 샘플링과 무관하게 이 요청을 트레이스 (값 "1")
+TRACE_HEADER = "X-ITW-Trace"
+
 
 def get_engine() -> ITWEngine:
     """엔진 인스턴스 반환 (의존성 주입)"""
@@ -70,7 +113,7 @@ def get_event_bus(request: Request) -> EventBus:
     return bus
 
 
-def _build_location_info(location_view) -> LocationInfo:
+def build_location_info(location_view) -> LocationInfo:
     """LocationView를 LocationInfo로 변환"""
     return LocationInfo(
         location_id=location_view.coordinate_hash,
@@ -84,7 +127,7 @@ def _build_location_info(location_view) -> LocationInfo:
     )
 
 
-def _build_direction_info(hint) -> DirectionInfo:
+def build_direction_info(hint) -> DirectionInfo:
     """DirectionHint를 DirectionInfo로 변환"""
     return DirectionInfo(
         direction=hint.direction.symbol,
@@ -95,7 +138,7 @@ def _build_direction_info(hint) -> DirectionInfo:
     )
 
 
-def _build_player_info(player) -> PlayerInfo:
+def build_player_info(player) -> PlayerInfo:
     """PlayerState를 PlayerInfo로 변환"""
     return PlayerInfo(
         player_id=player.player_id,
@@ -127,16 +170,16 @@ def register_player(
         location = None
         directions = []
         if result.location_view:
-            location = _build_location_info(result.location_view)
+            location = build_location_info(result.location_view)
             directions = [
-                _build_direction_info(h) for h in result.location_view.direction_hints
+                build_direction_info(h) for h in result.location_view.direction_hints
             ]
 
         logger.info("Player registered: %s", request.player_id)
 
         return GameStateResponse(
             success=True,
-            player=_build_player_info(player),
+            player=build_player_info(player),
             location=location,
             directions=directions,
         )
@@ -170,14 +213,14 @@ def get_game_state(
         location = None
         directions = []
         if result.location_view:
-            location = _build_location_info(result.location_view)
+            location = build_location_info(result.location_view)
             directions = [
-                _build_direction_info(h) for h in result.location_view.direction_hints
+                build_direction_info(h) for h in result.location_view.direction_hints
             ]
 
         return GameStateResponse(
             success=True,
-            player=_build_player_info(player),
+            player=build_player_info(player),
             location=location,
             directions=directions,
         )
@@ -186,6 +229,36 @@ def get_game_state(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/events", response_model=GlobalEventFeedResponse)
+def get_global_events(
+    cursor: int | None = Query(None, description="이전 페이지의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    engine: ITWEngine = Depends(get_engine),
+) -> GlobalEventFeedResponse:
+    """
+    최근 글로벌 이벤트 피드
+
+    만료되지 않은 글로벌 이벤트를 최신순으로 반환합니다.
+    next_cursor를 다음 요청의 cursor로 넘기면 이어지는 페이지를 받습니다.
+    """
+    hooks, next_cursor = engine.get_global_feed(cursor=cursor, limit=limit)
+    return GlobalEventFeedResponse(
+        success=True,
+        events=[
+            GlobalEventInfo(
+                hook_id=hook["hook_id"],
+                event=hook["event"],
+                location_hint=hook["location_hint"],
+                description=hook["description"],
+                timestamp=hook["timestamp"],
+                expires_at=hook["expires_at"],
+            )
+            for hook in hooks
+        ],
+        next_cursor=next_cursor,
+    )
+
+
 @router.post(
     "/action",
     response_model=ActionResponse,
@@ -194,6 +267,7 @@ def get_game_state(
 def execute_action(
     request: ActionRequest,
     http_request: Request,
+    background_tasks: BackgroundTasks,
     engine: ITWEngine = Depends(get_engine),
 ) -> ActionResponse:
     """
@@ -203,14 +277,92 @@ def execute_action(
     - look: 현재 위치 관찰
     - move: 이동 (params: {direction: "n"|"s"|"e"|"w"|"up"|"down"})
     - rest: 휴식
-    - investigate: Echo 조사 (params: {echo_index: 0})
+    - investigate: Echo 조사 (params: {echo_id: "..."} 또는 {echo_index: 0})
     - harvest: 자원 채취 (params: {resource_id: "...", amount: 1})
     - enter: 서브 그리드(Depth) 진입
     - exit: 서브 그리드에서 메인 그리드로 복귀
     - talk: NPC와 대화 시작 (params: {npc_id: "..."})
     - say: 대화 중 발언 (params: {text: "..."})
     - end_talk: 대화 종료
+
+    같은 플레이어의 액션은 도착 순서대로 하나씩 처리되고(플레이어 액터),
+    다른 플레이어의 액션은 병렬로 처리된다.
+    액션 1회는 이벤트 체인 1회이며, 요청마다 독립된 체인으로 발행된다.
+    지연(deferred) 구독 핸들러는 응답을 보낸 뒤 백그라운드 작업으로 전달되며,
+    같은 플레이어 액터 안에서 실행되어 그 플레이어의 다음 액션과 겹치지 않는다.
+    """
+    action = request.action.lower()
+    label = action if action in ACTIONS else "other"
+    # 느린 요청이면 이 스레드의 샘플 스택을 액션/플레이어 태그로 저장
+    PROFILER.annotate(action=label, player_id=request.player_id)
+    started = time.perf_counter()
+    status = 500
+    with TRACER.trace(
+        f"action:{label}",
+        "action",
+        force=_trace_forced(http_request),
+        player_id=request.player_id,
+    ) as span:
+        try:
+            response = engine.actors.call(
+                request.player_id,
+                _execute_action_turn,
+                request,
+                http_request,
+                engine,
+                background_tasks,
+            )
+            status = 200
+            return response
+        except HTTPException as exc:
+            status = exc.status_code
+            raise
+        finally:
+            # 풀 스레드가 응답 전송 중 다른 요청을 맡아도 이 캡처에 섞이지 않도록
+            PROFILER.release()
+            ACTION_SECONDS.observe(time.perf_counter() - started, label, status)
+            if span is not None:
+                span.set(status=status)
+
+
+def _trace_forced(http_request: Request) -> bool:
+    """요청 헤더로 트레이스 강제 여부 (헤더가 없는 내부 호출은 False)"""
+    headers = getattr(http_request, "headers", None)
+    return headers is not None and headers.get(TRACE_HEADER) == "1"
+
+
+def _execute_action_turn(
+    request: ActionRequest,
+    http_request: Request,
+    engine: ITWEngine,
+    background_tasks: BackgroundTasks,
+) -> ActionResponse:
+    """요청 전용 이벤트 체인(turn_scope) 안에서 액션 실행
+
+    버스가 없는 앱은 스코프 없이 실행한다.
     """
+    bus: EventBus | None = getattr(http_request.app.state, "event_bus", None)
+    if bus is None:
+        return _execute_action(request, http_request, engine)
+
+    with bus.turn_scope():
+        response = _execute_action(request, http_request, engine)
+        deferred = bus.take_deferred()
+        if deferred:
+            # 응답 후 실행되지만 플레이어 액터를 다시 거쳐 다음 액션과 직렬화
+            background_tasks.add_task(
+                engine.actors.call,
+                request.player_id,
+                bus.deliver_deferred,
+                deferred,
+            )
+    return response
+
+
+def _execute_action(
+    request: ActionRequest, http_request: Request, engine: ITWEngine
+) -> ActionResponse:
+    """플레이어 액터 안에서 실행되는 액션 본체"""
     player = engine.get_player(request.player_id)
 
     if not player:
@@ -291,7 +443,8 @@ def execute_action(
             result = engine.rest(request.player_id)
         elif action == "investigate":
             echo_index = params.get("echo_index", 0)
-            result = engine.investigate(request.player_id, echo_index)
+            echo_id = params.get("echo_id")
+            result = engine.investigate(request.player_id, echo_index, echo_id)
             # ACTION_COMPLETED 이벤트 발행
             if result.success:
                 bus = get_event_bus(http_request)
@@ -744,7 +897,7 @@ def execute_action(
         # 응답 생성
         location = None
         if result.location_view:
-            location = _build_location_info(result.location_view)
+            location = build_location_info(result.location_view)
 
         logger.debug("Action executed: %s for %s", action, request.player_id)
 
@@ -0,0 +1,55 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter, Depends, Response
+
+from src.api.game import get_engine
+from src.core.engine import ITWEngine
+from src.core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+# 엔진 상태 게이지 (스크레이프 시점에 갱신)
+ENGINE_NODES = REGISTRY.gauge(
+    "itw_engine_nodes",
+    "World nodes held by the engine (resident, or pending restore from snapshot)",
+    ("state",),
+)
+ENGINE_PLAYERS = REGISTRY.gauge("itw_engine_players", "Registered players in memory")
+ENGINE_SUB_GRID_INSTANCES = REGISTRY.gauge(
+    "itw_engine_sub_grid_instances", "Resident sub-grid instances"
+)
+ENGINE_SUB_GRID_CELLS = REGISTRY.gauge(
+    "itw_engine_sub_grid_cells", "Resident sub-grid cells"
+)
+ENGINE_ECHOES = REGISTRY.gauge("itw_engine_echoes", "Echoes on resident nodes")
+ENGINE_GLOBAL_HOOKS = REGISTRY.gauge(
+    "itw_engine_global_hooks", "Active global event hooks"
+)
+
+
+def get_optional_engine() -> ITWEngine | None:
+    """엔진 인스턴스 (초기화 전이면 None)"""
+    try:
+        return get_engine()
+    except RuntimeError:
+        return None
+
+
+def update_engine_gauges(engine: ITWEngine) -> None:
+    """엔진 상주 수치를 게이지에 반영"""
+    counts = engine.get_runtime_counts()
+    ENGINE_NODES.set(counts["nodes_resident"], "resident")
+    ENGINE_NODES.set(counts["nodes_pending"], "pending")
+    ENGINE_PLAYERS.set(counts["players"])
+    ENGINE_SUB_GRID_INSTANCES.set(counts["sub_grid_instances"])
+    ENGINE_SUB_GRID_CELLS.set(counts["sub_grid_cells"])
+    ENGINE_ECHOES.set(counts["echoes"])
+    ENGINE_GLOBAL_HOOKS.set(counts["global_hooks"])
+
+
+@router.get("/metrics")
+def metrics(engine: ITWEngine | None = Depends(get_optional_engine)) -> Response:
+    """Return all metrics in the Prometheus text exposition format."""
+    if engine is not None:
+        update_engine_gauges(engine)
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,85 @@
+"""Slow-request profiling middleware and admin endpoints."""
+
+from typing import Any
+
+import anyio.to_thread
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.admin import require_admin
+from src.core.profiler import PROFILER, SlowRequestProfiler
+
+router = APIRouter(
+    prefix="/admin/profiles", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+class ProfilingMiddleware:
+    """Register every HTTP request with the profiler for its whole lifetime.
+
+    Endpoints opt their worker thread into sampling with
+    ``PROFILER.annotate(...)`` and release it with ``PROFILER.release()``
+    when they return; requests that never annotate are not sampled.
+    Timing stops once the last response body chunk is sent, so
+    BackgroundTasks that run afterwards are not counted. ``end()`` may
+    write a capture to disk and runs in a worker thread.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: SlowRequestProfiler = PROFILER):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        record = self.profiler.begin(scope["method"], scope["path"])
+        if record is None:
+            await self.app(scope, receive, send)
+            return
+        status: int | None = None
+        ended = False
+
+        async def finish() -> None:
+            nonlocal ended
+            if not ended:
+                ended = True
+                await anyio.to_thread.run_sync(self.profiler.end, record, status)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                await finish()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await finish()
+
+
+@router.get("")
+def list_profiles() -> dict[str, Any]:
+    """Return profiler settings and stored captures, newest first."""
+    return {"profiler": PROFILER.settings(), "captures": PROFILER.store.list()}
+
+
+@router.get("/{capture_id}")
+def download_profile(capture_id: str) -> FileResponse:
+    """Download one capture in collapsed-stack format."""
+    path = PROFILER.store.path(capture_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=path.name)
+
+
+@router.delete("")
+def clear_profiles() -> dict[str, int]:
+    """Delete all stored captures."""
+    return {"cleared": PROFILER.store.clear()}
@@ -24,6 +24,14 @@ class ActionRequest(BaseModel):
     params: dict[str, Any] = Field(default_factory=dict, description="액션 파라미터")
 
 
+class TraceSamplingRequest(BaseModel):
+    """트레이스 샘플링 설정 변경 (생략한 항목은 유지)"""
+
+    sample_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    min_duration_ms: Optional[float] = Field(default=None, ge=0.0)
+    capacity: Optional[int] = Field(default=None, ge=1)
+
+
 # === Response Schemas ===
 
 
@@ -82,6 +90,25 @@ class ActionResponse(BaseModel):
     narrative: Optional[str] = None
 
 
+class GlobalEventInfo(BaseModel):
+    """글로벌 이벤트 (보스 처치, 대발견 등)"""
+
+    hook_id: int
+    event: str
+    location_hint: str
+    description: str
+    timestamp: str
+    expires_at: float
+
+
+class GlobalEventFeedResponse(BaseModel):
+    """최근 글로벌 이벤트 피드 응답 (최신순)"""
+
+    success: bool
+    events: list[GlobalEventInfo] = []
+    next_cursor: Optional[int] = None
+
+
 class ErrorResponse(BaseModel):
     """에러 응답"""
 
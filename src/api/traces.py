@@ -0,0 +1,53 @@
+"""Turn trace export and sampling controls."""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.api.admin import require_admin
+from src.api.schemas import TraceSamplingRequest
+from src.core.tracing import TRACER
+
+router = APIRouter(
+    prefix="/traces", tags=["traces"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("")
+def list_traces(
+    limit: int = Query(default=50, ge=1, le=1000),
+    min_ms: float = Query(default=0.0, ge=0.0),
+) -> dict[str, Any]:
+    """Return summaries of buffered traces, newest first."""
+    return {
+        "sampling": TRACER.settings(),
+        "traces": TRACER.traces(limit=limit, min_duration_ms=min_ms),
+    }
+
+
+@router.get("/{trace_id}")
+def get_trace(trace_id: str) -> dict[str, Any]:
+    """Return one trace with all spans and its critical path."""
+    trace = TRACER.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Trace not found")
+    return trace
+
+
+@router.put("/sampling")
+def update_sampling(request: TraceSamplingRequest) -> dict[str, Any]:
+    """Change the sample rate, minimum kept duration or buffer size."""
+    try:
+        return TRACER.configure(
+            sample_rate=request.sample_rate,
+            capacity=request.capacity,
+            min_duration_ms=request.min_duration_ms,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.delete("")
+def clear_traces() -> dict[str, int]:
+    """Drop all buffered traces."""
+    return {"cleared": TRACER.clear()}
@@ -0,0 +1,28 @@
+"""
+엔진 핫 패스 마이크로 벤치마크
+
+python -m src.bench --save-baseline bench-baseline.json
+python -m src.bench --baseline bench-baseline.json --fail-on-regression
+
+케이스마다 warm-up 후 반복 측정해 median/stdev/min/max(호출당 us)를 내고,
+tracemalloc으로 호출당 잔여 블록 수와 단일 호출 피크를 잰다.
+기준선 JSON과 median을 비교해 threshold 이상 느려진 케이스를 표시한다.
+"""
+
+from src.bench.baseline import Comparison, compare, load_baseline, save_baseline
+from src.bench.cases import CASE_NAMES, BenchContext, get_cases
+from src.bench.runner import BenchResult, autorange, run_benchmark, run_suite
+
+__all__ = [
+    "CASE_NAMES",
+    "BenchContext",
+    "BenchResult",
+    "Comparison",
+    "autorange",
+    "compare",
+    "get_cases",
+    "load_baseline",
+    "run_benchmark",
+    "run_suite",
+    "save_baseline",
+]
@@ -0,0 +1,106 @@
+"""마이크로 벤치마크 CLI: python -m src.bench"""
+
+import argparse
+import json
+import sys
+
+from src.bench.baseline import compare, load_baseline, save_baseline
+from src.bench.cases import CASE_NAMES, get_cases
+from src.bench.runner import BenchResult, run_suite
+from src.core.logging import setup_logging
+
+
+def format_results(results: list[BenchResult]) -> str:
+    header = (
+        f"{'case':<42}{'median_us':>11}{'stdev_us':>10}{'min_us':>10}"
+        f"{'blocks':>9}{'peak_kb':>9}{'n':>8}"
+    )
+    lines = [header]
+    for r in results:
+        lines.append(
+            f"{r.name:<42}{r.median_us:>11.2f}{r.stdev_us:>10.2f}{r.min_us:>10.2f}"
+            f"{r.alloc_blocks:>9.1f}{r.alloc_peak_kb:>9.1f}{r.number:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.bench",
+        description="Micro-benchmarks for engine hot paths",
+    )
+    parser.add_argument(
+        "-k", "--filter", action="append", help="케이스 이름 부분 일치 (반복 가능)"
+    )
+    parser.add_argument("--list", action="store_true", help="케이스 목록만 출력")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument(
+        "--number", type=int, default=None, help="반복당 호출 수 (기본: 자동)"
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="버리는 반복 횟수")
+    parser.add_argument("--no-alloc", action="store_true", help="할당 측정 생략")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--save-baseline", help="결과를 기준선 JSON으로 저장")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="허용 변동 비율 (기본 10%%)"
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="기준선보다 느린 케이스가 있으면 종료 코드 1",
+    )
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASE_NAMES))
+        return 0
+
+    setup_logging(args.log_level)
+    cases = get_cases(args.filter)
+    if not cases:
+        parser.error(f"No benchmark matches {args.filter}")
+
+    results = run_suite(
+        cases,
+        repeat=args.repeat,
+        number=args.number,
+        warmup=args.warmup,
+        measure_alloc=not args.no_alloc,
+    )
+    comparisons = (
+        compare(results, load_baseline(args.baseline), args.threshold)
+        if args.baseline
+        else []
+    )
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+
+    if args.json:
+        payload = {
+            "results": [result.to_dict() for result in results],
+            "comparison": [vars(c) for c in comparisons],
+        }
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+    else:
+        print(format_results(results))
+        if comparisons:
+            print()
+            print(f"{'case':<42}{'baseline':>11}{'current':>11}{'ratio':>8}  status")
+            for c in comparisons:
+                base = f"{c.baseline_us:.2f}" if c.baseline_us is not None else "-"
+                ratio = f"{c.ratio:.2f}x" if c.ratio is not None else "-"
+                print(
+                    f"{c.name:<42}{base:>11}{c.current_us:>11.2f}{ratio:>8}  {c.status}"
+                )
+
+    regressed = [c.name for c in comparisons if c.status == "slower"]
+    if regressed and args.fail_on_regression:
+        print(f"Regressed: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""벤치마크 기준선(JSON) 저장/비교"""
+
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from src.bench.runner import BenchResult
+
+BASELINE_VERSION = 1
+
+
+def save_baseline(path: str | Path, results: list[BenchResult]) -> None:
+    """측정 결과를 기준선 파일로 저장"""
+    payload = {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {result.name: result.to_dict() for result in results},
+    }
+    Path(path).write_text(
+        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def load_baseline(path: str | Path) -> dict[str, dict[str, Any]]:
+    """
+    기준선 파일 로드 → {케이스 이름: 결과 dict}
+
+    Raises:
+        ValueError: 지원하지 않는 버전
+    """
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if payload.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {payload.get('version')}")
+    results: dict[str, dict[str, Any]] = payload["results"]
+    return results
+
+
+@dataclass
+class Comparison:
+    """케이스 하나의 기준선 대비 비교 (median 기준)"""
+
+    name: str
+    baseline_us: float | None
+    current_us: float
+    ratio: float | None  # current / baseline
+    status: str  # "slower" | "faster" | "same" | "new"
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float = 0.10,
+) -> list[Comparison]:
+    """
+    기준선과 비교
+
+    Args:
+        threshold: 허용 변동 비율 (0.10이면 ±10% 이내는 same)
+    """
+    comparisons = []
+    for result in results:
+        entry = baseline.get(result.name)
+        if entry is None or not entry.get("median_us"):
+            comparisons.append(
+                Comparison(result.name, None, result.median_us, None, "new")
+            )
+            continue
+
+        ratio = result.median_us / entry["median_us"]
+        if ratio > 1 + threshold:
+            status = "slower"
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = "same"
+        comparisons.append(
+            Comparison(result.name, entry["median_us"], result.median_us, ratio, status)
+        )
+    return comparisons
@@ -0,0 +1,281 @@
+"""
+엔진 핫 패스 벤치마크 케이스
+
+각 케이스는 setup 함수로, 호출하면 인자 없는 측정 대상 callable을 반환한다.
+무거운 공용 객체(AxiomLoader, WorldGenerator 등)는 BenchContext에서 한 번만 만든다.
+"""
+
+import itertools
+import json
+import random
+from collections.abc import Callable
+from functools import cached_property, partial
+from typing import Any
+
+from src.bench.runner import BenchFactory
+from src.core.axiom_system import AxiomLoader
+from src.core.core_rule import CharacterSheet, ResolutionEngine, StatType
+from src.core.dialogue.constraints import validate_action_interpretation
+from src.core.dialogue.validation import validate_meta
+from src.core.echo_system import EchoCategory, EchoManager
+from src.core.engine import PlayerState
+from src.core.event_bus import EventBus, GameEvent
+from src.core.navigator import Navigator
+from src.core.world_generator import WorldGenerator
+from src.services.narrative_parser import ResponseParser
+from src.services.narrative_prompts import PromptBuilder
+from src.services.narrative_safety import ContentSafetyFilter, NarrationManager
+from src.services.narrative_types import DialoguePromptContext, NarrativeConfig
+
+AXIOM_DATA_PATH = "src/data/itw_214_divine_axioms.json"
+BENCH_SEED = 42
+
+# 이벤트 타입당 실제 구독자 수는 1~4 (DIALOGUE_ENDED가 4로 최다)
+EMIT_SUBSCRIBER_COUNTS = (1, 4)
+ECHOES_PER_NODE = 50
+HISTORY_TURNS = 10
+DISCOVERED_NODES = 200
+
+
+class BenchContext:
+    """케이스 간 공유하는 엔진 구성 요소 (지연 생성)"""
+
+    @cached_property
+    def axiom_loader(self) -> AxiomLoader:
+        return AxiomLoader(AXIOM_DATA_PATH)
+
+    @cached_property
+    def world(self) -> WorldGenerator:
+        return WorldGenerator(self.axiom_loader, seed=BENCH_SEED)
+
+    @cached_property
+    def navigator(self) -> Navigator:
+        return Navigator(self.world, self.axiom_loader)
+
+    @cached_property
+    def echo_manager(self) -> EchoManager:
+        return EchoManager(self.axiom_loader)
+
+
+# === 월드 / 판정 ===
+
+
+def bench_generate_node(ctx: BenchContext) -> Callable[[], Any]:
+    coords = itertools.cycle(
+        [(x, y) for x in range(-10, 11) for y in range(-10, 11) if (x, y) != (0, 0)]
+    )
+
+    def run() -> Any:
+        x, y = next(coords)
+        return ctx.world.generate_node(x, y, force=True)
+
+    return run
+
+
+def bench_get_location_view(ctx: BenchContext) -> Callable[[], Any]:
+    # 주변 노드를 미리 만들어 방향 힌트 계산이 캐시된 노드를 쓰게 한다
+    for dx in range(-1, 2):
+        for dy in range(-1, 2):
+            ctx.world.generate_node(dx, dy)
+    return lambda: ctx.navigator.get_location_view(0, 0, "bench_player")
+
+
+def bench_resolve_check(ctx: BenchContext) -> Callable[[], Any]:
+    engine = ResolutionEngine()
+    character = CharacterSheet(name="bench")
+    rng = random.Random(BENCH_SEED)
+    return lambda: engine.resolve_check(
+        character, StatType.EXEC, difficulty=2, relevant_tags=1, rng=rng
+    )
+
+
+def bench_decay_echoes(ctx: BenchContext) -> Callable[[], Any]:
+    # 만료 전 Echo만 두어 매 호출이 같은 전체 검사를 하도록 한다
+    node = ctx.world.generate_node(3, 3)
+    rng = random.Random(BENCH_SEED)
+    categories = [EchoCategory.COMBAT, EchoCategory.SOCIAL, EchoCategory.MYSTERY]
+    for i in range(ECHOES_PER_NODE):
+        ctx.echo_manager.create_echo(
+            categories[i % len(categories)], node, f"p{i}", rng=rng
+        )
+    return lambda: ctx.echo_manager.decay_echoes(node)
+
+
+# === 이벤트 ===
+
+
+def _bench_emit(subscribers: int) -> Callable[[BenchContext], Callable[[], Any]]:
+    def setup(ctx: BenchContext) -> Callable[[], Any]:
+        bus = EventBus()
+        received: list[int] = [0]
+
+        def handler(event: GameEvent) -> None:
+            received[0] += 1
+
+        for _ in range(subscribers):
+            bus.subscribe("action_completed", handler)
+
+        event_data = {"player_id": "bench", "action_type": "look", "node_id": "0_0"}
+
+        def run() -> None:
+            bus.reset_chain()  # 턴 경계 (중복 발행 차단 초기화)
+            bus.emit(
+                GameEvent(
+                    event_type="action_completed", data=event_data, source="bench"
+                )
+            )
+
+        return run
+
+    return setup
+
+
+# === 대화 / 나레이션 ===
+
+
+SAMPLE_META: dict[str, Any] = {
+    "dialogue_state": {
+        "wants_to_continue": True,
+        "end_conversation": False,
+        "topic_tags": ["trade", "rumor"],
+    },
+    "relationship_delta": {"affinity": 7, "reason": "helped_with_cargo"},
+    "memory_tags": ["caravan_ambush", "owes_favor", "x" * 80],
+    "quest_seed_response": "accepted",
+    "action_interpretation": None,
+    "trade_request": {"action": "buy", "item_instance_id": "inst_iron_ore"},
+    "gift_offered": {"item_instance_id": "inst_herb_bundle"},
+}
+
+SAMPLE_INTERPRETATION: dict[str, Any] = {
+    "approach": "persuade with forged papers",
+    "stat": "SUDO",
+    "modifiers": [
+        {"source": "axiom_resonance", "axiom_id": "AX_001", "value": 1.5},
+        {"source": "axiom_resonance", "axiom_id": "AX_999", "value": 1.0},
+        {"source": "item_bonus", "item_id": "forged_papers", "value": 3.0},
+        {"source": "item_bonus", "item_id": "missing_item", "value": 0.5},
+        {"source": "situation", "value": -0.5},
+    ],
+}
+
+
+def bench_validate_meta(ctx: BenchContext) -> Callable[[], Any]:
+    return lambda: validate_meta(SAMPLE_META)
+
+
+def bench_validate_action_interpretation(ctx: BenchContext) -> Callable[[], Any]:
+    axioms = [f"AX_{i:03d}" for i in range(1, 21)]
+    items = ["forged_papers", "rope", "lantern"]
+    stats = {"WRITE": 2, "READ": 3, "EXEC": 2, "SUDO": 1}
+    return lambda: validate_action_interpretation(
+        SAMPLE_INTERPRETATION, axioms, items, stats
+    )
+
+
+def bench_build_dialogue(ctx: BenchContext) -> Callable[[], Any]:
+    builder = PromptBuilder(NarrativeConfig(), ContentSafetyFilter(NarrationManager()))
+    prompt_ctx = DialoguePromptContext(
+        npc_name="ハンス",
+        npc_role="blacksmith",
+        hexaco_summary="正直で慎重",
+        manner_tags=["gruff", "short_sentences"],
+        attitude_tags=["wary"],
+        relationship_status="acquaintance",
+        familiarity=3,
+        npc_memories=["caravan_ambush", "owes_favor"],
+        npc_opinions={"npc_2": ["reliable"], "npc_3": ["greedy", "loud"]},
+        node_environment="煤けた鍛冶場",
+        constraints={"axioms": ["AX_001"], "items": ["rope"], "stats": {"EXEC": 2}},
+        quest_seed={"seed_id": "s1", "seed_type": "rumor", "tier": 3},
+        active_quests=[{"quest_id": "q1", "title": "失われた荷"}],
+        budget_phase="winding",
+        budget_remaining=4,
+        budget_total=10,
+        history=[
+            {"speaker": "pc" if i % 2 == 0 else "npc", "text": f"発言 {i}"}
+            for i in range(HISTORY_TURNS)
+        ],
+        pc_input="最近この辺りで何か変わったことは？",
+    )
+    return lambda: builder.build_dialogue(prompt_ctx)
+
+
+SAMPLE_DUAL_RESPONSE = json.dumps(
+    {"narrative": "ハンスは槌を置いた。「...噂なら聞いている。」", "meta": SAMPLE_META},
+    ensure_ascii=False,
+)
+SAMPLE_FENCED_RESPONSE = f"以下が応答です。\n```json\n{SAMPLE_DUAL_RESPONSE}\n```\n"
+
+
+def bench_parse_dual(ctx: BenchContext) -> Callable[[], Any]:
+    parser = ResponseParser()
+    return lambda: parser.parse_dual(SAMPLE_DUAL_RESPONSE)
+
+
+def bench_parse_dual_fenced(ctx: BenchContext) -> Callable[[], Any]:
+    parser = ResponseParser()
+    return lambda: parser.parse_dual(SAMPLE_FENCED_RESPONSE)
+
+
+# === 플레이어 상태 직렬화 ===
+
+
+def _sample_player() -> PlayerState:
+    return PlayerState(
+        player_id="bench_player",
+        x=12,
+        y=-7,
+        discovered_nodes=[f"{i}_{-i}" for i in range(DISCOVERED_NODES)],
+        inventory={f"item_{i}": i for i in range(20)},
+        active_effects=[{"type": "blessed", "remaining": 3}],
+    )
+
+
+def bench_player_to_dict(ctx: BenchContext) -> Callable[[], Any]:
+    player = _sample_player()
+    return player.to_dict
+
+
+def bench_player_from_dict(ctx: BenchContext) -> Callable[[], Any]:
+    data = _sample_player().to_dict()
+    return lambda: PlayerState.from_dict(data)
+
+
+# === 레지스트리 ===
+
+
+_CASES: dict[str, Callable[[BenchContext], Callable[[], Any]]] = {
+    "world.generate_node": bench_generate_node,
+    "navigator.get_location_view": bench_get_location_view,
+    "core_rule.resolve_check": bench_resolve_check,
+    "echo.decay_echoes": bench_decay_echoes,
+    **{
+        f"event_bus.emit[{count}]": _bench_emit(count)
+        for count in EMIT_SUBSCRIBER_COUNTS
+    },
+    "dialogue.validate_meta": bench_validate_meta,
+    "dialogue.validate_action_interpretation": bench_validate_action_interpretation,
+    "narrative.build_dialogue": bench_build_dialogue,
+    "narrative.parse_dual": bench_parse_dual,
+    "narrative.parse_dual[fenced]": bench_parse_dual_fenced,
+    "player.to_dict": bench_player_to_dict,
+    "player.from_dict": bench_player_from_dict,
+}
+
+CASE_NAMES = tuple(_CASES)
+
+
+def get_cases(patterns: list[str] | None = None) -> dict[str, BenchFactory]:
+    """
+    이름에 patterns 중 하나가 포함된 케이스 (None이면 전체)
+
+    반환 값은 공용 BenchContext에 묶인 setup 함수들이다.
+    """
+    ctx = BenchContext()
+    selected: dict[str, BenchFactory] = {}
+    for name, setup in _CASES.items():
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+        selected[name] = partial(setup, ctx)
+    return selected
@@ -0,0 +1,143 @@
+"""마이크로 벤치마크 실행기 (warm-up, 반복 통계, tracemalloc 할당 측정)"""
+
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 케이스 정의: 이름 → 측정 대상 callable 을 만드는 setup 함수
+BenchFactory = Callable[[], Callable[[], Any]]
+
+
+@dataclass
+class BenchResult:
+    """케이스 하나의 측정 결과 (시간: 호출 1회당 마이크로초)"""
+
+    name: str
+    number: int  # 반복 1회당 호출 수
+    repeat: int
+    mean_us: float
+    median_us: float
+    stdev_us: float
+    min_us: float
+    max_us: float
+    alloc_blocks: float  # 호출 1회당 남은(해제되지 않은) 메모리 블록 수
+    alloc_peak_kb: float  # 호출 1회 동안의 tracemalloc 피크 (KB)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def autorange(func: Callable[[], Any], min_time: float = 0.05) -> int:
+    """반복 1회가 min_time 이상 걸리는 호출 수 (1, 2, 5, 10, 20, 50 ...)"""
+    number = 1
+    while True:
+        for factor in (1, 2, 5):
+            count = number * factor
+            started = time.perf_counter()
+            for _ in range(count):
+                func()
+            if time.perf_counter() - started >= min_time:
+                return count
+        number *= 10
+
+
+def _measure_allocations(func: Callable[[], Any], number: int) -> tuple[float, float]:
+    """(호출당 잔여 블록 수, 단일 호출 피크 KB)"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+
+        before = tracemalloc.take_snapshot()
+        for _ in range(number):
+            func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    blocks = sum(diff.count_diff for diff in after.compare_to(before, "filename"))
+    return max(0, blocks) / number, max(0, peak - base) / 1024
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    number: int | None = None,
+    warmup: int = 1,
+    measure_alloc: bool = True,
+) -> BenchResult:
+    """
+    케이스 하나 측정
+
+    Args:
+        name: 케이스 이름
+        func: 인자 없는 측정 대상
+        repeat: 반복 횟수 (통계 표본 수)
+        number: 반복 1회당 호출 수 (None이면 autorange로 결정)
+        warmup: 측정 전 버리는 반복 횟수
+        measure_alloc: tracemalloc 할당 측정 여부 (시간 측정과 별도 패스)
+    """
+    if number is None:
+        number = autorange(func)
+    for _ in range(warmup * number):
+        func()
+
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter_ns() - started) / number / 1000)
+
+    blocks, peak_kb = (
+        _measure_allocations(func, number) if measure_alloc else (0.0, 0.0)
+    )
+
+    result = BenchResult(
+        name=name,
+        number=number,
+        repeat=repeat,
+        mean_us=statistics.fmean(samples),
+        median_us=statistics.median(samples),
+        stdev_us=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        min_us=min(samples),
+        max_us=max(samples),
+        alloc_blocks=blocks,
+        alloc_peak_kb=peak_kb,
+    )
+    logger.debug("bench %s: median %.2fus", name, result.median_us)
+    return result
+
+
+def run_suite(
+    cases: dict[str, BenchFactory],
+    repeat: int = 5,
+    number: int | None = None,
+    warmup: int = 1,
+    measure_alloc: bool = True,
+) -> list[BenchResult]:
+    """케이스별 setup 후 측정"""
+    results = []
+    for name, factory in cases.items():
+        func = factory()
+        results.append(
+            run_benchmark(
+                name,
+                func,
+                repeat=repeat,
+                number=number,
+                warmup=warmup,
+                measure_alloc=measure_alloc,
+            )
+        )
+    return results
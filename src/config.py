@@ -22,11 +22,42 @@ class Settings(BaseSettings):
     SYNC_TIMEZONE: str = "Asia/Tokyo"
     LOG_LEVEL: str = "INFO"
 
+    # Sub-grid (dungeon) instance lifecycle
+    SUB_GRID_IDLE_EVICT_SECONDS: float = 600.0
+    # How often idle instances are swept (flushed + evicted) off the request path
+    SUB_GRID_EVICT_INTERVAL_SECONDS: float = 60.0
+
+    # Engine snapshot (loaded on startup if present, written on shutdown)
+    SNAPSHOT_PATH: Optional[str] = None
+
+    # Sharded deployment (uvicorn src.shard.app:app)
+    SHARD_COUNT: int = 2
+    SHARD_REGION_SIZE: int = 16
+
+    # Diagnostic endpoints (/traces, /admin/*): X-ITW-Admin-Token must match
+    # when set, otherwise they are served only while DEBUG is on
+    ADMIN_TOKEN: Optional[str] = None
+
+    # Turn tracing (GET /traces); X-ITW-Trace: 1 forces a single request
+    TRACE_SAMPLE_RATE: float = 0.0
+    TRACE_BUFFER_SIZE: int = 200
+    TRACE_MIN_DURATION_MS: float = 0.0
+
+    # Slow-request profiler (GET /admin/profiles)
+    PROFILE_ENABLED: bool = False
+    PROFILE_THRESHOLD_MS: float = 1000.0
+    PROFILE_INTERVAL_MS: float = 10.0
+    PROFILE_MAX_PER_MINUTE: int = 6
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_FILES: int = 50
+    PROFILE_MAX_BYTES: int = 20_000_000
+
     # AI Provider settings
     AI_PROVIDER: str = "mock"
     AI_API_KEY: Optional[str] = None
     AI_MODEL: Optional[str] = None
     AI_BASE_URL: Optional[str] = None
+    AI_TIMEOUT_SECONDS: float = 30.0
 
 
 settings = Settings()
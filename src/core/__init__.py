@@ -30,6 +30,8 @@ from src.core.core_rule import (
     StatType,
     CheckResult,
     CheckResultTier,
+    BatchCheckResult,
+    CheckOdds,
     ResolutionEngine,
 )
 from src.core.engine import ITWEngine, PlayerState, ActionResult
@@ -60,6 +62,8 @@ __all__ = [
     "StatType",
     "CheckResult",
     "CheckResultTier",
+    "BatchCheckResult",
+    "CheckOdds",
     "ResolutionEngine",
     "ITWEngine",
     "PlayerState",
@@ -0,0 +1,226 @@
+"""
+ITW Core Engine - Actor Execution Layer
+=======================================
+플레이어별 직렬 실행 + 월드 청크 잠금
+
+FastAPI는 동기 핸들러를 스레드 풀에서 실행하므로, 같은 플레이어의 요청이
+엔진 내부(보급/위치 갱신 등)에서 뒤섞일 수 있다.
+
+- PlayerActor: 플레이어마다 FIFO 대기열을 가진 실행 단위.
+  같은 플레이어의 명령은 도착 순서대로 하나씩, 각자 호출 스레드에서 실행된다.
+  서로 다른 플레이어의 명령은 병렬로 실행된다.
+- ChunkLockTable: 좌표를 chunk_size 격자로 묶은 청크 단위 잠금.
+  여러 청크는 항상 정렬 순서로 잡아 교착을 피한다.
+
+잠금 순서: 플레이어 액터 → 청크 잠금. 청크 잠금을 쥔 채 액터를 요청하지 않는다.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 8
+
+
+# === 플레이어 액터 ===
+
+
+class PlayerActor:
+    """
+    플레이어 한 명의 직렬 명령 대기열
+
+    call()은 앞선 명령이 모두 끝날 때까지 대기한 뒤 호출 스레드에서 실행한다.
+    실행권은 끝난 명령이 대기열 맨 앞 명령에게 직접 넘기므로 순서가 보장된다.
+    같은 스레드의 중첩 호출(액션 안에서 다른 엔진 액션 호출)은 재진입으로 허용한다.
+    """
+
+    def __init__(self, player_id: str):
+        self.player_id = player_id
+        self.processed = 0
+
+        self._lock = threading.Lock()
+        self._waiters: deque[threading.Event] = deque()
+        self._owner: int | None = None
+        self._depth = 0
+
+    @property
+    def pending(self) -> int:
+        """실행 대기 중인 명령 수"""
+        return len(self._waiters)
+
+    @property
+    def busy(self) -> bool:
+        return self._owner is not None
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """명령 실행 (앞선 명령 완료까지 대기)"""
+        self._acquire()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._release()
+
+    def _acquire(self) -> None:
+        me = threading.get_ident()
+        with self._lock:
+            if self._owner == me:
+                self._depth += 1
+                return
+            if self._owner is None and not self._waiters:
+                self._owner = me
+                self._depth = 1
+                return
+            turn = threading.Event()
+            self._waiters.append(turn)
+
+        turn.wait()
+        # 실행권은 _release()에서 넘겨받음 (owner는 넘겨준 쪽이 비워 둠)
+        with self._lock:
+            self._owner = me
+            self._depth = 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._depth -= 1
+            if self._depth > 0:
+                return
+            self.processed += 1
+            if self._waiters:
+                # 실행권 이양: 다음 명령이 owner를 채울 때까지 새 호출은 대기열로
+                self._owner = -1
+                self._waiters.popleft().set()
+            else:
+                self._owner = None
+
+
+class ActorRegistry:
+    """플레이어 ID → PlayerActor (최초 요청 시 생성)"""
+
+    def __init__(self) -> None:
+        self._actors: dict[str, PlayerActor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, player_id: str) -> PlayerActor:
+        actor = self._actors.get(player_id)
+        if actor is not None:
+            return actor
+        with self._lock:
+            actor = self._actors.get(player_id)
+            if actor is None:
+                actor = PlayerActor(player_id)
+                self._actors[player_id] = actor
+            return actor
+
+    def call(
+        self, player_id: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """player_id의 액터에서 func 실행"""
+        return self.get(player_id).call(func, *args, **kwargs)
+
+    def discard(self, player_id: str) -> bool:
+        """유휴 액터 제거 (실행/대기 중이면 유지)"""
+        with self._lock:
+            actor = self._actors.get(player_id)
+            if actor is None or actor.busy or actor.pending:
+                return False
+            del self._actors[player_id]
+            return True
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    def stats(self) -> dict[str, int]:
+        actors = list(self._actors.values())
+        return {
+            "actors": len(actors),
+            "busy": sum(1 for actor in actors if actor.busy),
+            "pending": sum(actor.pending for actor in actors),
+            "processed": sum(actor.processed for actor in actors),
+        }
+
+
+# === 월드 청크 잠금 ===
+
+
+class ChunkLockTable:
+    """
+    청크 단위 월드 잠금
+
+    청크 (cx, cy) = (x // chunk_size, y // chunk_size).
+    잠금 객체는 처음 필요할 때 만든다. hold()는 먼저 필요한 잠금 객체를 모두
+    확보한 뒤 정렬 순서로 잡으므로, 청크를 쥔 채 테이블 잠금을 기다리지 않는다.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.chunk_size = chunk_size
+        self._locks: dict[tuple[int, int], threading.RLock] = {}
+        self._table_lock = threading.RLock()
+
+    def chunk_of(self, x: int, y: int) -> tuple[int, int]:
+        return (x // self.chunk_size, y // self.chunk_size)
+
+    def chunks_around(
+        self, coords: Iterable[tuple[int, int]], radius: int = 0
+    ) -> set[tuple[int, int]]:
+        """좌표들 ±radius 영역이 걸치는 청크 집합"""
+        chunks: set[tuple[int, int]] = set()
+        for x, y in coords:
+            x0, y0 = self.chunk_of(x - radius, y - radius)
+            x1, y1 = self.chunk_of(x + radius, y + radius)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    chunks.add((cx, cy))
+        return chunks
+
+    def _resolve(self, chunks: Iterable[tuple[int, int]]) -> list[threading.RLock]:
+        with self._table_lock:
+            locks = []
+            for chunk in sorted(chunks):
+                lock = self._locks.get(chunk)
+                if lock is None:
+                    lock = threading.RLock()
+                    self._locks[chunk] = lock
+                locks.append(lock)
+            return locks
+
+    @contextmanager
+    def hold(self, *coords: tuple[int, int], radius: int = 0) -> Iterator[None]:
+        """좌표들 ±radius 영역의 청크를 모두 잡은 동안 실행"""
+        locks = self._resolve(self.chunks_around(coords, radius))
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    @contextmanager
+    def hold_all(self) -> Iterator[None]:
+        """
+        월드 전체 잠금 (일일 틱 등)
+
+        테이블 잠금을 쥐어 새 청크 잠금 생성을 막고, 기존 청크를 정렬 순서로 잡는다.
+        """
+        with self._table_lock:
+            locks = [self._locks[chunk] for chunk in sorted(self._locks)]
+            for lock in locks:
+                lock.acquire()
+            try:
+                yield
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+
+    def __len__(self) -> int:
+        return len(self._locks)
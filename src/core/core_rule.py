@@ -13,9 +13,12 @@ Protocol T.A.G. v2.0 Resonance 판정 엔진
 4. Success Check: 5, 6 = Hit
 """
 
+import math
 import random
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from src.core.logging import get_logger
@@ -58,6 +61,84 @@ class CheckResult:
     narrative_hint: str  # AI 서술 가이드
 
 
+@dataclass
+class BatchCheckResult:
+    """일괄 판정 결과 (인덱스별로 입력 판정과 대응)"""
+
+    hits: List[int]  # 성공수
+    tiers: List[CheckResultTier]  # 결과 티어
+    successes: List[bool]  # 성공 여부
+    criticals: List[bool]  # 대성공/대실패 여부
+
+    def __len__(self) -> int:
+        return len(self.hits)
+
+
+@dataclass
+class CheckOdds:
+    """판정 확률 (주사위를 굴리지 않고 이항분포로 계산)"""
+
+    pool_size: int
+    difficulty: int
+    success: float  # P(hits >= difficulty)
+    critical_success: float  # P(hits >= difficulty + 2)
+    critical_failure: float  # P(hits == 0 & 1이 존재)
+
+
+# === 이항분포 테이블 (주사위 1개: Hit 1/3, 1 눈 1/6) ===
+
+HIT_PROBABILITY = 1 / 3  # 5, 6
+
+
+@lru_cache(maxsize=64)
+def _hit_pmf(pool_size: int) -> tuple[float, ...]:
+    """P(hits == k), k = 0..pool_size"""
+    p = HIT_PROBABILITY
+    return tuple(
+        math.comb(pool_size, k) * p**k * (1 - p) ** (pool_size - k)
+        for k in range(pool_size + 1)
+    )
+
+
+@lru_cache(maxsize=64)
+def _hit_cdf(pool_size: int) -> tuple[float, ...]:
+    """P(hits <= k), k = 0..pool_size (역CDF 샘플링용)"""
+    cdf: list[float] = []
+    total = 0.0
+    for prob in _hit_pmf(pool_size):
+        total += prob
+        cdf.append(total)
+    return tuple(cdf)
+
+
+def _no_ones_given_no_hits(pool_size: int) -> float:
+    """성공 0개일 때 1이 하나도 없을 확률 (각 주사위가 2~4 중 하나)"""
+    return 0.75**pool_size
+
+
+def _classify(
+    hits: int, difficulty: int, has_ones: bool
+) -> tuple[bool, CheckResultTier, str]:
+    """성공수 → (성공 여부, 티어, 서술 가이드)"""
+    if hits >= difficulty:
+        if hits >= difficulty + 2:
+            return (
+                True,
+                CheckResultTier.CRITICAL_SUCCESS,
+                "압도적인 성과. 의도한 것 이상의 이득을 얻거나 시간을 단축함.",
+            )
+        return True, CheckResultTier.SUCCESS, "목표 달성. 깔끔하게 의도를 실현함."
+
+    # 대실패 판정 (성공 0개이고 1이 있는 경우)
+    if hits == 0 and has_ones:
+        return (
+            False,
+            CheckResultTier.CRITICAL_FAILURE,
+            "치명적 실패. 상황이 악화되거나 반동을 입음.",
+        )
+    return False, CheckResultTier.FAILURE, "단순 실패. 현상 유지 혹은 기회 소진."
+
+
 @dataclass
 class CharacterSheet:
     """캐릭터/NPC 데이터 구조"""
@@ -167,6 +248,7 @@ class ResolutionEngine:
         bonus_dice: int = 0,
         risk_penalty: int = 0,
         relevant_tags: int = 0,  # Axiom/아이템 등에서 오는 보너스 개수
+        rng: Optional[random.Random] = None,
     ) -> CheckResult:
         """
         핵심 판정 로직 실행
@@ -178,46 +260,26 @@ class ResolutionEngine:
             bonus_dice: 상황 보너스 주사위 (GM 부여)
             risk_penalty: 상황 페널티 주사위 (GM 부여)
             relevant_tags: 유리한 태그 개수 (개당 +1d6)
+            rng: 난수 스트림 (None이면 random 모듈 전역 상태)
 
         Returns:
             CheckResult 객체
         """
-        # 1. Base Dice (스탯)
-        base_dice = character.get_stat(stat_type)
-
-        # 2. Total Pool 계산 (최소 1개는 굴림)
-        total_dice = base_dice + relevant_tags + bonus_dice - risk_penalty
-        total_dice = max(1, total_dice)
+        # 1~2. Dice Pool 계산 (최소 1개는 굴림)
+        total_dice = self.pool_size(
+            character, stat_type, bonus_dice, risk_penalty, relevant_tags
+        )
 
         # 3. Roll (d6)
-        rolls = [random.randint(1, 6) for _ in range(total_dice)]
+        roll = (rng or random).randint
+        rolls = [roll(1, 6) for _ in range(total_dice)]
 
         # 4. Count Hits (5, 6 = Success)
         hits = sum(1 for r in rolls if r >= 5)
-        ones = sum(1 for r in rolls if r == 1)
+        has_ones = 1 in rolls
 
         # 5. Determine Outcome
-        tier = CheckResultTier.FAILURE
-        success = False
-        hint = ""
-
-        if hits >= difficulty:
-            success = True
-            if hits >= difficulty + 2:
-                tier = CheckResultTier.CRITICAL_SUCCESS
-                hint = "압도적인 성과. 의도한 것 이상의 이득을 얻거나 시간을 단축함."
-            else:
-                tier = CheckResultTier.SUCCESS
-                hint = "목표 달성. 깔끔하게 의도를 실현함."
-        else:
-            success = False
-            # 대실패 판정 (성공 0개이고 1이 있는 경우)
-            if hits == 0 and ones > 0:
-                tier = CheckResultTier.CRITICAL_FAILURE
-                hint = "치명적 실패. 상황이 악화되거나 반동을 입음."
-            else:
-                tier = CheckResultTier.FAILURE
-                hint = "단순 실패. 현상 유지 혹은 기회 소진."
+        success, tier, hint = _classify(hits, difficulty, has_ones)
 
         return CheckResult(
             success=success,
@@ -228,6 +290,82 @@ class ResolutionEngine:
             narrative_hint=hint,
         )
 
+    def pool_size(
+        self,
+        character: CharacterSheet,
+        stat_type: Union[StatType, str],
+        bonus_dice: int = 0,
+        risk_penalty: int = 0,
+        relevant_tags: int = 0,
+    ) -> int:
+        """주사위 풀 크기 = 스탯 + 태그 + 보너스 - 페널티 (최소 1)"""
+        base_dice = character.get_stat(stat_type)
+        return max(1, base_dice + relevant_tags + bonus_dice - risk_penalty)
+
+    def resolve_checks(
+        self,
+        pool_sizes: List[int],
+        difficulties: List[int],
+        rng: Optional[random.Random] = None,
+    ) -> BatchCheckResult:
+        """
+        일괄 판정 (NPC 시뮬레이션/전투용)
+
+        주사위를 하나씩 굴리지 않고 판정당 성공수를 이항분포 역CDF로
+        한 번에 샘플링한다. 성공 0개일 때만 1의 존재 여부를 추가로 뽑는다.
+        분포는 resolve_check와 동일하지만 개별 눈(rolls)은 남지 않는다.
+
+        Args:
+            pool_sizes: 판정별 주사위 개수 (1 미만은 1로 보정)
+            difficulties: 판정별 목표 성공수
+            rng: 난수 생성기 (None이면 random 모듈 전역 상태)
+
+        Returns:
+            BatchCheckResult
+        """
+        if len(pool_sizes) != len(difficulties):
+            raise ValueError("pool_sizes and difficulties must have the same length")
+
+        draw = (rng or random).random
+        result = BatchCheckResult(hits=[], tiers=[], successes=[], criticals=[])
+
+        for pool, difficulty in zip(pool_sizes, difficulties):
+            pool = max(1, pool)
+            hits = min(bisect_right(_hit_cdf(pool), draw()), pool)
+            has_ones = hits > 0 or draw() >= _no_ones_given_no_hits(pool)
+
+            success, tier, _ = _classify(hits, difficulty, has_ones)
+            result.hits.append(hits)
+            result.tiers.append(tier)
+            result.successes.append(success)
+            result.criticals.append(
+                tier
+                in (CheckResultTier.CRITICAL_SUCCESS, CheckResultTier.CRITICAL_FAILURE)
+            )
+
+        return result
+
+    def check_odds(self, pool_size: int, difficulty: int) -> CheckOdds:
+        """
+        판정 확률 계산 (UI 힌트, AI 난이도 서술용)
+
+        성공수 분포 테이블은 풀 크기별로 메모이즈된다.
+        """
+        pool_size = max(1, pool_size)
+        pmf = _hit_pmf(pool_size)
+        no_hits = pmf[0]
+        return CheckOdds(
+            pool_size=pool_size,
+            difficulty=difficulty,
+            success=sum(pmf[max(0, difficulty) :]),
+            critical_success=sum(pmf[max(0, difficulty + 2) :]),
+            critical_failure=(
+                0.0
+                if difficulty <= 0
+                else no_hits * (1 - _no_ones_given_no_hits(pool_size))
+            ),
+        )
+
     def calculate_resonance_interaction(
         self,
         check_result: CheckResult,
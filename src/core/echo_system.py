@@ -7,14 +7,18 @@ ITW Core Engine - Module 4: Echo System (Memory & Investigation)
 플레이어는 이를 조사하여 정보를 얻을 수 있습니다.
 """
 
+import heapq
+import itertools
 import random
+import threading
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.axiom_system import AxiomLoader
 from src.core.logging import get_logger
+from src.core.timeutil import parse_timestamp, to_epoch, week_bucket
 from src.core.world_generator import Echo, MapNode
 
 logger = get_logger(__name__)
@@ -175,6 +179,32 @@ class EchoManager:
         ),
     }
 
+    # 카테고리 값 → 템플릿 (O(1) 조회)
+    TEMPLATES_BY_VALUE = {
+        category.value: template for category, template in TEMPLATES.items()
+    }
+
+    # 카테고리가 없는 레거시 Short Echo의 수명
+    # (기존 decay 로직은 첫 번째 Short 템플릿인 COMBAT의 7일을 일괄 적용했음)
+    LEGACY_SHORT_DECAY_DAYS = 7
+
+    # === 압축 (Compaction) ===
+    # 반복적으로 쌓이는 카테고리: 같은 (카테고리, 가시성, 난이도, 주간 버킷)
+    # Echo가 COMPACTION_THRESHOLD개에 도달하면 집계 Echo 하나로 접는다.
+    COMPACTABLE_CATEGORIES = frozenset(
+        {EchoCategory.EXPLORATION.value, EchoCategory.CRAFTING.value}
+    )
+    COMPACTION_THRESHOLD = 3
+
+    # 노드당 압축 대상 카테고리 Echo 상한 (초과 시 가장 먼저 소멸할 것부터 제거)
+    MAX_COMPACTABLE_ECHOES_PER_NODE = 24
+
+    # 집계 Echo 플레이버 ({count}: 누적 횟수)
+    SUMMARY_FLAVORS = {
+        EchoCategory.EXPLORATION.value: "이번 주 {count}명의 여행자가 이곳을 지나갔다...",
+        EchoCategory.CRAFTING.value: "이번 주 이곳에서 {count}번의 작업 흔적이 겹쳐 있다...",
+    }
+
     # 시간 경과에 따른 난이도 증가 (7일마다 +1)
     TIME_MODIFIER_DAYS = 7
 
@@ -196,6 +226,13 @@ class EchoManager:
     def __init__(self, axiom_loader: AxiomLoader):
         self.axiom_loader = axiom_loader
 
+        # 소멸 예정 Short Echo 최소 힙: (expires_at, seq, echo, node)
+        # 노드에서 이미 빠진 Echo는 꺼낼 때 무시 (지연 삭제)
+        self._expiry_heap: List[Tuple[float, int, Echo, MapNode]] = []
+        self._expiry_seq = itertools.count()
+        # 청크 잠금이 다른 스레드들이 같은 힙을 갱신하므로 별도 잠금
+        self._expiry_lock = threading.RLock()
+
     def get_fame_reward(self, category: EchoCategory) -> int:
         """카테고리별 Fame 보상 반환"""
         return self.FAME_REWARDS.get(category, 0)
@@ -207,6 +244,7 @@ class EchoManager:
         source_player_id: Optional[str] = None,
         custom_flavor: Optional[str] = None,
         difficulty_modifier: int = 0,
+        rng: Optional[random.Random] = None,
     ) -> Echo:
         """
         새 Echo 생성
@@ -217,6 +255,7 @@ class EchoManager:
             source_player_id: 생성자 플레이어 ID
             custom_flavor: 커스텀 플레이버 텍스트
             difficulty_modifier: 난이도 수정치
+            rng: 플레이버 선택용 난수 스트림 (None이면 random 모듈 전역 상태)
 
         Returns:
             생성된 Echo
@@ -229,32 +268,151 @@ class EchoManager:
         if custom_flavor:
             flavor = custom_flavor
         else:
-            flavor = random.choice(template.flavor_templates)
+            flavor = (rng or random).choice(template.flavor_templates)
 
         # 노드의 지배 Axiom으로 플레이버 강화
-        dominant = node.get_dominant_axiom()
-        if dominant:
-            axiom = self.axiom_loader.get_by_code(dominant)
-            if axiom:
-                flavor = f"{flavor} ({axiom.name_kr}의 기운과 함께)"
+        flavor = self._decorate_flavor(node, flavor)
 
         # 난이도 계산
         difficulty = template.base_difficulty + difficulty_modifier
 
+        now = datetime.utcnow()
         echo = Echo(
             echo_type=template.echo_type.value,
             visibility=template.visibility.value,
             base_difficulty=difficulty,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=now.isoformat(),
             flavor_text=flavor,
             source_player_id=source_player_id,
+            category=template.category.value,
+            expires_at=self._expiry_from(now, self._decay_days_of(template)),
+            week_bucket=week_bucket(now),
         )
 
+        # 반복 카테고리는 삽입 시점에 압축 (커스텀 플레이버는 고유하므로 제외)
+        if custom_flavor is None and echo.category in self.COMPACTABLE_CATEGORIES:
+            return self._insert_compacted(node, echo)
+
         # 노드에 추가
         node.add_echo(echo)
+        self.track_echo(node, echo)
 
         return echo
 
+    def _decorate_flavor(self, node: MapNode, flavor: str) -> str:
+        """노드의 지배 Axiom으로 플레이버 강화"""
+        dominant = node.get_dominant_axiom()
+        if dominant:
+            axiom = self.axiom_loader.get_by_code(dominant)
+            if axiom:
+                return f"{flavor} ({axiom.name_kr}의 기운과 함께)"
+        return flavor
+
+    @staticmethod
+    def _compaction_key(echo: Echo) -> Tuple[Optional[str], str, int, int]:
+        """압축 그룹 키: (카테고리, 가시성, 난이도, ISO 주차)
+
+        주차는 Echo에 캐시된 week_bucket을 쓰고, 로드된 Echo처럼 비어 있으면 한 번만 파싱한다.
+        """
+        if echo.week_bucket is None:
+            echo.week_bucket = week_bucket(parse_timestamp(echo.timestamp))
+        return (echo.category, echo.visibility, echo.base_difficulty, echo.week_bucket)
+
+    def _insert_compacted(self, node: MapNode, echo: Echo) -> Echo:
+        """
+        압축 대상 Echo 삽입
+
+        같은 그룹의 집계 Echo가 있으면 횟수만 더하고,
+        개별 Echo가 임계치에 도달하면 하나의 집계 Echo로 접는다.
+
+        Returns:
+            노드에 실제로 남은 Echo (개별 또는 집계)
+        """
+        key = self._compaction_key(echo)
+        group = [
+            e
+            for e in node.echoes.by_category(echo.category)
+            if self._compaction_key(e) == key
+        ]
+
+        summary = next((e for e in group if e.count > 1), None)
+        if summary is None and len(group) + 1 >= self.COMPACTION_THRESHOLD:
+            summary = self._fold(node, group)
+
+        if summary is None:
+            node.add_echo(echo)
+            self.track_echo(node, echo)
+            self._enforce_node_cap(node)
+            return echo
+
+        # 소멸 시각이 늦춰졌으면 새 힙 항목 등록 (이전 항목은 꺼낼 때 무시됨)
+        if self._absorb(node, summary, echo):
+            self.track_echo(node, summary)
+        return summary
+
+    def _fold(self, node: MapNode, group: List[Echo]) -> Echo:
+        """개별 Echo 그룹을 집계 Echo 하나로 교체"""
+        first = group[0]
+        summary = Echo(
+            echo_type=first.echo_type,
+            visibility=first.visibility,
+            base_difficulty=first.base_difficulty,
+            timestamp=first.timestamp,
+            flavor_text="",
+            source_player_id=first.source_player_id,
+            category=first.category,
+            expires_at=first.expires_at,
+            count=0,
+            week_bucket=first.week_bucket,
+        )
+        for echo in group:
+            self._absorb(node, summary, echo)
+
+        node.echoes.discard_many(e.echo_id for e in group)
+        node.add_echo(summary)
+        self.track_echo(node, summary)
+        return summary
+
+    def _absorb(self, node: MapNode, summary: Echo, echo: Echo) -> bool:
+        """
+        Echo 하나를 집계 Echo에 합산 (최신 흔적 기준으로 갱신)
+
+        Returns:
+            소멸 시각이 늦춰졌는지 (소멸 색인 재등록 필요)
+        """
+        summary.count += echo.count
+        if echo.timestamp > summary.timestamp:
+            summary.timestamp = echo.timestamp
+            summary.source_player_id = echo.source_player_id
+
+        extended = echo.expires_at is not None and (
+            summary.expires_at is None or echo.expires_at > summary.expires_at
+        )
+        if extended:
+            summary.expires_at = echo.expires_at
+
+        flavor = self.SUMMARY_FLAVORS.get(summary.category or "", "{count}개의 흔적")
+        summary.flavor_text = self._decorate_flavor(
+            node, flavor.format(count=summary.count)
+        )
+        return extended
+
+    def _enforce_node_cap(self, node: MapNode) -> None:
+        """노드당 압축 대상 Echo 상한 유지"""
+        compactable = [
+            e
+            for category in self.COMPACTABLE_CATEGORIES
+            for e in node.echoes.by_category(category)
+        ]
+        overflow = len(compactable) - self.MAX_COMPACTABLE_ECHOES_PER_NODE
+        if overflow <= 0:
+            return
+
+        compactable.sort(
+            key=lambda e: e.expires_at if e.expires_at is not None else float("inf")
+        )
+        node.echoes.discard_many(e.echo_id for e in compactable[:overflow])
+
     def calculate_investigation_difficulty(self, echo: Echo) -> Dict[str, Any]:
         """
         조사 난이도 계산 (d6 Dice Pool 시스템)
@@ -336,6 +494,9 @@ class EchoManager:
                 "age": f"{difficulty_info['days_passed']}일 전",
                 "source_hint": self._get_source_hint(echo, margin),
             }
+            if echo.count > 1:
+                # 집계 Echo: 겹쳐진 흔적 수
+                result["discovered_info"]["count"] = echo.count
 
             # 대성공 (hits >= difficulty + 2) 시 추가 정보
             if margin >= 2:
@@ -362,52 +523,143 @@ class EchoManager:
             return "희미한 흔적. 기본적인 정보만 알 수 있다."
         return "거의 사라진 흔적."
 
-    def decay_echoes(self, node: MapNode) -> int:
+    # === 소멸 (Expiry) ===
+
+    def get_template(self, category: Optional[str]) -> Optional[EchoTemplate]:
+        """카테고리 값으로 템플릿 조회"""
+        if category is None:
+            return None
+        return self.TEMPLATES_BY_VALUE.get(category)
+
+    @staticmethod
+    def _decay_days_of(template: EchoTemplate) -> Optional[int]:
+        """템플릿의 수명 (Long은 None)"""
+        if template.echo_type != EchoType.SHORT:
+            return None
+        return template.decay_days
+
+    @staticmethod
+    def _expiry_from(created: datetime, decay_days: Optional[int]) -> Optional[float]:
         """
-        노드의 Short Echo 시간 경과 처리
+        생성 시각 + 수명 → 소멸 시각 (epoch 초)
+
+        기존 판정(경과 일수 > decay_days)과 같도록 decay_days + 1일 시점에 소멸.
+        """
+        if decay_days is None:
+            return None
+        return to_epoch(created + timedelta(days=decay_days + 1))
+
+    def get_decay_days(self, echo: Echo) -> Optional[int]:
+        """Echo 수명 (일). Long Echo는 None"""
+        if echo.echo_type == EchoType.LONG.value:
+            return None
+        template = self.get_template(echo.category)
+        if template is None:
+            return self.LEGACY_SHORT_DECAY_DAYS
+        return self._decay_days_of(template)
+
+    def compute_expiry(self, echo: Echo) -> Optional[float]:
+        """Echo 소멸 시각 계산 (레거시 Echo 색인용)"""
+        decay_days = self.get_decay_days(echo)
+        if decay_days is None:
+            return None
+        return self._expiry_from(parse_timestamp(echo.timestamp), decay_days)
+
+    def track_echo(self, node: MapNode, echo: Echo) -> None:
+        """Echo를 소멸 색인에 등록 (expires_at 없으면 계산하여 채움)"""
+        if echo.expires_at is None:
+            echo.expires_at = self.compute_expiry(echo)
+        if echo.expires_at is not None:
+            with self._expiry_lock:
+                heapq.heappush(
+                    self._expiry_heap,
+                    (echo.expires_at, next(self._expiry_seq), echo, node),
+                )
+
+    def index_node(self, node: MapNode) -> int:
+        """노드의 기존 Echo 전체를 소멸 색인에 등록 (DB 로드 후)"""
+        with self._expiry_lock:
+            before = len(self._expiry_heap)
+            for echo in node.echoes:
+                self.track_echo(node, echo)
+            return len(self._expiry_heap) - before
+
+    def clear_expiry_index(self) -> None:
+        """소멸 색인 초기화"""
+        with self._expiry_lock:
+            self._expiry_heap.clear()
+
+    @property
+    def pending_expiry_count(self) -> int:
+        """색인에 남은 소멸 예정 항목 수 (지연 삭제분 포함)"""
+        return len(self._expiry_heap)
+
+    def decay_expired(self, now: Optional[datetime] = None) -> int:
+        """
+        소멸 시각이 지난 Short Echo 일괄 제거
+
+        힙에서 만료된 항목만 꺼내므로, 만료 Echo가 있는 노드만 처리한다.
 
         Returns:
             삭제된 Echo 수
         """
-        now = datetime.utcnow()
-        remaining = []
-        removed = 0
+        now_ts = to_epoch(now or datetime.utcnow())
+        expired: Dict[int, Tuple[MapNode, List[str]]] = {}
 
-        for echo in node.echoes:
-            if echo.echo_type == EchoType.LONG.value:
-                # Long Echo는 영구 보존
-                remaining.append(echo)
+        with self._expiry_lock:
+            due = []
+            while self._expiry_heap and self._expiry_heap[0][0] <= now_ts:
+                due.append(heapq.heappop(self._expiry_heap))
+
+        for _, _, echo, node in due:
+            # 압축으로 소멸 시각이 늦춰진 Echo의 이전 항목은 무시
+            if echo.expires_at is None or echo.expires_at > now_ts:
+                continue
+            # 노드에서 이미 빠졌거나 다른 Echo로 교체된 경우 무시
+            if node.echoes.get(echo.echo_id) is not echo:
                 continue
+            expired.setdefault(id(node), (node, []))[1].append(echo.echo_id)
 
-            # Short Echo 수명 체크
-            template = None
-            for t in self.TEMPLATES.values():
-                if t.echo_type.value == echo.echo_type:
-                    template = t
-                    break
+        removed = 0
+        for node, echo_ids in expired.values():
+            removed += node.echoes.discard_many(echo_ids)
 
-            if template and template.decay_days:
-                created = datetime.fromisoformat(
-                    echo.timestamp.replace("Z", "+00:00").replace("+00:00", "")
-                )
-                age = (now - created).days
+        return removed
 
-                if age > template.decay_days:
-                    removed += 1
-                    continue
+    def decay_echoes(self, node: MapNode) -> int:
+        """
+        노드의 Short Echo 시간 경과 처리 (단일 노드 전체 검사)
 
-            remaining.append(echo)
+        일일 틱은 decay_expired()를 사용한다.
 
-        node.echoes = remaining
-        return removed
+        Returns:
+            삭제된 Echo 수
+        """
+        now_ts = to_epoch(datetime.utcnow())
+        expired = []
+
+        for echo in node.echoes:
+            if echo.expires_at is None:
+                echo.expires_at = self.compute_expiry(echo)
+            if echo.expires_at is not None and echo.expires_at <= now_ts:
+                expired.append(echo.echo_id)
+
+        return node.echoes.discard_many(expired)
 
     def get_visible_echoes(self, node: MapNode) -> List[Echo]:
         """공개 Echo 목록 반환"""
-        return [e for e in node.echoes if e.visibility == EchoVisibility.PUBLIC.value]
+        return node.echoes.by_visibility(EchoVisibility.PUBLIC.value)
 
     def get_hidden_echoes(self, node: MapNode) -> List[Echo]:
         """숨겨진 Echo 목록 반환 (조사 필요)"""
-        return [e for e in node.echoes if e.visibility == EchoVisibility.HIDDEN.value]
+        return node.echoes.by_visibility(EchoVisibility.HIDDEN.value)
+
+    def find_hidden_echo(self, node: MapNode, echo_id: str) -> Optional[Echo]:
+        """ID로 숨겨진 Echo 조회 (공개 Echo나 사라진 Echo는 None)"""
+        echo = node.echoes.get(echo_id)
+        if echo is None or echo.visibility != EchoVisibility.HIDDEN.value:
+            return None
+        return echo
 
     def create_global_hook(
         self, event_type: str, location_hint: str, description: str
@@ -7,27 +7,47 @@ Infinite Text World 핵심 엔진 통합 모듈
 게임 세션을 관리합니다.
 """
 
+import functools
 import json
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from sqlalchemy.orm import Session
 
 # 엔진 모듈 임포트
+from src.core.actor import ActorRegistry, ChunkLockTable
 from src.core.axiom_system import AxiomLoader, AxiomVector
 from src.core.core_rule import CharacterSheet, ResolutionEngine, StatType
-from src.core.echo_system import EchoCategory, EchoManager
+from src.core.echo_system import EchoCategory, EchoManager, EchoVisibility
+from src.core.event_bus import EventBus
+from src.core.global_hooks import GlobalHookStore
 from src.core.logging import get_logger
 from src.core.navigator import Direction, LocationView, Navigator, render_compass
+from src.core.reachability import ReachabilityIndex
+from src.core.rng import RNGProvider
+from src.core.snapshot import (
+    EngineSnapshot,
+    LazyNodeStore,
+    SnapshotError,
+    SnapshotReader,
+    SnapshotWriter,
+    encode_node,
+    write_snapshot,
+)
 from src.core.sub_grid import SubGridGenerator
+from src.core.sub_grid_store import SubGridInstanceManager
 from src.core.world_generator import (
     Echo,
+    EchoStore,
     MapNode,
     NodeTier,
     Resource,
     SensoryData,
     WorldGenerator,
+    new_echo_id,
 )
 from src.db.models import EchoModel, MapNodeModel, PlayerModel, ResourceModel
 from src.modules.base import GameContext
@@ -36,6 +56,33 @@ from src.modules.geography import GeographyModule
 
 logger = get_logger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _player_command(radius: Optional[int] = 0) -> Callable[[F], F]:
+    """
+    플레이어 명령 데코레이터 (첫 인자 player_id)
+
+    플레이어 액터에서 직렬 실행하고, 현재 위치 ±radius 청크를 잠근다.
+    서브 그리드 안이면 부모 좌표 기준. radius=None이면 메서드가 직접 잠근다.
+    """
+
+    def decorate(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(self: "ITWEngine", player_id: str, *args: Any, **kwargs: Any):
+            def run() -> Any:
+                if radius is None:
+                    return method(self, player_id, *args, **kwargs)
+                anchor = self._anchor_of(player_id)
+                with self.chunk_locks.hold(anchor, radius=radius):
+                    return method(self, player_id, *args, **kwargs)
+
+            return self.actors.call(player_id, run)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
 
 def _node_to_model(node: MapNode) -> MapNodeModel:
     """MapNode를 MapNodeModel로 변환"""
@@ -69,18 +116,26 @@ def _model_to_node(model: MapNodeModel) -> MapNode:
         for res in model.resources
     ]
 
-    # Echoes 변환
-    echoes = [
-        Echo(
-            echo_type=echo.echo_type,
-            visibility=echo.visibility,
-            base_difficulty=echo.base_difficulty,
-            timestamp=echo.timestamp,
-            flavor_text=echo.flavor_text,
-            source_player_id=echo.source_player_id,
+    # Echoes 변환. 레거시 행(echo_id 없음)은 생성한 ID를 행에도 기록해
+    # 재로드/재시작 후에도 investigate(echo_id=...)로 같은 Echo를 찾게 한다
+    echoes = EchoStore()
+    for echo_model in model.echoes:
+        if not echo_model.echo_id:
+            echo_model.echo_id = new_echo_id()
+        echoes.append(
+            Echo(
+                echo_type=echo_model.echo_type,
+                visibility=echo_model.visibility,
+                base_difficulty=echo_model.base_difficulty,
+                timestamp=echo_model.timestamp,
+                flavor_text=echo_model.flavor_text,
+                source_player_id=echo_model.source_player_id,
+                category=echo_model.category,
+                expires_at=echo_model.expires_at,
+                count=echo_model.count or 1,
+                echo_id=echo_model.echo_id,
+            )
         )
-        for echo in model.echoes
-    ]
 
     # SensoryData 변환
     sensory_data = SensoryData.from_dict(model.sensory_data)
@@ -223,6 +278,7 @@ class PlayerState:
                 "resonance_shield": self.character.resonance_shield,
                 "status_tags": self.character.status_tags,
             },
+            "equipped_tags": self.equipped_tags,
         }
 
     @classmethod
@@ -260,6 +316,7 @@ class PlayerState:
             sub_y=sub_pos.get("sy", 0),
             sub_z=sub_pos.get("sz", 0),
             character=character,
+            equipped_tags=data.get("equipped_tags", []),
         )
 
 
@@ -299,6 +356,9 @@ class ITWEngine:
         self,
         axiom_data_path: str = "itw_214_divine_axioms.json",
         world_seed: Optional[int] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+        sub_grid_idle_evict_seconds: Optional[float] = None,
+        event_bus: Optional[EventBus] = None,
     ):
         """
         엔진 초기화
@@ -306,9 +366,18 @@ class ITWEngine:
         Args:
             axiom_data_path: Axiom 데이터 JSON 경로
             world_seed: 월드 생성 시드 (재현성)
+            session_factory: 서브 그리드 인스턴스·글로벌 훅 영속화용 세션 팩토리
+                (None이면 메모리 전용)
+            sub_grid_idle_evict_seconds: 마지막 퇴장 후 서브 그리드 인스턴스 축출까지 시간
+            event_bus: 서비스와 공유할 EventBus. 모듈 관리자가 이 버스의 아이템/NPC
+                이벤트로 노드 상태 캐시를 무효화한다 (None이면 엔진 전용 버스)
         """
         logger.info("Initializing v%s...", self.VERSION)
 
+        # 난수 스트림 (전역 random 상태 대신 용도별 스트림 사용)
+        self.rng = RNGProvider(world_seed)
+        self.tick_count = 0
+
         # 코어 시스템 초기화
         self.axiom_loader = AxiomLoader(axiom_data_path)
         self.world = WorldGenerator(self.axiom_loader, seed=world_seed)
@@ -320,15 +389,39 @@ class ITWEngine:
         )
         self.echo_manager = EchoManager(self.axiom_loader)
         self.resolution_engine = ResolutionEngine()
+        self.reachability = ReachabilityIndex(self.world, self.sub_grid_generator)
+        # 새 노드는 생성 시점 틱부터 자원 변동 (스냅샷 대기 중에도 기준 유지)
+        self.world.add_node_listener(self._stamp_resource_tick)
+        self.sub_grid_instances = SubGridInstanceManager(
+            self.sub_grid_generator,
+            session_factory=session_factory,
+            idle_evict_seconds=sub_grid_idle_evict_seconds,
+        )
 
         # 플레이어 세션
         self.players: dict[str, PlayerState] = {}
 
-        # 글로벌 이벤트 로그
-        self.global_hooks: list[dict] = []
+        # 좌표 소유 판정 (샤드 모드). 소유하지 않은 좌표로 이동하면 도착 처리
+        # (발견/탐험 Echo/모듈 알림)를 생략하고 소유 엔진의 complete_arrival()에 맡긴다.
+        # None이면 모든 좌표를 이 엔진이 소유
+        self.owns_position: Optional[Callable[[int, int], bool]] = None
+
+        # 동시 실행: 플레이어별 직렬 대기열 + 월드 청크 잠금
+        self.actors = ActorRegistry()
+        self.chunk_locks = ChunkLockTable()
+        # 서브 그리드 공유 상태(생성기 층/셀, 인스턴스 관리자) 보호 - 청크 잠금과
+        # 무관하게 모든 인스턴스가 같은 자료구조를 쓰므로 이 잠금 하나로 직렬화
+        self._instances_lock = threading.RLock()
+
+        # 글로벌 이벤트 로그 (만료 힙 + 피드, 세션 팩토리가 있으면 영속화)
+        self.global_hooks = GlobalHookStore(session_factory=session_factory)
+        self.global_hooks.load()
+
+        # 스냅샷 백그라운드 기록기 (첫 비동기 저장 시 생성)
+        self._snapshot_writer: Optional[SnapshotWriter] = None
 
         # === 모듈 시스템 초기화 (기존 인스턴스 래핑) ===
-        self._module_manager = ModuleManager()
+        self._module_manager = ModuleManager(event_bus=event_bus)
 
         geography = GeographyModule(
             world_generator=self.world,
@@ -353,6 +446,17 @@ class ITWEngine:
 
     # === 플레이어 관리 ===
 
+    def _anchor_of(self, player_id: str) -> tuple[int, int]:
+        """청크 잠금 기준 좌표 (서브 그리드 안이면 부모 좌표, 미등록이면 0,0)"""
+        player = self.players.get(player_id)
+        if player is None:
+            return (0, 0)
+        if player.in_sub_grid and player.sub_grid_parent:
+            parent_x, parent_y = player.sub_grid_parent.split("_")
+            return (int(parent_x), int(parent_y))
+        return (player.x, player.y)
+
+    @_player_command()
     def register_player(self, player_id: str) -> PlayerState:
         """새 플레이어 등록"""
         if player_id in self.players:
@@ -394,6 +498,7 @@ class ITWEngine:
 
     # === 핵심 게임 액션 ===
 
+    @_player_command(radius=1)
     def look(self, player_id: str) -> ActionResult:
         """현재 위치 관찰"""
         player = self.get_player(player_id)
@@ -409,6 +514,7 @@ class ITWEngine:
             location_view=view,
         )
 
+    @_player_command(radius=2)
     def move(self, player_id: str, direction: str) -> ActionResult:
         """이동"""
         player = self.get_player(player_id)
@@ -444,6 +550,11 @@ class ITWEngine:
         if not dir_enum:
             return ActionResult(False, "move", f"알 수 없는 방향: {direction}")
 
+        # 도착 처리 주체 (다른 샤드 좌표면 그 샤드가 complete_arrival로 처리)
+        arrive_here = self.owns_position is None or self.owns_position(
+            player.x + dir_enum.dx, player.y + dir_enum.dy
+        )
+
         # 이동 실행
         result = self.navigator.travel(
             player.x,
@@ -452,6 +563,8 @@ class ITWEngine:
             player.player_id,
             player.supply,
             player_inventory=player.equipped_tags,
+            rng=self.rng.player(player.player_id),
+            describe=arrive_here,
         )
 
         if result.success:
@@ -459,21 +572,8 @@ class ITWEngine:
             player.x += dir_enum.dx
             player.y += dir_enum.dy
             player.supply -= result.supply_consumed
-
-            # 발견 노드 기록
-            coord = f"{player.x}_{player.y}"
-            if coord not in player.discovered_nodes:
-                player.discovered_nodes.append(coord)
-
             player.last_action_time = datetime.utcnow().isoformat()
 
-            # 탐험 Echo 생성
-            current_node = self.world.get_node(player.x, player.y)
-            if current_node:
-                self.echo_manager.create_echo(
-                    EchoCategory.EXPLORATION, current_node, player.player_id
-                )
-
             data: dict[str, Any] = {
                 "supply_consumed": result.supply_consumed,
                 "remaining_supply": player.supply,
@@ -481,8 +581,8 @@ class ITWEngine:
             if result.encounter:
                 data["encounter"] = result.encounter
 
-            # 모듈 알림 (이동 성공 시)
-            self._notify_modules_node_enter(player.player_id, player.x, player.y)
+            if arrive_here:
+                self._record_arrival(player)
 
             return ActionResult(
                 success=True,
@@ -496,6 +596,39 @@ class ITWEngine:
                 success=False, action_type="move", message=result.message
             )
 
+    def _record_arrival(self, player: PlayerState) -> None:
+        """메인 그리드 도착 처리: 발견 기록 + 탐험 Echo + 모듈 알림"""
+        coord = f"{player.x}_{player.y}"
+        if coord not in player.discovered_nodes:
+            player.discovered_nodes.append(coord)
+
+        current_node = self.world.get_node(player.x, player.y)
+        if current_node:
+            self.echo_manager.create_echo(
+                EchoCategory.EXPLORATION,
+                current_node,
+                player.player_id,
+                rng=self.rng.player(player.player_id),
+            )
+
+        self._notify_modules_node_enter(player.player_id, player.x, player.y)
+
+    @_player_command(radius=1)
+    def complete_arrival(self, player_id: str) -> Optional[LocationView]:
+        """
+        다른 엔진에서 이동해 온 플레이어의 도착 처리 (샤드 핸드오프)
+
+        출발 엔진이 owns_position으로 생략한 발견/탐험 Echo/모듈 알림을
+        이 엔진의 노드에 적용하고 도착 위치 뷰를 반환한다.
+        """
+        player = self.get_player(player_id)
+        if not player:
+            return None
+        self.world.get_or_generate(player.x, player.y)
+        view = self.navigator.get_location_view(player.x, player.y, player_id)
+        self._record_arrival(player)
+        return view
+
     def _move_in_sub_grid(self, player: PlayerState, direction: str) -> ActionResult:
         """서브 그리드 내 이동 (up/down 포함)"""
         # 방향 파싱 (서브 그리드는 N/S/E/W + UP/DOWN)
@@ -535,18 +668,22 @@ class ITWEngine:
         parent_node = self.world.get_node(parent_x, parent_y)
         depth_tier = parent_node.tier.value if parent_node else 1
 
-        # 서브 그리드 이동 실행
-        result = self.navigator.travel_sub_grid(
-            parent_x=parent_x,
-            parent_y=parent_y,
-            sx=player.sub_x,
-            sy=player.sub_y,
-            sz=player.sub_z,
-            direction=dir_enum,
-            depth_tier=depth_tier,
-            current_supply=player.supply,
-            player_inventory=player.equipped_tags,
-        )
+        with self._instances_lock:
+            # 축출된 인스턴스 안에서 복원된 플레이어 대비 (이미 로드/점유 중이면 no-op)
+            self.sub_grid_instances.enter(f"{parent_x}_{parent_y}", player.player_id)
+
+            # 서브 그리드 이동 실행 (층/셀 지연 생성)
+            result = self.navigator.travel_sub_grid(
+                parent_x=parent_x,
+                parent_y=parent_y,
+                sx=player.sub_x,
+                sy=player.sub_y,
+                sz=player.sub_z,
+                direction=dir_enum,
+                depth_tier=depth_tier,
+                current_supply=player.supply,
+                player_inventory=player.equipped_tags,
+            )
 
         if result.success:
             # 플레이어 상태 업데이트
@@ -578,8 +715,16 @@ class ITWEngine:
                 success=False, action_type="move", message=result.message
             )
 
-    def investigate(self, player_id: str, echo_index: int = 0) -> ActionResult:
-        """Echo 조사 (d6 Dice Pool 시스템)"""
+    @_player_command()
+    def investigate(
+        self, player_id: str, echo_index: int = 0, echo_id: Optional[str] = None
+    ) -> ActionResult:
+        """
+        Echo 조사 (d6 Dice Pool 시스템)
+
+        echo_id가 주어지면 해당 Echo를 조사한다 (권장, 소멸에도 안정적).
+        없으면 숨겨진 Echo 목록의 echo_index 위치를 조사한다 (하위 호환).
+        """
         player = self.get_player(player_id)
         if not player:
             return ActionResult(False, "investigate", "플레이어를 찾을 수 없습니다.")
@@ -588,23 +733,32 @@ class ITWEngine:
         if not node:
             return ActionResult(False, "investigate", "현재 위치를 찾을 수 없습니다.")
 
-        # 숨겨진 Echo 목록
-        hidden_echoes = self.echo_manager.get_hidden_echoes(node)
-        if not hidden_echoes:
+        # 숨겨진 Echo 유무 (목록 복사는 번호로 고를 때만)
+        hidden_count = node.echoes.count_visibility(EchoVisibility.HIDDEN.value)
+        if not hidden_count:
             return ActionResult(
                 success=False,
                 action_type="investigate",
                 message="조사할 숨겨진 흔적이 없습니다.",
             )
 
-        if echo_index >= len(hidden_echoes):
+        if echo_id is not None:
+            found = self.echo_manager.find_hidden_echo(node, echo_id)
+            if found is None:
+                return ActionResult(
+                    success=False,
+                    action_type="investigate",
+                    message=f"흔적을 찾을 수 없습니다 (이미 사라졌을 수 있음): {echo_id}",
+                )
+            target_echo = found
+        elif echo_index >= hidden_count:
             return ActionResult(
                 success=False,
                 action_type="investigate",
                 message=f"유효하지 않은 흔적 번호: {echo_index}",
             )
-
-        target_echo = hidden_echoes[echo_index]
+        else:
+            target_echo = self.echo_manager.get_hidden_echoes(node)[echo_index]
 
         # 난이도 계산
         difficulty_info = self.echo_manager.calculate_investigation_difficulty(
@@ -619,6 +773,7 @@ class ITWEngine:
             difficulty=final_difficulty,
             bonus_dice=0,
             risk_penalty=player.investigation_penalty,
+            rng=self.rng.player(player_id),
         )
 
         # echo_manager.investigate() 호출
@@ -638,6 +793,7 @@ class ITWEngine:
         # 결과 데이터에 판정 정보 추가
         result_data = {
             **investigation,
+            "echo_id": target_echo.echo_id,
             "check": {
                 "rolls": check_result.rolls,
                 "hits": check_result.hits,
@@ -653,6 +809,7 @@ class ITWEngine:
             data=result_data,
         )
 
+    @_player_command()
     def harvest(
         self, player_id: str, resource_id: str, amount: int = 1
     ) -> ActionResult:
@@ -691,7 +848,9 @@ class ITWEngine:
         player.inventory[resource_id] = player.inventory.get(resource_id, 0) + harvested
 
         # 채취 Echo 생성
-        self.echo_manager.create_echo(EchoCategory.CRAFTING, node, player_id)
+        self.echo_manager.create_echo(
+            EchoCategory.CRAFTING, node, player_id, rng=self.rng.player(player_id)
+        )
 
         player.last_action_time = datetime.utcnow().isoformat()
 
@@ -707,6 +866,7 @@ class ITWEngine:
             },
         )
 
+    @_player_command()
     def rest(self, player_id: str) -> ActionResult:
         """휴식 (Supply 회복)"""
         player = self.get_player(player_id)
@@ -741,6 +901,16 @@ class ITWEngine:
             data={"recovery": recovery, "current_supply": player.supply},
         )
 
+    def get_reachable_nodes(self, player_id: str, radius: int) -> dict[str, int]:
+        """플레이어가 현재 장비로 radius 이동 이내 도달 가능한 노드 (퀘스트 배치용)"""
+        player = self.get_player(player_id)
+        if not player:
+            return {}
+        # 서브 그리드 BFS가 축출/생성 중인 셀을 읽지 않도록 인스턴스 잠금 안에서 조회
+        with self._instances_lock:
+            return self.reachability.reachable_within(player, radius)
+
+    @_player_command(radius=1)
     def get_compass(self, player_id: str) -> str:
         """ASCII 나침반 반환"""
         player = self.get_player(player_id)
@@ -784,6 +954,7 @@ class ITWEngine:
 
     # === 서브 그리드 진입/탈출 ===
 
+    @_player_command()
     def enter_depth(self, player_id: str) -> ActionResult:
         """서브 그리드(Depth)로 진입"""
         player = self.get_player(player_id)
@@ -810,15 +981,30 @@ class ITWEngine:
                 message="이 지역에는 진입할 수 있는 깊은 곳이 없습니다.",
             )
 
-        # 서브 그리드 입구 생성
+        parent_coordinate = f"{player.x}_{player.y}"
         depth_tier = node.tier.value  # 기본 난이도 = 노드 티어
-        entrance = self.sub_grid_generator.generate_entrance(
-            player.x, player.y, depth_tier
-        )
+        with self._instances_lock:
+            # 인스턴스 지연 로드 + 점유 등록 (생성보다 먼저: 저장된 셀 우선)
+            self.sub_grid_instances.enter(parent_coordinate, player.player_id)
+
+            # 서브 그리드 입구층 일괄 생성
+            floor = self.sub_grid_generator.generate_floor(
+                player.x, player.y, 0, depth_tier
+            )
+            entrance = floor.get_cell(0, 0)
+            if entrance is None:
+                self.sub_grid_instances.leave(parent_coordinate, player.player_id)
+
+        if entrance is None:
+            return ActionResult(
+                success=False,
+                action_type="enter",
+                message="입구를 찾을 수 없습니다.",
+            )
 
         # 플레이어 상태 업데이트
         player.in_sub_grid = True
-        player.sub_grid_parent = f"{player.x}_{player.y}"
+        player.sub_grid_parent = parent_coordinate
         player.sub_x = 0
         player.sub_y = 0
         player.sub_z = 0
@@ -852,6 +1038,7 @@ class ITWEngine:
             location_view=location_view,
         )
 
+    @_player_command(radius=1)
     def exit_depth(self, player_id: str) -> ActionResult:
         """서브 그리드에서 메인 그리드로 복귀"""
         player = self.get_player(player_id)
@@ -877,6 +1064,11 @@ class ITWEngine:
                 message="입구 위치로 이동해야 합니다. (현재 위치에서 벗어남)",
             )
 
+        # 인스턴스 점유 해제 (마지막 퇴장이면 유휴 타이머 시작)
+        if player.sub_grid_parent:
+            with self._instances_lock:
+                self.sub_grid_instances.leave(player.sub_grid_parent, player_id)
+
         # 플레이어 상태 업데이트
         player.in_sub_grid = False
         player.sub_grid_parent = None
@@ -898,8 +1090,33 @@ class ITWEngine:
             location_view=view,
         )
 
+    def evict_idle_sub_grids(self) -> int:
+        """
+        유휴 서브 그리드 인스턴스 축출 (저장 후 메모리 해제)
+
+        DB 저장이 포함되므로 플레이어 명령 경로가 아닌 주기 작업
+        (main.py 스위퍼, 샤드 워커 루프, daily_tick)에서 호출한다.
+        잠금은 인스턴스 단위로 잡아 느린 저장이 진입/퇴장을 오래 막지 않게 하고,
+        저장 실패한 인스턴스는 메모리에 남겨 다음 주기에 재시도한다.
+        """
+        with self._instances_lock:
+            candidates = self.sub_grid_instances.idle_expired()
+        evicted = 0
+        for parent_coordinate in candidates:
+            with self._instances_lock:
+                if not self.sub_grid_instances.evict_if_idle(parent_coordinate):
+                    continue
+                self.reachability.invalidate_sub_grid(parent_coordinate)
+                # 부모 노드 키에 셀 위치별로 쌓인 모듈 캐시 항목도 정리
+                self._module_manager.discard_node(parent_coordinate)
+            evicted += 1
+        if evicted:
+            logger.debug("Evicted %d idle sub-grid instances", evicted)
+        return evicted
+
     # === 글로벌 이벤트 ===
 
+    @_player_command()
     def trigger_global_event(self, player_id: str, event_type: str, description: str):
         """글로벌 이벤트 트리거"""
         player = self.get_player(player_id)
@@ -913,7 +1130,7 @@ class ITWEngine:
             event_type=event_type, location_hint=location_hint, description=description
         )
 
-        self.global_hooks.append(hook)
+        self.global_hooks.add(hook)
 
         # 보스 처치 시 특수 Echo 생성
         if event_type == "boss_kill" and node:
@@ -928,17 +1145,15 @@ class ITWEngine:
 
     def get_active_hooks(self) -> list[dict]:
         """활성 글로벌 훅 목록"""
-        now = datetime.utcnow()
-        active = []
-
-        for hook in self.global_hooks:
-            created = datetime.fromisoformat(hook["timestamp"])
-            hours_passed = (now - created).total_seconds() / 3600
+        return self.global_hooks.active()
 
-            if hours_passed < hook.get("expires_in_hours", 24):
-                active.append(hook)
-
-        return active
+    def get_global_feed(
+        self,
+        cursor: int | None = None,
+        limit: int = GlobalHookStore.DEFAULT_FEED_LIMIT,
+    ) -> tuple[list[dict], int | None]:
+        """최근 글로벌 이벤트 피드 (최신순, 커서 페이지네이션)"""
+        return self.global_hooks.feed(cursor=cursor, limit=limit)
 
     # === 월드 관리 ===
 
@@ -998,6 +1213,10 @@ class ITWEngine:
                         timestamp=echo.timestamp,
                         flavor_text=echo.flavor_text,
                         source_player_id=echo.source_player_id,
+                        category=echo.category,
+                        expires_at=echo.expires_at,
+                        count=echo.count,
+                        echo_id=echo.echo_id,
                     )
                     session.add(new_echo_model)
             else:
@@ -1023,6 +1242,10 @@ class ITWEngine:
                         timestamp=echo.timestamp,
                         flavor_text=echo.flavor_text,
                         source_player_id=echo.source_player_id,
+                        category=echo.category,
+                        expires_at=echo.expires_at,
+                        count=echo.count,
+                        echo_id=echo.echo_id,
                     )
                     session.add(new_echo)
 
@@ -1049,6 +1272,18 @@ class ITWEngine:
             self.world.nodes[node.coordinate] = node
             loaded_count += 1
 
+        # 레거시 Echo에 부여한 ID 저장
+        if session.dirty:
+            session.commit()
+
+        # 소멸 색인 재구성 (교체된 노드의 옛 항목 제거, 재로드 시 중복 방지)
+        self.echo_manager.clear_expiry_index()
+        for node in self._resident_nodes():
+            self.echo_manager.index_node(node)
+
+        # 로드된 노드의 required_tags가 기존 캐시와 다를 수 있음
+        self.reachability.clear()
+
         return loaded_count
 
     def save_players_to_db(self, session: Session) -> int:
@@ -1109,21 +1344,110 @@ class ITWEngine:
 
         return loaded_count
 
+    # === 스냅샷 ===
+
+    def capture_snapshot(self) -> EngineSnapshot:
+        """
+        엔진 전체 상태의 일관된 사본 (월드 잠금 안에서 바이트로 인코딩)
+
+        스냅샷에서 아직 복원되지 않은 노드는 원본 레코드를 그대로 옮긴다.
+        """
+        with self.chunk_locks.hold_all(), self._instances_lock:
+            if isinstance(self.world.nodes, LazyNodeStore):
+                items = self.world.nodes.raw_items()
+            else:
+                items = list(self.world.nodes.items())
+            return EngineSnapshot.build(
+                world_seed=self.world.seed,
+                tick_count=self.tick_count,
+                nodes=(
+                    (coord, node if isinstance(node, bytes) else encode_node(node))
+                    for coord, node in items
+                ),
+                players=[player.to_dict() for player in self.players.values()],
+                global_hooks=self.global_hooks.export_state(),
+                sub_grid=self.sub_grid_instances.export_state(),
+            )
+
+    def save_snapshot(self, filepath: str) -> int:
+        """
+        스냅샷 파일 기록 (동기, 원자적 교체)
+
+        Returns:
+            기록된 바이트 수
+        """
+        return write_snapshot(self.capture_snapshot(), filepath)
+
+    def save_snapshot_async(self, filepath: str) -> "Future[int]":
+        """사본은 즉시 캡처하고 파일 기록은 백그라운드 스레드에서 진행"""
+        if self._snapshot_writer is None:
+            self._snapshot_writer = SnapshotWriter()
+        return self._snapshot_writer.submit(self.capture_snapshot(), filepath)
+
+    def load_snapshot(self, filepath: str) -> int:
+        """
+        스냅샷 적재 (노드는 첫 접근 시 복원)
+
+        Returns:
+            스냅샷의 노드 수
+
+        Raises:
+            SnapshotError: 파일 손상 또는 월드 시드 불일치
+        """
+        reader = SnapshotReader(filepath)
+        meta = reader.meta
+        if meta.get("world_seed") != self.world.seed:
+            reader.close()
+            raise SnapshotError(
+                f"Snapshot world seed {meta.get('world_seed')} "
+                f"does not match engine seed {self.world.seed}"
+            )
+
+        with self.chunk_locks.hold_all(), self._instances_lock:
+            if isinstance(self.world.nodes, LazyNodeStore):
+                self.world.nodes.close()
+            self.echo_manager.clear_expiry_index()
+            self.world.nodes = LazyNodeStore(
+                reader, on_materialize=self._on_node_materialized
+            )
+            self.reachability.clear()
+
+            self.players = {
+                data["player_id"]: PlayerState.from_dict(data)
+                for data in meta["players"]
+            }
+            self.tick_count = meta["tick_count"]
+            self.global_hooks.restore_state(meta["global_hooks"])
+            self.sub_grid_instances.restore_state(meta["sub_grid"])
+
+        logger.info(
+            "Snapshot loaded: %s (%d nodes, %d players)",
+            filepath,
+            reader.node_count,
+            len(self.players),
+        )
+        return reader.node_count
+
     def daily_tick(self):
         """일일 월드 업데이트"""
         logger.info("Daily tick processing...")
-
-        # 모든 노드의 자원 갱신 및 Echo 정리
-        for coord, node in self.world.nodes.items():
-            # 자원 일일 변동
-            for resource in node.resources:
-                resource.daily_decay()
-                resource.regenerate(rate=0.05)
-
-            # Echo 시간 경과 처리
-            removed = self.echo_manager.decay_echoes(node)
+        self.tick_count += 1
+
+        # 월드 전체 잠금 (진행 중인 플레이어 액션이 끝난 뒤 일괄 갱신)
+        with self.chunk_locks.hold_all():
+            # 메모리에 있는 노드만 자원 갱신 (스냅샷 대기 노드는 복원 시 따라잡음)
+            for node in self._resident_nodes():
+                if node.resource_tick is None:
+                    node.resource_tick = self.tick_count - 1
+                self._catch_up_resources(node)
+
+            # Echo 시간 경과 처리 (소멸 색인에서 만료분만)
+            removed = self.echo_manager.decay_expired()
             if removed > 0:
-                logger.debug("[%s] %d echoes decayed", coord, removed)
+                logger.debug("%d echoes decayed", removed)
+
+        # 유휴 서브 그리드 인스턴스 정리 (DB 저장은 청크 잠금 밖에서)
+        self.evict_idle_sub_grids()
 
         # 모듈 턴 처리
         if self._module_manager.get_enabled_modules():
@@ -1145,24 +1469,80 @@ class ITWEngine:
             "world": world_stats,
             "axioms": axiom_stats,
             "active_players": len(self.players),
-            "global_hooks": len(self.get_active_hooks()),
+            "global_hooks": self.global_hooks.active_count,
+            "sub_grid": self.sub_grid_instances.get_stats(),
+        }
+
+    def _catch_up_resources(self, node: MapNode) -> None:
+        """
+        노드 자원에 놓친 일일 변동을 현재 틱까지 적용
+
+        틱마다 (틱, 좌표)로 파생한 스트림을 쓰므로 상주 중에 갱신되든
+        복원 시 몰아서 갱신되든 결과가 같다. 기준 틱이 없는 노드(Safe Haven,
+        DB/구 스냅샷에서 읽은 노드)는 다음 일일 틱부터 적용한다.
+        """
+        if node.resource_tick is None:
+            return
+        while node.resource_tick < self.tick_count:
+            node.resource_tick += 1
+            rng = self.rng.tick(node.resource_tick, node.coordinate)
+            for resource in node.resources:
+                resource.daily_decay(rng)
+                resource.regenerate(rate=0.05)
+
+    def _stamp_resource_tick(self, node: MapNode) -> None:
+        if node.resource_tick is None:
+            node.resource_tick = self.tick_count
+
+    def _on_node_materialized(self, node: MapNode) -> None:
+        """스냅샷 노드 복원: 자원 변동 따라잡기 + Echo 소멸 색인 등록"""
+        self._catch_up_resources(node)
+        self.echo_manager.index_node(node)
+
+    def _resident_nodes(self) -> list[MapNode]:
+        """메모리에 올라온 노드 (스냅샷에서 아직 복원되지 않은 노드는 제외)"""
+        nodes = self.world.nodes
+        if isinstance(nodes, LazyNodeStore):
+            return nodes.resident_nodes()
+        return list(nodes.values())
+
+    def get_runtime_counts(self) -> dict[str, int]:
+        """메모리 상주 수치 (GET /metrics 게이지용)
+
+        스냅샷에서 아직 복원되지 않은 노드는 복원하지 않고 pending으로 센다.
+        Echo는 상주 노드만 센다.
+        """
+        nodes = self.world.nodes
+        resident = self._resident_nodes()
+        pending = nodes.pending_count if isinstance(nodes, LazyNodeStore) else 0
+        sub_grid = self.sub_grid_instances.get_stats()
+        return {
+            "nodes_resident": len(resident),
+            "nodes_pending": pending,
+            "players": len(self.players),
+            "sub_grid_instances": sub_grid["resident_instances"],
+            "sub_grid_cells": sub_grid["resident_cells"],
+            "echoes": sum(len(node.echoes) for node in resident),
+            "global_hooks": self.global_hooks.active_count,
         }
 
     # === 디버그 / 개발용 ===
 
+    @_player_command(radius=None)
     def debug_teleport(self, player_id: str, x: int, y: int) -> ActionResult:
         """[DEBUG] 텔레포트"""
         player = self.get_player(player_id)
         if not player:
             return ActionResult(False, "debug_teleport", "플레이어를 찾을 수 없습니다.")
 
-        # 목적지 노드 생성
-        self.world.get_or_generate(x, y)
+        with self.chunk_locks.hold((player.x, player.y), (x, y), radius=1):
+            # 목적지 노드 생성
+            self.world.get_or_generate(x, y)
 
-        player.x = x
-        player.y = y
+            player.x = x
+            player.y = y
 
-        view = self.navigator.get_location_view(x, y, player_id)
+            view = self.navigator.get_location_view(x, y, player_id)
 
         return ActionResult(
             success=True,
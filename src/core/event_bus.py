@@ -7,18 +7,95 @@ docs/30_technical/architecture.md "서비스 간 통신 원칙" 참조.
 - 이벤트는 식별자(ID)만 전달한다
 - 전파 깊이 최대 MAX_DEPTH 단계
 - 동일 원인에서 동일 이벤트 중복 발행 금지
+
+체인 상태(전파 깊이, 발행 기록)는 turn_scope() 안에서 contextvars로 분리된다.
+요청/턴마다 turn_scope()를 열면 하나의 버스를 여러 스레드가 공유해도
+서로의 깊이 계산이나 중복 차단에 섞이지 않는다.
+스코프 밖의 발행은 버스 기본 체인을 공유한다 (reset_chain()으로 초기화).
+
+비동기 발행(emit_async):
+- 핸들러는 일반 함수나 async 함수 모두 가능
+- 기본 핸들러는 등록 순서대로 하나씩 실행 (emit과 같은 순서)
+- independent=True로 등록한 핸들러는 순서 제약 없이 동시에 실행
+  (동기 핸들러는 스레드에서 실행되므로 스레드 안전해야 한다)
+- after=("핸들러 이름", ...)으로 선행 핸들러를 지정하면 그 핸들러가 끝난 뒤 실행
+- timeout(초)을 넘긴 핸들러는 경고 후 건너뜀 (선행 관계는 완료로 간주).
+  timeout이 있는 동기 핸들러는 루프를 막지 않도록 스레드에서 실행
+- 동시에 실행되는 핸들러는 각자의 전파 깊이를 갖고, 중복 발행 기록은 체인 전체가 공유
+
+지연 전달(deferred=True):
+- 응답에 영향이 없는 후처리 핸들러용. turn_scope() 안의 발행은 턴 큐에 쌓였다가
+  스코프 종료 시(또는 take_deferred()로 넘겨받은 쪽이 deliver_deferred()로) 전달된다
+- coalesce 키가 같은 이벤트는 마지막 것만 남긴다 (예: 한 플레이어의 연속 이동)
+- 지연 전달된 핸들러는 원래 깊이(발행 깊이 + 1)에서 각자의 체인으로 실행된다
+- 스코프 밖의 발행은 즉시 전달 (턴 경계가 없으므로)
+
+라우팅 구독(where={"player_id": "p1"}):
+- 페이로드 필드 값이 일치하는 이벤트만 받는다
+- 첫 필드 값으로 해시 인덱스에 등록되어, 발행 시 해당 값의 버킷만 조회한다
+  (플레이어/퀘스트가 늘어도 이벤트당 핸들러 호출 수는 늘지 않는다)
+- 전체 구독과 섞여도 호출 순서는 등록 순서를 따른다
+
+구독 목록/라우팅 인덱스의 변경과 발행 시 조회는 버스 잠금 아래에서 일어난다.
+발행은 잠금 안에서 병합한 복사본으로 핸들러를 호출하므로, 핸들러나 다른 스레드가
+실행 중에 구독/해제해도 진행 중인 전파에는 영향이 없다.
 """
 
-from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Any, Set
+import asyncio
+import heapq
+import inspect
+import itertools
+import threading
+import time
 from collections import defaultdict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Any,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from src.core.logging import get_logger
+from src.core.metrics import REGISTRY
+from src.core.tracing import TRACER
 
 logger = get_logger(__name__)
 
 MAX_DEPTH = 5  # 한 턴 내 이벤트 전파 최대 깊이
 
+# === 메트릭 (GET /metrics) ===
+
+EVENT_EMITS = REGISTRY.counter(
+    "itw_event_emits_total",
+    "EventBus events admitted for delivery",
+    ("event_type",),
+)
+EVENT_BLOCKED = REGISTRY.counter(
+    "itw_event_blocked_total",
+    "EventBus events dropped by the depth/duplicate guards",
+    ("event_type", "reason"),
+)
+EVENT_HANDLER_CALLS = REGISTRY.counter(
+    "itw_event_handler_calls_total",
+    "EventBus handler invocations",
+    ("event_type",),
+)
+EVENT_HANDLER_SECONDS = REGISTRY.counter(
+    "itw_event_handler_seconds_total",
+    "Time spent in EventBus handlers, including nested emits",
+    ("event_type",),
+)
+
 
 @dataclass
 class GameEvent:
@@ -38,98 +115,547 @@ class GameEvent:
     _depth: int = field(default=0, repr=False)
 
 
-# 핸들러 타입: GameEvent를 받는 callable
-EventHandler = Callable[[GameEvent], None]
+# 핸들러 타입: GameEvent를 받는 callable (async 함수 허용)
+EventHandler = Callable[[GameEvent], Union[None, Awaitable[None]]]
+
+# 지연 전달 병합 키 추출기
+CoalesceKey = Callable[[GameEvent], Hashable]
+
+
+def coalesce_by(*fields: str) -> CoalesceKey:
+    """event.data 필드 값으로 병합 키를 만드는 추출기"""
+
+    def key(event: GameEvent) -> Hashable:
+        return tuple(event.data.get(name) for name in fields)
+
+    return key
+
+
+def _record_handler(event: GameEvent, started: float) -> None:
+    EVENT_HANDLER_CALLS.inc(event.event_type)
+    EVENT_HANDLER_SECONDS.inc(event.event_type, amount=time.perf_counter() - started)
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    """구독 1건 (핸들러 + 실행 선언)"""
+
+    handler: EventHandler
+    name: str
+    independent: bool = False
+    after: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    deferred: bool = False
+    coalesce: Optional[CoalesceKey] = None
+    where: Tuple[Tuple[str, Hashable], ...] = ()  # 라우팅 조건 (첫 필드가 인덱스 키)
+    seq: int = 0  # 등록 순번 (전체/라우팅 구독 병합 순서)
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.handler)
+
+    def matches(self, event: GameEvent) -> bool:
+        return all(event.data.get(name) == value for name, value in self.where)
+
+
+@dataclass
+class _ChainState:
+    """이벤트 체인 1회분의 추적 상태"""
+
+    depth: int = 0
+    emitted: Set[str] = field(default_factory=set)  # "source:event_type"
+    scoped: bool = False  # turn_scope 안인지 (지연 전달 큐 사용 여부)
+    # 지연 전달 큐: 병합 키 → (구독, 이벤트), 삽입 순서 = 전달 순서
+    deferred: Dict[Hashable, Tuple[_Subscription, GameEvent]] = field(
+        default_factory=dict
+    )
 
 
 class EventBus:
-    """동기식 이벤트 버스
+    """이벤트 버스 (동기 emit + 비동기 emit_async)
 
     사용 패턴:
         bus = EventBus()
         bus.subscribe("npc_promoted", memory_module.handle_npc_promoted)
-        bus.emit(GameEvent(event_type="npc_promoted", data={"npc_id": "abc"}, source="npc_core"))
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="npc_promoted", data={"npc_id": "abc"}, source="npc_core"))
     """
 
     def __init__(self) -> None:
-        self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
-        self._current_depth: int = 0
-        self._emitted_in_chain: Set[str] = set()  # "source:event_type" 중복 방지
-
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
-        """이벤트 구독 등록"""
-        self._handlers[event_type].append(handler)
-        logger.debug(f"EventBus 구독: {event_type} → {handler.__qualname__}")
-
-    def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
-        """이벤트 구독 해제"""
-        if event_type in self._handlers:
+        self._handlers: Dict[str, List[_Subscription]] = defaultdict(list)
+        # 라우팅 구독: event_type → 필드 → 값 → 구독 목록
+        self._routes: Dict[str, Dict[str, Dict[Hashable, List[_Subscription]]]] = (
+            defaultdict(dict)
+        )
+        self._subscription_seq = itertools.count()
+        # 구독 목록/라우팅 인덱스 변경 및 조회 보호 (핸들러 호출 중에는 잡지 않음)
+        self._subscriptions_lock = threading.Lock()
+        self._default_chain = _ChainState()  # turn_scope 밖에서 공유
+        self._chain: ContextVar[Optional[_ChainState]] = ContextVar(
+            f"event_chain_{id(self)}", default=None
+        )
+        self._deferred_seq = itertools.count()  # 병합하지 않는 항목의 고유 키
+
+    # === 체인 상태 ===
+
+    def _state(self) -> _ChainState:
+        """현재 컨텍스트의 체인 (스코프 밖이면 기본 체인)"""
+        return self._chain.get() or self._default_chain
+
+    @property
+    def _current_depth(self) -> int:
+        return self._state().depth
+
+    @property
+    def _emitted_in_chain(self) -> Set[str]:
+        return self._state().emitted
+
+    @contextmanager
+    def turn_scope(self) -> Iterator[None]:
+        """요청/턴 1회분의 독립 체인을 연다 (종료 시 이전 체인으로 복귀)
+
+        contextvars 기반이라 스레드별, asyncio 태스크별로 분리된다.
+        중첩하면 안쪽 스코프가 새 턴이 된다.
+        종료 시 아직 넘겨지지 않은 지연 이벤트를 전달한다.
+        """
+        chain = _ChainState(scoped=True)
+        token = self._chain.set(chain)
+        try:
+            yield
+        finally:
+            self._chain.reset(token)
+            self.deliver_deferred(self._drain(chain))
+
+    # === 지연 전달 ===
+
+    def _defer(
+        self, chain: _ChainState, subscription: _Subscription, event: GameEvent
+    ) -> None:
+        """턴 큐에 적재 (같은 병합 키는 최신 이벤트로 교체, 순서는 맨 뒤로)"""
+        if subscription.coalesce is not None:
+            key: Hashable = (subscription, subscription.coalesce(event))
+            chain.deferred.pop(key, None)
+        else:
+            key = (subscription, next(self._deferred_seq))
+        chain.deferred[key] = (subscription, event)
+
+    @staticmethod
+    def _drain(chain: _ChainState) -> List[Tuple[_Subscription, GameEvent]]:
+        batch = list(chain.deferred.values())
+        chain.deferred.clear()
+        return batch
+
+    def take_deferred(self) -> List[Tuple[_Subscription, GameEvent]]:
+        """현재 턴에 쌓인 지연 이벤트를 꺼낸다 (응답 후 전달하려는 호출자용)"""
+        return self._drain(self._state())
+
+    def deliver_deferred(self, batch: List[Tuple[_Subscription, GameEvent]]) -> int:
+        """지연 이벤트 전달 (항목마다 독립 체인, 발행 깊이 + 1에서 실행)
+
+        Returns:
+            전달한 핸들러 호출 수 (전달 중 새로 지연된 것 포함)
+        """
+        delivered = 0
+        for subscription, event in batch:
+            chain = _ChainState(depth=event._depth + 1, scoped=True)
+            token = self._chain.set(chain)
             try:
-                self._handlers[event_type].remove(handler)
-                logger.debug(
-                    f"EventBus 구독 해제: {event_type} → {handler.__qualname__}"
-                )
-            except ValueError:
-                logger.warning(f"핸들러 미등록: {event_type} → {handler.__qualname__}")
+                self._call(subscription, event)
+            finally:
+                self._chain.reset(token)
+            delivered += 1 + self.deliver_deferred(self._drain(chain))
+        return delivered
 
-    def emit(self, event: GameEvent) -> None:
-        """이벤트 발행. 등록된 핸들러를 동기 호출.
+    # === 구독 / 발행 ===
 
-        안전장치:
-        1. 전파 깊이 MAX_DEPTH 초과 시 무시
-        2. 동일 source에서 동일 event_type 중복 발행 시 무시
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        name: Optional[str] = None,
+        independent: bool = False,
+        after: Tuple[str, ...] = (),
+        timeout: Optional[float] = None,
+        deferred: bool = False,
+        coalesce: Optional[CoalesceKey] = None,
+        where: Optional[Dict[str, Hashable]] = None,
+    ) -> None:
+        """이벤트 구독 등록
+
+        Args:
+            name: after에서 참조할 핸들러 이름 (기본: handler.__qualname__)
+            independent: 다른 핸들러와 순서 무관 (emit_async에서 동시 실행)
+            after: 먼저 끝나야 하는 같은 이벤트의 핸들러 이름들
+            timeout: emit_async에서 핸들러 최대 실행 시간 (초). 동기 핸들러는
+                스레드에서 실행하며, 초과 시 결과를 기다리지 않을 뿐 중단되지는 않음
+            deferred: 턴 종료 후 지연 전달 (turn_scope 안의 발행만)
+            coalesce: 지연 큐 병합 키 추출기 (예: coalesce_by("player_id"))
+            where: 라우팅 조건. event.data의 필드 값이 모두 같을 때만 호출
+                (예: {"player_id": "p1"}, 첫 필드 값으로 인덱싱)
+
+        Raises:
+            ValueError: after 선언이 순환을 만드는 경우, where가 비어 있는 경우
         """
+        if where is not None and not where:
+            raise ValueError("EventBus where 조건이 비어 있음")
+        subscription = _Subscription(
+            handler=handler,
+            name=name or handler.__qualname__,
+            independent=independent,
+            after=tuple(after),
+            timeout=timeout,
+            deferred=deferred,
+            coalesce=coalesce,
+            where=tuple(where.items()) if where else (),
+            seq=next(self._subscription_seq),
+        )
+        with self._subscriptions_lock:
+            subscriptions = self._bucket(event_type, subscription.where)
+            subscriptions.append(subscription)
+            try:
+                if subscription.where:
+                    self._plan(self._merge(self._handlers[event_type], [subscriptions]))
+                else:
+                    self._plan(subscriptions)
+            except ValueError:
+                subscriptions.pop()
+                self._prune_bucket(event_type, subscription.where)
+                raise
+        logger.debug(f"EventBus 구독: {event_type} → {subscription.name}")
+
+    def unsubscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        where: Optional[Dict[str, Hashable]] = None,
+    ) -> None:
+        """이벤트 구독 해제 (라우팅 구독은 등록 시의 where로 지정)"""
+        route = tuple(where.items()) if where else ()
+        with self._subscriptions_lock:
+            subscriptions = self._find_bucket(event_type, route)
+            if subscriptions is not None:
+                for index, subscription in enumerate(subscriptions):
+                    if subscription.handler == handler and subscription.where == route:
+                        del subscriptions[index]
+                        self._prune_bucket(event_type, route)
+                        logger.debug(
+                            f"EventBus 구독 해제: {event_type} → {handler.__qualname__}"
+                        )
+                        return
+        logger.warning(f"핸들러 미등록: {event_type} → {handler.__qualname__}")
+
+    # === 라우팅 인덱스 ===
+
+    # 아래 인덱스 메서드는 _subscriptions_lock을 잡은 상태에서만 호출한다
+
+    def _bucket(
+        self, event_type: str, route: Tuple[Tuple[str, Hashable], ...]
+    ) -> List[_Subscription]:
+        """구독 목록 생성/조회 (route가 없으면 전체 구독, 있으면 첫 필드 값의 버킷)"""
+        if not route:
+            return self._handlers[event_type]
+        field_name, value = route[0]
+        index = self._routes[event_type].setdefault(field_name, {})
+        return index.setdefault(value, [])
+
+    def _find_bucket(
+        self, event_type: str, route: Tuple[Tuple[str, Hashable], ...]
+    ) -> Optional[List[_Subscription]]:
+        """구독 목록 조회 (없으면 None, 생성하지 않음)"""
+        if not route:
+            return self._handlers.get(event_type)
+        field_name, value = route[0]
+        return self._routes.get(event_type, {}).get(field_name, {}).get(value)
+
+    def _prune_bucket(
+        self, event_type: str, route: Tuple[Tuple[str, Hashable], ...]
+    ) -> None:
+        """빈 버킷/인덱스 정리 (플레이어가 떠난 뒤 키가 남지 않도록)"""
+        if not route:
+            return
+        routes = self._routes.get(event_type)
+        field_name, value = route[0]
+        if routes is None or field_name not in routes:
+            return
+        index = routes[field_name]
+        if not index.get(value, True):
+            del index[value]
+        if not index:
+            del routes[field_name]
+        if not routes:
+            del self._routes[event_type]
+
+    def _routed(self, event: GameEvent) -> List[List[_Subscription]]:
+        """이벤트 페이로드 값으로 조회한 라우팅 구독 (필드별, 등록 순서)"""
+        routes = self._routes.get(event.event_type)
+        if not routes:
+            return []
+        matched: List[List[_Subscription]] = []
+        for field_name, index in routes.items():
+            try:
+                bucket = index.get(event.data.get(field_name))
+            except TypeError:  # 해시 불가 값 (list 등)
+                continue
+            if bucket:
+                matched.append([sub for sub in bucket if sub.matches(event)])
+        return matched
+
+    @staticmethod
+    def _merge(
+        subscriptions: List[_Subscription], routed: List[List[_Subscription]]
+    ) -> List[_Subscription]:
+        """전체 구독과 라우팅 구독을 등록 순서로 병합"""
+        if not routed:
+            return list(subscriptions)
+        return list(
+            heapq.merge(
+                subscriptions, *routed, key=lambda subscription: subscription.seq
+            )
+        )
+
+    def _admit(self, event: GameEvent, chain: _ChainState) -> bool:
+        """안전장치 통과 여부 (통과하면 체인에 발행 기록)"""
         # 깊이 체크
-        if self._current_depth >= MAX_DEPTH:
+        if chain.depth >= MAX_DEPTH:
             logger.warning(
                 f"EventBus 전파 깊이 초과 ({MAX_DEPTH}): "
                 f"{event.source}:{event.event_type} 무시됨"
             )
-            return
+            EVENT_BLOCKED.inc(event.event_type, "depth")
+            return False
 
         # 중복 체크
         chain_key = f"{event.source}:{event.event_type}"
-        if chain_key in self._emitted_in_chain:
+        if chain_key in chain.emitted:
             logger.warning(f"EventBus 중복 이벤트 차단: {chain_key}")
-            return
+            EVENT_BLOCKED.inc(event.event_type, "duplicate")
+            return False
 
-        self._emitted_in_chain.add(chain_key)
-        event._depth = self._current_depth
+        chain.emitted.add(chain_key)
+        event._depth = chain.depth
+        EVENT_EMITS.inc(event.event_type)
+        return True
 
-        handlers = self._handlers.get(event.event_type, [])
-        if not handlers:
+    def _subscriptions_for(
+        self, event: GameEvent, chain: _ChainState
+    ) -> List[_Subscription]:
+        with self._subscriptions_lock:
+            subscriptions = self._merge(
+                self._handlers.get(event.event_type, []), self._routed(event)
+            )
+        if not subscriptions:
             logger.debug(f"EventBus: {event.event_type} 구독자 없음")
-            return
+            return subscriptions
 
         logger.info(
             f"EventBus 전파: {event.event_type} (source={event.source}, "
-            f"depth={self._current_depth}, handlers={len(handlers)})"
+            f"depth={chain.depth}, handlers={len(subscriptions)})"
         )
+        return subscriptions
+
+    def emit(self, event: GameEvent) -> None:
+        """이벤트 발행. 등록된 핸들러를 등록 순서대로 동기 호출.
 
-        self._current_depth += 1
+        안전장치:
+        1. 전파 깊이 MAX_DEPTH 초과 시 무시
+        2. 동일 source에서 동일 event_type 중복 발행 시 무시
+
+        async 핸들러는 실행 중인 이벤트 루프가 없을 때만 완료까지 실행한다
+        (루프 안에서는 emit_async를 써야 한다).
+        """
+        chain = self._state()
+        if not self._admit(event, chain):
+            return
+        subscriptions = self._subscriptions_for(event, chain)
+        if not subscriptions:
+            return
+
+        chain.depth += 1
         try:
-            for handler in handlers:
-                try:
-                    handler(event)
-                except Exception:
-                    logger.exception(
-                        f"EventBus 핸들러 에러: {handler.__qualname__} "
-                        f"(event={event.event_type})"
+            with TRACER.span(
+                f"emit:{event.event_type}",
+                "event",
+                source=event.source,
+                depth=event._depth,
+            ):
+                for subscription in subscriptions:
+                    if subscription.deferred and chain.scoped:
+                        self._defer(chain, subscription, event)
+                    else:
+                        self._call(subscription, event)
+        finally:
+            chain.depth -= 1
+
+    def _call(self, subscription: _Subscription, event: GameEvent) -> None:
+        """핸들러 1개 동기 호출 (예외는 기록만)"""
+        if subscription.is_async:
+            self._run_async_from_sync(subscription, event)  # 시간은 _invoke가 기록
+            return
+        started = time.perf_counter()
+        try:
+            with TRACER.span(
+                f"handler:{subscription.name}", "handler", event_type=event.event_type
+            ):
+                subscription.handler(event)
+        except Exception:
+            logger.exception(
+                f"EventBus 핸들러 에러: {subscription.name} (event={event.event_type})"
+            )
+        finally:
+            _record_handler(event, started)
+
+    def _run_async_from_sync(
+        self, subscription: _Subscription, event: GameEvent
+    ) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._invoke(subscription, event))
+            return
+        logger.warning(
+            f"EventBus: 이벤트 루프 안의 emit에서 async 핸들러 건너뜀 "
+            f"({subscription.name}, event={event.event_type}) - emit_async 사용"
+        )
+
+    # === 비동기 발행 ===
+
+    @staticmethod
+    def _plan(subscriptions: List[_Subscription]) -> List[Set[int]]:
+        """
+        핸들러별 선행 핸들러 인덱스
+
+        기본 핸들러는 앞서 등록된 기본 핸들러 전부를 기다리고(등록 순서 유지),
+        independent 핸들러는 after로 지정한 핸들러만 기다린다.
+
+        Raises:
+            ValueError: 순환 의존
+        """
+        by_name = {sub.name: index for index, sub in enumerate(subscriptions)}
+        prerequisites: List[Set[int]] = []
+        for index, subscription in enumerate(subscriptions):
+            deps = {
+                by_name[name]
+                for name in subscription.after
+                if name in by_name and by_name[name] != index
+            }
+            if not subscription.independent:
+                deps.update(
+                    earlier
+                    for earlier in range(index)
+                    if not subscriptions[earlier].independent
+                )
+            prerequisites.append(deps)
+
+        # 위상 정렬로 순환 검사
+        remaining = {index: set(deps) for index, deps in enumerate(prerequisites)}
+        while remaining:
+            ready = [index for index, deps in remaining.items() if not deps]
+            if not ready:
+                names = sorted(subscriptions[index].name for index in remaining)
+                raise ValueError(f"EventBus 핸들러 순환 의존: {names}")
+            for index in ready:
+                del remaining[index]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return prerequisites
+
+    async def _invoke(self, subscription: _Subscription, event: GameEvent) -> None:
+        """핸들러 1개 실행 (timeout 적용, 예외/시간 초과는 기록만)"""
+        handler = subscription.handler
+        started = time.perf_counter()
+        try:
+            with TRACER.span(
+                f"handler:{subscription.name}", "handler", event_type=event.event_type
+            ):
+                if subscription.is_async:
+                    coroutine = cast(Awaitable[None], handler(event))
+                    await asyncio.wait_for(coroutine, subscription.timeout)
+                elif subscription.independent or subscription.timeout is not None:
+                    # 다른 핸들러와 겹치거나 timeout을 지킬 수 있도록 스레드로
+                    # (컨텍스트 복사됨, 순서 제약은 _plan이 그대로 보장)
+                    sync_handler = cast(Callable[[GameEvent], None], handler)
+                    await asyncio.wait_for(
+                        asyncio.to_thread(sync_handler, event), subscription.timeout
                     )
+                else:
+                    handler(event)
+        except TimeoutError:
+            logger.warning(
+                f"EventBus 핸들러 시간 초과 ({subscription.timeout}s): "
+                f"{subscription.name} (event={event.event_type})"
+            )
+        except Exception:
+            logger.exception(
+                f"EventBus 핸들러 에러: {subscription.name} (event={event.event_type})"
+            )
         finally:
-            self._current_depth -= 1
+            _record_handler(event, started)
+
+    async def emit_async(self, event: GameEvent) -> None:
+        """이벤트 비동기 발행. 선언된 순서 제약 안에서 핸들러를 동시 실행.
+
+        안전장치(깊이/중복)는 emit과 같다. 모든 핸들러가 끝나면 반환한다.
+        """
+        chain = self._state()
+        if not self._admit(event, chain):
+            return
+        subscriptions = self._subscriptions_for(event, chain)
+        if not subscriptions:
+            return
+
+        prerequisites = self._plan(subscriptions)
+        finished = [asyncio.Event() for _ in subscriptions]
+
+        async def run(index: int) -> None:
+            subscription = subscriptions[index]
+            if subscription.deferred and chain.scoped:
+                self._defer(chain, subscription, event)
+                finished[index].set()
+                return
+            for dep in prerequisites[index]:
+                await finished[dep].wait()
+            # 태스크별 컨텍스트: 깊이는 분기마다, 중복 기록/지연 큐는 체인 공유
+            self._chain.set(
+                _ChainState(
+                    depth=chain.depth + 1,
+                    emitted=chain.emitted,
+                    scoped=chain.scoped,
+                    deferred=chain.deferred,
+                )
+            )
+            try:
+                await self._invoke(subscription, event)
+            finally:
+                finished[index].set()
+
+        with TRACER.span(
+            f"emit:{event.event_type}", "event", source=event.source, depth=event._depth
+        ):
+            await asyncio.gather(*(run(index) for index in range(len(subscriptions))))
 
     def reset_chain(self) -> None:
-        """턴 종료 시 호출. 중복 추적 초기화."""
-        self._emitted_in_chain.clear()
-        self._current_depth = 0
+        """턴 종료 시 호출. 현재 컨텍스트 체인의 중복 추적 초기화."""
+        chain = self._state()
+        chain.emitted.clear()
+        chain.depth = 0
 
     def clear(self) -> None:
         """모든 구독 해제 (테스트용)"""
-        self._handlers.clear()
+        with self._subscriptions_lock:
+            self._handlers.clear()
+            self._routes.clear()
         self.reset_chain()
 
     @property
     def handler_count(self) -> int:
-        """등록된 총 핸들러 수"""
-        return sum(len(h) for h in self._handlers.values())
+        """등록된 총 핸들러 수 (라우팅 구독 포함)"""
+        with self._subscriptions_lock:
+            routed = sum(
+                len(bucket)
+                for routes in self._routes.values()
+                for index in routes.values()
+                for bucket in index.values()
+            )
+            return sum(len(h) for h in self._handlers.values()) + routed
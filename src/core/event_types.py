@@ -48,6 +48,8 @@ class EventTypes:
     # === Objective events (ObjectiveWatcher) ===
     OBJECTIVE_COMPLETED = "objective_completed"
     OBJECTIVE_FAILED = "objective_failed"
+    # 실패 목표의 대체 목표 생성 (QuestService → ObjectiveWatcher 인덱스)
+    OBJECTIVES_REPLACED = "objectives_replaced"
 
     # === Action events (engine → ObjectiveWatcher) ===
     PLAYER_MOVED = "player_moved"
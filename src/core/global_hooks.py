@@ -0,0 +1,276 @@
+"""
+ITW Core Engine - Global Hook Store
+====================================
+글로벌 훅(보스 처치, 대발견 등 월드 이벤트)의 만료 관리 및 피드 제공
+
+- 만료 시각 기준 최소 힙: 시간이 지나면 만료된 훅만 꺼내어 제거
+- 활성 훅 수는 dict 크기로 O(1) 조회 (조회 전 만료분만 정리)
+- hook_id 오름차순 인덱스로 커서 기반 최신순 피드 제공
+- 세션 팩토리가 있으면 훅을 즉시 기록하고 재시작 시 활성 훅을 복원
+"""
+
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from src.core.logging import get_logger
+from src.core.timeutil import parse_timestamp, to_epoch
+from src.db.models import GlobalHookModel
+
+logger = get_logger(__name__)
+
+
+def _model_to_hook(model: GlobalHookModel) -> dict[str, Any]:
+    """GlobalHookModel → 훅 dict 변환"""
+    return {
+        "type": "global_hook",
+        "event": model.event_type,
+        "location_hint": model.location_hint,
+        "description": model.description,
+        "timestamp": model.created_at.isoformat(),
+        "expires_in_hours": model.expires_in_hours,
+        "hook_id": model.id,
+        "expires_at": model.expires_at,
+    }
+
+
+class GlobalHookStore:
+    """
+    만료형 글로벌 훅 저장소
+
+    훅은 EchoManager.create_global_hook()이 만든 dict에
+    hook_id(단조 증가)와 expires_at(epoch 초)을 붙여 보관한다.
+    """
+
+    DEFAULT_FEED_LIMIT = 20
+    MAX_FEED_LIMIT = 100
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.session_factory = session_factory
+        self._clock = clock
+
+        self._hooks: dict[int, dict[str, Any]] = {}  # hook_id 오름차순
+        self._order: list[int] = []  # 피드 이분 탐색용 (만료 id가 남을 수 있음)
+        self._expiry_heap: list[tuple[float, int]] = []
+        self._next_id = 1
+        self._lock = threading.RLock()  # 여러 요청 스레드의 add/prune 직렬화
+
+    # === 추가 / 만료 ===
+
+    def add(self, hook: dict[str, Any]) -> dict[str, Any]:
+        """훅 등록 (hook_id, expires_at 부여 후 저장)"""
+        created = parse_timestamp(hook["timestamp"])
+        with self._lock:
+            hook["hook_id"] = self._next_id
+            hook["expires_at"] = (
+                to_epoch(created) + hook.get("expires_in_hours", 24) * 3600
+            )
+            self._next_id += 1
+
+            self._index(hook)
+            self._persist(hook, created)
+        return hook
+
+    def _index(self, hook: dict[str, Any]) -> None:
+        hook_id = hook["hook_id"]
+        self._hooks[hook_id] = hook
+        self._order.append(hook_id)
+        heapq.heappush(self._expiry_heap, (hook["expires_at"], hook_id))
+
+    def prune(self, now: float | None = None) -> int:
+        """
+        만료된 훅 제거
+
+        Returns:
+            제거된 훅 수
+        """
+        now = self._clock() if now is None else now
+        if not self._expiry_heap or self._expiry_heap[0][0] > now:
+            return 0
+
+        with self._lock:
+            expired: list[int] = []
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                _, hook_id = heapq.heappop(self._expiry_heap)
+                if self._hooks.pop(hook_id, None) is not None:
+                    expired.append(hook_id)
+
+            if not expired:
+                return 0
+
+            # 만료 id가 피드 인덱스의 절반을 넘으면 재구성
+            if len(self._order) > 2 * len(self._hooks) + 32:
+                self._order = list(self._hooks)
+            self._delete_expired(now)
+        return len(expired)
+
+    # === 조회 ===
+
+    @property
+    def active_count(self) -> int:
+        """활성 훅 수"""
+        self.prune()
+        return len(self._hooks)
+
+    def active(self) -> list[dict[str, Any]]:
+        """활성 훅 목록 (오래된 순)"""
+        self.prune()
+        return list(self._hooks.values())
+
+    def feed(
+        self, cursor: int | None = None, limit: int = DEFAULT_FEED_LIMIT
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """
+        최신순 피드 페이지
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (이 hook_id 미만부터 반환)
+            limit: 페이지 크기 (1 ~ MAX_FEED_LIMIT)
+
+        Returns:
+            (훅 목록, 다음 커서) - 더 없으면 다음 커서는 None
+        """
+        self.prune()
+        limit = max(1, min(limit, self.MAX_FEED_LIMIT))
+        pos = len(self._order) if cursor is None else bisect_left(self._order, cursor)
+
+        page: list[dict[str, Any]] = []
+        while pos > 0 and len(page) <= limit:
+            pos -= 1
+            hook = self._hooks.get(self._order[pos])
+            if hook is not None:
+                page.append(hook)
+
+        if len(page) > limit:
+            page.pop()
+            return page, page[-1]["hook_id"]
+        return page, None
+
+    def __len__(self) -> int:
+        return self.active_count
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.active())
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        return self.active()[index]
+
+    # === 영속화 ===
+
+    def _persist(self, hook: dict[str, Any], created: datetime) -> None:
+        if self.session_factory is None:
+            return
+        session = self.session_factory()
+        try:
+            session.execute(
+                insert(GlobalHookModel).values(
+                    id=hook["hook_id"],
+                    event_type=hook["event"],
+                    location_hint=hook["location_hint"],
+                    description=hook["description"],
+                    created_at=created,
+                    expires_in_hours=hook.get("expires_in_hours", 24),
+                    expires_at=hook["expires_at"],
+                )
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _delete_expired(self, now: float) -> None:
+        if self.session_factory is None:
+            return
+        session = self.session_factory()
+        try:
+            session.execute(
+                delete(GlobalHookModel).where(GlobalHookModel.expires_at <= now)
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def load(self) -> int:
+        """
+        DB에서 활성 훅 복원 (재시작 시)
+
+        Returns:
+            복원된 훅 수
+        """
+        if self.session_factory is None:
+            return 0
+
+        now = self._clock()
+        session = self.session_factory()
+        try:
+            last_id = session.scalar(
+                select(GlobalHookModel.id).order_by(GlobalHookModel.id.desc())
+            )
+            models = session.scalars(
+                select(GlobalHookModel)
+                .where(GlobalHookModel.expires_at > now)
+                .order_by(GlobalHookModel.id)
+            ).all()
+            hooks = [_model_to_hook(model) for model in models]
+        finally:
+            session.close()
+
+        loaded = 0
+        for hook in hooks:
+            if hook["hook_id"] not in self._hooks:
+                self._index(hook)
+                loaded += 1
+        self._order.sort()
+        self._hooks = dict(sorted(self._hooks.items()))
+        if last_id is not None:
+            self._next_id = max(self._next_id, last_id + 1)
+
+        logger.debug("Loaded %d active global hooks", loaded)
+        return loaded
+
+    # === 스냅샷 ===
+
+    def export_state(self) -> dict[str, Any]:
+        """활성 훅과 다음 hook_id (엔진 스냅샷용)"""
+        with self._lock:
+            self.prune()
+            return {
+                "next_id": self._next_id,
+                "hooks": [dict(hook) for hook in self._hooks.values()],
+            }
+
+    def restore_state(self, state: dict[str, Any]) -> int:
+        """
+        스냅샷의 훅 복원 (이미 있는 hook_id와 만료된 훅은 건너뜀)
+
+        Returns:
+            복원된 훅 수
+        """
+        now = self._clock()
+        restored = 0
+        with self._lock:
+            for hook in state.get("hooks", []):
+                if hook["hook_id"] in self._hooks or hook["expires_at"] <= now:
+                    continue
+                self._index(dict(hook))
+                restored += 1
+            self._order.sort()
+            self._hooks = dict(sorted(self._hooks.items()))
+            self._next_id = max(self._next_id, state.get("next_id", 1))
+        return restored
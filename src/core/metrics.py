@@ -0,0 +1,268 @@
+"""
+의존성 없는 Prometheus 메트릭 레지스트리
+
+prometheus_client 없이 카운터/게이지/히스토그램을 모아
+GET /metrics에서 text exposition format(0.0.4)으로 내보낸다.
+
+- 메트릭은 모듈 import 시점에 REGISTRY.counter()/gauge()/histogram()으로 선언
+  (같은 이름은 같은 객체를 돌려주므로 여러 번 선언해도 안전)
+- 라벨 값은 위치 인자로 전달: counter.inc("move"), histogram.observe(0.12, "move")
+- 모든 갱신은 메트릭별 잠금 안에서 이뤄진다 (액터/스레드 풀에서 동시 호출)
+"""
+
+import abc
+import math
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 기본 버킷 (액션/DB 지연)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(abc.ABC):
+    """메트릭 공통: 이름/설명/라벨 + 라벨 값별 상태"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: tuple[object, ...]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name}: expected labels {self.labelnames}, got {labels}"
+            )
+        return tuple(str(value) for value in labels)
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        """(샘플 이름, 라벨 문자열, 값)"""
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(
+            f"{name}{labels} {_format_value(value)}"
+            for name, labels, value in self.samples()
+        )
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str]):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: object, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class Gauge(_Metric):
+    """현재 값 게이지 (스크레이프 직전에 set)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str]):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, *labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, _format_labels(self.labelnames, key), value
+
+
+class _HistogramState:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size  # 구간별 개수 (누적 아님, 마지막은 +Inf)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (_bucket / _sum / _count)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str],
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        if not self.buckets:
+            raise ValueError(f"{self.name}: at least one bucket required")
+        self._states: dict[LabelValues, _HistogramState] = {}
+
+    def observe(self, value: float, *labels: object) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)  # value <= le 인 첫 버킷
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _HistogramState(len(self.buckets) + 1)
+            state.buckets[index] += 1
+            state.sum += value
+            state.count += 1
+
+    def count(self, *labels: object) -> int:
+        with self._lock:
+            state = self._states.get(self._key(labels))
+            return state.count if state else 0
+
+    def sum(self, *labels: object) -> float:
+        with self._lock:
+            state = self._states.get(self._key(labels))
+            return state.sum if state else 0.0
+
+    def samples(self) -> Iterator[tuple[str, str, float]]:
+        with self._lock:
+            items = [
+                (key, list(state.buckets), state.sum, state.count)
+                for key, state in sorted(self._states.items())
+            ]
+        names = (*self.labelnames, "le")
+        for key, buckets, total, count in items:
+            cumulative = 0
+            for bound, observed in zip((*self.buckets, math.inf), buckets):
+                cumulative += observed
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """이름 → 메트릭. 같은 이름/종류로 다시 선언하면 기존 객체 반환."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _declare(self, cls: type[_M], name: str, create: Callable[[], _M]) -> _M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = create()
+            if not isinstance(metric, cls):
+                raise TypeError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Counter:
+        return self._declare(
+            Counter, name, lambda: Counter(name, documentation, labelnames)
+        )
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Gauge:
+        return self._declare(
+            Gauge, name, lambda: Gauge(name, documentation, labelnames)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._declare(
+            Histogram,
+            name,
+            lambda: Histogram(name, documentation, labelnames, buckets),
+        )
+
+    def get(self, name: str) -> _Metric | None:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """text exposition format (이름순)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# 프로세스 전역 레지스트리
+REGISTRY = MetricsRegistry()
@@ -7,6 +7,7 @@ ITW Core Engine - Module 3: Navigation & Fog of War
 이동에는 Supply 아이템이 소모되며, 거리 제한이 있습니다.
 """
 
+import random
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional
@@ -276,6 +277,7 @@ class Navigator:
                     if len(echo.flavor_text) > 50
                     else echo.flavor_text,
                     "age": "recent" if "T" in echo.timestamp else "old",  # 간략 판정
+                    "echo_id": echo.echo_id,
                 }
             )
 
@@ -319,6 +321,8 @@ class Navigator:
         player_id: str,
         current_supply: int,
         player_inventory: Optional[List[str]] = None,
+        rng: Optional[random.Random] = None,
+        describe: bool = True,
     ) -> TravelResult:
         """
         특정 방향으로 이동
@@ -329,6 +333,8 @@ class Navigator:
             player_id: 플레이어 ID
             current_supply: 현재 보유 Supply
             player_inventory: 플레이어 인벤토리 태그 목록
+            rng: 조우 판정용 난수 스트림 (None이면 random 모듈 전역 상태)
+            describe: False면 목적지 뷰 생성/발견 처리를 생략 (다른 샤드가 도착 처리)
 
         Returns:
             TravelResult: 이동 결과
@@ -377,15 +383,13 @@ class Navigator:
             )
 
         # 이동 성공
-        new_view = self.get_location_view(new_x, new_y, player_id)
+        new_view = self.get_location_view(new_x, new_y, player_id) if describe else None
 
         # 이동 중 조우 체크 (간략 구현)
         encounter = None
         danger = self._estimate_danger(target_node)
         if danger in ["Danger", "Caution"]:
-            import random
-
-            if random.random() < 0.2:  # 20% 확률
+            if (rng or random).random() < 0.2:  # 20% 확률
                 encounter = {
                     "type": "random_encounter",
                     "danger_level": danger,
@@ -468,11 +472,11 @@ class Navigator:
                 message="서브 그리드 생성기가 초기화되지 않았습니다.",
             )
 
-        # 현재 노드 조회
-        current_node = self.sub_grid_generator.get_node(parent_x, parent_y, sx, sy, sz)
-        if not current_node:
-            current_node = self.sub_grid_generator.generate_node(
-                parent_x, parent_y, sx, sy, sz, depth_tier
+        # 현재 층 (층 단위 일괄 생성 캐시 - 이동은 딕셔너리 조회)
+        floor = self.sub_grid_generator.get_floor(parent_x, parent_y, sz)
+        if floor is None:
+            floor = self.sub_grid_generator.generate_floor(
+                parent_x, parent_y, sz, depth_tier
             )
 
         # 목적지 좌표 계산
@@ -489,9 +493,20 @@ class Navigator:
                 message="입구입니다. 'exit' 명령으로 메인 그리드로 복귀하세요.",
             )
 
-        # 수평 이동 시 범위 체크 (서브 그리드 크기 제한)
-        SUB_GRID_SIZE = 5  # -2 ~ +2
-        if abs(new_sx) > SUB_GRID_SIZE or abs(new_sy) > SUB_GRID_SIZE:
+        # 수평 이동은 사전 계산된 인접 그래프로 확인 (격자 경계 포함)
+        if direction.dz == 0:
+            target_floor = floor
+            connected = floor.is_connected((sx, sy), (new_sx, new_sy))
+        else:
+            target_floor = self.sub_grid_generator.get_floor(
+                parent_x, parent_y, new_sz
+            ) or self.sub_grid_generator.generate_floor(
+                parent_x, parent_y, new_sz, depth_tier
+            )
+            connected = True
+
+        target_node = target_floor.get_cell(new_sx, new_sy) if connected else None
+        if target_node is None:
             return TravelResult(
                 success=False,
                 new_location=None,
@@ -499,11 +514,6 @@ class Navigator:
                 message="더 이상 갈 수 없습니다. 벽에 막혀 있습니다.",
             )
 
-        # 목적지 노드 생성
-        target_node = self.sub_grid_generator.get_or_generate(
-            parent_x, parent_y, new_sx, new_sy, new_sz, depth_tier
-        )
-
         # 필수 장비 체크
         if player_inventory is None:
             player_inventory = []
@@ -32,17 +32,20 @@ _NEUTRAL_TEMPLATE: Dict[str, float] = {
 _VARIANCE = 0.15  # ±0.15 랜덤 보정
 
 
-def generate_hexaco(role: str, seed: Optional[int] = None) -> HEXACO:
+def generate_hexaco(
+    role: str, seed: Optional[int] = None, rng: Optional[random.Random] = None
+) -> HEXACO:
     """역할 기반 HEXACO 생성 (섹션 8.3)
 
     Args:
         role: NPC 역할 (e.g. "innkeeper", "guard")
         seed: 재현성을 위한 RNG 시드. None이면 비결정적.
+        rng: 주입된 난수 스트림. 지정 시 seed보다 우선.
 
     Returns:
         HEXACO dataclass 인스턴스. 모든 값 0.0~1.0 클램프.
     """
-    rng = random.Random(seed)
+    rng = rng or random.Random(seed)
     template = ROLE_HEXACO_TEMPLATES.get(role, _NEUTRAL_TEMPLATE)
 
     values: Dict[str, float] = {}
@@ -164,17 +164,19 @@ NAME_POOLS: Dict = {
 def generate_name(
     seed: Optional[NPCNameSeed] = None,
     rng_seed: Optional[int] = None,
+    rng: Optional[random.Random] = None,
 ) -> NPCFullName:
     """이름 풀에서 랜덤 선택하여 NPCFullName 생성 (섹션 7.3)
 
     Args:
         seed: 이름 시드. None이면 성별 N, 역할 없음 기준으로 생성.
         rng_seed: 재현성을 위한 RNG 시드.
+        rng: 주입된 난수 스트림. 지정 시 rng_seed보다 우선.
 
     Returns:
         NPCFullName 인스턴스.
     """
-    rng = random.Random(rng_seed)
+    rng = rng or random.Random(rng_seed)
 
     if seed is None:
         seed = NPCNameSeed()
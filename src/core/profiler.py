@@ -0,0 +1,397 @@
+"""
+느린 요청 샘플링 프로파일러 (표준 라이브러리만 사용)
+
+요청마다 프로파일링하지 않고, 진행 중인 요청의 스레드 스택을 타이머로 샘플링해 두었다가
+끝난 요청이 threshold_ms를 넘었을 때만 collapsed stack 파일로 남긴다.
+
+- begin() → 요청 레코드 (컨텍스트 변수에 등록). API 미들웨어가 요청마다 호출
+- annotate(action=, player_id=) → 태그 + 호출 스레드를 샘플링 대상에 추가.
+  실제 작업을 하는 스레드(동기 엔드포인트의 스레드 풀)에서 호출해야 한다
+- release() → 작업이 끝난 스레드를 샘플링 대상에서 제외. 풀 스레드는 응답 전송이
+  끝나기 전에 다른 요청을 처리할 수 있으므로 엔드포인트가 반환할 때 호출한다
+- 샘플러 스레드가 interval_ms마다 sys._current_frames()로 대상 스레드 스택을 수집
+- end() → 임계값 초과 + 분당 캡처 제한 안이면 ProfileStore에 저장
+- 파일 형식: 한 줄에 "root;...;leaf 샘플수" (flamegraph.pl / speedscope 호환)
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from src.core.logging import get_logger
+from src.core.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+# 스택 1개에 남기는 최대 프레임 수 (leaf 쪽 유지)
+MAX_STACK_DEPTH = 128
+
+PROFILE_CAPTURES = REGISTRY.counter(
+    "itw_profile_captures_total",
+    "Slow-request profiles by outcome (saved, rate_limited, no_samples)",
+    ("outcome",),
+)
+
+_REQUEST: ContextVar["_InFlight | None"] = ContextVar(
+    "itw_profile_request", default=None
+)
+_CAPTURE_ID = re.compile(r"^\d{13}-\d{4}$")
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    label = f"{module}:{code.co_qualname}"
+    return label.replace(";", ":").replace(" ", "_")
+
+
+def collapse(frame: FrameType | None) -> str:
+    """프레임 → "root;...;leaf" (깊이는 MAX_STACK_DEPTH로 제한)"""
+    labels: list[str] = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class _InFlight:
+    """진행 중인 요청 1개"""
+
+    __slots__ = (
+        "method",
+        "path",
+        "started",
+        "tags",
+        "annotated",
+        "threads",
+        "stacks",
+        "samples",
+    )
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.started = time.perf_counter()
+        self.tags: dict[str, Any] = {}
+        self.annotated = False
+        # 지금 샘플링할 스레드 (release() 후 빠짐)
+        self.threads: set[int] = set()
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+
+
+# === 저장소 ===
+
+
+class ProfileStore:
+    """
+    디스크 캡처 저장소 (개수/용량 제한)
+
+    캡처 1개 = {id}.folded (collapsed stack) + {id}.json (메타데이터).
+    id는 "밀리초 타임스탬프-일련번호"라 이름순이 곧 시간순이다.
+    제한을 넘으면 가장 오래된 캡처부터 지운다.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_files: int = 50, max_bytes: int = 20_000_000
+    ):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def save(self, meta: dict[str, Any], folded: str) -> str:
+        """캡처 저장 후 id 반환 (제한 초과분 정리)"""
+        with self._lock:
+            self._seq = (self._seq + 1) % 10000
+            capture_id = f"{int(time.time() * 1000):013d}-{self._seq:04d}"
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{capture_id}.folded").write_text(
+                folded, encoding="utf-8"
+            )
+            meta = {"id": capture_id, **meta}
+            (self.directory / f"{capture_id}.json").write_text(
+                json.dumps(meta, ensure_ascii=False), encoding="utf-8"
+            )
+            self._prune()
+        return capture_id
+
+    def _ids(self) -> list[str]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            path.stem
+            for path in self.directory.glob("*.json")
+            if _CAPTURE_ID.match(path.stem)
+        )
+
+    def _size(self, capture_id: str) -> int:
+        total = 0
+        for suffix in (".folded", ".json"):
+            path = self.directory / f"{capture_id}{suffix}"
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
+    def _delete(self, capture_id: str) -> None:
+        for suffix in (".folded", ".json"):
+            (self.directory / f"{capture_id}{suffix}").unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        ids = self._ids()
+        sizes = {capture_id: self._size(capture_id) for capture_id in ids}
+        total = sum(sizes.values())
+        # 방금 저장한 최신 캡처는 항상 남긴다
+        while len(ids) > 1 and (len(ids) > self.max_files or total > self.max_bytes):
+            oldest = ids.pop(0)
+            total -= sizes[oldest]
+            self._delete(oldest)
+
+    def list(self) -> list[dict[str, Any]]:
+        """캡처 메타데이터 (최신 순)"""
+        captures = []
+        for capture_id in reversed(self._ids()):
+            try:
+                text = (self.directory / f"{capture_id}.json").read_text(
+                    encoding="utf-8"
+                )
+                captures.append(json.loads(text))
+            except (OSError, ValueError):
+                continue  # 정리 중 삭제되었거나 깨진 메타데이터
+        return captures
+
+    def path(self, capture_id: str) -> Path | None:
+        """collapsed stack 파일 경로 (형식이 틀리거나 없으면 None)"""
+        if not _CAPTURE_ID.match(capture_id):
+            return None
+        path = self.directory / f"{capture_id}.folded"
+        return path if path.is_file() else None
+
+    def clear(self) -> int:
+        """전체 삭제 (지운 캡처 수 반환)"""
+        with self._lock:
+            ids = self._ids()
+            for capture_id in ids:
+                self._delete(capture_id)
+        return len(ids)
+
+
+# === 프로파일러 ===
+
+
+class SlowRequestProfiler:
+    """진행 중 요청 스택 샘플링 + 느린 요청 캡처"""
+
+    def __init__(
+        self,
+        store: ProfileStore | None = None,
+        enabled: bool = False,
+        threshold_ms: float = 1000.0,
+        interval_ms: float = 10.0,
+        max_per_minute: int = 6,
+    ):
+        self.store = store or ProfileStore("profiles")
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.max_per_minute = max_per_minute
+
+        self._inflight: set[_InFlight] = set()
+        self._lock = threading.Lock()
+        self._captured_at: deque[float] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = {"saved": 0, "rate_limited": 0, "no_samples": 0}
+
+    def configure(
+        self,
+        store: ProfileStore | None = None,
+        enabled: bool | None = None,
+        threshold_ms: float | None = None,
+        interval_ms: float | None = None,
+        max_per_minute: int | None = None,
+    ) -> None:
+        """설정 변경 (None인 항목은 유지)"""
+        if interval_ms is not None and interval_ms <= 0:
+            raise ValueError(f"interval_ms must be > 0: {interval_ms}")
+        if max_per_minute is not None and max_per_minute < 0:
+            raise ValueError(f"max_per_minute must be >= 0: {max_per_minute}")
+        if store is not None:
+            self.store = store
+        if enabled is not None:
+            self.enabled = enabled
+        if threshold_ms is not None:
+            self.threshold_ms = threshold_ms
+        if interval_ms is not None:
+            self.interval_ms = interval_ms
+        if max_per_minute is not None:
+            self.max_per_minute = max_per_minute
+
+    def settings(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": self.threshold_ms,
+            "interval_ms": self.interval_ms,
+            "max_per_minute": self.max_per_minute,
+            "in_flight": len(self._inflight),
+            **self._stats,
+        }
+
+    # === 요청 수명 ===
+
+    def begin(self, method: str, path: str) -> _InFlight | None:
+        """요청 시작 (비활성이면 None)"""
+        if not self.enabled:
+            return None
+        record = _InFlight(method, path)
+        _REQUEST.set(record)
+        with self._lock:
+            self._inflight.add(record)
+        self._ensure_sampler()
+        self._wake.set()
+        return record
+
+    def annotate(self, **tags: Any) -> None:
+        """현재 요청에 태그 + 호출 스레드를 샘플링 대상에 추가 (요청 밖이면 무시)"""
+        record = _REQUEST.get()
+        if record is None:
+            return
+        record.tags.update(tags)
+        with self._lock:
+            record.annotated = True
+            record.threads.add(threading.get_ident())
+
+    def release(self) -> None:
+        """호출 스레드를 현재 요청의 샘플링 대상에서 제외 (요청 밖이면 무시)"""
+        record = _REQUEST.get()
+        if record is None:
+            return
+        with self._lock:
+            record.threads.discard(threading.get_ident())
+
+    def end(self, record: _InFlight, status: int | None = None) -> str | None:
+        """요청 종료. 캡처를 저장했으면 id 반환."""
+        with self._lock:
+            self._inflight.discard(record)
+        duration_ms = (time.perf_counter() - record.started) * 1000
+        if duration_ms < self.threshold_ms or not record.annotated:
+            return None
+        if not record.samples:
+            self._count("no_samples")
+            return None
+        if not self._allow_capture():
+            self._count("rate_limited")
+            return None
+
+        meta = {
+            "action": record.tags.get("action", record.path),
+            "player_id": record.tags.get("player_id"),
+            "method": record.method,
+            "path": record.path,
+            "status": status,
+            "duration_ms": round(duration_ms, 3),
+            "samples": record.samples,
+            "interval_ms": self.interval_ms,
+            "created_at": time.time(),
+        }
+        folded = "".join(
+            f"{stack} {count}\n" for stack, count in record.stacks.most_common()
+        )
+        try:
+            capture_id = self.store.save(meta, folded)
+        except OSError:
+            logger.exception("Failed to write slow-request profile")
+            return None
+        self._count("saved")
+        logger.warning(
+            "Slow request profiled: %s %s %.0fms (player=%s) -> %s",
+            record.method,
+            meta["action"],
+            duration_ms,
+            meta["player_id"],
+            capture_id,
+        )
+        return capture_id
+
+    def _count(self, outcome: str) -> None:
+        self._stats[outcome] += 1
+        PROFILE_CAPTURES.inc(outcome)
+
+    def _allow_capture(self) -> bool:
+        """최근 60초 캡처 수가 max_per_minute 미만이면 자리 확보"""
+        now = time.monotonic()
+        with self._lock:
+            while self._captured_at and now - self._captured_at[0] >= 60.0:
+                self._captured_at.popleft()
+            if len(self._captured_at) >= self.max_per_minute:
+                return False
+            self._captured_at.append(now)
+            return True
+
+    # === 샘플링 ===
+
+    def sample(self) -> int:
+        """대상 스레드 스택을 1회 수집 (샘플을 얻은 요청 수 반환)"""
+        sampled = 0
+        # end()가 레코드를 뺀 뒤에는 갱신하지 않도록 잠금 안에서 수집
+        with self._lock:
+            records = [record for record in self._inflight if record.threads]
+            if not records:
+                return 0
+            frames = sys._current_frames()
+            for record in records:
+                for ident in list(record.threads):
+                    frame = frames.get(ident)
+                    if frame is None:
+                        continue
+                    record.stacks[collapse(frame)] += 1
+                    record.samples += 1
+                    sampled += 1
+        return sampled
+
+    def _ensure_sampler(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="itw-profiler", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if not self._inflight:
+                self._wake.clear()
+                if not self._inflight:  # clear 직전에 begin()이 들어온 경우
+                    self._wake.wait()
+                continue
+            time.sleep(self.interval_ms / 1000)
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("Profiler sample failed")
+
+    def shutdown(self) -> None:
+        """샘플러 스레드 정지"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+
+# 프로세스 전역 프로파일러 (기본 비활성, main.py가 설정에서 구성)
+PROFILER = SlowRequestProfiler()
@@ -1,4 +1,7 @@
-"""퀘스트 확률 판정 — 순수 Python, 외부 의존 없음"""
+"""퀘스트 확률 판정 — 순수 Python, 외부 의존 없음
+
+판정 함수는 모두 rng(random.Random)를 받는다. None이면 random 모듈 전역 상태.
+"""
 
 import logging
 import random
@@ -47,14 +50,14 @@ NPC_QUEST_COOLDOWN = 5  # 같은 NPC에게서 최소 5회 대화 후 재발생
 FAILURE_REPORT_SEED_CHANCE = 0.50
 
 
-def roll_seed_chance() -> bool:
+def roll_seed_chance(rng: random.Random | None = None) -> bool:
     """5% 확률로 시드 발생 판정."""
-    return random.random() < SEED_CHANCE
+    return (rng or random).random() < SEED_CHANCE
 
 
-def determine_seed_tier() -> int:
+def determine_seed_tier(rng: random.Random | None = None) -> int:
     """시드 티어 확률 판정. 반환: 1, 2, 3."""
-    roll = random.random()
+    roll = (rng or random).random()
     if roll < SEED_TIER_WEIGHTS[3]:
         return 3
     elif roll < SEED_TIER_WEIGHTS[3] + SEED_TIER_WEIGHTS[2]:
@@ -63,16 +66,16 @@ def determine_seed_tier() -> int:
         return 1
 
 
-def roll_chain_chance(seed_tier: int) -> bool:
+def roll_chain_chance(seed_tier: int, rng: random.Random | None = None) -> bool:
     """체이닝 확률 판정."""
     prob = CHAIN_PROBABILITY_BY_TIER.get(seed_tier, 0.10)
-    return random.random() < prob
+    return (rng or random).random() < prob
 
 
-def should_finalize_chain(chain_length: int) -> bool:
+def should_finalize_chain(chain_length: int, rng: random.Random | None = None) -> bool:
     """체인 완결 여부 판정."""
     chance = FINALIZE_CHANCES.get(chain_length, FINALIZE_DEFAULT)
-    return random.random() < chance
+    return (rng or random).random() < chance
 
 
 def can_generate_seed(
@@ -87,9 +90,9 @@ def can_generate_seed(
     ) >= NPC_QUEST_COOLDOWN
 
 
-def roll_failure_report_seed() -> bool:
+def roll_failure_report_seed(rng: random.Random | None = None) -> bool:
     """의뢰주 보고 시 후속 시드 발생 확률 (50%)."""
-    return random.random() < FAILURE_REPORT_SEED_CHANCE
+    return (rng or random).random() < FAILURE_REPORT_SEED_CHANCE
 
 
 def get_default_ttl(seed_type: str) -> int:
@@ -24,6 +24,7 @@ def try_generate_seed(
     last_seed_conversation_count: int | None,
     current_conversation_count: int,
     eligible_quests: list | None = None,
+    rng: random.Random | None = None,
 ) -> QuestSeed | None:
     """시드 발생 시도. 실패 시 None.
 
@@ -37,16 +38,16 @@ def try_generate_seed(
         logger.debug("Seed generation blocked by cooldown for npc=%s", npc_id)
         return None
 
-    if not roll_seed_chance():
+    if not roll_seed_chance(rng):
         logger.debug("Seed generation failed 5%% roll for npc=%s", npc_id)
         return None
 
-    seed_tier = determine_seed_tier()
-    seed_type = select_seed_type()
+    seed_tier = determine_seed_tier(rng)
+    seed_type = select_seed_type(rng)
     ttl = get_default_ttl(seed_type)
 
     chain_id: str | None = None
-    if eligible_quests and roll_chain_chance(seed_tier):
+    if eligible_quests and roll_chain_chance(seed_tier, rng):
         chain_id = f"chain_{uuid.uuid4().hex[:8]}"
         logger.info(
             "Chain seed generated: npc=%s, chain_id=%s, tier=%d",
@@ -88,6 +89,6 @@ def process_seed_ttl(seed: QuestSeed, current_turn: int) -> bool:
     return False
 
 
-def select_seed_type() -> str:
+def select_seed_type(rng: random.Random | None = None) -> str:
     """시드 유형 랜덤 선택. 균등 분포 (각 25%)."""
-    return random.choice(_SEED_TYPES)
+    return (rng or random).choice(_SEED_TYPES)
@@ -0,0 +1,379 @@
+"""
+ITW Core Engine - Reachability Index
+====================================
+required_tags 게이팅을 고려한 도달 가능 영역 계산
+
+플레이어의 equipped_tags로 어떤 타일까지 갈 수 있는지 판정합니다.
+퀘스트 목표/NPC 심부름 배치, 빠른 이동 탐색 가지치기에 사용합니다.
+
+- 태그는 비트셋 마스크로 변환하여 통과 판정을 정수 연산 1회로 처리
+- BFS 결과는 (출발 좌표, 태그 마스크) 단위로 메모이즈
+- 노드 변경 시 해당 영역(REGION_SIZE 청크)을 지나간 결과만 무효화
+- 캐시/마스크 갱신은 내부 잠금 하나로 보호 (조회와 생성 알림이 여러 스레드에서 옴)
+"""
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.core.logging import get_logger
+from src.core.sub_grid import SubGridGenerator, SubGridNode
+from src.core.world_generator import MapNode, WorldGenerator
+
+if TYPE_CHECKING:
+    from src.core.engine import PlayerState
+
+logger = get_logger(__name__)
+
+# 영역 키: 메인 그리드는 (rx, ry) 청크, 서브 그리드는 부모 좌표 문자열
+RegionKey = tuple[int, int] | str
+CacheKey = tuple[str, int]
+
+# 메인 그리드 4방향 (N, S, E, W)
+_MAIN_STEPS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+
+# 서브 그리드 6방향 (N, S, E, W, UP, DOWN)
+_SUB_STEPS = [(0, 1, 0), (0, -1, 0), (1, 0, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1)]
+
+
+class TagBitRegistry:
+    """태그 문자열 → 비트 위치 매핑
+
+    처음 보는 태그에 다음 비트를 할당합니다.
+    """
+
+    def __init__(self) -> None:
+        self._bits: dict[str, int] = {}
+
+    def bit(self, tag: str) -> int:
+        """태그의 비트 값 (1 << index)"""
+        index = self._bits.get(tag)
+        if index is None:
+            index = len(self._bits)
+            self._bits[tag] = index
+        return 1 << index
+
+    def mask(self, tags: Iterable[str]) -> int:
+        """태그 목록을 비트 마스크로 변환"""
+        result = 0
+        for tag in tags:
+            result |= self.bit(tag)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+
+@dataclass
+class _ReachResult:
+    """메모이즈된 BFS 결과"""
+
+    radius: int
+    exhausted: bool  # radius 이전에 탐색이 끝났는지 (더 큰 radius에도 재사용 가능)
+    distances: dict[str, int]
+    regions: set[RegionKey] = field(default_factory=set)
+
+    def covers(self, radius: int) -> bool:
+        return self.exhausted or self.radius >= radius
+
+    def within(self, radius: int) -> dict[str, int]:
+        if radius >= self.radius:
+            return dict(self.distances)
+        return {c: d for c, d in self.distances.items() if d <= radius}
+
+
+class ReachabilityIndex:
+    """
+    도달 가능성 인덱스
+
+    이미 생성된(발견/생성된) 노드 그래프 위에서만 탐색합니다.
+    아직 생성되지 않은 좌표는 미지의 영역으로 보고 넘어가지 않습니다.
+    """
+
+    # 무효화 단위 청크 크기
+    REGION_SIZE = 16
+
+    def __init__(
+        self,
+        world: WorldGenerator,
+        sub_grid_generator: SubGridGenerator | None = None,
+    ):
+        self.world = world
+        self.sub_grid_generator = sub_grid_generator
+        self.tags = TagBitRegistry()
+
+        self._cache: dict[CacheKey, _ReachResult] = {}
+        self._region_index: dict[RegionKey, set[CacheKey]] = {}
+        self._required_masks: dict[str, int] = {}
+        self._lock = threading.RLock()
+
+        world.add_node_listener(self._on_node_changed)
+        if sub_grid_generator is not None:
+            sub_grid_generator.add_node_listener(self._on_sub_node_changed)
+
+    # === 마스크 ===
+
+    def tag_mask(self, tags: Iterable[str]) -> int:
+        """태그 목록 → 비트 마스크"""
+        with self._lock:
+            return self.tags.mask(tags)
+
+    def _required_mask(self, node_id: str, required_tags: list[str]) -> int:
+        mask = self._required_masks.get(node_id)
+        if mask is None:
+            mask = self.tags.mask(required_tags)
+            self._required_masks[node_id] = mask
+        return mask
+
+    def _to_mask(self, tags: int | Iterable[str]) -> int:
+        if isinstance(tags, int):
+            return tags
+        return self.tag_mask(tags)
+
+    # === 메인 그리드 ===
+
+    def region_of(self, x: int, y: int) -> tuple[int, int]:
+        """좌표가 속한 영역 키"""
+        return (x // self.REGION_SIZE, y // self.REGION_SIZE)
+
+    def _passable(self, node: MapNode, mask: int) -> bool:
+        if not node.required_tags:
+            return True
+        required = self._required_mask(node.coordinate, node.required_tags)
+        return required & ~mask == 0
+
+    def reachable_from(
+        self, x: int, y: int, tags: int | Iterable[str], radius: int
+    ) -> dict[str, int]:
+        """
+        (x, y)에서 radius 이동 이내로 도달 가능한 노드
+
+        Args:
+            x, y: 출발 좌표
+            tags: 보유 태그 목록 또는 tag_mask() 결과
+            radius: 최대 이동 횟수
+
+        Returns:
+            {좌표 문자열: 이동 횟수}
+        """
+        mask = self._to_mask(tags)
+        key = (f"{x}_{y}", mask)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached.covers(radius):
+                return cached.within(radius)
+
+            result = self._bfs_main(x, y, mask, radius)
+            self._store(key, result)
+            return result.within(radius)
+
+    def _bfs_main(self, x: int, y: int, mask: int, radius: int) -> _ReachResult:
+        nodes = self.world.nodes
+        origin = f"{x}_{y}"
+        distances: dict[str, int] = {}
+        regions: set[RegionKey] = set()
+
+        if origin not in nodes:
+            return _ReachResult(radius, True, distances, regions)
+
+        distances[origin] = 0
+        regions.add(self.region_of(x, y))
+        queue = deque([(x, y, 0)])
+        exhausted = True
+
+        while queue:
+            cx, cy, dist = queue.popleft()
+            for dx, dy in _MAIN_STEPS:
+                nx, ny = cx + dx, cy + dy
+                coord = f"{nx}_{ny}"
+                if coord in distances:
+                    continue
+                node = nodes.get(coord)
+                # 미생성 좌표 경계도 무효화 대상 영역으로 기록
+                regions.add(self.region_of(nx, ny))
+                if node is None or not self._passable(node, mask):
+                    continue
+                if dist >= radius:
+                    exhausted = False
+                    continue
+                distances[coord] = dist + 1
+                queue.append((nx, ny, dist + 1))
+
+        return _ReachResult(radius, exhausted, distances, regions)
+
+    # === 서브 그리드 ===
+
+    def reachable_sub_grid(
+        self,
+        parent_x: int,
+        parent_y: int,
+        sx: int,
+        sy: int,
+        sz: int,
+        tags: int | Iterable[str],
+        radius: int,
+    ) -> dict[str, int]:
+        """
+        서브 그리드 내 (sx, sy, sz)에서 radius 이동 이내로 도달 가능한 셀
+
+        Returns:
+            {서브 노드 ID: 이동 횟수}
+        """
+        mask = self._to_mask(tags)
+        parent_coordinate = f"{parent_x}_{parent_y}"
+        key = (f"{parent_coordinate}_{sx}_{sy}_{sz}", mask)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached.covers(radius):
+                return cached.within(radius)
+
+            result = self._bfs_sub(parent_x, parent_y, sx, sy, sz, mask, radius)
+            self._store(key, result)
+            return result.within(radius)
+
+    def _sub_passable(self, node: SubGridNode, mask: int) -> bool:
+        if not node.required_tags:
+            return True
+        required = self._required_mask(node.id, node.required_tags)
+        return required & ~mask == 0
+
+    def _bfs_sub(
+        self,
+        parent_x: int,
+        parent_y: int,
+        sx: int,
+        sy: int,
+        sz: int,
+        mask: int,
+        radius: int,
+    ) -> _ReachResult:
+        parent_coordinate = f"{parent_x}_{parent_y}"
+        regions: set[RegionKey] = {parent_coordinate}
+        distances: dict[str, int] = {}
+
+        generator = self.sub_grid_generator
+        if generator is None or not generator.get_node(parent_x, parent_y, sx, sy, sz):
+            return _ReachResult(radius, True, distances, regions)
+
+        limit = generator.GRID_RADIUS
+        distances[f"{parent_coordinate}_{sx}_{sy}_{sz}"] = 0
+        queue = deque([(sx, sy, sz, 0)])
+        exhausted = True
+
+        while queue:
+            cx, cy, cz, dist = queue.popleft()
+            for dx, dy, dz in _SUB_STEPS:
+                # 입구층(sz=0)에서 위로는 서브 그리드 밖
+                if cz == 0 and dz > 0:
+                    continue
+                nx, ny, nz = cx + dx, cy + dy, cz + dz
+                if abs(nx) > limit or abs(ny) > limit:
+                    continue
+                node_id = f"{parent_coordinate}_{nx}_{ny}_{nz}"
+                if node_id in distances:
+                    continue
+                node = generator.get_node(parent_x, parent_y, nx, ny, nz)
+                if node is None or not self._sub_passable(node, mask):
+                    continue
+                if dist >= radius:
+                    exhausted = False
+                    continue
+                distances[node_id] = dist + 1
+                queue.append((nx, ny, nz, dist + 1))
+
+        return _ReachResult(radius, exhausted, distances, regions)
+
+    # === 플레이어 기준 조회 ===
+
+    def reachable_within(self, player: "PlayerState", radius: int) -> dict[str, int]:
+        """
+        플레이어의 현재 위치/장비 태그 기준 도달 가능 영역
+
+        서브 그리드 안에 있으면 서브 그리드 셀을, 아니면 메인 노드를 반환합니다.
+        """
+        mask = self.tag_mask(player.equipped_tags)
+
+        if player.in_sub_grid and player.sub_grid_parent:
+            parent_x, parent_y = (int(v) for v in player.sub_grid_parent.split("_"))
+            return self.reachable_sub_grid(
+                parent_x,
+                parent_y,
+                player.sub_x,
+                player.sub_y,
+                player.sub_z,
+                mask,
+                radius,
+            )
+
+        return self.reachable_from(player.x, player.y, mask, radius)
+
+    def is_reachable(self, player: "PlayerState", coordinate: str, radius: int) -> bool:
+        """특정 좌표가 radius 이내 도달 가능한지 (빠른 이동 탐색 가지치기용)"""
+        return coordinate in self.reachable_within(player, radius)
+
+    # === 캐시 / 무효화 ===
+
+    def _store(self, key: CacheKey, result: _ReachResult) -> None:
+        self._drop(key)
+        self._cache[key] = result
+        for region in result.regions:
+            self._region_index.setdefault(region, set()).add(key)
+
+    def _drop(self, key: CacheKey) -> None:
+        old = self._cache.pop(key, None)
+        if old is None:
+            return
+        for region in old.regions:
+            keys = self._region_index.get(region)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._region_index[region]
+
+    def invalidate_region(self, region: RegionKey) -> int:
+        """영역을 지나간 캐시 결과 무효화. 삭제된 항목 수 반환"""
+        with self._lock:
+            keys = self._region_index.pop(region, None)
+            if not keys:
+                return 0
+            for key in list(keys):
+                self._drop(key)
+            return len(keys)
+
+    def invalidate_node(self, x: int, y: int) -> int:
+        """메인 노드 변경(생성/태그 변경) 시 관련 캐시 무효화"""
+        # BFS는 막힌/미생성 좌표의 영역도 기록하므로 해당 영역만 무효화하면 충분
+        with self._lock:
+            self._required_masks.pop(f"{x}_{y}", None)
+            return self.invalidate_region(self.region_of(x, y))
+
+    def invalidate_sub_grid(self, parent_coordinate: str) -> int:
+        """서브 그리드 인스턴스 변경 시 관련 캐시 무효화"""
+        prefix = f"{parent_coordinate}_"
+        with self._lock:
+            for node_id in [k for k in self._required_masks if k.startswith(prefix)]:
+                if node_id.count("_") == 4:
+                    del self._required_masks[node_id]
+            return self.invalidate_region(parent_coordinate)
+
+    def clear(self) -> None:
+        """전체 캐시 초기화 (월드 전체 재로드 시)"""
+        with self._lock:
+            self._cache.clear()
+            self._region_index.clear()
+            self._required_masks.clear()
+
+    def _on_node_changed(self, node: MapNode) -> None:
+        self.invalidate_node(node.x, node.y)
+
+    def _on_sub_node_changed(self, node: SubGridNode) -> None:
+        self.invalidate_sub_grid(node.parent_coordinate)
+
+    @property
+    def cache_size(self) -> int:
+        """메모이즈된 결과 수"""
+        return len(self._cache)
@@ -0,0 +1,73 @@
+"""
+ITW Core Engine - RNG Provider
+==============================
+세션별 난수 스트림 공급자
+
+전역 random 모듈 상태를 공유하지 않도록, 월드 시드에서 용도별
+독립 스트림(random.Random)을 파생한다.
+
+- player(player_id): 플레이어 게임플레이 스트림 (세션 동안 유지)
+- tick(tick_number, *parts): 틱 단위 시뮬레이션 스트림 (노드 좌표 등으로 세분)
+
+파생 시드는 SHA-256 기반이라 프로세스/플랫폼과 무관하게 재현된다.
+루트 시드와 플레이어/틱 식별자만 기록하면 세션을 재생할 수 있다.
+"""
+
+import hashlib
+import random
+import threading
+from typing import Optional
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def derive_seed(root_seed: int, *parts: object) -> int:
+    """루트 시드 + 식별자 → 64비트 파생 시드"""
+    key = "|".join([str(root_seed), *(str(part) for part in parts)])
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class RNGProvider:
+    """
+    용도별 난수 스트림 공급자
+
+    플레이어 스트림은 최초 요청 시 생성되어 캐시된다. 같은 플레이어의
+    요청은 직렬로 처리된다는 전제이며, 스트림 생성 자체는 잠금으로 보호한다.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+            logger.info("RNG root seed not given, using %d", seed)
+        self.seed = seed
+
+        self._players: dict[str, random.Random] = {}
+        self._lock = threading.Lock()
+
+    def stream(self, *parts: object) -> random.Random:
+        """식별자로 파생한 새 스트림 (같은 식별자면 같은 시퀀스)"""
+        return random.Random(derive_seed(self.seed, *parts))
+
+    def tick(self, tick_number: int, *parts: object) -> random.Random:
+        """틱 시뮬레이션 스트림"""
+        return self.stream("tick", tick_number, *parts)
+
+    def player(self, player_id: str) -> random.Random:
+        """플레이어 게임플레이 스트림 (세션 동안 같은 객체)"""
+        rng = self._players.get(player_id)
+        if rng is not None:
+            return rng
+        with self._lock:
+            rng = self._players.get(player_id)
+            if rng is None:
+                rng = self.stream("player", player_id)
+                self._players[player_id] = rng
+            return rng
+
+    def reset_player(self, player_id: str) -> None:
+        """플레이어 스트림 폐기 (다음 요청 시 처음부터 다시 파생)"""
+        with self._lock:
+            self._players.pop(player_id, None)
@@ -0,0 +1,420 @@
+"""
+ITW Core Engine - Engine Snapshot
+=================================
+엔진 전체 상태(노드/자원/Echo, 플레이어, 글로벌 훅, 서브 그리드 인스턴스)의
+단일 파일 바이너리 스냅샷
+
+DB 경로는 재시작 시 월드를 행 단위로 다시 조립하므로 큰 월드에서 수 분이 걸린다.
+스냅샷은 mmap으로 열고 노드는 접근할 때 하나씩 복원하므로 재시작이 즉시 끝난다.
+
+파일 구조 (정수는 모두 little-endian):
+    prefix   magic(8) | version(u32) | flags(u32) | header_offset(u64) | header_length(u64)
+    meta     JSON - tick_count, world_seed, players, global_hooks, sub_grid
+    coords   JSON - 노드 좌표 목록 ("x_y")
+    index    u64 배열 - 노드별 (offset, length) 쌍
+    nodes    노드별 compact JSON(MapNode.to_dict()) 연속 기록
+    header   JSON - 섹션 위치, 노드 수 (섹션 위치를 알아야 쓰므로 맨 끝)
+
+- 캡처(EngineSnapshot): 호출자가 월드 잠금을 쥔 채 바이트로 인코딩 = 일관된 사본
+- 기록(write_snapshot): 임시 파일 → fsync → os.replace (중간에 죽어도 기존 파일 유지)
+- 읽기(SnapshotReader + LazyNodeStore): 노드는 첫 접근 시 MapNode로 복원
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Self
+
+from src.core.logging import get_logger
+from src.core.world_generator import MapNode
+
+logger = get_logger(__name__)
+
+SNAPSHOT_MAGIC = b"ITWSNAP\x00"
+SNAPSHOT_VERSION = 1
+
+_PREFIX = struct.Struct("<8sIIQQ")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SnapshotError(ValueError):
+    """스냅샷 파일이 손상되었거나 현재 엔진과 호환되지 않음"""
+
+
+def encode_record(data: Any) -> bytes:
+    """스냅샷 레코드 인코딩 (compact JSON)"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_node(node: MapNode) -> bytes:
+    """노드 레코드 인코딩"""
+    return encode_record(node.to_dict())
+
+
+# === 캡처 / 기록 ===
+
+
+@dataclass
+class EngineSnapshot:
+    """
+    인코딩이 끝난 엔진 상태 사본
+
+    바이트만 보관하므로 캡처 이후 엔진이 바뀌어도 내용이 흔들리지 않는다.
+    """
+
+    meta: bytes
+    nodes: list[tuple[str, bytes]]
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        world_seed: int | None,
+        tick_count: int,
+        nodes: Iterable[tuple[str, bytes]],
+        players: list[dict[str, Any]],
+        global_hooks: dict[str, Any],
+        sub_grid: dict[str, Any],
+    ) -> "EngineSnapshot":
+        meta = {
+            "created_at": datetime.now(UTC).isoformat(),
+            "world_seed": world_seed,
+            "tick_count": tick_count,
+            "players": players,
+            "global_hooks": global_hooks,
+            "sub_grid": sub_grid,
+        }
+        return cls(meta=encode_record(meta), nodes=list(nodes))
+
+
+def _pack_index(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array("Q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _fsync_dir(path: str) -> None:
+    """rename 결과를 디스크에 반영 (지원하지 않는 플랫폼은 무시)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_snapshot(snapshot: EngineSnapshot, path: str) -> int:
+    """
+    스냅샷을 원자적으로 기록
+
+    Returns:
+        기록된 바이트 수
+    """
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    sections: dict[str, list[int]] = {}
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"\x00" * _PREFIX.size)
+
+            def section(name: str, payload: bytes) -> None:
+                sections[name] = [f.tell(), len(payload)]
+                f.write(payload)
+
+            section("meta", snapshot.meta)
+            section("coords", encode_record([coord for coord, _ in snapshot.nodes]))
+
+            # 노드 본문 위치는 인덱스 뒤로 정해지므로 인덱스 크기만큼 먼저 비워 둔다
+            index_offset = f.tell()
+            index_length = len(snapshot.nodes) * 2 * 8
+            sections["index"] = [index_offset, index_length]
+            f.seek(index_offset + index_length)
+
+            index = array("Q")
+            nodes_offset = f.tell()
+            for _, blob in snapshot.nodes:
+                index.append(f.tell())
+                index.append(len(blob))
+                f.write(blob)
+            sections["nodes"] = [nodes_offset, f.tell() - nodes_offset]
+
+            header_offset = f.tell()
+            header = encode_record(
+                {"sections": sections, "node_count": len(snapshot.nodes)}
+            )
+            f.write(header)
+            file_length = f.tell()
+
+            f.seek(index_offset)
+            f.write(_pack_index(index))
+            f.seek(0)
+            f.write(
+                _PREFIX.pack(
+                    SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, header_offset, len(header)
+                )
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(path)
+
+    logger.info(
+        "Snapshot written: %s (%d nodes, %d bytes)",
+        path,
+        len(snapshot.nodes),
+        file_length,
+    )
+    return file_length
+
+
+class SnapshotWriter:
+    """
+    백그라운드 스냅샷 기록기
+
+    기록 스레드는 하나라서 같은 경로에 대한 요청도 제출 순서대로 끝난다.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="itw-snapshot"
+        )
+
+    def submit(self, snapshot: EngineSnapshot, path: str) -> "Future[int]":
+        return self._executor.submit(write_snapshot, snapshot, path)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+# === 읽기 ===
+
+
+class SnapshotReader:
+    """
+    mmap 기반 스냅샷 리더
+
+    meta와 좌표 목록만 즉시 파싱하고, 노드 본문은 node_bytes()로 필요할 때 읽는다.
+    close() 전까지 파일 매핑을 유지한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")  # noqa: SIM115  close()에서 닫음
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # 빈 파일
+            self._file.close()
+            raise SnapshotError(f"Empty snapshot file: {path}") from exc
+
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        size = len(self._mmap)
+        if size < _PREFIX.size:
+            raise SnapshotError(f"Truncated snapshot file: {self.path}")
+        magic, version, _flags, header_offset, header_length = _PREFIX.unpack_from(
+            self._mmap, 0
+        )
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"Not an ITW snapshot: {self.path}")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}")
+        if header_offset + header_length != size:
+            raise SnapshotError(f"Truncated snapshot file: {self.path}")
+
+        header = json.loads(self._mmap[header_offset : header_offset + header_length])
+        self._sections: dict[str, list[int]] = header["sections"]
+        for name, (offset, length) in self._sections.items():
+            if offset + length > header_offset:
+                raise SnapshotError(f"Section {name} out of bounds: {self.path}")
+
+        self.node_count: int = header["node_count"]
+        self.meta: dict[str, Any] = json.loads(self._section("meta"))
+        self.coords: list[str] = json.loads(self._section("coords"))
+
+        offset, length = self._sections["index"]
+        if len(self.coords) != self.node_count or length != self.node_count * 16:
+            raise SnapshotError(f"Node index mismatch: {self.path}")
+        self._index: memoryview | array[int]
+        if _LITTLE_ENDIAN:
+            self._index = memoryview(self._mmap)[offset : offset + length].cast("Q")
+        else:
+            index = array("Q", self._mmap[offset : offset + length])
+            index.byteswap()
+            self._index = index
+
+    def _section(self, name: str) -> bytes:
+        offset, length = self._sections[name]
+        return self._mmap[offset : offset + length]
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap.closed
+
+    def node_bytes(self, position: int) -> bytes:
+        """position번째 노드 레코드 원본 바이트"""
+        offset = self._index[2 * position]
+        return self._mmap[offset : offset + self._index[2 * position + 1]]
+
+    def node(self, position: int) -> MapNode:
+        """position번째 노드 복원"""
+        return MapNode.from_dict(json.loads(self.node_bytes(position)))
+
+    def close(self) -> None:
+        index = getattr(self, "_index", None)
+        if isinstance(index, memoryview):
+            index.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class LazyNodeStore(MutableMapping[str, MapNode]):
+    """
+    스냅샷에서 지연 복원되는 노드 저장소 (WorldGenerator.nodes 대체)
+
+    dict처럼 쓰이며, 아직 복원되지 않은 좌표는 첫 접근 시 스냅샷에서 읽어
+    MapNode로 만든다. 전부 복원되면 파일 매핑을 닫는다.
+    values()/items() 순회는 남은 노드를 모두 복원한다.
+    """
+
+    def __init__(
+        self,
+        reader: SnapshotReader,
+        on_materialize: Callable[[MapNode], Any] | None = None,
+    ):
+        self._reader: SnapshotReader | None = reader
+        self._on_materialize = on_materialize
+        self._nodes: dict[str, MapNode] = {}
+        self._pending: dict[str, int] = {
+            coord: position for position, coord in enumerate(reader.coords)
+        }
+        self._lock = threading.Lock()
+        if not self._pending:
+            self._release()
+
+    @property
+    def pending_count(self) -> int:
+        """아직 복원되지 않은 노드 수"""
+        return len(self._pending)
+
+    def _release(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _materialize(self, coord: str) -> MapNode:
+        with self._lock:
+            node = self._nodes.get(coord)
+            if node is not None:
+                return node
+            position = self._pending.get(coord)
+            if position is None or self._reader is None:
+                raise KeyError(coord)
+            node = self._reader.node(position)
+            self._nodes[coord] = node
+            del self._pending[coord]
+            if self._on_materialize is not None:
+                self._on_materialize(node)
+            if not self._pending:
+                self._release()
+            return node
+
+    def materialize_all(self) -> int:
+        """남은 노드 전부 복원 (복원한 수 반환)"""
+        count = 0
+        for coord in list(self._pending):
+            if coord in self._pending:
+                self._materialize(coord)
+                count += 1
+        return count
+
+    def resident_nodes(self) -> list[MapNode]:
+        """이미 복원된 노드 (남은 노드는 복원하지 않음)"""
+        with self._lock:
+            return list(self._nodes.values())
+
+    def raw_items(self) -> list[tuple[str, bytes | MapNode]]:
+        """
+        저장용 순회: 복원된 노드는 MapNode, 남은 노드는 원본 레코드 바이트
+
+        재저장 시 건드리지 않은 노드를 디코딩/재인코딩하지 않기 위함.
+        """
+        with self._lock:
+            items: list[tuple[str, bytes | MapNode]] = list(self._nodes.items())
+            if self._reader is not None:
+                items.extend(
+                    (coord, self._reader.node_bytes(position))
+                    for coord, position in self._pending.items()
+                )
+            return items
+
+    def close(self) -> None:
+        """파일 매핑 해제 (남은 노드는 버려짐)"""
+        with self._lock:
+            self._pending.clear()
+            self._release()
+
+    # === MutableMapping ===
+
+    def __getitem__(self, coord: str) -> MapNode:
+        node = self._nodes.get(coord)
+        if node is not None:
+            return node
+        return self._materialize(coord)
+
+    def __setitem__(self, coord: str, node: MapNode) -> None:
+        with self._lock:
+            self._nodes[coord] = node
+            if self._pending.pop(coord, None) is not None and not self._pending:
+                self._release()
+
+    def __delitem__(self, coord: str) -> None:
+        with self._lock:
+            if self._nodes.pop(coord, None) is not None:
+                return
+            if self._pending.pop(coord, None) is None:
+                raise KeyError(coord)
+            if not self._pending:
+                self._release()
+
+    def __contains__(self, coord: object) -> bool:
+        return coord in self._nodes or coord in self._pending
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([*self._nodes, *self._pending])
+
+    def __len__(self) -> int:
+        return len(self._nodes) + len(self._pending)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyNodeStore(materialized={len(self._nodes)}, "
+            f"pending={len(self._pending)})"
+        )
@@ -10,10 +10,11 @@ import random
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 from src.core.axiom_system import AxiomLoader, AxiomVector, DomainType
 from src.core.logging import get_logger
+from src.core.rng import derive_seed
 
 logger = get_logger(__name__)
 
@@ -128,6 +129,35 @@ class SubGridNode:
         )
 
 
+# 층 내부 좌표 (sx, sy)
+FloorPos = tuple[int, int]
+
+
+@dataclass
+class SubGridFloor:
+    """
+    서브 그리드 한 층 (일괄 생성/캐시 단위)
+
+    층 전체 셀과 수평 인접 그래프, 출구 위치를 함께 보관한다.
+    층 내 이동은 cells/adjacency 딕셔너리 조회만으로 처리된다.
+    """
+
+    parent_coordinate: str
+    sz: int
+    depth_tier: int
+    cells: dict[FloorPos, SubGridNode]
+    adjacency: dict[FloorPos, tuple[FloorPos, ...]]
+    exits: list[FloorPos] = field(default_factory=list)
+
+    def get_cell(self, sx: int, sy: int) -> SubGridNode | None:
+        """층 내 셀 조회"""
+        return self.cells.get((sx, sy))
+
+    def is_connected(self, origin: FloorPos, target: FloorPos) -> bool:
+        """두 셀이 수평으로 직접 연결되어 있는지"""
+        return target in self.adjacency.get(origin, ())
+
+
 class SubGridGenerator:
     """
     서브 그리드 절차적 생성기
@@ -137,6 +167,9 @@ class SubGridGenerator:
     - 난이도: depth_tier + abs(sz)
     """
 
+    # 수평 이동 한계 (sx, sy 각각 -GRID_RADIUS ~ +GRID_RADIUS)
+    GRID_RADIUS = 5
+
     # 티어별 문자열
     TIER_NAMES = {1: "Common", 2: "Uncommon", 3: "Rare", 4: "Epic", 5: "Legendary"}
 
@@ -188,6 +221,87 @@ class SubGridGenerator:
         self.axiom_loader = axiom_loader
         self.seed = seed
         self.nodes: dict[str, SubGridNode] = {}
+        # 인스턴스(부모 좌표)별 셀 ID 색인 - 인스턴스 단위 로드/축출용
+        self._instance_cells: dict[str, set[str]] = {}
+        # 일괄 생성된 층: (부모 좌표, sz) → SubGridFloor
+        self.floors: dict[tuple[str, int], SubGridFloor] = {}
+        # 티어별 Axiom 후보 풀 (중복 제거 완료) - 셀마다 다시 만들지 않음
+        self._axiom_pools: dict[int, list] = {}
+        # 층 수평 인접 그래프 - 모든 층이 같은 격자를 쓰므로 한 번만 계산
+        self._floor_adjacency: dict[FloorPos, tuple[FloorPos, ...]] | None = None
+        self._node_listeners: list[Callable[[SubGridNode], None]] = []
+
+    def add_node_listener(self, listener: Callable[[SubGridNode], None]) -> None:
+        """노드 생성/변경 알림 구독 (캐시 무효화용)"""
+        self._node_listeners.append(listener)
+
+    def notify_node_changed(self, node: SubGridNode) -> None:
+        """노드 생성/변경을 구독자에게 알림"""
+        for listener in self._node_listeners:
+            listener(node)
+
+    def notify_instance_changed(self, nodes: list[SubGridNode]) -> None:
+        """
+        여러 셀 생성/적재를 인스턴스당 한 번만 알림
+
+        구독자(도달성 색인, 인스턴스 저장소)는 인스턴스 단위로 무효화하므로
+        셀마다 알리면 같은 무효화가 셀 수만큼 반복된다.
+        """
+        first: dict[str, SubGridNode] = {}
+        for node in nodes:
+            first.setdefault(node.parent_coordinate, node)
+        for node in first.values():
+            self.notify_node_changed(node)
+
+    def _store_node(self, node: SubGridNode) -> None:
+        """노드를 저장하고 인스턴스 색인에 등록"""
+        self.nodes[node.id] = node
+        self._instance_cells.setdefault(node.parent_coordinate, set()).add(node.id)
+
+    # === 인스턴스 단위 관리 ===
+
+    def is_instance_resident(self, parent_coordinate: str) -> bool:
+        """인스턴스의 셀이 메모리에 하나라도 있는지"""
+        return bool(self._instance_cells.get(parent_coordinate))
+
+    def get_resident_instances(self) -> list[str]:
+        """메모리에 셀이 있는 인스턴스(부모 좌표) 목록"""
+        return [parent for parent, cells in self._instance_cells.items() if cells]
+
+    def get_instance_nodes(self, parent_coordinate: str) -> list[SubGridNode]:
+        """인스턴스에 속한 메모리 상의 모든 셀"""
+        cell_ids = self._instance_cells.get(parent_coordinate, ())
+        return [self.nodes[cell_id] for cell_id in cell_ids]
+
+    def load_instance(self, nodes: list[SubGridNode]) -> int:
+        """
+        저장소에서 읽은 셀을 메모리에 적재
+
+        이미 메모리에 있는 셀은 덮어쓰지 않는다 (메모리 쪽이 최신).
+
+        Returns:
+            새로 적재된 셀 수
+        """
+        loaded: list[SubGridNode] = []
+        for node in nodes:
+            if node.id in self.nodes:
+                continue
+            self._store_node(node)
+            loaded.append(node)
+        self.notify_instance_changed(loaded)
+        return len(loaded)
+
+    def evict_instance(self, parent_coordinate: str) -> list[SubGridNode]:
+        """
+        인스턴스의 모든 셀을 메모리에서 제거
+
+        Returns:
+            제거된 셀 목록 (저장은 호출자 책임)
+        """
+        cell_ids = self._instance_cells.pop(parent_coordinate, set())
+        for key in [key for key in self.floors if key[0] == parent_coordinate]:
+            del self.floors[key]
+        return [self.nodes.pop(cell_id) for cell_id in cell_ids]
 
     def _get_coord_seed(
         self, parent_x: int, parent_y: int, sx: int, sy: int, sz: int
@@ -195,6 +309,10 @@ class SubGridGenerator:
         """좌표 기반 결정론적 시드 생성"""
         return hash((self.seed, parent_x, parent_y, sx, sy, sz)) & 0xFFFFFFFF
 
+    def _get_floor_seed(self, parent_x: int, parent_y: int, sz: int) -> int:
+        """층 단위 결정론적 시드 생성 (문자열 hash()는 프로세스마다 달라 쓰지 않음)"""
+        return derive_seed(self.seed, "floor", parent_x, parent_y, sz)
+
     def _calculate_effective_tier(self, depth_tier: int, sz: int) -> int:
         """유효 난이도 계산: depth_tier + abs(sz)"""
         return min(depth_tier + abs(sz), 5)  # 최대 5 (Legendary)
@@ -203,8 +321,12 @@ class SubGridGenerator:
         """티어 숫자를 문자열로 변환"""
         return self.TIER_NAMES.get(effective_tier, "Common")
 
-    def _select_axioms_by_tier(self, effective_tier: int, count: int = 3) -> list:
-        """티어에 따른 Axiom 선택"""
+    def _get_axiom_pool(self, effective_tier: int) -> list:
+        """티어별 Axiom 후보 풀 (캐시)"""
+        pool = self._axiom_pools.get(effective_tier)
+        if pool is not None:
+            return pool
+
         if effective_tier >= 4:
             # Epic/Legendary: Mystery 도메인 포함
             pool = self.axiom_loader.get_by_tier(3) + self.axiom_loader.get_by_domain(
@@ -221,24 +343,32 @@ class SubGridGenerator:
             pool = self.axiom_loader.get_by_tier(1)
 
         pool = list({a.id: a for a in pool}.values())
-        return random.sample(pool, min(count, len(pool)))
+        self._axiom_pools[effective_tier] = pool
+        return pool
+
+    def _select_axioms_by_tier(
+        self, rng: random.Random, effective_tier: int, count: int = 3
+    ) -> list:
+        """티어에 따른 Axiom 선택"""
+        pool = self._get_axiom_pool(effective_tier)
+        return rng.sample(pool, min(count, len(pool)))
 
-    def _generate_vector(self, effective_tier: int) -> AxiomVector:
+    def _generate_vector(self, rng: random.Random, effective_tier: int) -> AxiomVector:
         """Axiom 벡터 생성"""
         vector = AxiomVector()
 
-        axiom_count = random.randint(1, min(4, effective_tier + 1))
-        selected = self._select_axioms_by_tier(effective_tier, axiom_count)
+        axiom_count = rng.randint(1, min(4, effective_tier + 1))
+        selected = self._select_axioms_by_tier(rng, effective_tier, axiom_count)
 
         for i, axiom in enumerate(selected):
             weight = 0.8 - (i * 0.15)
-            weight = max(0.2, weight + random.uniform(-0.1, 0.1))
+            weight = max(0.2, weight + rng.uniform(-0.1, 0.1))
             vector.add(axiom.code, weight)
 
         return vector
 
     def _generate_sensory(
-        self, vector: AxiomVector, effective_tier: int, sz: int
+        self, rng: random.Random, vector: AxiomVector, effective_tier: int, sz: int
     ) -> dict[str, Any]:
         """감각 데이터 생성"""
         dominant_code = vector.get_dominant()
@@ -265,9 +395,9 @@ class SubGridGenerator:
         elif sz > 0:
             depth_desc = f"상층 {sz}층. "
 
-        atmosphere = random.choice(templates["atmosphere"])
-        sound = random.choice(templates["sound"])
-        smell = random.choice(templates["smell"])
+        atmosphere = rng.choice(templates["atmosphere"])
+        sound = rng.choice(templates["sound"])
+        smell = rng.choice(templates["smell"])
 
         axiom_name = dominant_axiom.name_kr if dominant_axiom else "알 수 없는"
 
@@ -320,51 +450,159 @@ class SubGridGenerator:
         if node_id in self.nodes:
             return self.nodes[node_id]
 
-        # 좌표 기반 결정론적 시드 설정
-        random.seed(self._get_coord_seed(parent_x, parent_y, sx, sy, sz))
+        # 좌표 기반 결정론적 시드 (전역 RNG를 건드리지 않도록 로컬 인스턴스)
+        rng = random.Random(self._get_coord_seed(parent_x, parent_y, sx, sy, sz))
 
         # 유효 난이도 계산
         effective_tier = self._calculate_effective_tier(depth_tier, sz)
-        tier_name = self._get_tier_name(effective_tier)
 
-        # Axiom 벡터 생성
-        vector = self._generate_vector(effective_tier)
+        node = self._build_node(
+            rng,
+            parent_coordinate,
+            sx,
+            sy,
+            sz,
+            effective_tier,
+            self._generate_required_tags(effective_tier, sz),
+        )
 
-        # 감각 데이터 생성
-        sensory = self._generate_sensory(vector, effective_tier, sz)
+        self._store_node(node)
+        self.notify_node_changed(node)
+        logger.debug("Generated SubGridNode: %s (tier=%s)", node_id, node.tier)
 
-        # 필수 태그 생성
-        required_tags = self._generate_required_tags(effective_tier, sz)
+        return node
+
+    def _build_node(
+        self,
+        rng: random.Random,
+        parent_coordinate: str,
+        sx: int,
+        sy: int,
+        sz: int,
+        effective_tier: int,
+        required_tags: list[str],
+    ) -> SubGridNode:
+        """셀 하나의 내용 생성 (저장/알림 없음)"""
+        # Axiom 벡터 생성
+        vector = self._generate_vector(rng, effective_tier)
 
-        # 입구/출구 판정
-        is_entrance = sz == 0 and sx == 0 and sy == 0
-        is_exit = False  # 출구는 별도 로직으로 설정
+        # 감각 데이터 생성
+        sensory = self._generate_sensory(rng, vector, effective_tier, sz)
 
-        # 노드 생성
-        node = SubGridNode(
+        return SubGridNode(
             parent_coordinate=parent_coordinate,
             sx=sx,
             sy=sy,
             sz=sz,
-            tier=tier_name,
+            tier=self._get_tier_name(effective_tier),
             axiom_vector=vector.to_dict(),
             sensory_data=sensory,
-            required_tags=required_tags,
-            is_entrance=is_entrance,
-            is_exit=is_exit,
+            required_tags=list(required_tags),
+            is_entrance=sz == 0 and sx == 0 and sy == 0,
+            is_exit=False,  # 출구는 층 단위 생성에서 배치
         )
 
-        self.nodes[node_id] = node
-        logger.debug("Generated SubGridNode: %s (tier=%s)", node_id, tier_name)
-
-        return node
-
     def generate_entrance(
         self, parent_x: int, parent_y: int, depth_tier: int
     ) -> SubGridNode:
         """입구 노드 생성 (sz=0, sx=0, sy=0)"""
         return self.generate_node(parent_x, parent_y, 0, 0, 0, depth_tier)
 
+    # === 층 단위 일괄 생성 ===
+
+    def _get_floor_adjacency(self) -> dict[FloorPos, tuple[FloorPos, ...]]:
+        """층 수평 인접 그래프 (N/S/E/W, GRID_RADIUS 경계)"""
+        if self._floor_adjacency is None:
+            radius = self.GRID_RADIUS
+            span = range(-radius, radius + 1)
+            adjacency: dict[FloorPos, tuple[FloorPos, ...]] = {}
+            for sy in span:
+                for sx in span:
+                    adjacency[(sx, sy)] = tuple(
+                        (sx + dx, sy + dy)
+                        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0))
+                        if abs(sx + dx) <= radius and abs(sy + dy) <= radius
+                    )
+            self._floor_adjacency = adjacency
+        return self._floor_adjacency
+
+    def generate_floor(
+        self, parent_x: int, parent_y: int, sz: int, depth_tier: int
+    ) -> SubGridFloor:
+        """
+        서브 그리드 한 층 전체를 일괄 생성
+
+        유효 티어/필수 태그/Axiom 풀은 층 단위로 한 번만 계산하고,
+        층 시드 하나의 RNG 스트림으로 모든 셀을 채운다.
+        이미 존재하는 셀(개별 생성/DB 로드)은 덮어쓰지 않는다.
+
+        Args:
+            parent_x, parent_y: 부모 메인 노드 좌표
+            sz: 층 (0=입구층)
+            depth_tier: 기본 난이도 (DepthPoint.depth_tier)
+
+        Returns:
+            캐시된 SubGridFloor
+        """
+        parent_coordinate = f"{parent_x}_{parent_y}"
+        key = (parent_coordinate, sz)
+        floor = self.floors.get(key)
+        if floor is not None:
+            return floor
+
+        rng = random.Random(self._get_floor_seed(parent_x, parent_y, sz))
+        effective_tier = self._calculate_effective_tier(depth_tier, sz)
+        required_tags = self._generate_required_tags(effective_tier, sz)
+        adjacency = self._get_floor_adjacency()
+
+        cells: dict[FloorPos, SubGridNode] = {}
+        created: list[SubGridNode] = []
+        for sx, sy in adjacency:
+            existing = self.nodes.get(f"{parent_coordinate}_{sx}_{sy}_{sz}")
+            if existing is not None:
+                cells[(sx, sy)] = existing
+                continue
+            node = self._build_node(
+                rng, parent_coordinate, sx, sy, sz, effective_tier, required_tags
+            )
+            cells[(sx, sy)] = node
+            created.append(node)
+
+        # 출구 배치: 기존 출구가 없을 때만, 새로 만든 셀 중에서 (입구 제외)
+        exits = [pos for pos, node in cells.items() if node.is_exit]
+        if not exits:
+            candidates = [node for node in created if not node.is_entrance]
+            exit_count = min(1 if effective_tier < 3 else 2, len(candidates))
+            for node in rng.sample(candidates, exit_count):
+                node.is_exit = True
+                exits.append((node.sx, node.sy))
+
+        for node in created:
+            self._store_node(node)
+        self.notify_instance_changed(created)
+
+        floor = SubGridFloor(
+            parent_coordinate=parent_coordinate,
+            sz=sz,
+            depth_tier=depth_tier,
+            cells=cells,
+            adjacency=adjacency,
+            exits=exits,
+        )
+        self.floors[key] = floor
+        logger.debug(
+            "Generated SubGridFloor: %s sz=%d (%d new cells, tier=%d)",
+            parent_coordinate,
+            sz,
+            len(created),
+            effective_tier,
+        )
+        return floor
+
+    def get_floor(self, parent_x: int, parent_y: int, sz: int) -> SubGridFloor | None:
+        """캐시된 층 조회 (없으면 None)"""
+        return self.floors.get((f"{parent_x}_{parent_y}", sz))
+
     def get_node(
         self, parent_x: int, parent_y: int, sx: int, sy: int, sz: int
     ) -> SubGridNode | None:
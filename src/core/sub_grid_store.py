@@ -0,0 +1,342 @@
+"""
+ITW Core Engine - Sub Grid Instance Store
+==========================================
+던전(서브 그리드) 인스턴스 단위 영속화 및 메모리 수명 관리
+
+인스턴스 = 하나의 부모 메인 노드("x_y") 아래 생성된 셀 전체.
+- enter: 인스턴스가 메모리에 없으면 DB에서 지연 로드, 점유자 등록
+- leave: 마지막 점유자가 나가면 유휴 시각 기록
+- evict_idle: 유휴 시간이 idle_evict_seconds를 넘긴 인스턴스를
+  DB에 일괄 저장한 뒤 메모리에서 제거 (저장 실패 시 남겨 두고 다음 주기에 재시도).
+  플레이어 명령이 아닌 주기 작업(ITWEngine.evict_idle_sub_grids)에서 호출된다
+
+세션 팩토리가 없으면 저장 없이 축출만 한다.
+(셀은 좌표 시드로 결정론적으로 재생성되므로 구조는 유실되지 않는다)
+
+설계 참조: docs/20_design/sub-grid.md
+"""
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from src.core.logging import get_logger
+from src.core.sub_grid import SubGridGenerator, SubGridNode
+from src.db.models import SubGridInstanceModel, SubGridNodeModel
+
+logger = get_logger(__name__)
+
+
+def _sub_grid_node_to_row(node: SubGridNode) -> dict:
+    """SubGridNode → sub_grid_nodes 행 매핑 (bulk insert용)"""
+    return {
+        "id": node.id,
+        "parent_coordinate": node.parent_coordinate,
+        "sx": node.sx,
+        "sy": node.sy,
+        "sz": node.sz,
+        "tier": node.tier,
+        "axiom_vector": node.axiom_vector,
+        "sensory_data": node.sensory_data,
+        "required_tags": node.required_tags,
+        "is_entrance": node.is_entrance,
+        "is_exit": node.is_exit,
+        "created_at": node.created_at,
+    }
+
+
+def _model_to_sub_grid_node(model: SubGridNodeModel) -> SubGridNode:
+    """SubGridNodeModel → SubGridNode 변환"""
+    return SubGridNode(
+        parent_coordinate=model.parent_coordinate,
+        sx=model.sx,
+        sy=model.sy,
+        sz=model.sz,
+        tier=model.tier,
+        axiom_vector=model.axiom_vector or {},
+        sensory_data=model.sensory_data or {},
+        required_tags=list(model.required_tags or []),
+        is_entrance=model.is_entrance,
+        is_exit=model.is_exit,
+        created_at=model.created_at,
+    )
+
+
+class SubGridInstanceManager:
+    """
+    서브 그리드 인스턴스 수명 관리자
+
+    점유자(player_id) 집합과 유휴 시작 시각을 인스턴스별로 추적한다.
+    변경 여부는 생성기의 노드 리스너로 감지하여, 바뀐 인스턴스만 저장한다.
+    """
+
+    # 마지막 퇴장 후 축출까지 기본 유휴 시간 (초)
+    DEFAULT_IDLE_EVICT_SECONDS = 600.0
+
+    def __init__(
+        self,
+        generator: SubGridGenerator,
+        session_factory: Callable[[], Session] | None = None,
+        idle_evict_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.generator = generator
+        self.session_factory = session_factory
+        self.idle_evict_seconds = (
+            self.DEFAULT_IDLE_EVICT_SECONDS
+            if idle_evict_seconds is None
+            else idle_evict_seconds
+        )
+        self._clock = clock
+
+        self._occupants: dict[str, set[str]] = {}
+        self._idle_since: dict[str, float] = {}
+        self._loaded: set[str] = set()
+        self._dirty: set[str] = set()
+        self._loading = False
+
+        generator.add_node_listener(self._on_node_changed)
+
+    def _on_node_changed(self, node: SubGridNode) -> None:
+        """생성/변경된 셀의 인스턴스를 저장 대상으로 표시"""
+        if self._loading:
+            return
+        self._dirty.add(node.parent_coordinate)
+        # 점유자 없이 생성된 인스턴스(디버그/사전 생성)도 축출 대상으로 추적
+        if not self._occupants.get(node.parent_coordinate):
+            self._idle_since.setdefault(node.parent_coordinate, self._clock())
+
+    # === 점유 관리 ===
+
+    def enter(self, parent_coordinate: str, player_id: str) -> int:
+        """
+        플레이어 진입: 필요 시 인스턴스를 로드하고 점유자로 등록
+
+        Returns:
+            DB에서 새로 적재된 셀 수
+        """
+        loaded = self.ensure_loaded(parent_coordinate)
+        self._occupants.setdefault(parent_coordinate, set()).add(player_id)
+        self._idle_since.pop(parent_coordinate, None)
+        return loaded
+
+    def leave(self, parent_coordinate: str, player_id: str) -> None:
+        """플레이어 퇴장: 마지막 점유자면 유휴 시각 기록"""
+        occupants = self._occupants.get(parent_coordinate)
+        if occupants is None:
+            return
+        occupants.discard(player_id)
+        if not occupants:
+            del self._occupants[parent_coordinate]
+            self._idle_since[parent_coordinate] = self._clock()
+
+    def occupants(self, parent_coordinate: str) -> set[str]:
+        """현재 점유자 집합 (복사본)"""
+        return set(self._occupants.get(parent_coordinate, ()))
+
+    # === 로드 / 저장 ===
+
+    def ensure_loaded(self, parent_coordinate: str) -> int:
+        """인스턴스가 아직 로드되지 않았으면 DB에서 읽어 적재"""
+        if parent_coordinate in self._loaded:
+            return 0
+        self._loaded.add(parent_coordinate)
+        if self.session_factory is None:
+            return 0
+
+        session = self.session_factory()
+        try:
+            if session.get(SubGridInstanceModel, parent_coordinate) is None:
+                return 0
+            models = session.scalars(
+                select(SubGridNodeModel).where(
+                    SubGridNodeModel.parent_coordinate == parent_coordinate
+                )
+            ).all()
+            nodes = [_model_to_sub_grid_node(model) for model in models]
+        finally:
+            session.close()
+
+        self._loading = True
+        try:
+            loaded = self.generator.load_instance(nodes)
+        finally:
+            self._loading = False
+
+        logger.debug(
+            "Loaded sub-grid instance %s (%d cells)", parent_coordinate, loaded
+        )
+        return loaded
+
+    def flush(self, parent_coordinate: str) -> int:
+        """
+        인스턴스의 메모리 상 셀을 DB에 일괄 저장 (변경된 경우만)
+
+        Returns:
+            저장된 셀 수
+        """
+        if self.session_factory is None or parent_coordinate not in self._dirty:
+            return 0
+
+        if not self.generator.is_instance_resident(parent_coordinate):
+            self._dirty.discard(parent_coordinate)
+            return 0
+
+        # 지연 로드 없이 생성된 셀만 있으면 DB 쪽 셀이 지워지므로 먼저 병합
+        self.ensure_loaded(parent_coordinate)
+        nodes = self.generator.get_instance_nodes(parent_coordinate)
+
+        session = self.session_factory()
+        try:
+            session.execute(
+                delete(SubGridNodeModel).where(
+                    SubGridNodeModel.parent_coordinate == parent_coordinate
+                )
+            )
+            session.execute(
+                insert(SubGridNodeModel),
+                [_sub_grid_node_to_row(node) for node in nodes],
+            )
+
+            instance = session.get(SubGridInstanceModel, parent_coordinate)
+            if instance is None:
+                instance = SubGridInstanceModel(parent_coordinate=parent_coordinate)
+                session.add(instance)
+            instance.cell_count = len(nodes)
+            instance.updated_at = datetime.utcnow()
+            if parent_coordinate in self._idle_since:
+                instance.last_exit_at = datetime.utcnow()
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        self._dirty.discard(parent_coordinate)
+        return len(nodes)
+
+    def flush_all(self) -> int:
+        """변경된 모든 인스턴스 저장 (종료 시)"""
+        return sum(self.flush(parent) for parent in list(self._dirty))
+
+    # === 스냅샷 ===
+
+    def export_state(self) -> dict[str, Any]:
+        """메모리 상주 인스턴스의 셀과 점유자 (엔진 스냅샷용)"""
+        return {
+            parent: {
+                "cells": [
+                    node.to_dict() for node in self.generator.get_instance_nodes(parent)
+                ],
+                "occupants": sorted(self._occupants.get(parent, ())),
+            }
+            for parent in self.generator.get_resident_instances()
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> int:
+        """
+        스냅샷의 인스턴스 적재
+
+        스냅샷이 DB보다 최신일 수 있으므로 적재한 인스턴스는 저장 대상으로 표시한다.
+
+        Returns:
+            적재된 셀 수
+        """
+        loaded = 0
+        for parent, instance in state.items():
+            nodes = [SubGridNode.from_dict(cell) for cell in instance["cells"]]
+            self._loading = True
+            try:
+                loaded += self.generator.load_instance(nodes)
+            finally:
+                self._loading = False
+            self._loaded.add(parent)
+            self._dirty.add(parent)
+
+            occupants = set(instance.get("occupants", ()))
+            if occupants:
+                self._occupants.setdefault(parent, set()).update(occupants)
+                self._idle_since.pop(parent, None)
+            elif not self._occupants.get(parent):
+                self._idle_since.setdefault(parent, self._clock())
+        return loaded
+
+    # === 축출 ===
+
+    def evict(self, parent_coordinate: str) -> bool:
+        """
+        인스턴스를 저장 후 메모리에서 제거
+
+        점유자가 있으면 축출하지 않는다.
+        """
+        if self._occupants.get(parent_coordinate):
+            return False
+
+        try:
+            self.flush(parent_coordinate)
+        except Exception:
+            # 저장 실패: 메모리에 남겨 두고(변경 표시 유지) 다음 축출 주기에 재시도
+            logger.exception(
+                "Failed to flush sub-grid instance %s, keeping it resident",
+                parent_coordinate,
+            )
+            return False
+        evicted = self.generator.evict_instance(parent_coordinate)
+        self._loaded.discard(parent_coordinate)
+        self._idle_since.pop(parent_coordinate, None)
+        self._dirty.discard(parent_coordinate)
+
+        logger.debug(
+            "Evicted sub-grid instance %s (%d cells)", parent_coordinate, len(evicted)
+        )
+        return True
+
+    def idle_expired(self, now: float | None = None) -> list[str]:
+        """유휴 시간이 idle_evict_seconds를 넘긴 인스턴스 목록"""
+        now = self._clock() if now is None else now
+        return [
+            parent
+            for parent, since in self._idle_since.items()
+            if now - since >= self.idle_evict_seconds
+        ]
+
+    def evict_if_idle(self, parent_coordinate: str, now: float | None = None) -> bool:
+        """아직 유휴 시간이 지난 상태면 축출 (목록 조회 후 재진입한 경우 건너뜀)"""
+        since = self._idle_since.get(parent_coordinate)
+        if since is None:
+            return False
+        now = self._clock() if now is None else now
+        if now - since < self.idle_evict_seconds:
+            return False
+        return self.evict(parent_coordinate)
+
+    def evict_idle(self, now: float | None = None) -> list[str]:
+        """
+        유휴 시간이 지난 인스턴스 축출 (저장 실패한 인스턴스는 남김)
+
+        Returns:
+            축출된 인스턴스의 부모 좌표 목록
+        """
+        return [parent for parent in self.idle_expired(now) if self.evict(parent)]
+
+    # === 통계 ===
+
+    @property
+    def resident_instances(self) -> int:
+        """메모리에 셀이 있는 인스턴스 수"""
+        return len(self.generator.get_resident_instances())
+
+    def get_stats(self) -> dict[str, int]:
+        """인스턴스 상주 통계"""
+        return {
+            "resident_instances": self.resident_instances,
+            "resident_cells": len(self.generator.nodes),
+            "occupied_instances": len(self._occupants),
+            "idle_instances": len(self._idle_since),
+        }
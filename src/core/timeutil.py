@@ -0,0 +1,27 @@
+"""
+ITW Core Engine - Time Helpers
+==============================
+Echo/글로벌 훅이 공유하는 타임스탬프 변환 (모두 naive UTC 기준)
+"""
+
+from datetime import datetime
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """ISO 타임스탬프 파싱 (Z/+00:00 접미사 제거, naive UTC)"""
+    return datetime.fromisoformat(
+        timestamp.replace("Z", "+00:00").replace("+00:00", "")
+    )
+
+
+def to_epoch(moment: datetime) -> float:
+    """naive UTC datetime → epoch 초"""
+    return (moment - EPOCH).total_seconds()
+
+
+def week_bucket(moment: datetime) -> int:
+    """ISO 주차 버킷 (year * 100 + week)"""
+    year, week, _ = moment.isocalendar()
+    return year * 100 + week
@@ -0,0 +1,395 @@
+"""
+경량 턴 트레이싱 (외부 의존성 없음)
+
+느린 턴에서 시간이 어디에 쓰였는지(EventBus 핸들러, 서비스, SQL, 프롬프트 구성,
+LLM 호출) 보기 위한 스팬 트리를 만든다.
+
+- TRACER.trace(name, kind): 루트 스팬. sample_rate에 뽑혔거나 force=True일 때만 기록
+- TRACER.span(name, kind): 진행 중인 트레이스 안에서만 자식 스팬을 기록 (밖이면 no-op)
+- TRACER.start_span()/finish_span(): 현재 스팬을 바꾸지 않는 말단 스팬 (SQL 이벤트용)
+- @traced: 클래스의 공개 메서드마다 "Class.method" 서비스 스팬
+- 현재 스팬은 contextvars로 전달된다 (copy_context, asyncio 태스크, to_thread 포함)
+- 끝난 트레이스 중 min_duration_ms 이상인 것만 링 버퍼(capacity)에 남는다
+- export는 JSON dict: 스팬 목록(부모 id, 시작 오프셋, 길이) + critical path
+"""
+
+import functools
+import inspect
+import itertools
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from typing import Any, Optional, TypeVar
+
+# 트레이스 1개에 기록하는 최대 스팬 수 (넘으면 dropped_spans로만 집계)
+MAX_SPANS_PER_TRACE = 2000
+# SQL 등 긴 속성 값 자르기
+MAX_ATTR_LENGTH = 200
+
+_CURRENT: ContextVar[Optional["Span"]] = ContextVar("itw_current_span", default=None)
+
+
+def current_span() -> Optional["Span"]:
+    """현재 컨텍스트의 스팬 (트레이스 밖이면 None)"""
+    return _CURRENT.get()
+
+
+def _attr(value: Any) -> Any:
+    if isinstance(value, (bool, int, float)) or value is None:
+        return value
+    text = str(value)
+    return text if len(text) <= MAX_ATTR_LENGTH else text[:MAX_ATTR_LENGTH] + "…"
+
+
+class Span:
+    """스팬 1개 (perf_counter 기준 시각)"""
+
+    __slots__ = (
+        "attrs",
+        "end",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+        "span_id",
+        "start",
+        "thread",
+        "trace",
+    )
+
+    def __init__(
+        self,
+        trace: "Trace",
+        span_id: int,
+        parent_id: int | None,
+        name: str,
+        kind: str,
+        attrs: dict[str, Any],
+    ):
+        self.trace = trace
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.perf_counter()
+        self.end: float | None = None
+        self.attrs = {key: _attr(value) for key, value in attrs.items()}
+        self.error: str | None = None
+        self.thread = threading.current_thread().name
+
+    @property
+    def duration(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def set(self, **attrs: Any) -> None:
+        """속성 추가 (응답 상태 등 끝날 때 알게 되는 값)"""
+        for key, value in attrs.items():
+            self.attrs[key] = _attr(value)
+
+    def to_dict(self, origin: float) -> dict[str, Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+            "thread": self.thread,
+            "attrs": dict(self.attrs),
+            "error": self.error,
+        }
+
+
+class Trace:
+    """루트 스팬 1개에서 시작한 스팬 모음"""
+
+    def __init__(self, trace_id: str, max_spans: int):
+        self.trace_id = trace_id
+        self.started_at = time.time()
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+        self._max_spans = max_spans
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    @property
+    def duration_ms(self) -> float:
+        return self.root.duration * 1000
+
+    def new_span(
+        self, name: str, kind: str, parent: Span | None, attrs: dict[str, Any]
+    ) -> Span | None:
+        with self._lock:
+            if len(self.spans) >= self._max_spans:
+                self.dropped_spans += 1
+                return None
+            span = Span(
+                self,
+                next(self._ids),
+                parent.span_id if parent is not None else None,
+                name,
+                kind,
+                attrs,
+            )
+            self.spans.append(span)
+            return span
+
+    def critical_path(self) -> list[dict[str, Any]]:
+        """루트부터 가장 오래 걸린 자식을 따라간 경로 (self_ms: 자식 제외 시간)"""
+        with self._lock:
+            spans = list(self.spans)
+        children: dict[int | None, list[Span]] = {}
+        for span in spans:
+            children.setdefault(span.parent_id, []).append(span)
+
+        path: list[dict[str, Any]] = []
+        node: Span | None = spans[0] if spans else None
+        while node is not None:
+            kids = children.get(node.span_id, [])
+            busy = sum(kid.duration for kid in kids)
+            path.append(
+                {
+                    "span_id": node.span_id,
+                    "name": node.name,
+                    "kind": node.kind,
+                    "duration_ms": round(node.duration * 1000, 3),
+                    "self_ms": round(max(0.0, node.duration - busy) * 1000, 3),
+                }
+            )
+            node = max(kids, key=lambda kid: kid.duration) if kids else None
+        return path
+
+    def summary(self) -> dict[str, Any]:
+        root = self.root
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            "error": root.error,
+            "attrs": dict(root.attrs),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = list(self.spans)
+        origin = spans[0].start
+        data = self.summary()
+        data["critical_path"] = self.critical_path()
+        data["spans"] = [span.to_dict(origin) for span in spans]
+        return data
+
+
+class _NoopScope:
+    """트레이스 밖의 span()/trace() (아무것도 하지 않음)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NOOP = _NoopScope()
+
+
+class _SpanScope:
+    """스팬을 현재 스팬으로 두고 끝나면 닫는 컨텍스트 매니저"""
+
+    __slots__ = ("_span", "_token", "_tracer")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self._tracer = tracer
+        self._span = span
+        self._token: Token[Span | None] | None = None
+
+    def __enter__(self) -> Span:
+        self._token = _CURRENT.set(self._span)
+        return self._span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: object,
+    ) -> None:
+        if self._token is not None:
+            _CURRENT.reset(self._token)
+        error = f"{exc_type.__name__}: {exc}" if exc_type is not None else None
+        self._tracer.finish_span(self._span, error)
+
+
+class Tracer:
+    """샘플링 + 링 버퍼 트레이서"""
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        capacity: int = 200,
+        min_duration_ms: float = 0.0,
+        max_spans: int = MAX_SPANS_PER_TRACE,
+        rng: random.Random | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.min_duration_ms = min_duration_ms
+        self._max_spans = max_spans
+        self._rng = rng or random.Random()
+        self._buffer: deque[Trace] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    # === 설정 ===
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.maxlen or 0
+
+    def configure(
+        self,
+        sample_rate: float | None = None,
+        capacity: int | None = None,
+        min_duration_ms: float | None = None,
+    ) -> dict[str, float]:
+        """샘플링 설정 변경 (None인 항목은 유지). 변경 후 설정 반환."""
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError(f"sample_rate must be within [0, 1]: {sample_rate}")
+            self.sample_rate = sample_rate
+        if min_duration_ms is not None:
+            if min_duration_ms < 0:
+                raise ValueError(f"min_duration_ms must be >= 0: {min_duration_ms}")
+            self.min_duration_ms = min_duration_ms
+        if capacity is not None:
+            if capacity < 1:
+                raise ValueError(f"capacity must be >= 1: {capacity}")
+            with self._lock:
+                self._buffer = deque(self._buffer, maxlen=capacity)
+        return self.settings()
+
+    def settings(self) -> dict[str, float]:
+        return {
+            "sample_rate": self.sample_rate,
+            "min_duration_ms": self.min_duration_ms,
+            "capacity": self.capacity,
+        }
+
+    # === 스팬 ===
+
+    def trace(
+        self, name: str, kind: str = "action", force: bool = False, **attrs: Any
+    ) -> Any:
+        """루트 스팬 (이미 트레이스 안이면 자식 스팬). 샘플에서 빠지면 no-op."""
+        parent = _CURRENT.get()
+        if parent is not None:
+            return self.span(name, kind, **attrs)
+        if not force and (
+            self.sample_rate <= 0.0 or self._rng.random() >= self.sample_rate
+        ):
+            return _NOOP
+        trace = Trace(uuid.uuid4().hex[:16], self._max_spans)
+        span = trace.new_span(name, kind, None, attrs)
+        assert span is not None
+        return _SpanScope(self, span)
+
+    def span(self, name: str, kind: str, **attrs: Any) -> Any:
+        """현재 트레이스의 자식 스팬 (트레이스 밖이면 no-op)"""
+        parent = _CURRENT.get()
+        if parent is None:
+            return _NOOP
+        span = parent.trace.new_span(name, kind, parent, attrs)
+        if span is None:
+            return _NOOP
+        return _SpanScope(self, span)
+
+    def start_span(self, name: str, kind: str, **attrs: Any) -> Span | None:
+        """현재 스팬을 바꾸지 않는 자식 스팬 시작 (트레이스 밖이면 None)"""
+        parent = _CURRENT.get()
+        if parent is None:
+            return None
+        return parent.trace.new_span(name, kind, parent, attrs)
+
+    def finish_span(self, span: Span, error: str | None = None) -> None:
+        span.end = time.perf_counter()
+        if error is not None:
+            span.error = _attr(error)
+        if span.parent_id is None:
+            self._finish_trace(span.trace)
+
+    def _finish_trace(self, trace: Trace) -> None:
+        if trace.duration_ms < self.min_duration_ms:
+            return
+        with self._lock:
+            self._buffer.append(trace)
+
+    # === 조회 ===
+
+    def traces(
+        self, limit: int | None = None, min_duration_ms: float = 0.0
+    ) -> list[dict[str, Any]]:
+        """보관 중인 트레이스 요약 (최신 순)"""
+        with self._lock:
+            traces = list(self._buffer)
+        summaries = [
+            trace.summary()
+            for trace in reversed(traces)
+            if trace.duration_ms >= min_duration_ms
+        ]
+        return summaries[:limit] if limit is not None else summaries
+
+    def get(self, trace_id: str) -> dict[str, Any] | None:
+        """트레이스 전체 (스팬 + critical path)"""
+        with self._lock:
+            traces = list(self._buffer)
+        for trace in traces:
+            if trace.trace_id == trace_id:
+                return trace.to_dict()
+        return None
+
+    def clear(self) -> int:
+        """버퍼 비우기 (지운 수 반환)"""
+        with self._lock:
+            count = len(self._buffer)
+            self._buffer.clear()
+        return count
+
+
+# 프로세스 전역 트레이서 (기본은 샘플링 꺼짐, main.py가 설정에서 구성)
+TRACER = Tracer()
+
+_C = TypeVar("_C", bound=type)
+
+
+def traced(cls: _C) -> _C:
+    """클래스의 공개 메서드마다 "Class.method" 서비스 스팬을 남긴다.
+
+    트레이스 밖에서는 컨텍스트 변수 조회 1회만 추가된다.
+    staticmethod/classmethod/property와 _로 시작하는 메서드는 감싸지 않는다.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, _traced_method(value, f"{cls.__name__}.{attr}"))
+    return cls
+
+
+def _traced_method(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _CURRENT.get() is None:
+            return func(*args, **kwargs)
+        with TRACER.span(name, "service"):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -9,10 +9,20 @@ ITW Core Engine - Module 2: World Generation
 
 import json
 import random
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+)
 
 from src.core.axiom_system import Axiom, AxiomLoader, AxiomVector, DomainType
 from src.core.logging import get_logger
@@ -43,10 +53,11 @@ class Resource:
         self.current_amount -= harvested
         return harvested
 
-    def daily_decay(self) -> int:
-        """NPC 경쟁에 의한 일일 소모"""
-        if random.random() < self.npc_competition:
-            decay = int(self.max_amount * random.uniform(0.05, 0.15))
+    def daily_decay(self, rng: Optional[random.Random] = None) -> int:
+        """NPC 경쟁에 의한 일일 소모 (rng 미지정 시 random 모듈 전역 상태)"""
+        draw = rng or random
+        if draw.random() < self.npc_competition:
+            decay = int(self.max_amount * draw.uniform(0.05, 0.15))
             self.current_amount = max(0, self.current_amount - decay)
             return decay
         return 0
@@ -108,6 +119,11 @@ class SensoryData:
         )
 
 
+def new_echo_id() -> str:
+    """Echo 안정 ID 생성"""
+    return str(uuid.uuid4())
+
+
 @dataclass
 class Echo:
     """
@@ -122,6 +138,12 @@ class Echo:
     timestamp: str  # ISO 날짜
     flavor_text: str
     source_player_id: Optional[str] = None
+    category: Optional[str] = None  # EchoCategory 값 (레거시 Echo는 None)
+    expires_at: Optional[float] = None  # 소멸 시각 (UTC epoch 초), Long은 None
+    count: int = 1  # 압축된 집계 Echo면 합쳐진 흔적 수
+    echo_id: str = field(default_factory=new_echo_id)  # 안정 ID
+    # 압축 그룹용 ISO 주차 (year * 100 + week). 생성 시 채움, 없으면 처음 쓸 때 계산
+    week_bucket: Optional[int] = field(default=None, compare=False, repr=False)
 
     def to_dict(self) -> Dict:
         return {
@@ -131,6 +153,10 @@ class Echo:
             "timestamp": self.timestamp,
             "flavor_text": self.flavor_text,
             "source_player_id": self.source_player_id,
+            "category": self.category,
+            "expires_at": self.expires_at,
+            "count": self.count,
+            "echo_id": self.echo_id,
         }
 
     @classmethod
@@ -142,9 +168,108 @@ class Echo:
             timestamp=data["timestamp"],
             flavor_text=data["flavor_text"],
             source_player_id=data.get("source_player_id"),
+            category=data.get("category"),
+            expires_at=data.get("expires_at"),
+            count=data.get("count", 1),
+            echo_id=data.get("echo_id") or new_echo_id(),
         )
 
 
+class EchoStore:
+    """
+    노드별 Echo 저장소
+
+    echo_id → Echo (삽입 순서 유지) 와 가시성/카테고리별 파티션을 함께 유지하여
+    공개/숨김 목록과 ID 조회를 전체 스캔 없이 제공한다.
+    순회/len/in/append/비교는 리스트처럼 쓸 수 있지만 위치 인덱싱은 지원하지 않는다
+    (순서 있는 목록이 필요하면 by_visibility()/by_category()로 파티션을 받는다).
+    """
+
+    __slots__ = ("_by_id", "_by_visibility", "_by_category")
+
+    def __init__(self, echoes: Iterable[Echo] = ()):
+        self._by_id: Dict[str, Echo] = {}
+        self._by_visibility: Dict[str, Dict[str, Echo]] = {}
+        self._by_category: Dict[Optional[str], Dict[str, Echo]] = {}
+        for echo in echoes:
+            self.append(echo)
+
+    # === 변경 ===
+
+    def append(self, echo: Echo) -> None:
+        """Echo 추가 (같은 ID가 있으면 교체)"""
+        if echo.echo_id in self._by_id:
+            self.discard(echo.echo_id)
+        self._by_id[echo.echo_id] = echo
+        self._by_visibility.setdefault(echo.visibility, {})[echo.echo_id] = echo
+        self._by_category.setdefault(echo.category, {})[echo.echo_id] = echo
+
+    def extend(self, echoes: Iterable[Echo]) -> None:
+        for echo in echoes:
+            self.append(echo)
+
+    def discard(self, echo_id: str) -> Optional[Echo]:
+        """ID로 Echo 제거 (없으면 None)"""
+        echo = self._by_id.pop(echo_id, None)
+        if echo is not None:
+            self._by_visibility[echo.visibility].pop(echo_id, None)
+            self._by_category[echo.category].pop(echo_id, None)
+        return echo
+
+    def remove(self, echo: Echo) -> None:
+        """list.remove 호환"""
+        if self.discard(echo.echo_id) is None:
+            raise ValueError("echo not in store")
+
+    def discard_many(self, echo_ids: Iterable[str]) -> int:
+        """여러 Echo 제거, 제거된 수 반환"""
+        return sum(1 for echo_id in echo_ids if self.discard(echo_id) is not None)
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._by_visibility.clear()
+        self._by_category.clear()
+
+    # === 조회 ===
+
+    def get(self, echo_id: str) -> Optional[Echo]:
+        """ID로 Echo 조회"""
+        return self._by_id.get(echo_id)
+
+    def by_visibility(self, visibility: str) -> List[Echo]:
+        """가시성 파티션 ("Public" | "Hidden")"""
+        return list(self._by_visibility.get(visibility, {}).values())
+
+    def by_category(self, category: Optional[str]) -> List[Echo]:
+        """카테고리 파티션"""
+        return list(self._by_category.get(category, {}).values())
+
+    def count_visibility(self, visibility: str) -> int:
+        return len(self._by_visibility.get(visibility, ()))
+
+    # === 리스트 호환 ===
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Echo]:
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, echo: object) -> bool:
+        echo_id = getattr(echo, "echo_id", None)
+        return echo_id is not None and self._by_id.get(echo_id) == echo
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EchoStore):
+            return list(self._by_id.values()) == list(other._by_id.values())
+        if isinstance(other, list):
+            return list(self._by_id.values()) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EchoStore({list(self._by_id.values())!r})"
+
+
 @dataclass
 class MapNode:
     """
@@ -160,7 +285,7 @@ class MapNode:
     axiom_vector: AxiomVector
     sensory_data: SensoryData
     resources: List[Resource] = field(default_factory=list)
-    echoes: List[Echo] = field(default_factory=list)
+    echoes: EchoStore = field(default_factory=EchoStore)
     cluster_id: Optional[str] = None
     development_level: int = 0  # Safe Haven(0,0) 전용
     required_tags: List[str] = field(default_factory=list)
@@ -168,6 +293,13 @@ class MapNode:
     # 메타데이터
     discovered_by: List[str] = field(default_factory=list)
     created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # 자원 일일 변동을 마지막으로 적용한 틱 (None: 아직 기준 없음)
+    resource_tick: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # 타입 없는 호출부가 리스트를 넘긴 경우 방어 (대입은 변환하지 않음)
+        if not isinstance(self.echoes, EchoStore):
+            self.echoes = EchoStore(self.echoes)
 
     @property
     def coordinate(self) -> str:
@@ -189,7 +321,7 @@ class MapNode:
 
     def get_public_echoes(self) -> List[Echo]:
         """공개 Echo만 반환"""
-        return [e for e in self.echoes if e.visibility == "Public"]
+        return self.echoes.by_visibility("Public")
 
     def mark_discovered(self, player_id: str):
         """플레이어 발견 기록"""
@@ -207,8 +339,10 @@ class MapNode:
             "echoes": [e.to_dict() for e in self.echoes],
             "cluster_id": self.cluster_id,
             "development_level": self.development_level,
+            "required_tags": self.required_tags,
             "discovered_by": self.discovered_by,
             "created_at": self.created_at,
+            "resource_tick": self.resource_tick,
         }
 
     @classmethod
@@ -222,11 +356,13 @@ class MapNode:
             axiom_vector=AxiomVector.from_dict(data["axiom_vector"]),
             sensory_data=SensoryData.from_dict(data["sensory_data"]),
             resources=[Resource.from_dict(r) for r in data.get("resources", [])],
-            echoes=[Echo.from_dict(e) for e in data.get("echoes", [])],
+            echoes=EchoStore(Echo.from_dict(e) for e in data.get("echoes", [])),
             cluster_id=data.get("cluster_id"),
             development_level=data.get("development_level", 0),
+            required_tags=data.get("required_tags", []),
             discovered_by=data.get("discovered_by", []),
             created_at=data.get("created_at", datetime.utcnow().isoformat()),
+            resource_tick=data.get("resource_tick"),
         )
 
     def to_json(self) -> str:
@@ -299,11 +435,10 @@ class WorldGenerator:
 
     def __init__(self, axiom_loader: AxiomLoader, seed: Optional[int] = None):
         self.axiom_loader = axiom_loader
-        self.nodes: Dict[str, MapNode] = {}
+        # 스냅샷 로드 후에는 LazyNodeStore로 교체된다
+        self.nodes: MutableMapping[str, MapNode] = {}
         self.seed = seed
-
-        if seed:
-            random.seed(seed)
+        self._node_listeners: List[Callable[[MapNode], None]] = []
 
         # Safe Haven 자동 생성
         self._generate_safe_haven()
@@ -312,6 +447,18 @@ class WorldGenerator:
         """좌표 기반 결정론적 시드 생성"""
         return hash((self.seed, x, y)) & 0xFFFFFFFF
 
+    def add_node_listener(self, listener: Callable[[MapNode], None]):
+        """노드 생성/변경 알림 구독 (캐시 무효화용)"""
+        self._node_listeners.append(listener)
+
+    def notify_node_changed(self, node: MapNode):
+        """노드 생성/변경을 구독자에게 알림
+
+        required_tags 등 통과 조건을 외부에서 바꾼 경우에도 호출해야 합니다.
+        """
+        for listener in self._node_listeners:
+            listener(node)
+
     def _generate_safe_haven(self):
         """시작 지점 (0, 0) - Safe Haven 생성"""
         vector = AxiomVector()
@@ -361,9 +508,9 @@ class WorldGenerator:
         self.nodes["0_0"] = node
         logger.info("Safe Haven (0,0) generated")
 
-    def _roll_rarity(self) -> NodeTier:
+    def _roll_rarity(self, rng: random.Random) -> NodeTier:
         """희귀도 롤 (94/5/1 분포)"""
-        roll = random.randint(1, 100)
+        roll = rng.randint(1, 100)
         if roll <= 94:
             return NodeTier.COMMON
         elif roll <= 99:
@@ -380,7 +527,9 @@ class WorldGenerator:
             neighbors.append(self.nodes.get(coord))
         return neighbors
 
-    def _select_axioms_by_tier(self, tier: NodeTier, count: int = 3) -> List[Axiom]:
+    def _select_axioms_by_tier(
+        self, rng: random.Random, tier: NodeTier, count: int = 3
+    ) -> List[Axiom]:
         """티어에 따른 Axiom 선택"""
         if tier == NodeTier.RARE:
             # Rare: Mystery 도메인 포함 가능
@@ -390,7 +539,7 @@ class WorldGenerator:
             )
         elif tier == NodeTier.UNCOMMON:
             # Uncommon: Tier 2 중심
-            pool = self.axiom_loader.get_by_tier(2) + random.sample(
+            pool = self.axiom_loader.get_by_tier(2) + rng.sample(
                 self.axiom_loader.get_by_tier(1),
                 min(10, len(self.axiom_loader.get_by_tier(1))),
             )
@@ -400,10 +549,13 @@ class WorldGenerator:
 
         # 중복 제거 후 샘플링
         pool = list({a.id: a for a in pool}.values())
-        return random.sample(pool, min(count, len(pool)))
+        return rng.sample(pool, min(count, len(pool)))
 
     def _generate_vector(
-        self, tier: NodeTier, inherited_vector: Optional[AxiomVector] = None
+        self,
+        rng: random.Random,
+        tier: NodeTier,
+        inherited_vector: Optional[AxiomVector] = None,
     ) -> AxiomVector:
         """
         Axiom 벡터 생성
@@ -413,14 +565,14 @@ class WorldGenerator:
         vector = AxiomVector()
 
         # 1~4개의 Axiom 선택
-        axiom_count = random.randint(1, 4)
-        selected = self._select_axioms_by_tier(tier, axiom_count)
+        axiom_count = rng.randint(1, 4)
+        selected = self._select_axioms_by_tier(rng, tier, axiom_count)
 
         # 가중치 할당
         for i, axiom in enumerate(selected):
             # 첫 번째 Axiom이 가장 강함
             weight = 0.8 - (i * 0.15)
-            weight = max(0.2, weight + random.uniform(-0.1, 0.1))
+            weight = max(0.2, weight + rng.uniform(-0.1, 0.1))
             vector.add(axiom.code, weight)
 
         # 클러스터 상속 병합
@@ -429,7 +581,9 @@ class WorldGenerator:
 
         return vector
 
-    def _generate_sensory(self, vector: AxiomVector, tier: NodeTier) -> SensoryData:
+    def _generate_sensory(
+        self, rng: random.Random, vector: AxiomVector, tier: NodeTier
+    ) -> SensoryData:
         """감각 데이터 생성"""
         # 지배적 Axiom 기반 도메인 결정
         dominant_code = vector.get_dominant()
@@ -449,9 +603,9 @@ class WorldGenerator:
             NodeTier.RARE: "경이로운 ",
         }
 
-        atmosphere = random.choice(templates["atmosphere"])
-        sound = random.choice(templates["sound"])
-        smell = random.choice(templates["smell"])
+        atmosphere = rng.choice(templates["atmosphere"])
+        sound = rng.choice(templates["sound"])
+        smell = rng.choice(templates["smell"])
 
         axiom_name = dominant_axiom.name_kr if dominant_axiom else "알 수 없는"
 
@@ -464,7 +618,7 @@ class WorldGenerator:
         )
 
     def _generate_resources(
-        self, vector: AxiomVector, tier: NodeTier
+        self, rng: random.Random, vector: AxiomVector, tier: NodeTier
     ) -> List[Resource]:
         """노드 자원 생성"""
         resources: List[Resource] = []
@@ -494,8 +648,8 @@ class WorldGenerator:
         base_resources = domain_resources.get(dominant_axiom.domain, [])
         tier_multiplier = {NodeTier.COMMON: 1, NodeTier.UNCOMMON: 2, NodeTier.RARE: 5}
 
-        for res_id in base_resources[: random.randint(1, 2)]:
-            base_amount = random.randint(20, 50) * tier_multiplier[tier]
+        for res_id in base_resources[: rng.randint(1, 2)]:
+            base_amount = rng.randint(20, 50) * tier_multiplier[tier]
             resources.append(
                 Resource(
                     id=res_id,
@@ -528,8 +682,8 @@ class WorldGenerator:
         if x == 0 and y == 0:
             return self.nodes["0_0"]
 
-        # 좌표 기반 결정론적 시드 설정
-        random.seed(self._get_coord_seed(x, y))
+        # 좌표 기반 결정론적 스트림 (전역 random 상태는 건드리지 않음)
+        rng = random.Random(self._get_coord_seed(x, y))
 
         # 인접 노드 확인 (클러스터 상속)
         neighbors = [n for n in self._get_neighbors(x, y) if n is not None]
@@ -538,18 +692,18 @@ class WorldGenerator:
         inherited_tier = None
         cluster_id = None
 
-        if neighbors and random.random() < self.CLUSTER_INHERITANCE_CHANCE:
+        if neighbors and rng.random() < self.CLUSTER_INHERITANCE_CHANCE:
             # 클러스터 상속
-            parent = random.choice(neighbors)
+            parent = rng.choice(neighbors)
             inherited_vector = parent.axiom_vector
             inherited_tier = parent.tier
             cluster_id = parent.cluster_id
 
         # 희귀도 결정
-        tier = inherited_tier if inherited_tier else self._roll_rarity()
+        tier = inherited_tier if inherited_tier else self._roll_rarity(rng)
 
         # Axiom 벡터 생성
-        vector = self._generate_vector(tier, inherited_vector)
+        vector = self._generate_vector(rng, tier, inherited_vector)
 
         # 클러스터 ID 생성 (새로운 클러스터)
         if not cluster_id:
@@ -559,10 +713,10 @@ class WorldGenerator:
             )
 
         # 감각 데이터 생성
-        sensory = self._generate_sensory(vector, tier)
+        sensory = self._generate_sensory(rng, vector, tier)
 
         # 자원 생성
-        resources = self._generate_resources(vector, tier)
+        resources = self._generate_resources(rng, vector, tier)
 
         # 노드 생성
         node = MapNode(
@@ -576,6 +730,7 @@ class WorldGenerator:
         )
 
         self.nodes[coord] = node
+        self.notify_node_changed(node)
         return node
 
     def generate_area(
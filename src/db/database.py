@@ -1,17 +1,102 @@
 """Database engine and session configuration."""
 
+import sys
+import time
 from collections.abc import Generator
+from types import CodeType, FrameType
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import settings
+from src.core.metrics import REGISTRY
+from src.core.tracing import TRACER
+
+DB_STATEMENT_SECONDS = REGISTRY.histogram(
+    "itw_db_statement_seconds",
+    "SQL statement execution time by calling module",
+    ("service",),
+)
+
+_STARTED_KEY = "itw_statement_started"
+
+
+# Code object -> service label, or None for frames to skip (non-src and src.db).
+# Keyed per call site so repeated statements skip the module-name checks.
+_CODE_LABELS: dict[CodeType, str | None] = {}
+
+
+def _code_label(frame: FrameType) -> str | None:
+    code = frame.f_code
+    try:
+        return _CODE_LABELS[code]
+    except KeyError:
+        pass
+    module = str(frame.f_globals.get("__name__", ""))
+    label = None
+    if module.startswith("src.") and not module.startswith("src.db."):
+        label = module.rsplit(".", 1)[-1]
+    _CODE_LABELS[code] = label
+    return label
+
+
+def _calling_module() -> str:
+    """Name of the first src.* module (outside src.db) on the call stack."""
+    frame: FrameType | None = sys._getframe(2)
+    while frame is not None:
+        label = _code_label(frame)
+        if label is not None:
+            return label
+        frame = frame.f_back
+    return "other"
+
+
+def instrument_engine(db_engine: Engine) -> None:
+    """Record per-statement timings for ``db_engine`` in DB_STATEMENT_SECONDS.
+
+    The ``service`` label is the module that issued the statement
+    (e.g. ``item_service``, ``global_hooks``). Inside a sampled trace each
+    statement also becomes a ``db`` span.
+    """
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def _before(conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        service = _calling_module()
+        span = TRACER.start_span(
+            f"sql:{statement.split(None, 1)[0].upper() if statement else ''}",
+            "db",
+            service=service,
+            statement=statement,
+        )
+        conn.info.setdefault(_STARTED_KEY, []).append(
+            (time.perf_counter(), service, span)
+        )
+
+    def _finish(conn: Any, error: str | None = None) -> None:
+        stack = conn.info.get(_STARTED_KEY) if conn is not None else None
+        if not stack:
+            return
+        started, service, span = stack.pop()
+        DB_STATEMENT_SECONDS.observe(time.perf_counter() - started, service)
+        if span is not None:
+            TRACER.finish_span(span, error)
+
+    @event.listens_for(db_engine, "after_cursor_execute")
+    def _after(conn: Any, *_args: Any) -> None:
+        _finish(conn)
+
+    @event.listens_for(db_engine, "handle_error")
+    def _error(context: Any) -> None:
+        _finish(context.connection, repr(context.original_exception))
+
 
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False},  # required for SQLite
     echo=settings.DEBUG,
 )
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -80,6 +80,14 @@ class EchoModel(Base):
     timestamp: Mapped[str] = mapped_column(String, nullable=False)
     flavor_text: Mapped[str] = mapped_column(Text, nullable=False)
     source_player_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    category: Mapped[str | None] = mapped_column(String, nullable=True)
+    expires_at: Mapped[float | None] = mapped_column(
+        Float, nullable=True, index=True
+    )  # UTC epoch 초, Long Echo는 NULL
+    count: Mapped[int] = mapped_column(Integer, default=1)  # 집계 Echo의 흔적 수
+    echo_id: Mapped[str | None] = mapped_column(
+        String, nullable=True, index=True
+    )  # 안정 Echo ID (조사 대상 지정용)
 
     node: Mapped["MapNodeModel"] = relationship("MapNodeModel", back_populates="echoes")
 
@@ -114,8 +122,8 @@ class SubGridNodeModel(Base):
         String, primary_key=True
     )  # "parent_x_y_sx_sy_sz" 형식
     parent_coordinate: Mapped[str] = mapped_column(
-        String, ForeignKey("map_nodes.coordinate"), nullable=False
-    )
+        String, ForeignKey("map_nodes.coordinate"), nullable=False, index=True
+    )  # 던전 인스턴스 키 - 인스턴스 단위 일괄 로드/저장
     sx: Mapped[int] = mapped_column(Integer, nullable=False)
     sy: Mapped[int] = mapped_column(Integer, nullable=False)
     sz: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -135,3 +143,30 @@ class SubGridNodeModel(Base):
     )  # 다른 출구로 연결되는지
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class SubGridInstanceModel(Base):
+    """ORM model for sub-grid (dungeon) instances."""
+
+    __tablename__ = "sub_grid_instances"
+
+    parent_coordinate: Mapped[str] = mapped_column(
+        String, primary_key=True
+    )  # "x_y" 형식
+    cell_count: Mapped[int] = mapped_column(Integer, default=0)
+    last_exit_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class GlobalHookModel(Base):
+    """ORM model for global hooks (world-wide events)."""
+
+    __tablename__ = "global_hooks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # hook_id
+    event_type: Mapped[str] = mapped_column(String)  # "boss_kill" 등
+    location_hint: Mapped[str] = mapped_column(String, default="")
+    description: Mapped[str] = mapped_column(Text, default="")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    expires_in_hours: Mapped[float] = mapped_column(Float, default=24)
+    expires_at: Mapped[float] = mapped_column(Float, index=True)  # epoch 초
@@ -3,9 +3,19 @@
 engine(ModuleManager) 내부 컴포넌트.
 각 모듈의 사건 이벤트를 구독하고, 활성 목표와 대조하여
 objective_completed / objective_failed 이벤트를 발행한다.
+
+활성 목표는 (목표 유형, 대상 필드, 값) 키의 인메모리 인덱스로 관리한다.
+시작 시 QuestService에서 한 번 구성하고, 이후에는 퀘스트 활성화/완료/실패/포기,
+목표 달성/실패, 대체 목표 생성 이벤트로만 갱신한다 (사건 이벤트마다 DB 조회 없음).
+QuestService 변경 이벤트는 data["revision"](objectives_revision)을 싣는다. 같은 체인에서
+같은 source:event_type이 중복 차단되어 변경을 놓치면 revision 차이로 감지해 재구성한다.
+인덱스는 여러 요청 스레드의 핸들러가 함께 갱신하므로 _lock 아래에서만 읽고 쓴다.
+노드 목표(reach_node, escort 목적지)가 있는 노드만 이동/행동 이벤트를 라우팅 구독한다.
 """
 
 import logging
+import threading
+from collections import Counter
 from typing import Any
 
 from src.core.event_bus import EventBus, GameEvent
@@ -21,6 +31,21 @@ TIER_ORDER: dict[str, int] = {
     "critical": 3,
 }
 
+# 목표 유형별 인덱스 대상 필드 (target dict 키). 없으면 유형 전체로 조회.
+TARGET_KEYS: dict[str, tuple[str, ...]] = {
+    "reach_node": ("node_id",),
+    "talk_to_npc": ("npc_id",),
+    "deliver": ("recipient_npc_id",),
+    "escort": ("destination_node_id", "target_npc_id"),
+}
+
+# 노드 라우팅 구독을 여는 (목표 유형, 대상 필드)
+NODE_TARGETS: frozenset[tuple[str, str]] = frozenset(
+    {("reach_node", "node_id"), ("escort", "destination_node_id")}
+)
+
+IndexKey = tuple[str, str | None, Any]
+
 
 class ObjectiveWatcher:
     """활성 퀘스트 목표 감시 + 달성/실패 이벤트 발행"""
@@ -33,7 +58,9 @@ class ObjectiveWatcher:
     ) -> None:
         """
         quest_service: QuestService 인스턴스.
-            get_active_objectives_by_type() 메서드 사용.
+            get_active_objectives() (시작 시 인덱스 구성),
+            get_quest_objectives() (퀘스트 단위 갱신) 메서드와
+            objectives_revision (놓친 변경 감지) 속성 사용.
         companion_service: CompanionService 인스턴스.
             is_companion() 메서드 사용 (escort 판정).
 
@@ -44,15 +71,32 @@ class ObjectiveWatcher:
         self._quest_service = quest_service
         self._companion_service = companion_service
         self._cumulative_deliveries: dict[str, int] = {}
+
+        # 활성 목표 인덱스 (_lock 보호, 재구성 중 _add/_unindex 재진입 → RLock)
+        self._lock = threading.RLock()
+        self._revision = 0  # 인덱스에 반영한 quest_service.objectives_revision
+        self._objectives: dict[str, Any] = {}  # objective_id → objective
+        self._index: dict[IndexKey, dict[str, Any]] = {}
+        self._quest_objectives: dict[str, set[str]] = {}  # quest_id → objective_id
+        self._node_refs: Counter[str] = Counter()  # 노드별 노드 목표 수
+
         self._register_watchers()
+        self.rebuild_index()
 
     def _register_watchers(self) -> None:
         """목표 유형별 감시 이벤트 구독"""
         bus = self._bus
 
-        # reach_node
-        bus.subscribe(EventTypes.PLAYER_MOVED, self._check_reach_objectives)
-        bus.subscribe(EventTypes.ACTION_COMPLETED, self._check_action_reach_objectives)
+        # 인덱스 갱신
+        bus.subscribe(EventTypes.QUEST_ACTIVATED, self._on_quest_changed)
+        bus.subscribe(EventTypes.OBJECTIVES_REPLACED, self._on_quest_changed)
+        bus.subscribe(EventTypes.QUEST_COMPLETED, self._on_quest_ended)
+        bus.subscribe(EventTypes.QUEST_FAILED, self._on_quest_ended)
+        bus.subscribe(EventTypes.QUEST_ABANDONED, self._on_quest_ended)
+        bus.subscribe(EventTypes.OBJECTIVE_COMPLETED, self._on_objective_closed)
+        bus.subscribe(EventTypes.OBJECTIVE_FAILED, self._on_objective_closed)
+
+        # reach_node / escort 도착: 노드 목표가 있는 노드만 라우팅 구독 (_route_node)
 
         # talk_to_npc
         bus.subscribe(EventTypes.DIALOGUE_STARTED, self._check_talk_objectives_start)
@@ -62,16 +106,184 @@ class ObjectiveWatcher:
         bus.subscribe(EventTypes.CHECK_RESULT, self._check_resolve_objectives)
 
         # deliver
-        bus.subscribe(EventTypes.ITEM_GIVEN, self._check_deliver_objectives)
-
-        # escort
-        bus.subscribe(EventTypes.PLAYER_MOVED, self._check_escort_objectives)
+        # 응답과 무관 → 턴 종료 후 (누적 전달 수를 세므로 병합하지 않음)
+        bus.subscribe(
+            EventTypes.ITEM_GIVEN, self._check_deliver_objectives, deferred=True
+        )
 
         # escort 실패 감지
         bus.subscribe(EventTypes.NPC_DIED, self._check_escort_target_dead)
 
+    # === 활성 목표 인덱스 ===
+
+    def rebuild_index(self) -> int:
+        """QuestService의 활성 목표로 인덱스 재구성 (시작 시)
+
+        Returns:
+            인덱싱된 목표 수
+        """
+        with self._lock:
+            # 조회 전에 읽어 두면 조회 중 변경은 다음 조회 때 다시 감지된다
+            self._revision = self._quest_service.objectives_revision
+            for objective_id in list(self._objectives):
+                self._unindex(objective_id)
+            for obj in self._quest_service.get_active_objectives():
+                self._add(obj)
+            count = len(self._objectives)
+        logger.debug("Objective index built: %d objectives", count)
+        return count
+
+    def _sync(self) -> None:
+        """마지막 변경 이벤트를 놓쳤으면 재구성 (_lock을 잡은 상태에서 호출)"""
+        if self._quest_service.objectives_revision != self._revision:
+            self.rebuild_index()
+
+    def _follows(self, event: GameEvent) -> bool:
+        """QuestService 변경 이벤트가 반영한 다음 revision이면 기록 후 True.
+
+        사이에 놓친 변경이 있으면 인덱스를 재구성하고 False (이 이벤트도 반영됨).
+        revision이 없는 이벤트는 그대로 반영한다. _lock을 잡은 상태에서 호출.
+        """
+        revision = event.data.get("revision")
+        if revision is None:
+            return True
+        if revision == self._revision + 1:
+            self._revision = revision
+            return True
+        if revision > self._revision:
+            self.rebuild_index()
+        return False
+
+    @property
+    def indexed_count(self) -> int:
+        """인덱싱된 활성 목표 수"""
+        with self._lock:
+            self._sync()
+            return len(self._objectives)
+
+    def _keys(self, obj: Any) -> list[IndexKey]:
+        fields = TARGET_KEYS.get(obj.objective_type)
+        if not fields:
+            return [(obj.objective_type, None, None)]
+        keys: list[IndexKey] = []
+        for name in fields:
+            value = obj.target.get(name)
+            if value is not None:
+                keys.append((obj.objective_type, name, value))
+        return keys
+
+    def _add(self, obj: Any) -> None:
+        if obj.status != "active":
+            return
+        if obj.objective_id in self._objectives:
+            self._unindex(obj.objective_id)
+        self._objectives[obj.objective_id] = obj
+        self._quest_objectives.setdefault(obj.quest_id, set()).add(obj.objective_id)
+        for key in self._keys(obj):
+            self._index.setdefault(key, {})[obj.objective_id] = obj
+            objective_type, name, node_id = key
+            if (objective_type, name) in NODE_TARGETS:
+                self._node_refs[node_id] += 1
+                if self._node_refs[node_id] == 1:
+                    self._route_node(node_id)
+
+    def _unindex(self, objective_id: str) -> None:
+        obj = self._objectives.pop(objective_id, None)
+        if obj is None:
+            return
+        self._cumulative_deliveries.pop(objective_id, None)
+        quest_objectives = self._quest_objectives.get(obj.quest_id)
+        if quest_objectives is not None:
+            quest_objectives.discard(objective_id)
+            if not quest_objectives:
+                del self._quest_objectives[obj.quest_id]
+        for key in self._keys(obj):
+            bucket = self._index.get(key)
+            if bucket is not None:
+                bucket.pop(objective_id, None)
+                if not bucket:
+                    del self._index[key]
+            objective_type, name, node_id = key
+            if (objective_type, name) in NODE_TARGETS:
+                self._node_refs[node_id] -= 1
+                if self._node_refs[node_id] <= 0:
+                    del self._node_refs[node_id]
+                    self._unroute_node(node_id)
+
+    def _active(
+        self, objective_type: str, name: str | None = None, value: Any = None
+    ) -> list[Any]:
+        """인덱스 조회 (발행 중 인덱스가 바뀌어도 안전하도록 복사본)"""
+        with self._lock:
+            self._sync()
+            try:
+                bucket = self._index.get((objective_type, name, value))
+            except TypeError:  # 해시 불가 값
+                return []
+            return list(bucket.values()) if bucket else []
+
+    def _route_node(self, node_id: str) -> None:
+        self._bus.subscribe(
+            EventTypes.PLAYER_MOVED,
+            self._check_move_objectives,
+            where={"to_node": node_id},
+        )
+        self._bus.subscribe(
+            EventTypes.ACTION_COMPLETED,
+            self._check_action_reach_objectives,
+            where={"node_id": node_id},
+        )
+
+    def _unroute_node(self, node_id: str) -> None:
+        self._bus.unsubscribe(
+            EventTypes.PLAYER_MOVED,
+            self._check_move_objectives,
+            where={"to_node": node_id},
+        )
+        self._bus.unsubscribe(
+            EventTypes.ACTION_COMPLETED,
+            self._check_action_reach_objectives,
+            where={"node_id": node_id},
+        )
+
+    def _on_quest_changed(self, event: GameEvent) -> None:
+        """quest_activated / objectives_replaced 시 해당 퀘스트 목표 재인덱싱."""
+        quest_id = event.data.get("quest_id")
+        if not quest_id:
+            return
+        with self._lock:
+            if not self._follows(event):
+                return
+            for objective_id in list(self._quest_objectives.get(quest_id, ())):
+                self._unindex(objective_id)
+            for obj in self._quest_service.get_quest_objectives(quest_id):
+                self._add(obj)
+
+    def _on_quest_ended(self, event: GameEvent) -> None:
+        """quest_completed / failed / abandoned 시 남은 목표 제거."""
+        quest_id = event.data.get("quest_id")
+        if not quest_id:
+            return
+        with self._lock:
+            if not self._follows(event):
+                return
+            for objective_id in list(self._quest_objectives.get(quest_id, ())):
+                self._unindex(objective_id)
+
+    def _on_objective_closed(self, event: GameEvent) -> None:
+        """objective_completed / failed 시 해당 목표 제거."""
+        objective_id = event.data.get("objective_id")
+        if objective_id:
+            with self._lock:
+                self._unindex(objective_id)
+
     # === reach_node ===
 
+    def _check_move_objectives(self, event: GameEvent) -> None:
+        """player_moved (목표 노드 도착만 라우팅) 시 reach_node → escort 순으로 체크."""
+        self._check_reach_objectives(event)
+        self._check_escort_objectives(event)
+
     def _check_reach_objectives(self, event: GameEvent) -> None:
         """player_moved 시 reach_node 달성 체크.
 
@@ -81,10 +293,8 @@ class ObjectiveWatcher:
         """
         to_node = event.data.get("to_node")
 
-        for obj in self._quest_service.get_active_objectives_by_type("reach_node"):
+        for obj in self._active("reach_node", "node_id", to_node):
             target = obj.target
-            if target.get("node_id") != to_node:
-                continue
 
             # require_action이 없으면 도착만으로 달성
             if not target.get("require_action"):
@@ -102,10 +312,8 @@ class ObjectiveWatcher:
         action_type = event.data.get("action_type")
         node_id = event.data.get("node_id")
 
-        for obj in self._quest_service.get_active_objectives_by_type("reach_node"):
+        for obj in self._active("reach_node", "node_id", node_id):
             target = obj.target
-            if target.get("node_id") != node_id:
-                continue
             if target.get("require_action") != action_type:
                 continue
 
@@ -124,10 +332,8 @@ class ObjectiveWatcher:
         """
         npc_id = event.data.get("npc_id")
 
-        for obj in self._quest_service.get_active_objectives_by_type("talk_to_npc"):
+        for obj in self._active("talk_to_npc", "npc_id", npc_id):
             target = obj.target
-            if target.get("npc_id") != npc_id:
-                continue
             if target.get("require_topic"):
                 continue  # 주제 요구는 dialogue_ended에서 판정
 
@@ -145,10 +351,8 @@ class ObjectiveWatcher:
         memory_tags = event.data.get("memory_tags", [])
         all_tags = set(topic_tags + memory_tags)
 
-        for obj in self._quest_service.get_active_objectives_by_type("talk_to_npc"):
+        for obj in self._active("talk_to_npc", "npc_id", npc_id):
             target = obj.target
-            if target.get("npc_id") != npc_id:
-                continue
             if not target.get("require_topic"):
                 continue  # 단순 접촉은 dialogue_started에서 이미 처리
             if target["require_topic"] not in all_tags:
@@ -172,7 +376,7 @@ class ObjectiveWatcher:
         stat = event.data.get("stat")
         context_tags = event.data.get("context_tags", [])
 
-        for obj in self._quest_service.get_active_objectives_by_type("resolve_check"):
+        for obj in self._active("resolve_check"):
             target = obj.target
 
             # 최소 성공 등급 체크
@@ -213,10 +417,8 @@ class ObjectiveWatcher:
         given_qty = event.data.get("quantity", 1)
         given_tags = event.data.get("item_tags", [])
 
-        for obj in self._quest_service.get_active_objectives_by_type("deliver"):
+        for obj in self._active("deliver", "recipient_npc_id", recipient):
             target = obj.target
-            if target.get("recipient_npc_id") != recipient:
-                continue
 
             # 프로토타입 ID 매칭 (특정 아이템)
             if "item_prototype_id" in target:
@@ -229,8 +431,9 @@ class ObjectiveWatcher:
 
             # 수량 체크 (누적)
             required_qty = target.get("quantity", 1)
-            cumulative = self._get_cumulative_delivery(obj.objective_id) + given_qty
-            self._cumulative_deliveries[obj.objective_id] = cumulative
+            with self._lock:
+                cumulative = self._get_cumulative_delivery(obj.objective_id) + given_qty
+                self._cumulative_deliveries[obj.objective_id] = cumulative
             if cumulative < required_qty:
                 logger.debug(
                     "deliver %s: %d/%d",
@@ -242,7 +445,8 @@ class ObjectiveWatcher:
 
             self._emit_completed(obj, trigger_action="give", trigger_data=event.data)
             # 완료 시 누적 초기화
-            self._cumulative_deliveries.pop(obj.objective_id, None)
+            with self._lock:
+                self._cumulative_deliveries.pop(obj.objective_id, None)
 
     def _get_cumulative_delivery(self, objective_id: str) -> int:
         """목표별 누적 전달 수량 조회."""
@@ -265,10 +469,8 @@ class ObjectiveWatcher:
         if self._companion_service is None:
             return
 
-        for obj in self._quest_service.get_active_objectives_by_type("escort"):
+        for obj in self._active("escort", "destination_node_id", to_node):
             target = obj.target
-            if target.get("destination_node_id") != to_node:
-                continue
 
             if not self._companion_service.is_companion(
                 player_id, target.get("target_npc_id", "")
@@ -287,10 +489,7 @@ class ObjectiveWatcher:
         """
         dead_npc_id = event.data.get("npc_id")
 
-        for obj in self._quest_service.get_active_objectives_by_type("escort"):
-            if obj.target.get("target_npc_id") != dead_npc_id:
-                continue
-
+        for obj in self._active("escort", "target_npc_id", dead_npc_id):
             self._emit_failed(
                 obj,
                 fail_reason="target_dead",
@@ -0,0 +1,36 @@
+"""
+HTTP 부하 테스트 하네스
+
+python -m src.loadtest --users 50 --duration 60 --llm-latency-ms 800
+
+uvicorn으로 띄운 실제 API에 가상 유저가 /game/register, GET /game/state,
+POST /game/action 을 섞어 보내고, 라벨별 p50/p95/p99 지연과 오류율을 보고한다.
+--base-url 을 생략하면 로컬 stub LLM(지연/실패율/동시 처리 한도 조절)과
+임시 DB를 쓰는 서버를 직접 띄워 LLM 병목 포화와 백프레셔를 재현한다.
+"""
+
+from src.loadtest.runner import (
+    DEFAULT_MIX,
+    EndpointSummary,
+    LoadConfig,
+    LoadReport,
+    UserResult,
+    VirtualUser,
+    parse_mix,
+    run_load,
+)
+from src.loadtest.stub_llm import StubLLMConfig, StubLLMServer, StubLLMStats
+
+__all__ = [
+    "DEFAULT_MIX",
+    "EndpointSummary",
+    "LoadConfig",
+    "LoadReport",
+    "UserResult",
+    "VirtualUser",
+    "parse_mix",
+    "run_load",
+    "StubLLMConfig",
+    "StubLLMServer",
+    "StubLLMStats",
+]
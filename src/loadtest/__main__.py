@@ -0,0 +1,153 @@
+"""HTTP 부하 테스트 CLI: python -m src.loadtest"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.core.logging import get_logger, setup_logging
+from src.loadtest.runner import DEFAULT_MIX, LoadConfig, parse_mix, run_load
+from src.loadtest.stub_llm import StubLLMConfig, StubLLMServer
+
+logger = get_logger(__name__)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def _wait_healthy(base_url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy")
+
+
+@contextmanager
+def spawn_server(ai_base_url: str, ai_timeout: float) -> Iterator[str]:
+    """임시 DB + http AI provider로 uvicorn 서브프로세스 기동 → base_url"""
+    port = _free_port()
+    with tempfile.TemporaryDirectory(prefix="itw-load-") as tmp:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'load.db')}",
+            AI_PROVIDER="http",
+            AI_BASE_URL=ai_base_url,
+            AI_TIMEOUT_SECONDS=str(ai_timeout),
+            DEBUG="false",  # SQL echo 끔
+            LOG_LEVEL="WARNING",
+        )
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "src.main:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(port),
+                "--log-level",
+                "warning",
+            ],
+            env=env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            _wait_healthy(base_url, timeout=60)
+            yield base_url
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.loadtest",
+        description="HTTP load test for the /game API with a local stub LLM",
+    )
+    parser.add_argument(
+        "--base-url", help="대상 서버 (생략 시 uvicorn + stub LLM을 직접 기동)"
+    )
+    parser.add_argument("--users", type=int, default=10, help="가상 유저 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간(초)")
+    parser.add_argument("--think-ms", type=float, default=500.0, help="평균 think time")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="유저 분산 시작(초)")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="라벨별 가중치, 예: state=3,look=2,move=5",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃")
+    parser.add_argument("--seed", type=int, default=42)
+
+    stub = parser.add_argument_group("stub LLM (--base-url 생략 시)")
+    stub.add_argument("--llm-latency-ms", type=float, default=200.0)
+    stub.add_argument("--llm-jitter-ms", type=float, default=50.0)
+    stub.add_argument("--llm-failure-rate", type=float, default=0.0)
+    stub.add_argument(
+        "--llm-max-concurrency", type=int, default=0, help="초과 시 429 (0=무제한)"
+    )
+    stub.add_argument("--llm-timeout", type=float, default=10.0)
+
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    setup_logging(args.log_level)
+    config = LoadConfig(
+        base_url=args.base_url or "",
+        users=args.users,
+        duration=args.duration,
+        think_ms=args.think_ms,
+        ramp_up=args.ramp_up,
+        mix=args.mix,
+        timeout=args.timeout,
+        seed=args.seed,
+    )
+
+    if args.base_url:
+        report = run_load(config)
+    else:
+        stub_config = StubLLMConfig(
+            latency_ms=args.llm_latency_ms,
+            jitter_ms=args.llm_jitter_ms,
+            failure_rate=args.llm_failure_rate,
+            max_concurrency=args.llm_max_concurrency,
+            seed=args.seed,
+        )
+        with StubLLMServer(stub_config) as llm:
+            with spawn_server(llm.url, args.llm_timeout) as base_url:
+                config.base_url = base_url
+                report = run_load(config)
+            report.extra["stub_llm"] = vars(llm.stats)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        print(report.format_text())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+HTTP 부하 러너
+
+가상 유저 스레드가 각자 영속 HTTP 연결(http.client)로
+/game/register → (GET /game/state, POST /game/action ...) 루프를 돌며
+요청별 지연과 상태 코드를 기록한다. 유저 사이 간격은 think time으로 조절한다.
+
+오류 기준: 2xx 외 응답 또는 전송 실패(타임아웃, 연결 끊김).
+게임 규칙상 실패(success=False, 200)는 오류로 보지 않는다.
+"""
+
+import http.client
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.core.logging import get_logger
+from src.sim.report import percentile
+
+logger = get_logger(__name__)
+
+# 라벨 → 가중치. state는 GET /game/state, 나머지는 POST /game/action 의 action
+DEFAULT_MIX: dict[str, int] = {
+    "state": 25,
+    "look": 25,
+    "move": 25,
+    "investigate": 10,
+    "harvest": 5,
+    "rest": 10,
+}
+SUPPORTED_LABELS = frozenset(DEFAULT_MIX)
+
+TRANSPORT_ERROR = 0  # 상태 코드 대신 기록하는 전송 실패 표시
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """
+    "state=3,look=2,move=5" 형식 → 가중치 dict
+
+    Raises:
+        ValueError: 형식 오류, 미지원 라벨, 음수 가중치, 가중치 합 0
+    """
+    mix: dict[str, int] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        label, sep, weight = part.partition("=")
+        label = label.strip()
+        if not sep or label not in SUPPORTED_LABELS:
+            raise ValueError(f"Invalid mix entry: {part!r}")
+        mix[label] = int(weight)
+        if mix[label] < 0:
+            raise ValueError(f"Negative weight for {label!r}")
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Mix must have at least one positive weight")
+    return mix
+
+
+@dataclass
+class LoadConfig:
+    """부하 테스트 설정"""
+
+    base_url: str = "http://127.0.0.1:8000"
+    users: int = 10
+    duration: float = 30.0  # 초 (등록 제외)
+    think_ms: float = 500.0  # 평균 think time (0.5x ~ 1.5x 균등 분포)
+    ramp_up: float = 0.0  # 유저 시작 시점을 이 구간에 고르게 분산 (초)
+    mix: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    timeout: float = 30.0  # 요청 타임아웃 (초)
+    seed: int = 42
+    player_prefix: str = "load"
+
+
+# === 측정값 ===
+
+
+@dataclass
+class UserResult:
+    """가상 유저 하나의 원시 측정값"""
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)  # 초
+    statuses: dict[str, dict[int, int]] = field(default_factory=dict)
+
+    def record(self, label: str, seconds: float, status: int) -> None:
+        self.latencies.setdefault(label, []).append(seconds)
+        counts = self.statuses.setdefault(label, {})
+        counts[status] = counts.get(status, 0) + 1
+
+
+@dataclass
+class EndpointSummary:
+    """라벨별 지연/오류 요약 (ms)"""
+
+    count: int
+    errors: int
+    error_rate: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    statuses: dict[str, int]  # "200", "429", "error" 등 → 횟수
+
+
+def _is_error(status: int) -> bool:
+    return not 200 <= status < 300
+
+
+@dataclass
+class LoadReport:
+    """부하 테스트 결과 보고서"""
+
+    users: int
+    duration: float
+    requests: int
+    errors: int
+    requests_per_sec: float
+    by_label: dict[str, EndpointSummary]
+    extra: dict[str, Any] = field(default_factory=dict)  # stub LLM 통계 등
+
+    @classmethod
+    def merge(cls, results: list[UserResult], duration: float) -> "LoadReport":
+        latencies: dict[str, list[float]] = {}
+        statuses: dict[str, dict[int, int]] = {}
+        for result in results:
+            for label, values in result.latencies.items():
+                latencies.setdefault(label, []).extend(values)
+            for label, counts in result.statuses.items():
+                merged = statuses.setdefault(label, {})
+                for status, count in counts.items():
+                    merged[status] = merged.get(status, 0) + count
+
+        by_label: dict[str, EndpointSummary] = {}
+        for label in sorted(latencies):
+            values = sorted(latencies[label])
+            counts = statuses.get(label, {})
+            errors = sum(c for s, c in counts.items() if _is_error(s))
+            by_label[label] = EndpointSummary(
+                count=len(values),
+                errors=errors,
+                error_rate=errors / len(values),
+                p50_ms=percentile(values, 50) * 1000,
+                p95_ms=percentile(values, 95) * 1000,
+                p99_ms=percentile(values, 99) * 1000,
+                max_ms=values[-1] * 1000,
+                statuses={
+                    ("error" if s == TRANSPORT_ERROR else str(s)): c
+                    for s, c in sorted(counts.items())
+                },
+            )
+
+        requests = sum(s.count for s in by_label.values())
+        return cls(
+            users=len(results),
+            duration=duration,
+            requests=requests,
+            errors=sum(s.errors for s in by_label.values()),
+            requests_per_sec=requests / duration if duration > 0 else 0.0,
+            by_label=by_label,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def format_text(self) -> str:
+        """사람이 읽는 표 형식"""
+        error_rate = self.errors / self.requests if self.requests else 0.0
+        lines = [
+            f"users={self.users} duration={self.duration:.1f}s "
+            f"requests={self.requests} ({self.requests_per_sec:.1f} req/s) "
+            f"errors={self.errors} ({error_rate:.1%})",
+        ]
+        for key, value in self.extra.items():
+            lines.append(f"{key}: {value}")
+
+        lines.append("")
+        lines.append(
+            f"{'label':<12}{'count':>8}{'err%':>8}"
+            f"{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}{'maxms':>9}  statuses"
+        )
+        for label, s in self.by_label.items():
+            statuses = " ".join(f"{k}:{v}" for k, v in s.statuses.items())
+            lines.append(
+                f"{label:<12}{s.count:>8}{s.error_rate:>8.1%}"
+                f"{s.p50_ms:>9.2f}{s.p95_ms:>9.2f}{s.p99_ms:>9.2f}{s.max_ms:>9.2f}"
+                f"  {statuses}"
+            )
+        return "\n".join(lines)
+
+
+# === 가상 유저 ===
+
+
+class VirtualUser:
+    """영속 연결 하나를 쓰는 HTTP 가상 유저"""
+
+    def __init__(self, config: LoadConfig, player_id: str, rng: random.Random) -> None:
+        self.config = config
+        self.player_id = player_id
+        self.rng = rng
+        self.result = UserResult()
+        self.known_resources: list[str] = []
+
+        parts = urlsplit(config.base_url)
+        self._host = parts.hostname or "127.0.0.1"
+        self._port = parts.port or 80
+        self._conn: http.client.HTTPConnection | None = None
+
+        self._labels = [label for label, w in config.mix.items() if w > 0]
+        self._weights = [config.mix[label] for label in self._labels]
+
+    def run(self, deadline: float, start_delay: float = 0.0) -> UserResult:
+        """등록 후 deadline(perf_counter 기준)까지 요청 루프"""
+        if start_delay > 0:
+            time.sleep(start_delay)
+        try:
+            self._request(
+                "register", "POST", "/game/register", {"player_id": self.player_id}
+            )
+            while time.perf_counter() < deadline:
+                self.step()
+                self._think(deadline)
+        finally:
+            self._close()
+        return self.result
+
+    def step(self) -> None:
+        """가중치로 라벨 하나를 골라 요청 1회"""
+        label = self.rng.choices(self._labels, weights=self._weights)[0]
+        if label == "state":
+            body = self._request("state", "GET", f"/game/state/{self.player_id}")
+            self._remember_resources(body)
+        elif label == "move":
+            direction = self.rng.choice("nsew")
+            body = self._action("move", {"direction": direction})
+            if body is not None and body.get("success"):
+                self.known_resources = []
+        elif label == "harvest" and self.known_resources:
+            self._action(
+                "harvest", {"resource_id": self.rng.choice(self.known_resources)}
+            )
+        elif label == "harvest":
+            self._remember_resources(self._action("look"))
+        else:
+            body = self._action(label)
+            if label == "look":
+                self._remember_resources(body)
+
+    def _think(self, deadline: float) -> None:
+        if self.config.think_ms <= 0:
+            return
+        pause = self.config.think_ms * self.rng.uniform(0.5, 1.5) / 1000
+        time.sleep(max(0.0, min(pause, deadline - time.perf_counter())))
+
+    def _remember_resources(self, body: dict[str, Any] | None) -> None:
+        location = (body or {}).get("location") or {}
+        resources = location.get("resources") or []
+        self.known_resources = [r["type"] for r in resources if "type" in r]
+
+    def _action(
+        self, action: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        return self._request(
+            action,
+            "POST",
+            "/game/action",
+            {"player_id": self.player_id, "action": action, "params": params or {}},
+        )
+
+    # === HTTP ===
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(
+                self._host, self._port, timeout=self.config.timeout
+            )
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request(
+        self,
+        label: str,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """요청 1회 + 기록. 2xx면 JSON 본문, 아니면 None"""
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        started = time.perf_counter()
+        try:
+            conn = self._connection()
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            raw = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException) as e:
+            self.result.record(label, time.perf_counter() - started, TRANSPORT_ERROR)
+            logger.debug("%s %s failed: %s", method, path, e)
+            self._close()  # 다음 요청에서 재연결
+            return None
+        self.result.record(label, time.perf_counter() - started, status)
+
+        if _is_error(status):
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+
+# === 실행 ===
+
+
+def run_load(config: LoadConfig) -> LoadReport:
+    """가상 유저 스레드를 띄워 duration 동안 부하를 건다"""
+    logger.info(
+        "Load test start: %s users=%d duration=%.1fs think=%.0fms",
+        config.base_url,
+        config.users,
+        config.duration,
+        config.think_ms,
+    )
+    rng = random.Random(config.seed)
+    users = [
+        VirtualUser(
+            config,
+            f"{config.player_prefix}_{config.seed}_{i}",
+            random.Random(rng.getrandbits(64)),
+        )
+        for i in range(config.users)
+    ]
+
+    started = time.perf_counter()
+    deadline = started + config.ramp_up + config.duration
+    step = config.ramp_up / config.users if config.users else 0.0
+    threads = [
+        threading.Thread(
+            target=user.run, args=(deadline, i * step), name=f"load-user-{i}"
+        )
+        for i, user in enumerate(users)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    report = LoadReport.merge([user.result for user in users], elapsed)
+    logger.info(
+        "Load test done: %d requests, %d errors, %.1f req/s",
+        report.requests,
+        report.errors,
+        report.requests_per_sec,
+    )
+    return report
@@ -0,0 +1,183 @@
+"""
+로컬 LLM 대역 서버
+
+HTTPProvider(AI_PROVIDER=http)가 호출하는 POST /generate 를 흉내 낸다.
+지연(평균 + 지터), 실패율(503), 동시 처리 한도(초과 시 429)를 조절해
+LLM 병목 상황의 포화/백프레셔를 로컬에서 재현한다.
+응답 본문은 MockProvider 출력을 그대로 사용한다.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from src.core.logging import get_logger
+from src.services.ai.mock import MockProvider
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StubLLMConfig:
+    """stub LLM 동작 설정"""
+
+    latency_ms: float = 200.0  # 평균 응답 지연
+    jitter_ms: float = 50.0  # 지연 편차 (균등 분포 ±)
+    failure_rate: float = 0.0  # 503 응답 비율 (0~1)
+    max_concurrency: int = 0  # 동시 처리 한도 (0이면 무제한, 초과 시 429)
+    seed: int | None = None
+
+
+@dataclass
+class StubLLMStats:
+    """stub LLM 누적 카운터"""
+
+    requests: int = 0
+    served: int = 0
+    failed: int = 0  # 주입된 503
+    rejected: int = 0  # 동시 처리 한도 초과 429
+    peak_in_flight: int = 0
+
+
+class _StubLLMHandler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"detail": "not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path != "/generate":
+            self._send(404, {"detail": "not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, {"detail": "invalid json"})
+            return
+
+        status, body = self.server.stub.handle_generate(payload)
+        self._send(status, body)
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("stub llm: " + format, *args)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], stub: "StubLLMServer"):
+        super().__init__(address, _StubLLMHandler)
+        self.stub = stub
+
+
+class StubLLMServer:
+    """
+    stub LLM HTTP 서버 (별도 스레드에서 구동)
+
+    사용:
+        with StubLLMServer(StubLLMConfig(latency_ms=300)) as stub:
+            os.environ["AI_BASE_URL"] = stub.url
+    """
+
+    def __init__(
+        self,
+        config: StubLLMConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or StubLLMConfig()
+        self.stats = StubLLMStats()
+        self._rng = random.Random(self.config.seed)
+        self._mock = MockProvider()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+        self._host = host
+        self._httpd = _StubHTTPServer((host, port), self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        # port=0이면 바인딩된 실제 포트
+        return f"http://{self._host}:{self._httpd.server_port}"
+
+    # === 요청 처리 ===
+
+    def handle_generate(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """POST /generate 처리 → (상태 코드, 응답 본문)"""
+        with self._lock:
+            self.stats.requests += 1
+            limit = self.config.max_concurrency
+            if limit and self._in_flight >= limit:
+                self.stats.rejected += 1
+                return 429, {"detail": "too many concurrent requests"}
+            self._in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+            delay = self._delay_seconds()
+            fail = self._rng.random() < self.config.failure_rate
+
+        try:
+            time.sleep(delay)
+            if fail:
+                with self._lock:
+                    self.stats.failed += 1
+                return 503, {"detail": "injected failure"}
+
+            text = self._mock.generate(
+                str(payload.get("prompt", "")),
+                system_prompt=payload.get("system_prompt"),
+                max_tokens=int(payload.get("max_tokens") or 1000),
+            )
+            with self._lock:
+                self.stats.served += 1
+            return 200, {"text": text}
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _delay_seconds(self) -> float:
+        jitter = self.config.jitter_ms
+        delay_ms = self.config.latency_ms + self._rng.uniform(-jitter, jitter)
+        return max(0.0, delay_ms) / 1000
+
+    # === 수명 주기 ===
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="stub-llm", daemon=True
+        )
+        self._thread.start()
+        logger.info("Stub LLM listening on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
@@ -1,16 +1,24 @@
 """FastAPI application entrypoint."""
 
-from contextlib import asynccontextmanager
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
 from src.api.game import router as game_router
 from src.api.health import router as health_router
+from src.api.metrics import router as metrics_router
+from src.api.profiles import ProfilingMiddleware, router as profiles_router
+from src.api.traces import router as traces_router
 from src.config import settings
 from src.core.engine import ITWEngine
 from src.core.event_bus import EventBus
 from src.core.logging import get_logger, setup_logging
+from src.core.profiler import PROFILER, ProfileStore
+from src.core.snapshot import SnapshotError
+from src.core.tracing import TRACER
 from src.db.database import SessionLocal, engine as db_engine
 from src.db.models import Base
 import src.db.models_v2  # noqa: F401  Phase 2 테이블 등록
@@ -38,24 +46,65 @@ def get_game_engine() -> ITWEngine:
     return game_engine
 
 
+async def _sweep_idle_sub_grids(engine: ITWEngine, interval: float) -> None:
+    """유휴 서브 그리드 인스턴스를 주기적으로 저장/축출 (DB 저장은 스레드에서)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(engine.evict_idle_sub_grids)
+        except Exception:
+            logger.exception("Sub-grid idle sweep failed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup and shutdown events."""
     global game_engine
 
+    TRACER.configure(
+        sample_rate=settings.TRACE_SAMPLE_RATE,
+        capacity=settings.TRACE_BUFFER_SIZE,
+        min_duration_ms=settings.TRACE_MIN_DURATION_MS,
+    )
+    PROFILER.configure(
+        store=ProfileStore(
+            settings.PROFILE_DIR,
+            max_files=settings.PROFILE_MAX_FILES,
+            max_bytes=settings.PROFILE_MAX_BYTES,
+        ),
+        enabled=settings.PROFILE_ENABLED,
+        threshold_ms=settings.PROFILE_THRESHOLD_MS,
+        interval_ms=settings.PROFILE_INTERVAL_MS,
+        max_per_minute=settings.PROFILE_MAX_PER_MINUTE,
+    )
+
     # DB 테이블 생성
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=db_engine)
     logger.info("Database tables created.")
 
+    # 서비스/모듈 공유 EventBus (모듈 노드 캐시도 서비스 이벤트로 무효화)
+    event_bus = EventBus()
+    app.state.event_bus = event_bus
+
     # 게임 엔진 초기화
     logger.info("Initializing game engine...")
     game_engine = ITWEngine(
         axiom_data_path="src/data/itw_214_divine_axioms.json",
         world_seed=42,
+        session_factory=SessionLocal,
+        sub_grid_idle_evict_seconds=settings.SUB_GRID_IDLE_EVICT_SECONDS,
+        event_bus=event_bus,
     )
     logger.info("Game engine initialized.")
 
+    # 스냅샷이 있으면 즉시 적재 (노드는 첫 접근 시 복원)
+    if settings.SNAPSHOT_PATH and os.path.exists(settings.SNAPSHOT_PATH):
+        try:
+            game_engine.load_snapshot(settings.SNAPSHOT_PATH)
+        except SnapshotError as exc:
+            logger.warning(f"Snapshot not loaded: {exc}")
+
     # AI Provider 및 NarrativeService 초기화
     logger.info("Initializing AI provider...")
     ai_provider = get_ai_provider()
@@ -65,11 +114,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # DialogueService 초기화
     logger.info("Initializing DialogueService...")
-    event_bus = EventBus()
     db_session = SessionLocal()
     dialogue_service = DialogueService(db_session, event_bus, narrative_service)
     app.state.dialogue_service = dialogue_service
-    app.state.event_bus = event_bus
     logger.info("DialogueService initialized.")
 
     # ItemService 초기화
@@ -95,6 +142,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     quest_service = QuestService(
         db=db_session,
         event_bus=event_bus,
+        rng=game_engine.rng,
     )
     app.state.quest_service = quest_service
     logger.info("QuestService initialized.")
@@ -118,10 +166,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.objective_watcher = objective_watcher
     logger.info("ObjectiveWatcher initialized.")
 
+    sub_grid_sweeper = asyncio.create_task(
+        _sweep_idle_sub_grids(game_engine, settings.SUB_GRID_EVICT_INTERVAL_SECONDS)
+    )
+
     yield
 
     # 종료 시 정리
     logger.info("Shutting down...")
+    sub_grid_sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await sub_grid_sweeper
+    PROFILER.shutdown()
+    game_engine.module_manager.shutdown()
+    game_engine.sub_grid_instances.flush_all()
+    if settings.SNAPSHOT_PATH:
+        game_engine.save_snapshot(settings.SNAPSHOT_PATH)
     db_session.close()
     game_engine = None
 
@@ -129,4 +189,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 app = FastAPI(title="Infinite Text World", lifespan=lifespan)
 
 app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(traces_router)
+app.include_router(profiles_router)
+app.add_middleware(ProfilingMiddleware)
 app.include_router(game_router)
@@ -41,6 +41,9 @@ class GameModule(ABC):
     - 모듈 간 통신은 EventBus를 경유한다 (지시서 #02)
     - Module → Core, Module → DB는 허용
     - Module → Module은 금지
+
+    on_turn / on_node_enter / get_available_actions는 기본이 no-op이다.
+    필요한 훅만 재정의하면 ModuleManager가 재정의한 모듈만 호출한다.
     """
 
     _enabled: bool
@@ -62,6 +65,38 @@ class GameModule(ABC):
         """
         return []
 
+    @property
+    def thread_safe(self) -> bool:
+        """훅을 같은 레이어의 다른 모듈과 동시에 실행해도 되는지
+
+        공유 DB 세션(서비스) 등 스레드 안전하지 않은 자원을 쓰면 False (기본값).
+        """
+        return False
+
+    @property
+    def hook_budget(self) -> Optional[float]:
+        """훅 1회 실행 시간 예산 (초). None이면 ModuleManager 기본값."""
+        return None
+
+    @property
+    def cache_actions(self) -> bool:
+        """get_available_actions 결과를 노드 상태 기준으로 재사용해도 되는지
+
+        True면 (노드, 노드 리비전, 점유 리비전, 플레이어 서브그리드 상태)가
+        같을 때 ModuleManager가 이전 결과를 돌려준다.
+        플레이어별 상태(대화 세션, 동행 등)에 따라 달라지면 False (기본값).
+        """
+        return False
+
+    @property
+    def cache_node_state(self) -> bool:
+        """on_node_enter가 context.extra[self.name]에 쓰는 노드 정보를 재사용해도 되는지
+
+        True면 노드/점유 리비전이 같을 때 on_node_enter를 호출하지 않고
+        캐시된 값을 context.extra[self.name]에 넣는다 (읽기 전용으로 취급).
+        """
+        return False
+
     @property
     def enabled(self) -> bool:
         return self._enabled
@@ -80,17 +115,12 @@ class GameModule(ABC):
         """모듈 비활성화 시 정리 작업"""
         ...
 
-    @abstractmethod
     def on_turn(self, context: GameContext) -> None:
-        """매 턴 호출. 모듈별 턴 처리 로직."""
-        ...
+        """매 턴 호출. 모듈별 턴 처리 로직. (기본: 없음)"""
 
-    @abstractmethod
     def on_node_enter(self, node_id: str, context: GameContext) -> None:
-        """플레이어가 노드에 진입할 때 호출."""
-        ...
+        """플레이어가 노드에 진입할 때 호출. (기본: 없음)"""
 
-    @abstractmethod
     def get_available_actions(self, context: GameContext) -> List[Action]:
-        """현재 상황에서 이 모듈이 제공하는 행동 목록 반환."""
-        ...
+        """현재 상황에서 이 모듈이 제공하는 행동 목록 반환. (기본: 없음)"""
+        return []
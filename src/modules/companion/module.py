@@ -42,10 +42,6 @@ class CompanionModule(GameModule):
     def on_disable(self) -> None:
         pass
 
-    def on_turn(self, context: GameContext) -> None:
-        """턴 처리. CompanionService._on_turn_processed가 EventBus로 처리."""
-        pass
-
     def on_node_enter(self, node_id: str, context: GameContext) -> None:
         """노드 진입 시 동행 정보를 context.extra에 추가."""
         companion = self._service.get_active_companion(context.player_id)
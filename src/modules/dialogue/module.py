@@ -47,10 +47,6 @@ class DialogueModule(GameModule):
         """모듈 비활성화."""
         logger.info("dialogue 모듈 비활성화")
 
-    def on_turn(self, context: GameContext) -> None:
-        """대화 중에는 다른 모듈의 턴이 처리되지 않으므로 패스."""
-        pass
-
     def on_node_enter(self, node_id: str, context: GameContext) -> None:
         """노드 진입 시 대화 가능 상태를 context.extra에 추가."""
         context.extra["dialogue"] = {
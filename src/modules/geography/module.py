@@ -65,19 +65,22 @@ class GeographyModule(GameModule):
     def dependencies(self) -> List[str]:
         return []
 
+    @property
+    def thread_safe(self) -> bool:
+        """월드/내비게이터만 사용 (DB 세션 없음) → 같은 레이어 모듈과 동시 실행 가능"""
+        return True
+
+    @property
+    def cache_actions(self) -> bool:
+        """행동 목록은 노드와 서브그리드 상태로만 결정됨"""
+        return True
+
     def on_enable(self) -> None:
         logger.info("geography 모듈 활성화")
 
     def on_disable(self) -> None:
         logger.info("geography 모듈 비활성화")
 
-    def on_turn(self, context: GameContext) -> None:
-        """턴 처리 - 현재 geography는 턴별 처리 없음.
-
-        향후 확장: 바이옴 시간 변화, 서브그리드 상태 업데이트 등.
-        """
-        pass
-
     def on_node_enter(self, node_id: str, context: GameContext) -> None:
         """노드 진입 시 지리 정보를 context.extra에 저장.
 
@@ -42,6 +42,16 @@ class ItemModule(GameModule):
     def dependencies(self) -> List[str]:
         return []
 
+    @property
+    def cache_actions(self) -> bool:
+        """액션 목록이 고정"""
+        return True
+
+    @property
+    def cache_node_state(self) -> bool:
+        """바닥 아이템 조회는 노드 리비전(아이템 이동)이 같으면 재사용"""
+        return True
+
     def register_restock_config(self, config: ShopRestockConfig) -> None:
         """상인 NPC 보충 설정 등록. TEMPORARY."""
         self._restock_configs.append(config)
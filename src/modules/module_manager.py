@@ -1,13 +1,242 @@
-"""모듈 관리자 - 등록, 활성화/비활성화, 의존성 검증, 턴/이벤트 전파"""
+"""모듈 관리자 - 등록, 활성화/비활성화, 의존성 검증, 턴/이벤트 전파
 
-from typing import Dict, List
+훅(on_turn / on_node_enter / get_available_actions) 실행:
+- 훅별로 그 훅을 재정의한 활성 모듈만 미리 골라 둔다 (기본 no-op 훅은 호출하지 않음)
+- dependencies 그래프로 레이어를 나눠 의존 대상 모듈이 항상 먼저 실행된다
+- 같은 레이어의 thread_safe 모듈은 스레드 풀에서 동시에 실행되고,
+  나머지는 호출 스레드에서 등록 순서대로 실행된다
+- 모듈별 시간 예산(hook_budget)을 넘긴 훅은 경고 후 기록하고,
+  동시 실행 중인 모듈은 작업 스레드에서 시작한 뒤 예산이 지나면 더 기다리지 않는다
+  (결과는 버림). 예산 안에 시작하지 못한 작업은 취소하고 호출 스레드에서 실행한다
+- 결과를 버린 작업이 아직 도는 동안에는 풀 자리를 차지하므로 abandoned_workers로
+  세고, 풀이 그런 작업으로 가득 차면 레이어를 호출 스레드에서 실행한다
+- 모듈/훅별 호출 수, 누적/최대 시간, 예산 초과/결과 버림 수는 hook_stats()로 조회
+
+노드 상태 캐시 (NodeStateCache):
+- cache_actions 모듈의 get_available_actions 결과는
+  (노드, 노드 리비전, 점유 리비전, 플레이어 서브그리드 상태) 기준으로 재사용
+- cache_node_state 모듈의 on_node_enter 결과(context.extra[module.name])는
+  (노드, 노드 리비전, 점유 리비전) 기준으로 재사용
+- 노드 리비전은 아이템 생성/이동/파괴, 점유 리비전은 NPC 생성/이동/사망/승격
+  이벤트로 올라가며, 해당 노드의 캐시 항목은 즉시 버려진다
+- 항목 수는 max_entries로 제한(가장 오래 안 쓴 노드부터 폐기)하고, 리비전 표가
+  max_revisions를 넘으면 기준 리비전을 올려 표를 비운다. 서브그리드 인스턴스가
+  축출되면 엔진이 discard_node()로 부모 노드의 항목을 버린다
+"""
+
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from src.core.logging import get_logger
-from src.core.event_bus import EventBus
+from src.core.event_bus import EventBus, GameEvent
+from src.core.event_types import EventTypes
 from src.modules.base import GameModule, GameContext, Action
 
 logger = get_logger(__name__)
 
+# ModuleManager가 전파하는 훅 (GameModule 기본 구현은 no-op)
+HOOKS: Tuple[str, ...] = ("on_turn", "on_node_enter", "get_available_actions")
+
+DEFAULT_MAX_WORKERS = 4
+
+# 노드 상태 캐시 한도 (캐시 항목 수, 노드/점유 리비전 표 크기)
+DEFAULT_CACHE_ENTRIES = 10_000
+DEFAULT_CACHE_REVISIONS = 50_000
+
+# 노드 리비전을 올리는 이벤트 (바닥 아이템)
+NODE_EVENTS: Tuple[str, ...] = (
+    EventTypes.ITEM_CREATED,
+    EventTypes.ITEM_TRANSFERRED,
+    EventTypes.ITEM_BROKEN,
+)
+# 점유 리비전을 올리는 이벤트 (노드의 NPC)
+OCCUPANCY_EVENTS: Tuple[str, ...] = (
+    EventTypes.NPC_CREATED,
+    EventTypes.NPC_MOVED,
+    EventTypes.NPC_DIED,
+    EventTypes.NPC_PROMOTED,
+)
+
+
+@dataclass
+class HookStats:
+    """모듈 1개 x 훅 1개의 실행 통계"""
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    over_budget: int = 0
+    abandoned: int = 0  # 예산 초과로 결과를 기다리지 않은 동시 실행 수
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "over_budget": self.over_budget,
+            "abandoned": self.abandoned,
+        }
+
+
+class _PooledCall:
+    """풀로 보낸 훅 1회 (예산은 작업 스레드에서 시작한 시점부터 잰다)"""
+
+    __slots__ = ("started", "started_at")
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.started_at = 0.0
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self.started_at = time.perf_counter()
+        self.started.set()
+        return fn(*args)
+
+
+# 아이템 이벤트에서 노드 소유자를 가리키는 (owner_type, owner_id) 필드
+_ITEM_OWNER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("owner_type", "owner_id"),
+    ("from_type", "from_id"),
+    ("to_type", "to_id"),
+)
+# NPC 이벤트에서 노드를 가리키는 필드
+_NPC_NODE_FIELDS: Tuple[str, ...] = ("node_id", "from_node", "to_node")
+
+
+def _sub_grid_state(context: GameContext) -> Tuple[Any, ...]:
+    """행동 목록에 영향을 주는 플레이어 서브그리드 상태"""
+    if not context.extra.get("in_sub_grid", False):
+        return (False,)
+    position = context.extra.get("sub_position", {})
+    return (True, position.get("sx"), position.get("sy"), position.get("sz"))
+
+
+class NodeStateCache:
+    """노드 리비전 기반 모듈 결과 캐시
+
+    키에 조회 시점의 리비전을 포함하므로, 계산 도중 리비전이 올라가면
+    그 결과는 저장되더라도 다시 조회되지 않는다.
+
+    리비전 표에 없는 노드는 기준 리비전(_base)을 쓴다. 표가 max_revisions를
+    넘으면 기준을 지금까지의 어떤 리비전보다 크게 올린 뒤 표를 비우므로,
+    이전 리비전으로 만든 키는 계속 무효다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        max_revisions: int = DEFAULT_CACHE_REVISIONS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_revisions = max_revisions
+        self._lock = threading.Lock()
+        self._base = 0
+        self._node_revisions: Dict[str, int] = {}
+        self._occupancy_revisions: Dict[str, int] = {}
+        # 노드별 항목 (오래 안 쓴 노드가 앞)
+        self._entries: "OrderedDict[str, Dict[Tuple[Any, ...], Any]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def revision(self, node_id: str) -> Tuple[int, int]:
+        """(노드 리비전, 점유 리비전)"""
+        with self._lock:
+            return (
+                self._node_revisions.get(node_id, self._base),
+                self._occupancy_revisions.get(node_id, self._base),
+            )
+
+    def get(self, node_id: str, key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            entries = self._entries.get(node_id)
+            if entries is not None and key in entries:
+                self._entries.move_to_end(node_id)
+                self.hits += 1
+                return True, entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, node_id: str, key: Tuple[Any, ...], value: Any) -> None:
+        with self._lock:
+            entries = self._entries.setdefault(node_id, {})
+            self._entries.move_to_end(node_id)
+            if key not in entries:
+                self._size += 1
+            entries[key] = value
+            # 방금 쓴 노드는 남긴다
+            while self._size > self.max_entries and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def bump_node(self, node_id: str) -> None:
+        """노드 상태(바닥 아이템) 변경"""
+        with self._lock:
+            self._node_revisions[node_id] = (
+                self._node_revisions.get(node_id, self._base) + 1
+            )
+            self._drop(node_id)
+            self._prune_revisions()
+
+    def bump_occupancy(self, node_id: str) -> None:
+        """노드 점유(NPC) 변경"""
+        with self._lock:
+            self._occupancy_revisions[node_id] = (
+                self._occupancy_revisions.get(node_id, self._base) + 1
+            )
+            self._drop(node_id)
+            self._prune_revisions()
+
+    def discard(self, node_id: str) -> None:
+        """노드 상태 변경 없이 해당 노드의 캐시 항목만 폐기 (메모리 정리용)"""
+        with self._lock:
+            self._drop(node_id)
+
+    def _drop(self, node_id: str) -> None:
+        entries = self._entries.pop(node_id, None)
+        if entries is not None:
+            self._size -= len(entries)
+
+    def _prune_revisions(self) -> None:
+        size = len(self._node_revisions) + len(self._occupancy_revisions)
+        if size <= self.max_revisions:
+            return
+        self._base = (
+            max(
+                self._base,
+                *self._node_revisions.values(),
+                *self._occupancy_revisions.values(),
+            )
+            + 1
+        )
+        self._node_revisions.clear()
+        self._occupancy_revisions.clear()
+        # 이전 기준으로 만든 항목은 더 이상 조회되지 않음
+        self._entries.clear()
+        self._size = 0
+
+    def clear(self) -> None:
+        """캐시 항목 전체 폐기 (리비전은 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "nodes": len(self._entries),
+                "entries": self._size,
+                "revisions": len(self._node_revisions) + len(self._occupancy_revisions),
+            }
+
 
 class ModuleManager:
     """모듈 토글 및 생명주기 관리
@@ -15,9 +244,37 @@ class ModuleManager:
     docs/30_technical/module-architecture.md 섹션 4.2 참조.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        default_budget: Optional[float] = None,
+        event_bus: Optional[EventBus] = None,
+    ) -> None:
+        """
+        Args:
+            max_workers: 동시 실행 스레드 풀 크기
+            default_budget: hook_budget 미지정 모듈의 훅 예산 (초, None이면 무제한)
+            event_bus: 모듈과 공유할 EventBus (None이면 새로 생성)
+        """
         self._modules: Dict[str, GameModule] = {}
-        self._event_bus: EventBus = EventBus()
+        self._event_bus: EventBus = event_bus if event_bus is not None else EventBus()
+        self._max_workers = max_workers
+        self.default_budget = default_budget
+
+        # 훅 → 레이어 목록 (활성화 상태가 바뀌면 무효화)
+        self._plans: Optional[Dict[str, List[List[GameModule]]]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats: Dict[Tuple[str, str], HookStats] = {}
+        self._stats_lock = threading.Lock()
+        # 결과를 버렸지만 아직 실행 중인 풀 작업 (_stats_lock 보호)
+        self._abandoned: Set[Future] = set()
+
+        # 노드 상태 캐시 (노드/점유 변경 이벤트로 무효화)
+        self._node_cache = NodeStateCache()
+        for event_type in NODE_EVENTS:
+            self._event_bus.subscribe(event_type, self._on_node_changed)
+        for event_type in OCCUPANCY_EVENTS:
+            self._event_bus.subscribe(event_type, self._on_occupancy_changed)
 
     @property
     def event_bus(self) -> EventBus:
@@ -30,7 +287,7 @@ class ModuleManager:
         return dict(self._modules)
 
     def get_enabled_modules(self) -> List[GameModule]:
-        """활성화된 모듈만 반환 (레이어 순서 보장은 추후)"""
+        """활성화된 모듈만 반환 (등록 순서)"""
         return [m for m in self._modules.values() if m.enabled]
 
     def register(self, module: GameModule) -> None:
@@ -38,6 +295,7 @@ class ModuleManager:
         if module.name in self._modules:
             logger.warning(f"모듈 덮어쓰기: {module.name}")
         self._modules[module.name] = module
+        self._plans = None
         logger.info(f"모듈 등록: {module.name}")
 
     def enable(self, name: str) -> bool:
@@ -69,6 +327,7 @@ class ModuleManager:
 
         module.on_enable()
         module.enabled = True
+        self._plans = None
         logger.info(f"모듈 활성화: {name}")
         return True
 
@@ -95,30 +354,270 @@ class ModuleManager:
 
         module.on_disable()
         module.enabled = False
+        self._plans = None
+        self._node_cache.clear()
         logger.info(f"모듈 비활성화: {name}")
         return True
 
+    # === 훅 전파 ===
+
     def process_turn(self, context: GameContext) -> None:
-        """활성 모듈의 on_turn 순차 호출 + 턴 종료 시 이벤트 체인 초기화"""
-        for module in self._modules.values():
-            if module.enabled:
-                module.on_turn(context)
+        """활성 모듈의 on_turn 호출 + 턴 종료 시 이벤트 체인 초기화"""
+        self._run_hook("on_turn", context)
         self._event_bus.reset_chain()
 
     def process_node_enter(self, node_id: str, context: GameContext) -> None:
-        """활성 모듈의 on_node_enter 순차 호출"""
-        for module in self._modules.values():
-            if module.enabled:
-                module.on_node_enter(node_id, context)
+        """활성 모듈의 on_node_enter 호출"""
+        self._run_hook("on_node_enter", node_id, context)
 
     def get_all_actions(self, context: GameContext) -> List[Action]:
-        """모든 활성 모듈에서 가능한 행동 수집"""
+        """모든 활성 모듈에서 가능한 행동 수집 (레이어 → 등록 순서)"""
         actions: List[Action] = []
-        for module in self._modules.values():
-            if module.enabled:
-                actions.extend(module.get_available_actions(context))
+        for module_actions in self._run_hook("get_available_actions", context):
+            actions.extend(module_actions)
         return actions
 
+    def hook_plan(self, hook: str) -> List[List[str]]:
+        """훅의 실행 레이어 (모듈 이름, 디버그/테스트용)"""
+        return [[module.name for module in layer] for layer in self._plan()[hook]]
+
+    def _plan(self) -> Dict[str, List[List[GameModule]]]:
+        """훅별 실행 레이어 계산 (캐시)
+
+        레이어 = 의존성 깊이. 의존 대상이 없는 모듈이 0, 그 다음이 1...
+        훅을 재정의하지 않은 모듈은 빠지지만, 깊이는 전체 의존성 그래프 기준이다.
+        """
+        if self._plans is not None:
+            return self._plans
+
+        enabled = self.get_enabled_modules()
+        depths: Dict[str, int] = {}
+
+        def depth(module: GameModule) -> int:
+            if module.name not in depths:
+                depths[module.name] = 0  # 순환 방어 (enable()이 선행 활성화를 보장)
+                deps = [
+                    self._modules[dep]
+                    for dep in module.dependencies
+                    if dep in self._modules and self._modules[dep].enabled
+                ]
+                depths[module.name] = max((depth(d) + 1 for d in deps), default=0)
+            return depths[module.name]
+
+        for module in enabled:
+            depth(module)
+
+        plans: Dict[str, List[List[GameModule]]] = {}
+        for hook in HOOKS:
+            base_impl = getattr(GameModule, hook)
+            layers: Dict[int, List[GameModule]] = {}
+            for module in enabled:
+                if getattr(type(module), hook, base_impl) is base_impl:
+                    continue  # no-op 기본 구현
+                layers.setdefault(depths[module.name], []).append(module)
+            plans[hook] = [layers[level] for level in sorted(layers)]
+
+        self._plans = plans
+        return plans
+
+    def _run_hook(self, hook: str, *args: Any) -> List[Any]:
+        """훅을 레이어 순서로 실행. 모듈별 반환값 목록 (예산 초과로 버린 것 제외)."""
+        results: List[Any] = []
+        for layer in self._plan()[hook]:
+            results.extend(self._run_layer(hook, layer, args))
+        return results
+
+    def _run_layer(
+        self, hook: str, layer: List[GameModule], args: Tuple[Any, ...]
+    ) -> List[Any]:
+        # 레이어에 모듈이 둘 이상일 때만 thread_safe 모듈을 풀로 보냄
+        pooled = [m for m in layer if m.thread_safe] if len(layer) > 1 else []
+        if pooled and self.abandoned_workers >= self._max_workers:
+            logger.warning(
+                f"훅 스레드 풀이 예산 초과 작업으로 가득 참, 호출 스레드에서 실행: "
+                f"{hook} ({self.abandoned_workers}/{self._max_workers})"
+            )
+            pooled = []
+        calls: Dict[str, Tuple[Future, _PooledCall]] = {}
+        for module in pooled:
+            # 호출 스레드의 contextvars(EventBus turn_scope 등)를 이어받음
+            context = contextvars.copy_context()
+            call = _PooledCall()
+            future = self._pool().submit(
+                context.run, call.run, self._invoke, module, hook, args
+            )
+            calls[module.name] = (future, call)
+
+        results: Dict[str, Any] = {}
+        for module in layer:
+            if module.name not in calls:
+                results[module.name] = self._invoke(module, hook, args)
+
+        for module in pooled:
+            future, call = calls[module.name]
+            budget = self._budget(module)
+            if call.started.is_set():
+                started = True
+            elif self.abandoned_workers >= self._max_workers:
+                started = False  # 버린 작업이 풀을 모두 차지 → 기다려도 시작 못 함
+            else:
+                started = call.started.wait(budget)
+            if not started:
+                if future.cancel():
+                    # 예산 안에 시작하지 못함 → 호출 스레드에서 실행
+                    results[module.name] = self._invoke(module, hook, args)
+                    continue
+                call.started.wait()  # 취소 직전에 시작됨
+            timeout = None
+            if budget is not None:
+                timeout = max(0.0, call.started_at + budget - time.perf_counter())
+            try:
+                results[module.name] = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                self._abandon(module, hook, budget, future)
+
+        return [results[m.name] for m in layer if m.name in results]
+
+    def _abandon(
+        self, module: GameModule, hook: str, budget: Optional[float], future: Future
+    ) -> None:
+        """예산을 넘긴 동시 실행 작업의 결과를 버리고, 끝날 때까지 풀 점유로 센다"""
+        with self._stats_lock:
+            self._abandoned.add(future)
+            self._stats.setdefault((module.name, hook), HookStats()).abandoned += 1
+            running = len(self._abandoned)
+        future.add_done_callback(self._release_abandoned)
+        logger.warning(
+            f"모듈 훅 예산 초과로 결과 건너뜀: {module.name}.{hook} "
+            f"(budget={budget}s, 실행 중인 버린 작업 {running}/{self._max_workers})"
+        )
+
+    def _release_abandoned(self, future: Future) -> None:
+        with self._stats_lock:
+            self._abandoned.discard(future)
+
+    @property
+    def abandoned_workers(self) -> int:
+        """결과를 버렸지만 아직 풀 스레드를 차지하고 있는 훅 작업 수"""
+        with self._stats_lock:
+            return len(self._abandoned)
+
+    def _invoke(self, module: GameModule, hook: str, args: Tuple[Any, ...]) -> Any:
+        """노드 상태 캐시를 거쳐 훅 실행"""
+        if hook == "get_available_actions" and module.cache_actions:
+            (context,) = args
+            node_id = context.current_node_id
+            key: Tuple[Any, ...] = (
+                hook,
+                module.name,
+                self._node_cache.revision(node_id),
+                _sub_grid_state(context),
+            )
+            found, actions = self._node_cache.get(node_id, key)
+            if not found:
+                actions = self._call(module, hook, args)
+                self._node_cache.put(node_id, key, list(actions))
+            return list(actions)
+
+        if hook == "on_node_enter" and module.cache_node_state:
+            node_id, context = args
+            key = (hook, module.name, self._node_cache.revision(node_id))
+            found, state = self._node_cache.get(node_id, key)
+            if found:
+                context.extra[module.name] = state
+                return None
+            self._call(module, hook, args)
+            if module.name in context.extra:
+                self._node_cache.put(node_id, key, context.extra[module.name])
+            return None
+
+        return self._call(module, hook, args)
+
+    def _call(self, module: GameModule, hook: str, args: Tuple[Any, ...]) -> Any:
+        """훅 1회 실행 + 시간 기록 (예외는 호출자에게 전파)"""
+        started = time.perf_counter()
+        try:
+            return getattr(module, hook)(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            budget = self._budget(module)
+            over = budget is not None and elapsed > budget
+            with self._stats_lock:
+                stats = self._stats.setdefault((module.name, hook), HookStats())
+                stats.calls += 1
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+                if over:
+                    stats.over_budget += 1
+            if budget is not None and over:
+                logger.warning(
+                    f"모듈 훅 예산 초과: {module.name}.{hook} "
+                    f"{elapsed * 1000:.1f}ms > {budget * 1000:.1f}ms"
+                )
+
+    def _budget(self, module: GameModule) -> Optional[float]:
+        budget = module.hook_budget
+        return self.default_budget if budget is None else budget
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="module-hook"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """훅 스레드 풀 정리 (대기 중인 작업은 취소, 실행 중인 작업은 기다림)"""
+        if self._executor is not None:
+            running = self.abandoned_workers
+            if running:
+                logger.warning(f"종료 대기: 결과를 버린 훅 작업 {running}개 실행 중")
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    # === 노드 상태 캐시 ===
+
+    def _on_node_changed(self, event: GameEvent) -> None:
+        """아이템 이벤트 → 관련 노드의 노드 리비전 갱신"""
+        data = event.data
+        for type_field, id_field in _ITEM_OWNER_FIELDS:
+            if data.get(type_field) == "node" and data.get(id_field):
+                self._node_cache.bump_node(data[id_field])
+
+    def _on_occupancy_changed(self, event: GameEvent) -> None:
+        """NPC 이벤트 → 관련 노드의 점유 리비전 갱신"""
+        for field_name in _NPC_NODE_FIELDS:
+            node_id = event.data.get(field_name)
+            if node_id:
+                self._node_cache.bump_occupancy(node_id)
+
+    def invalidate_node(self, node_id: str) -> None:
+        """이벤트 없이 바뀐 노드의 캐시 폐기 (노드/점유 리비전 모두 갱신)"""
+        self._node_cache.bump_node(node_id)
+        self._node_cache.bump_occupancy(node_id)
+
+    def discard_node(self, node_id: str) -> None:
+        """상태 변경 없이 노드의 캐시 항목만 폐기 (서브그리드 인스턴스 축출 시)"""
+        self._node_cache.discard(node_id)
+
+    def node_cache_info(self) -> Dict[str, int]:
+        """노드 상태 캐시 통계 (hits, misses, nodes, entries, revisions)"""
+        return self._node_cache.info()
+
+    # === 통계 ===
+
+    def hook_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """모듈 → 훅 → 실행 통계 (calls, total_ms, max_ms, over_budget, abandoned)"""
+        with self._stats_lock:
+            report: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for (module_name, hook), stats in self._stats.items():
+                report.setdefault(module_name, {})[hook] = stats.to_dict()
+        return report
+
+    def reset_hook_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
     def is_enabled(self, name: str) -> bool:
         """특정 모듈이 활성화 상태인지 확인"""
         module = self._modules.get(name)
@@ -46,6 +46,16 @@ class NPCCoreModule(GameModule):
     def dependencies(self) -> List[str]:
         return ["geography"]
 
+    @property
+    def cache_actions(self) -> bool:
+        """talk 액션은 노드의 NPC 점유 상태로만 결정됨"""
+        return True
+
+    @property
+    def cache_node_state(self) -> bool:
+        """노드의 NPC/배경 엔티티 조회는 점유 리비전이 같으면 재사용"""
+        return True
+
     def on_enable(self) -> None:
         """모듈 활성화: NPCService 생성 + EventBus 구독"""
         self._service = NPCService(self._db, self._bus)
@@ -58,10 +68,6 @@ class NPCCoreModule(GameModule):
         self._service = None
         logger.info("npc_core 모듈 비활성화")
 
-    def on_turn(self, context: GameContext) -> None:
-        """턴 처리 — 현재는 패스. 향후 NPC 루틴/이동 처리."""
-        pass
-
     def on_node_enter(self, node_id: str, context: GameContext) -> None:
         """노드 진입 시 NPC/엔티티 정보를 context.extra에 저장"""
         if self._service is None:
@@ -31,6 +31,11 @@ class QuestModule(GameModule):
     def dependencies(self) -> List[str]:
         return ["npc_core", "relationship", "dialogue"]
 
+    @property
+    def cache_actions(self) -> bool:
+        """액션 목록이 고정"""
+        return True
+
     def on_enable(self) -> None:
         """QuestService의 이벤트 핸들러는 __init__에서 이미 등록됨."""
         pass
@@ -38,10 +43,6 @@ class QuestModule(GameModule):
     def on_disable(self) -> None:
         pass
 
-    def on_turn(self, context: GameContext) -> None:
-        """턴 처리. QuestService._on_turn_processed가 EventBus로 처리하므로 여기서는 pass."""
-        pass
-
     def on_node_enter(self, node_id: str, context: GameContext) -> None:
         """노드 진입 시 활성 퀘스트 정보를 context.extra에 추가."""
         active_quests = self._service.get_active_quests()
@@ -16,7 +16,7 @@ from src.core.event_types import EventTypes
 from src.core.logging import get_logger
 from src.core.npc.models import HEXACO
 from src.core.relationship.models import AttitudeContext, Relationship
-from src.modules.base import Action, GameContext, GameModule
+from src.modules.base import GameContext, GameModule
 from src.services.relationship_service import RelationshipService
 
 logger = get_logger(__name__)
@@ -51,7 +51,10 @@ class RelationshipModule(GameModule):
         """모듈 활성화: RelationshipService 생성 + EventBus 구독"""
         self._service = RelationshipService(self._db, self._bus)
         self._bus.subscribe(EventTypes.NPC_PROMOTED, self._handle_npc_promoted)
-        self._bus.subscribe(EventTypes.DIALOGUE_ENDED, self._handle_dialogue_ended)
+        # 관계 변동 반영은 응답과 무관 → 턴 종료 후 (변동은 누적이므로 병합하지 않음)
+        self._bus.subscribe(
+            EventTypes.DIALOGUE_ENDED, self._handle_dialogue_ended, deferred=True
+        )
         self._bus.subscribe(EventTypes.ATTITUDE_REQUEST, self._handle_attitude_request)
         logger.info("relationship 모듈 활성화")
 
@@ -71,14 +74,6 @@ class RelationshipModule(GameModule):
             return
         self._service.process_familiarity_decay(context.current_turn)
 
-    def on_node_enter(self, node_id: str, context: GameContext) -> None:
-        """노드 진입 — 현재 패스 (관계 데이터는 요청 시 조회)"""
-        pass
-
-    def get_available_actions(self, context: GameContext) -> List[Action]:
-        """관계 관련 행동 목록 — 현재 없음"""
-        return []
-
     # ── EventBus 핸들러 ────────────────────────────────────────
 
     def _handle_npc_promoted(self, event: GameEvent) -> None:
@@ -3,11 +3,13 @@
 from src.services.ai.base import AIProvider
 from src.services.ai.factory import get_ai_provider
 from src.services.ai.gemini import GeminiProvider
+from src.services.ai.http import HTTPProvider
 from src.services.ai.mock import MockProvider
 
 __all__ = [
     "AIProvider",
     "GeminiProvider",
+    "HTTPProvider",
     "MockProvider",
     "get_ai_provider",
 ]
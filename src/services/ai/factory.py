@@ -6,6 +6,7 @@ from src.config import settings
 from src.core.logging import get_logger
 from src.services.ai.base import AIProvider
 from src.services.ai.gemini import GeminiProvider
+from src.services.ai.http import HTTPProvider
 from src.services.ai.mock import MockProvider
 
 logger = get_logger(__name__)
@@ -36,6 +37,18 @@ def get_ai_provider(provider_name: Optional[str] = None) -> AIProvider:
             logger.warning("AI_API_KEY not set, falling back to MockProvider")
             return MockProvider()
 
+    if name == "http":
+        if settings.AI_BASE_URL:
+            logger.debug("Using HTTPProvider at: %s", settings.AI_BASE_URL)
+            return HTTPProvider(
+                base_url=settings.AI_BASE_URL,
+                model=settings.AI_MODEL,
+                timeout=settings.AI_TIMEOUT_SECONDS,
+            )
+        else:
+            logger.warning("AI_BASE_URL not set, falling back to MockProvider")
+            return MockProvider()
+
     # Fallback to MockProvider for unknown providers
     logger.warning("Unknown provider '%s', falling back to MockProvider", name)
     return MockProvider()
@@ -0,0 +1,83 @@
+"""Generic HTTP AI provider (self-hosted gateways, local LLM stand-ins)."""
+
+import json
+import urllib.error
+import urllib.request
+from typing import Any, Optional
+
+from src.core.logging import get_logger
+from src.services.ai.base import AIProvider
+
+logger = get_logger(__name__)
+
+
+class HTTPProvider(AIProvider):
+    """AI provider that POSTs prompts to ``{base_url}/generate``.
+
+    Request body: ``{"prompt", "system_prompt", "max_tokens", "model"}``.
+    Response body: ``{"text": "..."}``.
+    """
+
+    def __init__(
+        self, base_url: str, model: Optional[str] = None, timeout: float = 30.0
+    ) -> None:
+        """Initialize the HTTP provider.
+
+        Args:
+            base_url: Server root URL, e.g. ``http://127.0.0.1:8701``.
+            model: Optional model name forwarded to the server.
+            timeout: Per-request timeout in seconds.
+        """
+        self._base_url = base_url.rstrip("/")
+        self._model = model
+        self._timeout = timeout
+
+    @property
+    def name(self) -> str:
+        """Return the provider name."""
+        return "http"
+
+    def is_available(self) -> bool:
+        """Check if the provider is configured."""
+        return bool(self._base_url)
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1000,
+        context: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Generate text via the HTTP endpoint.
+
+        Raises:
+            RuntimeError: On HTTP errors (including 429/503 back-pressure),
+                timeouts or malformed responses.
+        """
+        body = json.dumps(
+            {
+                "prompt": prompt,
+                "system_prompt": system_prompt,
+                "max_tokens": max_tokens,
+                "model": self._model,
+            }
+        ).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self._base_url}/generate",
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"HTTP provider returned {e.code}") from e
+        except (urllib.error.URLError, TimeoutError, ValueError) as e:
+            raise RuntimeError(f"HTTP provider request failed: {e}") from e
+
+        text = payload.get("text") if isinstance(payload, dict) else None
+        if not isinstance(text, str):
+            raise RuntimeError("HTTP provider response has no 'text' field")
+        return text
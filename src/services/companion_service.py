@@ -21,8 +21,9 @@ from src.core.companion.conditions import (
 )
 from src.core.companion.models import CompanionState
 from src.core.companion.return_logic import determine_return_destination
-from src.core.event_bus import EventBus, GameEvent
+from src.core.event_bus import EventBus, GameEvent, coalesce_by
 from src.core.event_types import EventTypes
+from src.core.tracing import traced
 from src.db.models_v2 import CompanionLogModel, CompanionModel
 
 logger = logging.getLogger(__name__)
@@ -43,17 +44,26 @@ DISBAND_TEMPLATES: dict[str, str] = {
 }
 
 
+@traced
 class CompanionService:
     """동행 CRUD + 비즈니스 로직"""
 
     def __init__(self, db: Session, event_bus: EventBus):
         self._db = db
         self._bus = event_bus
+        self._routed_players: set[str] = set()
         self._register_event_handlers()
 
     def _register_event_handlers(self) -> None:
         """EventBus 구독"""
-        self._bus.subscribe(EventTypes.PLAYER_MOVED, self._on_player_moved)
+        # player_moved는 동행 중인 플레이어만 라우팅 구독 (_route_player_moves)
+        active = (
+            self._db.query(CompanionModel.player_id)
+            .filter(CompanionModel.status == "active")
+            .distinct()
+        )
+        for (player_id,) in active:
+            self._route_player_moves(player_id)
         self._bus.subscribe(EventTypes.QUEST_ACTIVATED, self._on_quest_activated)
         self._bus.subscribe(EventTypes.QUEST_COMPLETED, self._on_quest_completed)
         self._bus.subscribe(EventTypes.QUEST_FAILED, self._on_quest_failed)
@@ -124,6 +134,7 @@ class CompanionService:
         orm = self._companion_to_orm(state)
         self._db.add(orm)
         self._db.commit()
+        self._route_player_moves(player_id)
 
         self._bus.emit(
             GameEvent(
@@ -196,6 +207,7 @@ class CompanionService:
         orm = self._companion_to_orm(state)
         self._db.add(orm)
         self._db.commit()
+        self._route_player_moves(player_id)
 
         self._bus.emit(
             GameEvent(
@@ -255,6 +267,8 @@ class CompanionService:
             orm.ended_turn = current_turn
             orm.disband_reason = reason
             self._db.commit()
+        if self.get_active_companion(companion.player_id) is None:
+            self._unroute_player_moves(companion.player_id)
 
         # 귀환 목적지 결정
         return_dest = determine_return_destination(
@@ -289,6 +303,30 @@ class CompanionService:
 
     # === 이동 동기화 ===
 
+    def _route_player_moves(self, player_id: str) -> None:
+        """해당 플레이어의 player_moved만 구독 (동행 없는 이동은 호출되지 않음)"""
+        if player_id in self._routed_players:
+            return
+        self._routed_players.add(player_id)
+        # 동행 좌표 동기화는 응답과 무관 → 턴 종료 후, 마지막 이동만
+        self._bus.subscribe(
+            EventTypes.PLAYER_MOVED,
+            self._on_player_moved,
+            deferred=True,
+            coalesce=coalesce_by("player_id"),
+            where={"player_id": player_id},
+        )
+
+    def _unroute_player_moves(self, player_id: str) -> None:
+        if player_id not in self._routed_players:
+            return
+        self._routed_players.discard(player_id)
+        self._bus.unsubscribe(
+            EventTypes.PLAYER_MOVED,
+            self._on_player_moved,
+            where={"player_id": player_id},
+        )
+
     def _sync_companion_move(self, player_id: str, to_node: str) -> str | None:
         """동행 NPC 좌표를 PC 좌표로 갱신.
         Returns: 이동 서술 문자열 또는 None (동행 없음).
@@ -25,6 +25,7 @@ from src.core.dialogue.models import (
 from src.core.dialogue.validation import validate_meta
 from src.core.event_bus import EventBus, GameEvent
 from src.core.event_types import EventTypes
+from src.core.tracing import traced
 from src.db.models_v2 import DialogueSessionModel, DialogueTurnModel
 from src.services.narrative_service import NarrativeService
 from src.services.narrative_types import DialoguePromptContext
@@ -47,6 +48,7 @@ PC_END_KEYWORDS = frozenset(
 )
 
 
+@traced
 class DialogueService:
     """대화 세션 관리"""
 
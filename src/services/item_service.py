@@ -28,12 +28,14 @@ from src.core.item.trade import (
     evaluate_haggle,
 )
 from src.core.logging import get_logger
+from src.core.tracing import traced
 from src.db.models import PlayerModel
 from src.db.models_v2 import ItemInstanceModel, ItemPrototypeModel, NPCModel
 
 logger = get_logger(__name__)
 
 
+@traced
 class ItemService:
     """아이템 CRUD + 비즈니스 로직"""
 
@@ -6,6 +6,7 @@ narrative-service.md 섹션 4 대응.
 import json
 import logging
 
+from src.core.tracing import traced
 from src.services.narrative_safety import ContentSafetyFilter
 from src.services.narrative_types import (
     BuiltPrompt,
@@ -105,6 +106,7 @@ NPCの立場から、PCの行動に対する一言評価タグを生成してく
 """
 
 
+@traced
 class PromptBuilder:
     """호출 유형별 프롬프트 조립"""
 
@@ -3,9 +3,12 @@
 narrative-service.md v2.0 대응 — 단일 관문(single gateway).
 """
 
+import time
 from typing import Any
 
 from src.core.logging import get_logger
+from src.core.metrics import REGISTRY
+from src.core.tracing import TRACER, traced
 from src.services.ai.base import AIProvider
 from src.services.narrative_parser import ResponseParser
 from src.services.narrative_prompts import PromptBuilder
@@ -20,6 +23,20 @@ from src.services.narrative_types import (
 
 logger = get_logger(__name__)
 
+# === 메트릭 (GET /metrics) ===
+
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "itw_llm_call_seconds",
+    "LLM provider call latency per attempt",
+    ("provider", "request_type", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+LLM_RESULTS = REGISTRY.counter(
+    "itw_llm_results_total",
+    "Narrative requests by the fallback stage that produced the result",
+    ("request_type", "stage"),
+)
+
 # 폴백 템플릿 (3단계)
 FALLBACK_TEMPLATES: dict[NarrativeRequestType, str | None] = {
     NarrativeRequestType.LOOK: "あなたは{node_name}にいる。周囲を見渡す。",
@@ -36,6 +53,7 @@ FALLBACK_TEMPLATES: dict[NarrativeRequestType, str | None] = {
 }
 
 
+@traced
 class NarrativeService:
     """Service for generating game narratives using AI providers.
 
@@ -96,7 +114,8 @@ class NarrativeService:
 
         try:
             prompt = self._build_look_prompt(node_data, player_state)
-            return self.ai.generate(prompt)
+            with self._llm_span("look"):
+                return self.ai.generate(prompt)
         except Exception as e:
             logger.warning("AI generation failed, using fallback: %s", e)
             return self._fallback_look(node_data)
@@ -133,7 +152,8 @@ class NarrativeService:
 
         try:
             prompt = self._build_move_prompt(from_node, to_node, direction)
-            return self.ai.generate(prompt)
+            with self._llm_span("move"):
+                return self.ai.generate(prompt)
         except Exception as e:
             logger.warning("AI generation failed, using fallback: %s", e)
             return self._fallback_move(direction, to_node)
@@ -217,11 +237,9 @@ class NarrativeService:
         # 1단계: 통상 호출
         if self.ai.is_available():
             try:
-                return self.ai.generate(
-                    prompt,
-                    system_prompt=system_prompt,
-                    max_tokens=max_tokens,
-                )
+                result = self._generate(request_type, prompt, system_prompt, max_tokens)
+                LLM_RESULTS.inc(request_type.value, "primary")
+                return result
             except Exception as e:
                 logger.warning(
                     "LLM call failed for %s (stage 1): %s", request_type.value, e
@@ -229,11 +247,9 @@ class NarrativeService:
 
             # 2단계: 간소화 재시도
             try:
-                return self.ai.generate(
-                    prompt,
-                    system_prompt=system_prompt,
-                    max_tokens=max_tokens,
-                )
+                result = self._generate(request_type, prompt, system_prompt, max_tokens)
+                LLM_RESULTS.inc(request_type.value, "retry")
+                return result
             except Exception as e:
                 logger.warning(
                     "LLM call failed for %s (stage 2): %s", request_type.value, e
@@ -242,10 +258,45 @@ class NarrativeService:
         # 3단계: 폴백 템플릿
         template = FALLBACK_TEMPLATES.get(request_type)
         if template is None:
+            LLM_RESULTS.inc(request_type.value, "empty")
             return ""
+        LLM_RESULTS.inc(request_type.value, "template")
 
         ctx = fallback_context or {}
         try:
             return template.format(**ctx)
         except KeyError:
             return template
+
+    def _llm_span(self, request_type: str, **attrs: Any) -> Any:
+        """프로바이더 호출 1회를 감싸는 트레이스 스팬 (트레이스 밖이면 no-op)"""
+        return TRACER.span(
+            f"llm:{self.ai.name}", "llm", request_type=request_type, **attrs
+        )
+
+    def _generate(
+        self,
+        request_type: NarrativeRequestType,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+    ) -> str:
+        """프로바이더 호출 1회 + 지연 기록 (예외는 그대로 전파)"""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with self._llm_span(request_type.value, max_tokens=max_tokens):
+                result = self.ai.generate(
+                    prompt,
+                    system_prompt=system_prompt,
+                    max_tokens=max_tokens,
+                )
+            outcome = "ok"
+            return result
+        finally:
+            LLM_CALL_SECONDS.observe(
+                time.perf_counter() - started,
+                self.ai.name,
+                request_type.value,
+                outcome,
+            )
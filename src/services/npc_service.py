@@ -5,6 +5,7 @@ Service → Service 금지, EventBus 경유
 """
 
 import json
+import random
 import uuid
 from typing import List, Optional
 
@@ -27,6 +28,7 @@ from src.core.npc.promotion import (
     calculate_new_score,
     check_promotion_status,
 )
+from src.core.tracing import traced
 from src.db.models_v2 import (
     BackgroundEntityModel,
     NPCMemoryModel,
@@ -37,15 +39,22 @@ from src.db.models_v2 import (
 logger = get_logger(__name__)
 
 
+@traced
 class NPCService:
     """NPC CRUD, 승격, WorldPool, 기억 관리
 
     npc-system.md 섹션 14 대응.
     """
 
-    def __init__(self, db_session: Session, event_bus: EventBus) -> None:
+    def __init__(
+        self,
+        db_session: Session,
+        event_bus: EventBus,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         self._db = db_session
         self._bus = event_bus
+        self._rng = rng  # None이면 호출마다 비결정적 시드
 
     # ── 조회 ─────────────────────────────────────────────────
 
@@ -117,7 +126,7 @@ class NPCService:
         entity = self._entity_from_orm(row)
 
         # HEXACO 생성
-        hexaco = generate_hexaco(entity.role)
+        hexaco = generate_hexaco(entity.role, rng=self._rng)
 
         # Core 순수 변환
         npc_data = build_npc_from_entity(entity, hexaco)
@@ -134,7 +143,7 @@ class NPCService:
                 name_seed = NPCNameSeed(**seed_dict)
             except (json.JSONDecodeError, TypeError):
                 pass
-        full_name = generate_name(name_seed)
+        full_name = generate_name(name_seed, rng=self._rng)
         npc_data.full_name = full_name.to_dict()
         npc_data.given_name = full_name.given_name
 
@@ -211,8 +220,8 @@ class NPCService:
     def create_npc_for_quest(self, role: str, node_id: str) -> NPCData:
         """퀘스트용 NPC 직접 생성"""
         npc_id = str(uuid.uuid4())
-        hexaco = generate_hexaco(role)
-        full_name = generate_name(NPCNameSeed(role=role))
+        hexaco = generate_hexaco(role, rng=self._rng)
+        full_name = generate_name(NPCNameSeed(role=role), rng=self._rng)
 
         npc_data = NPCData(
             npc_id=npc_id,
@@ -6,6 +6,7 @@ Service → Service 금지, EventBus 경유
 
 import json
 import logging
+import random
 import uuid
 
 from sqlalchemy.orm import Session
@@ -42,6 +43,8 @@ from src.core.quest.result_logic import (
     evaluate_quest_result,
 )
 from src.core.quest.seed_logic import process_seed_ttl, try_generate_seed
+from src.core.rng import RNGProvider
+from src.core.tracing import traced
 from src.db.models_v2 import (
     QuestChainEligibleModel,
     QuestChainModel,
@@ -53,14 +56,38 @@ from src.db.models_v2 import (
 logger = logging.getLogger(__name__)
 
 
+@traced
 class QuestService:
     """퀘스트 CRUD + 비즈니스 로직"""
 
-    def __init__(self, db: Session, event_bus: EventBus):
+    def __init__(
+        self,
+        db: Session,
+        event_bus: EventBus,
+        rng: RNGProvider | None = None,
+    ):
         self._db = db
         self._bus = event_bus
+        self._rng = rng  # None이면 random 모듈 전역 상태
+        self._objectives_revision = 0
         self._register_event_handlers()
 
+    @property
+    def objectives_revision(self) -> int:
+        """활성 목표 집합 변경 횟수. ObjectiveWatcher가 놓친 이벤트 감지에 사용."""
+        return self._objectives_revision
+
+    def _next_objectives_revision(self) -> int:
+        """활성 목표 집합 변경 기록 (변경 이벤트의 data["revision"]으로 싣는다)."""
+        self._objectives_revision += 1
+        return self._objectives_revision
+
+    def _stream(self, *parts: object) -> random.Random | None:
+        """호출 단위 파생 스트림 (스레드 간 공유 Random 없음, rng 미지정 시 None)"""
+        if self._rng is None:
+            return None
+        return self._rng.stream("quest", *parts)
+
     def _register_event_handlers(self) -> None:
         """EventBus 구독"""
         self._bus.subscribe(EventTypes.DIALOGUE_STARTED, self._on_dialogue_started)
@@ -99,6 +126,7 @@ class QuestService:
             last_seed_conversation_count=last_count,
             current_conversation_count=conversation_count,
             eligible_quests=eligible_quests,
+            rng=self._stream("seed", npc_id, current_turn),
         )
 
         if seed is None:
@@ -228,7 +256,11 @@ class QuestService:
         self._bus.emit(
             GameEvent(
                 event_type=EventTypes.QUEST_ACTIVATED,
-                data={"quest_id": quest_id, "npc_id": seed.npc_id},
+                data={
+                    "quest_id": quest_id,
+                    "npc_id": seed.npc_id,
+                    "revision": self._next_objectives_revision(),
+                },
                 source="quest_service",
             )
         )
@@ -256,6 +288,19 @@ class QuestService:
         )
         return [self._objective_to_core(o) for o in orms]
 
+    def get_active_objectives(self) -> list[Objective]:
+        """활성 퀘스트의 활성 목표 전체. ObjectiveWatcher 인덱스 구성용."""
+        orms = (
+            self._db.query(QuestObjectiveModel)
+            .join(QuestModel, QuestModel.quest_id == QuestObjectiveModel.quest_id)
+            .filter(
+                QuestObjectiveModel.status == "active",
+                QuestModel.status == "active",
+            )
+            .all()
+        )
+        return [self._objective_to_core(o) for o in orms]
+
     def get_active_objectives_by_type(self, objective_type: str) -> list[Objective]:
         """특정 유형의 활성 목표. ObjectiveWatcher가 사용."""
         orms = (
@@ -284,7 +329,10 @@ class QuestService:
         self._bus.emit(
             GameEvent(
                 event_type=EventTypes.QUEST_ABANDONED,
-                data={"quest_id": quest_id},
+                data={
+                    "quest_id": quest_id,
+                    "revision": self._next_objectives_revision(),
+                },
                 source="quest_service",
             )
         )
@@ -332,6 +380,7 @@ class QuestService:
                     "quest_id": quest_id,
                     "result": result,
                     "rewards": self._rewards_to_dict(rewards),
+                    "revision": self._next_objectives_revision(),
                 },
                 source="quest_service",
             )
@@ -398,6 +447,19 @@ class QuestService:
             fail_reason,
             len(replacements),
         )
+        if replacements:
+            self._bus.emit(
+                GameEvent(
+                    event_type=EventTypes.OBJECTIVES_REPLACED,
+                    data={
+                        "quest_id": quest.quest_id,
+                        "failed_objective_id": objective_id,
+                        "objective_ids": [r.objective_id for r in replacements],
+                        "revision": self._next_objectives_revision(),
+                    },
+                    source="quest_service",
+                )
+            )
         return replacements
 
     # === 체이닝 ===
@@ -442,7 +504,10 @@ class QuestService:
         if quest.chain_id:
             chain = self._db.get(QuestChainModel, quest.chain_id)
             if chain is not None:
-                if should_finalize_chain(chain.total_quests):
+                if should_finalize_chain(
+                    chain.total_quests,
+                    self._stream("chain", quest.chain_id, quest.quest_id),
+                ):
                     chain.finalized = True
                     self._bus.emit(
                         GameEvent(
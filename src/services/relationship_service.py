@@ -35,11 +35,13 @@ from src.core.relationship.reversals import (
     apply_reversal as core_apply_reversal,
 )
 from src.core.relationship.transitions import evaluate_transition
+from src.core.tracing import traced
 from src.db.models_v2 import NPCModel, RelationshipModel
 
 logger = get_logger(__name__)
 
 
+@traced
 class RelationshipService:
     """관계 CRUD, 수치 변동, 반전, 감쇠, 태도 생성
 
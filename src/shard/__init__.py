@@ -0,0 +1,21 @@
+"""
+리전 샤딩 멀티 프로세스 엔진
+
+uvicorn src.shard.app:app   (SHARD_COUNT, SHARD_REGION_SIZE 설정)
+
+월드를 리전(region_size 격자) 단위로 N개 엔진 프로세스에 나누고,
+ShardRouter가 플레이어 명령을 현재 리전 소유 샤드로 전달한다.
+리전 경계를 넘으면 PlayerState를 새 샤드로 핸드오프한다.
+"""
+
+from src.shard.partition import RegionPartitioner
+from src.shard.router import ShardRouter
+from src.shard.worker import SHARD_ACTIONS, ShardCommandError, ShardWorker
+
+__all__ = [
+    "SHARD_ACTIONS",
+    "RegionPartitioner",
+    "ShardCommandError",
+    "ShardRouter",
+    "ShardWorker",
+]
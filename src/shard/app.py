@@ -0,0 +1,113 @@
+"""
+샤드 배포 모드 API
+
+uvicorn src.shard.app:app
+
+/game/register, /game/state/{id}, /game/action 을 ShardRouter로 전달한다.
+엔진 액션(look/move/rest/investigate/harvest/enter/exit)만 지원하며,
+대화/아이템/퀘스트 등 서비스 계층 액션은 단일 프로세스 모드(src.main) 전용이다.
+"""
+
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+
+from src.api.schemas import (
+    ActionRequest,
+    ActionResponse,
+    ErrorResponse,
+    GameStateResponse,
+    RegisterRequest,
+)
+from src.config import settings
+from src.core.logging import get_logger, setup_logging
+from src.shard.router import ShardRouter
+from src.shard.worker import ShardCommandError
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/game", tags=["game"])
+
+
+def get_shard_router(request: Request) -> ShardRouter:
+    """ShardRouter 인스턴스 반환"""
+    shard_router: ShardRouter = request.app.state.shard_router
+    return shard_router
+
+
+def _forward(func: Callable[..., dict[str, Any]], *args: Any) -> dict[str, Any]:
+    try:
+        return func(*args)
+    except ShardCommandError as e:
+        raise HTTPException(status_code=e.status, detail=e.detail)
+
+
+@router.post("/register", response_model=GameStateResponse)
+def register_player(request: RegisterRequest, http_request: Request) -> Any:
+    """플레이어 등록 (Safe Haven 리전의 샤드에서 시작)"""
+    return _forward(get_shard_router(http_request).register, request.player_id)
+
+
+@router.get(
+    "/state/{player_id}",
+    response_model=GameStateResponse,
+    responses={404: {"model": ErrorResponse}},
+)
+def get_game_state(player_id: str, http_request: Request) -> Any:
+    """현재 게임 상태 조회 (소유 샤드에서)"""
+    return _forward(get_shard_router(http_request).state, player_id)
+
+
+@router.post(
+    "/action",
+    response_model=ActionResponse,
+    responses={400: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+)
+def execute_action(request: ActionRequest, http_request: Request) -> Any:
+    """게임 액션 실행 (리전 경계를 넘으면 다음 요청부터 새 샤드에서 처리)"""
+    return _forward(
+        get_shard_router(http_request).action,
+        request.player_id,
+        request.action.lower(),
+        request.params,
+    )
+
+
+@router.get("/shards")
+def get_shard_stats(http_request: Request) -> dict[str, Any]:
+    """샤드별 플레이어/노드 수, 누적 핸드오프 수"""
+    return get_shard_router(http_request).stats()
+
+
+def create_app(shard_router: ShardRouter | None = None) -> FastAPI:
+    """샤드 모드 앱 생성 (shard_router가 없으면 설정값으로 시작/종료)"""
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        owned = shard_router is None
+        active = shard_router or ShardRouter(
+            num_shards=settings.SHARD_COUNT,
+            region_size=settings.SHARD_REGION_SIZE,
+            log_level=settings.LOG_LEVEL,
+        )
+        if owned:
+            active.start()
+        app.state.shard_router = active
+        yield
+        if owned:
+            active.stop()
+
+    app = FastAPI(title="Infinite Text World (sharded)", lifespan=lifespan)
+
+    @app.get("/health")
+    def health_check() -> dict[str, str]:
+        return {"status": "ok", "mode": "sharded"}
+
+    app.include_router(router)
+    return app
+
+
+setup_logging(settings.LOG_LEVEL)
+app = create_app()
@@ -0,0 +1,34 @@
+"""월드 좌표 → 리전 → 샤드 분할"""
+
+from src.core.rng import derive_seed
+
+DEFAULT_REGION_SIZE = 16
+
+
+class RegionPartitioner:
+    """
+    리전 단위 샤드 배정
+
+    리전 (rx, ry) = (x // region_size, y // region_size).
+    리전 → 샤드는 해시로 고르게 분산하며, 프로세스와 무관하게 같은 결과를 낸다.
+    """
+
+    def __init__(self, num_shards: int, region_size: int = DEFAULT_REGION_SIZE):
+        if num_shards < 1:
+            raise ValueError("num_shards must be >= 1")
+        if region_size < 1:
+            raise ValueError("region_size must be >= 1")
+        self.num_shards = num_shards
+        self.region_size = region_size
+
+    def region_of(self, x: int, y: int) -> tuple[int, int]:
+        return (x // self.region_size, y // self.region_size)
+
+    def shard_of_region(self, rx: int, ry: int) -> int:
+        if self.num_shards == 1:
+            return 0
+        return derive_seed(0, "region", rx, ry) % self.num_shards
+
+    def shard_of(self, x: int, y: int) -> int:
+        """좌표를 소유한 샤드 번호"""
+        return self.shard_of_region(*self.region_of(x, y))
@@ -0,0 +1,206 @@
+"""
+샤드 라우터
+
+N개 샤드 프로세스를 띄우고 플레이어 명령을 현재 리전 소유 샤드로 전달한다.
+명령 후 플레이어가 다른 샤드의 리전으로 넘어가면 PlayerState를 넘긴다(핸드오프).
+같은 플레이어의 명령과 핸드오프는 플레이어 액터로 직렬화된다.
+"""
+
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from src.core.actor import ActorRegistry
+from src.core.logging import get_logger
+from src.shard.partition import DEFAULT_REGION_SIZE, RegionPartitioner
+from src.shard.worker import ShardCommandError, shard_main
+
+logger = get_logger(__name__)
+
+SHARD_START_TIMEOUT = 60.0
+
+
+class _ShardHandle:
+    """샤드 프로세스 하나 + 요청/응답 파이프 (파이프는 한 번에 한 요청)"""
+
+    def __init__(self, shard_id: int, process: BaseProcess, conn: Connection):
+        self.shard_id = shard_id
+        self.process = process
+        self.conn = conn
+        self.lock = threading.Lock()
+
+    def request(self, *message: Any) -> dict[str, Any]:
+        with self.lock:
+            self.conn.send(message)
+            reply: dict[str, Any] = self.conn.recv()
+            return reply
+
+
+class ShardRouter:
+    """
+    리전 샤딩 라우터
+
+    사용:
+        with ShardRouter(num_shards=4) as router:
+            router.register("p1")
+            router.action("p1", "move", {"direction": "e"})
+    """
+
+    def __init__(
+        self,
+        num_shards: int = 2,
+        region_size: int = DEFAULT_REGION_SIZE,
+        world_seed: int = 42,
+        log_level: str = "WARNING",
+    ):
+        self.partitioner = RegionPartitioner(num_shards, region_size)
+        self.world_seed = world_seed
+        self.log_level = log_level
+
+        self._shards: list[_ShardHandle] = []
+        self._owners: dict[str, int] = {}  # player_id → 샤드 번호
+        self._actors = ActorRegistry()
+        self.handoffs = 0
+
+    # === 수명 주기 ===
+
+    def start(self) -> "ShardRouter":
+        # spawn: 부모의 스레드/엔진 상태를 물려받지 않는 깨끗한 프로세스
+        context = multiprocessing.get_context("spawn")
+        for shard_id in range(self.partitioner.num_shards):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=shard_main,
+                args=(
+                    child_conn,
+                    shard_id,
+                    self.world_seed,
+                    self.log_level,
+                    self.partitioner.num_shards,
+                    self.partitioner.region_size,
+                ),
+                name=f"itw-shard-{shard_id}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._shards.append(_ShardHandle(shard_id, process, parent_conn))
+
+        for shard in self._shards:
+            if not shard.conn.poll(SHARD_START_TIMEOUT):
+                self.stop()
+                raise RuntimeError(f"Shard {shard.shard_id} did not start")
+            shard.conn.recv()
+        logger.info("Started %d shards", len(self._shards))
+        return self
+
+    def stop(self) -> None:
+        for shard in self._shards:
+            try:
+                shard.request("stop")
+            except (EOFError, OSError, BrokenPipeError):
+                pass
+            shard.process.join(timeout=5)
+            if shard.process.is_alive():
+                shard.process.terminate()
+            shard.conn.close()
+        self._shards = []
+
+    def __enter__(self) -> "ShardRouter":
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    # === 라우팅 ===
+
+    def _call(self, shard_id: int, *message: Any) -> dict[str, Any]:
+        reply = self._shards[shard_id].request(*message)
+        if not reply.get("ok"):
+            raise ShardCommandError(reply.get("status", 500), reply.get("detail", ""))
+        return reply
+
+    def owner_of(self, player_id: str) -> int:
+        """
+        플레이어를 보유한 샤드 번호
+
+        Raises:
+            ShardCommandError: 미등록 플레이어 (404)
+        """
+        shard_id = self._owners.get(player_id)
+        if shard_id is None:
+            raise ShardCommandError(404, f"Player not found: {player_id}")
+        return shard_id
+
+    def register(self, player_id: str) -> dict[str, Any]:
+        """등록 (이미 있으면 현재 상태) → GameStateResponse dict"""
+
+        def run() -> dict[str, Any]:
+            shard_id = self._owners.get(player_id)
+            if shard_id is None:
+                shard_id = self.partitioner.shard_of(0, 0)
+                reply = self._call(shard_id, "register", player_id)
+                self._owners[player_id] = shard_id
+            else:
+                reply = self._call(shard_id, "state", player_id)
+            response: dict[str, Any] = reply["response"]
+            return response
+
+        return self._actors.call(player_id, run)
+
+    def state(self, player_id: str) -> dict[str, Any]:
+        """현재 상태 → GameStateResponse dict"""
+
+        def run() -> dict[str, Any]:
+            reply = self._call(self.owner_of(player_id), "state", player_id)
+            response: dict[str, Any] = reply["response"]
+            return response
+
+        return self._actors.call(player_id, run)
+
+    def action(
+        self, player_id: str, action: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """액션 실행 → ActionResponse dict (경계를 넘으면 핸드오프)"""
+
+        def run() -> dict[str, Any]:
+            shard_id = self.owner_of(player_id)
+            reply = self._call(shard_id, "action", player_id, action, params or {})
+            response: dict[str, Any] = reply["response"]
+            target = self.partitioner.shard_of(*reply["position"])
+            if target != shard_id:
+                # 도착 처리는 대상 샤드에서 (출발 샤드 응답에는 위치 뷰가 없음)
+                arrival = self._handoff(player_id, shard_id, target)
+                if arrival["location"] is not None:
+                    response = {**response, "location": arrival["location"]}
+            return response
+
+        return self._actors.call(player_id, run)
+
+    def _handoff(self, player_id: str, source: int, target: int) -> dict[str, Any]:
+        """플레이어 상태를 대상 샤드로 이동하고 도착 처리 → import 응답"""
+        state = self._call(source, "export", player_id)["state"]
+        try:
+            arrival = self._call(target, "import", state, True)
+        except ShardCommandError:
+            # 대상 샤드가 거부하면 원래 샤드로 되돌린다 (도착 처리 없이)
+            self._call(source, "import", state, False)
+            raise
+        self._owners[player_id] = target
+        self.handoffs += 1
+        logger.debug("Handoff %s: shard %d → %d", player_id, source, target)
+        return arrival
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "num_shards": self.partitioner.num_shards,
+            "region_size": self.partitioner.region_size,
+            "players": len(self._owners),
+            "handoffs": self.handoffs,
+            "shards": [
+                {k: v for k, v in self._call(s.shard_id, "stats").items() if k != "ok"}
+                for s in self._shards
+            ],
+        }
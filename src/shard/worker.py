@@ -0,0 +1,220 @@
+"""
+샤드 워커 프로세스
+
+ITWEngine 하나를 소유하고 파이프로 받은 명령을 순서대로 처리한다.
+명령: (op, *args) 튜플. 응답: {"ok": True, ...} 또는 {"ok": False, "status", "detail"}.
+"""
+
+import time
+from multiprocessing.connection import Connection
+from typing import Any
+
+from src.api.game import (
+    build_direction_info,
+    build_location_info,
+    build_player_info,
+)
+from src.api.schemas import ActionResponse, GameStateResponse
+from src.core.engine import ActionResult, ITWEngine, PlayerState
+from src.core.logging import get_logger, setup_logging
+from src.shard.partition import RegionPartitioner
+
+logger = get_logger(__name__)
+
+AXIOM_DATA_PATH = "src/data/itw_214_divine_axioms.json"
+
+# 샤드 모드에서 지원하는 엔진 액션 (서비스 계층 액션은 단일 프로세스 모드 전용)
+SHARD_ACTIONS = ("look", "move", "rest", "investigate", "harvest", "enter", "exit")
+
+# 유휴 서브 그리드 인스턴스 축출 주기 (명령 사이에 실행)
+SUB_GRID_SWEEP_SECONDS = 60.0
+
+
+class ShardCommandError(Exception):
+    """샤드 명령 실패 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class ShardWorker:
+    """샤드 하나의 엔진 + 명령 처리 (프로세스 없이도 직접 호출 가능)"""
+
+    def __init__(
+        self,
+        shard_id: int,
+        world_seed: int = 42,
+        partitioner: RegionPartitioner | None = None,
+    ):
+        self.shard_id = shard_id
+        self.engine = ITWEngine(axiom_data_path=AXIOM_DATA_PATH, world_seed=world_seed)
+        if partitioner is not None:
+            # 다른 샤드 리전으로의 이동은 도착 처리를 대상 샤드(_op_import)에 맡김
+            self.engine.owns_position = lambda x, y: (
+                partitioner.shard_of(x, y) == shard_id
+            )
+        self.handled = 0
+
+    def handle(self, op: str, *args: Any) -> dict[str, Any]:
+        """명령 처리 → 응답 dict"""
+        self.handled += 1
+        try:
+            handler = getattr(self, f"_op_{op}", None)
+            if handler is None:
+                raise ShardCommandError(400, f"Unknown shard op: {op}")
+            return {"ok": True, **handler(*args)}
+        except ShardCommandError as e:
+            return {"ok": False, "status": e.status, "detail": e.detail}
+        except Exception as e:
+            logger.exception("Shard %d op %s failed", self.shard_id, op)
+            return {"ok": False, "status": 500, "detail": str(e)}
+
+    # === 명령 ===
+
+    def _player(self, player_id: str) -> PlayerState:
+        player = self.engine.get_player(player_id)
+        if player is None:
+            raise ShardCommandError(404, f"Player not found: {player_id}")
+        return player
+
+    def _position(self, player: PlayerState) -> tuple[int, int]:
+        return (player.x, player.y)
+
+    def _op_register(self, player_id: str) -> dict[str, Any]:
+        self.engine.register_player(player_id)
+        return self._op_state(player_id)
+
+    def _op_state(self, player_id: str) -> dict[str, Any]:
+        player = self._player(player_id)
+        result = self.engine.look(player_id)
+        response = GameStateResponse(
+            success=True,
+            player=build_player_info(player),
+            location=(
+                build_location_info(result.location_view)
+                if result.location_view
+                else None
+            ),
+            directions=(
+                [build_direction_info(h) for h in result.location_view.direction_hints]
+                if result.location_view
+                else []
+            ),
+        )
+        return {"response": response.model_dump(), "position": self._position(player)}
+
+    def _op_action(
+        self, player_id: str, action: str, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        player = self._player(player_id)
+        result = self._run_action(player_id, action, params)
+        response = ActionResponse(
+            success=result.success,
+            action=result.action_type,
+            message=result.message,
+            data=result.data,
+            location=(
+                build_location_info(result.location_view)
+                if result.location_view
+                else None
+            ),
+        )
+        return {"response": response.model_dump(), "position": self._position(player)}
+
+    def _run_action(
+        self, player_id: str, action: str, params: dict[str, Any]
+    ) -> ActionResult:
+        engine = self.engine
+        if action == "look":
+            return engine.look(player_id)
+        if action == "move":
+            direction = params.get("direction", "")
+            if not direction:
+                raise ShardCommandError(400, "Missing 'direction' parameter")
+            return engine.move(player_id, direction)
+        if action == "rest":
+            return engine.rest(player_id)
+        if action == "investigate":
+            return engine.investigate(
+                player_id, params.get("echo_index", 0), params.get("echo_id")
+            )
+        if action == "harvest":
+            resource_id = params.get("resource_id", "")
+            if not resource_id:
+                raise ShardCommandError(400, "Missing 'resource_id' parameter")
+            return engine.harvest(player_id, resource_id, params.get("amount", 1))
+        if action == "enter":
+            return engine.enter_depth(player_id)
+        if action == "exit":
+            return engine.exit_depth(player_id)
+        raise ShardCommandError(400, f"Action not supported in sharded mode: {action}")
+
+    def _op_export(self, player_id: str) -> dict[str, Any]:
+        """핸드오프: 플레이어 상태를 꺼내고 이 샤드에서 제거"""
+        player = self._player(player_id)
+        state = player.to_dict()
+        del self.engine.players[player_id]
+        self.engine.actors.discard(player_id)
+        self.engine.rng.reset_player(player_id)
+        return {"state": state}
+
+    def _op_import(self, state: dict[str, Any], arrive: bool = False) -> dict[str, Any]:
+        """
+        핸드오프: 다른 샤드에서 넘어온 플레이어 상태 등록
+
+        arrive=True면 출발 샤드가 생략한 도착 처리(발견/탐험 Echo/모듈 알림)를
+        이 샤드의 노드에 적용하고 도착 위치를 함께 반환한다.
+        """
+        player = PlayerState.from_dict(state)
+        self.engine.players[player.player_id] = player
+        if not arrive:
+            self.engine.world.get_or_generate(player.x, player.y)
+            return {"position": self._position(player), "location": None}
+        view = self.engine.complete_arrival(player.player_id)
+        return {
+            "position": self._position(player),
+            "location": build_location_info(view).model_dump() if view else None,
+        }
+
+    def _op_stats(self) -> dict[str, Any]:
+        return {
+            "shard_id": self.shard_id,
+            "players": len(self.engine.players),
+            "nodes": len(self.engine.world.nodes),
+            "handled": self.handled,
+        }
+
+
+def shard_main(
+    conn: Connection,
+    shard_id: int,
+    world_seed: int,
+    log_level: str,
+    num_shards: int,
+    region_size: int,
+):
+    """샤드 프로세스 진입점: 'stop'을 받거나 파이프가 닫힐 때까지 명령 처리"""
+    setup_logging(log_level)
+    worker = ShardWorker(
+        shard_id, world_seed, partitioner=RegionPartitioner(num_shards, region_size)
+    )
+    conn.send({"ok": True, "ready": shard_id})
+    last_sweep = time.monotonic()
+    while True:
+        if time.monotonic() - last_sweep >= SUB_GRID_SWEEP_SECONDS:
+            worker.engine.evict_idle_sub_grids()
+            last_sweep = time.monotonic()
+        try:
+            if not conn.poll(SUB_GRID_SWEEP_SECONDS):
+                continue
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        op, args = message[0], message[1:]
+        if op == "stop":
+            conn.send({"ok": True})
+            break
+        conn.send(worker.handle(op, *args))
+    conn.close()
@@ -0,0 +1,29 @@
+"""
+헤드리스 시뮬레이션 하네스
+
+python -m src.sim --players 50 --turns 200 --workers 4
+
+전체 엔진 + 서비스를 인메모리 DB로 띄워 가상 플레이어 루프를 돌리고
+처리량, 액션별 지연 분위수, DB 문장 수, 메모리 증가량을 보고한다.
+"""
+
+from src.sim.harness import (
+    SimConfig,
+    SimEnvironment,
+    VirtualPlayer,
+    build_environment,
+    run_simulation,
+    run_worker,
+)
+from src.sim.report import SimReport, WorkerResult
+
+__all__ = [
+    "SimConfig",
+    "SimEnvironment",
+    "VirtualPlayer",
+    "build_environment",
+    "run_simulation",
+    "run_worker",
+    "SimReport",
+    "WorkerResult",
+]
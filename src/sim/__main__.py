@@ -0,0 +1,43 @@
+"""시뮬레이션 CLI: python -m src.sim"""
+
+import argparse
+import json
+
+from src.core.logging import setup_logging
+from src.sim.harness import SimConfig, run_simulation
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.sim",
+        description="Headless ITW simulation for throughput/memory profiling",
+    )
+    parser.add_argument("--players", type=int, default=10, help="워커당 플레이어 수")
+    parser.add_argument("--turns", type=int, default=50, help="플레이어당 턴 수")
+    parser.add_argument("--workers", type=int, default=1, help="프로세스 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--trace-memory", action="store_true", help="tracemalloc 피크 측정"
+    )
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    setup_logging(args.log_level)
+    report = run_simulation(
+        SimConfig(
+            players=args.players,
+            turns=args.turns,
+            workers=args.workers,
+            seed=args.seed,
+            trace_memory=args.trace_memory,
+        )
+    )
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    else:
+        print(report.format_text())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""
+헤드리스 시뮬레이션 하네스
+
+인메모리 SQLite + MockProvider 위에 ITWEngine과 전체 서비스
+(Dialogue/Item/Quest/Companion + ObjectiveWatcher)를 조립하고,
+가상 플레이어가 API 액션 핸들러(execute_action)를 직접 호출하며 턴을 진행한다.
+HTTP 서버/클라이언트는 거치지 않는다.
+"""
+
+import random
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, cast
+
+from fastapi import BackgroundTasks, HTTPException, Request
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import src.db.models_v2  # noqa: F401  Phase 2 테이블 등록
+from src.api.game import execute_action
+from src.api.schemas import ActionRequest, ActionResponse
+from src.core.engine import ITWEngine
+from src.core.event_bus import EventBus
+from src.core.item.axiom_mapping import AxiomTagMapping
+from src.core.item.registry import PrototypeRegistry
+from src.core.logging import get_logger
+from src.db.models import Base
+from src.engine.objective_watcher import ObjectiveWatcher
+from src.services.ai.mock import MockProvider
+from src.services.companion_service import CompanionService
+from src.services.dialogue_service import DialogueService
+from src.services.item_service import ItemService
+from src.services.narrative_service import NarrativeService
+from src.services.quest_service import QuestService
+from src.sim.report import SimReport, WorkerResult
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+AXIOM_DATA_PATH = "src/data/itw_214_divine_axioms.json"
+SEED_ITEMS_PATH = "src/data/seed_items.json"
+AXIOM_MAPPING_PATH = "src/data/axiom_tag_mapping.json"
+
+
+@dataclass
+class SimConfig:
+    """시뮬레이션 설정"""
+
+    players: int = 10  # 워커당 가상 플레이어 수
+    turns: int = 50  # 플레이어당 턴 수
+    workers: int = 1  # 프로세스 수 (1이면 현재 프로세스에서 실행)
+    seed: int = 42
+    trace_memory: bool = False  # tracemalloc 피크 측정 (느려짐)
+
+
+# === 환경 구성 ===
+
+
+class _SimHttpRequest:
+    """execute_action이 참조하는 request.app.state만 제공하는 최소 요청 객체"""
+
+    def __init__(self, state: SimpleNamespace):
+        self.app = SimpleNamespace(state=state)
+
+
+@dataclass
+class SimEnvironment:
+    """하네스가 조립한 엔진 + 서비스 묶음"""
+
+    engine: ITWEngine
+    state: SimpleNamespace
+    db_engine: Engine
+    db_session: Session
+    prototype_ids: list[str] = field(default_factory=list)
+    statements: list[int] = field(default_factory=lambda: [0])
+
+    @property
+    def http_request(self) -> Request:
+        # execute_action은 request.app.state만 읽으므로 최소 객체로 대신한다
+        return cast(Request, _SimHttpRequest(self.state))
+
+    @property
+    def item_service(self) -> ItemService:
+        service: ItemService = self.state.item_service
+        return service
+
+    def close(self) -> None:
+        self.engine.module_manager.shutdown()
+        self.db_session.close()
+        self.db_engine.dispose()
+
+
+def build_environment(seed: int = 42) -> SimEnvironment:
+    """인메모리 DB 위에 엔진과 전체 서비스를 main.py와 같은 순서로 조립"""
+    db_engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=db_engine)
+    session_factory = sessionmaker(bind=db_engine, autocommit=False, autoflush=False)
+
+    statements = [0]
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def _count_statement(*_args: Any) -> None:
+        statements[0] += 1
+
+    event_bus = EventBus()
+    engine = ITWEngine(
+        axiom_data_path=AXIOM_DATA_PATH,
+        world_seed=seed,
+        session_factory=session_factory,
+        event_bus=event_bus,
+    )
+
+    db_session = session_factory()
+    narrative_service = NarrativeService(MockProvider())
+    dialogue_service = DialogueService(db_session, event_bus, narrative_service)
+
+    registry = PrototypeRegistry()
+    registry.load_from_json(SEED_ITEMS_PATH)
+    axiom_mapping = AxiomTagMapping()
+    axiom_mapping.load_from_json(AXIOM_MAPPING_PATH)
+    item_service = ItemService(
+        db=db_session,
+        event_bus=event_bus,
+        registry=registry,
+        axiom_mapping=axiom_mapping,
+    )
+    item_service.sync_prototypes_to_db()
+
+    quest_service = QuestService(db=db_session, event_bus=event_bus, rng=engine.rng)
+    companion_service = CompanionService(db=db_session, event_bus=event_bus)
+    objective_watcher = ObjectiveWatcher(
+        event_bus=event_bus,
+        quest_service=quest_service,
+        companion_service=companion_service,
+    )
+
+    state = SimpleNamespace(
+        narrative_service=narrative_service,
+        dialogue_service=dialogue_service,
+        item_service=item_service,
+        quest_service=quest_service,
+        companion_service=companion_service,
+        objective_watcher=objective_watcher,
+        event_bus=event_bus,
+    )
+    return SimEnvironment(
+        engine=engine,
+        state=state,
+        db_engine=db_engine,
+        db_session=db_session,
+        prototype_ids=[prototype.item_id for prototype in registry.get_all()],
+        statements=statements,
+    )
+
+
+# === 가상 플레이어 ===
+
+
+class VirtualPlayer:
+    """
+    스크립트 가상 플레이어
+
+    턴마다 가중치로 의도를 하나 골라 1~3개의 액션을 실행한다.
+    - move / look / investigate / harvest: 단일 액션
+    - talk: talk → say → end_talk
+    - trade: browse(시장 컨테이너) → give(보유 아이템이 있으면)
+    """
+
+    INTENTS = ["move", "look", "investigate", "harvest", "talk", "trade"]
+    WEIGHTS = [30, 20, 15, 15, 10, 10]
+
+    MARKET_CONTAINER = "sim_market"
+    NPC_POOL = 8
+    STARTING_ITEMS = 3
+    REST_SUPPLY_THRESHOLD = 3
+
+    def __init__(self, env: SimEnvironment, player_id: str, rng: random.Random):
+        self.env = env
+        self.player_id = player_id
+        self.rng = rng
+        self.known_resources: list[str] = []
+        self.items: list[str] = []
+
+    def setup(self, prototype_ids: list[str]) -> None:
+        """등록 + 시작 아이템 지급"""
+        self.env.engine.register_player(self.player_id)
+        for prototype_id in self.rng.sample(
+            prototype_ids, min(self.STARTING_ITEMS, len(prototype_ids))
+        ):
+            with self.env.state.event_bus.turn_scope():
+                instance = self.env.item_service.create_instance(
+                    prototype_id, "player", self.player_id
+                )
+            self.items.append(instance.instance_id)
+
+    def take_turn(self, result: WorkerResult) -> None:
+        """한 턴 진행"""
+        player = self.env.engine.get_player(self.player_id)
+        if player is not None and player.supply < self.REST_SUPPLY_THRESHOLD:
+            self._act(result, "rest")
+            return
+
+        intent = self.rng.choices(self.INTENTS, weights=self.WEIGHTS)[0]
+        if intent == "move":
+            direction = self.rng.choice("nsew")
+            if self._act(result, "move", {"direction": direction}) is not None:
+                self.known_resources = []
+        elif intent == "look":
+            self._look(result)
+        elif intent == "investigate":
+            self._act(result, "investigate")
+        elif intent == "harvest":
+            if not self.known_resources:
+                self._look(result)
+            if self.known_resources:
+                resource_id = self.rng.choice(self.known_resources)
+                self._act(result, "harvest", {"resource_id": resource_id})
+        elif intent == "talk":
+            npc_id = f"sim_npc_{self.rng.randrange(self.NPC_POOL)}"
+            if self._act(result, "talk", {"npc_id": npc_id}) is not None:
+                self._act(result, "say", {"text": "요즘 이 근처는 어떤가?"})
+                self._act(result, "end_talk")
+        else:
+            self._act(result, "browse", {"container_id": self.MARKET_CONTAINER})
+            if self.items:
+                npc_id = f"sim_npc_{self.rng.randrange(self.NPC_POOL)}"
+                item_id = self.items.pop()
+                self._act(result, "give", {"npc_id": npc_id, "item_id": item_id})
+
+    def _look(self, result: WorkerResult) -> None:
+        response = self._act(result, "look")
+        if response is not None and response.location is not None:
+            self.known_resources = [r["type"] for r in response.location.resources]
+
+    def _act(
+        self, result: WorkerResult, action: str, params: dict | None = None
+    ) -> ActionResponse | None:
+        """액션 핸들러 직접 호출 + 지연 기록 (HTTP 오류/실패 응답은 따로 집계)"""
+        request = ActionRequest(
+            player_id=self.player_id, action=action, params=params or {}
+        )
+        # 액션 1회 = 이벤트 체인 1회 (execute_action이 요청별 turn_scope를 연다)
+        background_tasks = BackgroundTasks()
+        started = time.perf_counter()
+        try:
+            response = execute_action(
+                request,
+                self.env.http_request,
+                background_tasks,
+                engine=self.env.engine,
+            )
+        except HTTPException:
+            result.record(action, time.perf_counter() - started, ok=False)
+            return None
+        result.record(
+            action,
+            time.perf_counter() - started,
+            ok=True,
+            rejected=not response.success,
+        )
+        # 서버가 응답 후 실행하는 작업(지연 이벤트 전달)은 지연 측정 밖에서 실행
+        for task in background_tasks.tasks:
+            task.func(*task.args, **task.kwargs)
+        return response
+
+
+# === 실행 ===
+
+
+def _rss_kb() -> int | None:
+    """프로세스 최대 RSS (KB, 리눅스 기준)"""
+    if resource is None:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def run_worker(config: SimConfig, worker_index: int = 0) -> WorkerResult:
+    """워커 하나: 독립 환경에서 config.players명을 config.turns턴 진행"""
+    seed = config.seed + worker_index
+    rss_start = _rss_kb()
+    if config.trace_memory:
+        tracemalloc.start()
+
+    env = build_environment(seed)
+    try:
+        rng = random.Random(seed)
+        players = [
+            VirtualPlayer(
+                env, f"sim_w{worker_index}_p{i}", random.Random(rng.getrandbits(64))
+            )
+            for i in range(config.players)
+        ]
+        for player in players:
+            player.setup(env.prototype_ids)
+
+        result = WorkerResult(
+            worker_index=worker_index,
+            players=config.players,
+            turns=config.turns,
+            elapsed=0.0,
+        )
+        env.statements[0] = 0
+        started = time.perf_counter()
+        for _ in range(config.turns):
+            for player in players:
+                player.take_turn(result)
+        result.elapsed = time.perf_counter() - started
+
+        result.db_statements = env.statements[0]
+        stats = env.engine.get_world_stats()
+        result.world = {
+            "nodes": len(env.engine.world.nodes),
+            "players": stats["active_players"],
+            "echoes": sum(len(n.echoes) for n in env.engine.world.nodes.values()),
+            "sub_grid": stats["sub_grid"],
+        }
+    finally:
+        env.close()
+
+    if config.trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result.traced_peak_kb = peak // 1024
+    result.rss_start_kb = rss_start
+    result.rss_end_kb = _rss_kb()
+    return result
+
+
+def run_simulation(config: SimConfig) -> SimReport:
+    """시뮬레이션 실행 (workers > 1이면 프로세스 풀로 분산)"""
+    logger.info(
+        "Simulation start: players=%d turns=%d workers=%d seed=%d",
+        config.players,
+        config.turns,
+        config.workers,
+        config.seed,
+    )
+    started = time.perf_counter()
+    if config.workers <= 1:
+        results = [run_worker(config, 0)]
+    else:
+        with ProcessPoolExecutor(max_workers=config.workers) as pool:
+            futures = [
+                pool.submit(run_worker, config, index)
+                for index in range(config.workers)
+            ]
+            results = [future.result() for future in futures]
+    wall = time.perf_counter() - started
+
+    # 처리량은 턴 루프 시간 기준 (환경 구성 시간 제외)
+    loop_seconds = max(result.elapsed for result in results)
+    report = SimReport.merge(results, loop_seconds)
+    logger.info(
+        "Simulation done in %.2fs: %.1f actions/s", wall, report.actions_per_sec
+    )
+    return report
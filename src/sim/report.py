@@ -0,0 +1,162 @@
+"""시뮬레이션 측정값 집계 및 보고서"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값의 q 분위수 (nearest-rank, q: 0~100)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+@dataclass
+class WorkerResult:
+    """워커 하나의 원시 측정값 (프로세스 간 전달용, pickle 가능)"""
+
+    worker_index: int
+    players: int
+    turns: int
+    elapsed: float
+    latencies: dict[str, list[float]] = field(default_factory=dict)  # 초
+    errors: dict[str, int] = field(default_factory=dict)
+    rejected: dict[str, int] = field(default_factory=dict)  # success=False 응답
+    db_statements: int = 0
+    rss_start_kb: int | None = None
+    rss_end_kb: int | None = None
+    traced_peak_kb: int | None = None
+    world: dict[str, Any] = field(default_factory=dict)
+
+    def record(
+        self, action: str, seconds: float, ok: bool, rejected: bool = False
+    ) -> None:
+        """액션 1회 기록 (ok=False: HTTP 오류, rejected: 게임 규칙상 실패 응답)"""
+        self.latencies.setdefault(action, []).append(seconds)
+        if not ok:
+            self.errors[action] = self.errors.get(action, 0) + 1
+        elif rejected:
+            self.rejected[action] = self.rejected.get(action, 0) + 1
+
+    @property
+    def actions(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+
+@dataclass
+class ActionSummary:
+    """액션 유형별 지연 요약 (ms)"""
+
+    count: int
+    errors: int
+    rejected: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class SimReport:
+    """시뮬레이션 결과 보고서"""
+
+    players: int
+    turns: int
+    workers: int
+    loop_seconds: float
+    actions: int
+    errors: int
+    rejected: int
+    actions_per_sec: float
+    db_statements: int
+    db_statements_per_action: float
+    memory_growth_kb: int | None
+    traced_peak_kb: int | None
+    by_action: dict[str, ActionSummary]
+    world: list[dict[str, Any]]
+
+    @classmethod
+    def merge(cls, results: list[WorkerResult], loop_seconds: float) -> "SimReport":
+        """워커 결과 병합"""
+        latencies: dict[str, list[float]] = {}
+        errors: dict[str, int] = {}
+        rejected: dict[str, int] = {}
+        for result in results:
+            for action, values in result.latencies.items():
+                latencies.setdefault(action, []).extend(values)
+            for action, count in result.errors.items():
+                errors[action] = errors.get(action, 0) + count
+            for action, count in result.rejected.items():
+                rejected[action] = rejected.get(action, 0) + count
+
+        by_action: dict[str, ActionSummary] = {}
+        for action in sorted(latencies):
+            values = sorted(latencies[action])
+            by_action[action] = ActionSummary(
+                count=len(values),
+                errors=errors.get(action, 0),
+                rejected=rejected.get(action, 0),
+                p50_ms=percentile(values, 50) * 1000,
+                p95_ms=percentile(values, 95) * 1000,
+                p99_ms=percentile(values, 99) * 1000,
+                max_ms=values[-1] * 1000,
+            )
+
+        actions = sum(summary.count for summary in by_action.values())
+        statements = sum(result.db_statements for result in results)
+
+        growth = [
+            result.rss_end_kb - result.rss_start_kb
+            for result in results
+            if result.rss_start_kb is not None and result.rss_end_kb is not None
+        ]
+        traced = [r.traced_peak_kb for r in results if r.traced_peak_kb is not None]
+
+        return cls(
+            players=sum(result.players for result in results),
+            turns=results[0].turns if results else 0,
+            workers=len(results),
+            loop_seconds=loop_seconds,
+            actions=actions,
+            errors=sum(errors.values()),
+            rejected=sum(rejected.values()),
+            actions_per_sec=actions / loop_seconds if loop_seconds > 0 else 0.0,
+            db_statements=statements,
+            db_statements_per_action=statements / actions if actions else 0.0,
+            memory_growth_kb=max(growth) if growth else None,
+            traced_peak_kb=max(traced) if traced else None,
+            by_action=by_action,
+            world=[result.world for result in results],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def format_text(self) -> str:
+        """사람이 읽는 표 형식"""
+        lines = [
+            f"players={self.players} turns={self.turns} workers={self.workers}",
+            f"actions={self.actions} errors={self.errors} "
+            f"rejected={self.rejected} "
+            f"loop={self.loop_seconds:.2f}s "
+            f"throughput={self.actions_per_sec:.1f} actions/s",
+            f"db statements={self.db_statements} "
+            f"({self.db_statements_per_action:.2f}/action)",
+        ]
+        if self.memory_growth_kb is not None:
+            lines.append(f"max RSS growth={self.memory_growth_kb} KB (per worker)")
+        if self.traced_peak_kb is not None:
+            lines.append(f"tracemalloc peak={self.traced_peak_kb} KB (per worker)")
+
+        lines.append("")
+        lines.append(
+            f"{'action':<12}{'count':>8}{'errors':>8}{'rejected':>10}"
+            f"{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}{'maxms':>9}"
+        )
+        for action, s in self.by_action.items():
+            lines.append(
+                f"{action:<12}{s.count:>8}{s.errors:>8}{s.rejected:>10}"
+                f"{s.p50_ms:>9.2f}{s.p95_ms:>9.2f}{s.p99_ms:>9.2f}{s.max_ms:>9.2f}"
+            )
+        return "\n".join(lines)
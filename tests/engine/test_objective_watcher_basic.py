@@ -5,12 +5,19 @@ in-memory EventBus + mock quest_service.
 
 from dataclasses import dataclass, field
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from src.core.event_bus import EventBus, GameEvent
 from src.core.event_types import EventTypes
+from src.core.quest.models import QuestSeed
+from src.db.models import Base
+from src.db.models_v2 import NPCModel
 from src.engine.objective_watcher import ObjectiveWatcher
+from src.services.quest_service import QuestService
 
 
 # === Mock Objective ===
@@ -32,20 +39,30 @@ class MockObjective:
 
 
 class MockQuestService:
-    """테스트용 QuestService — get_active_objectives_by_type() 제공"""
+    """테스트용 QuestService — get_active_objectives() / get_quest_objectives() 제공"""
 
-    def __init__(self) -> None:
+    def __init__(self, event_bus: EventBus) -> None:
         self._objectives: list[MockObjective] = []
+        self._bus = event_bus
+        self.objectives_revision = 0
 
     def add_objective(self, obj: MockObjective) -> None:
+        """목표 추가 + quest_activated 발행 (ObjectiveWatcher 인덱스 갱신)"""
         self._objectives.append(obj)
+        self.objectives_revision += 1
+        self._bus.emit(
+            GameEvent(
+                event_type=EventTypes.QUEST_ACTIVATED,
+                data={"quest_id": obj.quest_id, "revision": self.objectives_revision},
+                source="quest_service",
+            )
+        )
 
-    def get_active_objectives_by_type(self, objective_type: str) -> list[MockObjective]:
-        return [
-            o
-            for o in self._objectives
-            if o.objective_type == objective_type and o.status == "active"
-        ]
+    def get_active_objectives(self) -> list[MockObjective]:
+        return [o for o in self._objectives if o.status == "active"]
+
+    def get_quest_objectives(self, quest_id: str) -> list[MockObjective]:
+        return [o for o in self._objectives if o.quest_id == quest_id]
 
 
 # === Fixtures ===
@@ -57,8 +74,8 @@ def event_bus() -> EventBus:
 
 
 @pytest.fixture()
-def quest_service() -> MockQuestService:
-    return MockQuestService()
+def quest_service(event_bus: EventBus) -> MockQuestService:
+    return MockQuestService(event_bus)
 
 
 @pytest.fixture()
@@ -671,3 +688,212 @@ class TestResolveCheck:
 
         assert len(collected_events) == 1
         assert collected_events[0].data["objective_id"] == "obj_3"
+
+
+# === 활성 목표 인덱스 테스트 ===
+
+
+class TestObjectiveIndex:
+    """이벤트로 갱신되는 활성 목표 인덱스"""
+
+    def _moved(self, to_node: str, source: str = "test") -> GameEvent:
+        return GameEvent(
+            event_type=EventTypes.PLAYER_MOVED,
+            data={"player_id": "p1", "from_node": "0_0", "to_node": to_node},
+            source=source,
+        )
+
+    def test_existing_objectives_indexed_at_startup(
+        self,
+        event_bus: EventBus,
+        quest_service: MockQuestService,
+        collected_events: list[GameEvent],
+    ) -> None:
+        """1. 생성 전에 있던 활성 목표는 시작 시 인덱싱"""
+        quest_service._objectives.append(
+            MockObjective(
+                objective_id="obj_1",
+                quest_id="quest_1",
+                objective_type="reach_node",
+                target={"node_id": "5_3"},
+            )
+        )
+        watcher = ObjectiveWatcher(event_bus=event_bus, quest_service=quest_service)
+        assert watcher.indexed_count == 1
+
+        event_bus.emit(self._moved("5_3"))
+        assert [e.data["objective_id"] for e in collected_events] == ["obj_1"]
+
+    def test_events_do_not_query_quest_service(
+        self,
+        event_bus: EventBus,
+        quest_service: MockQuestService,
+        watcher: ObjectiveWatcher,
+    ) -> None:
+        """2. 사건 이벤트는 인덱스만 조회 (QuestService 호출 없음)"""
+        quest_service.add_objective(
+            MockObjective(
+                objective_id="obj_1",
+                quest_id="quest_1",
+                objective_type="talk_to_npc",
+                target={"npc_id": "npc_a"},
+            )
+        )
+        with (
+            patch.object(quest_service, "get_active_objectives") as full_scan,
+            patch.object(quest_service, "get_quest_objectives") as per_quest,
+        ):
+            event_bus.emit(self._moved("1_1"))
+            event_bus.emit(
+                GameEvent(
+                    event_type=EventTypes.DIALOGUE_STARTED,
+                    data={"npc_id": "npc_b"},
+                    source="test",
+                )
+            )
+        assert full_scan.call_count == 0
+        assert per_quest.call_count == 0
+
+    def test_completed_objective_removed_with_route(
+        self,
+        event_bus: EventBus,
+        quest_service: MockQuestService,
+        watcher: ObjectiveWatcher,
+        collected_events: list[GameEvent],
+    ) -> None:
+        """3. 달성된 목표는 인덱스와 노드 라우팅에서 제거"""
+        before = event_bus.handler_count
+        quest_service.add_objective(
+            MockObjective(
+                objective_id="obj_1",
+                quest_id="quest_1",
+                objective_type="reach_node",
+                target={"node_id": "5_3"},
+            )
+        )
+        assert event_bus.handler_count == before + 2  # player_moved + action_completed
+
+        event_bus.emit(self._moved("5_3"))
+        assert len(collected_events) == 1
+        assert watcher.indexed_count == 0
+        assert event_bus.handler_count == before
+
+        event_bus.emit(self._moved("5_3", source="test_again"))
+        assert len(collected_events) == 1
+
+    def test_quest_end_drops_remaining_objectives(
+        self,
+        event_bus: EventBus,
+        quest_service: MockQuestService,
+        watcher: ObjectiveWatcher,
+        collected_events: list[GameEvent],
+    ) -> None:
+        """4. 퀘스트 종료(포기) 시 남은 목표 제거"""
+        for index, node in enumerate(["5_3", "6_3"]):
+            quest_service.add_objective(
+                MockObjective(
+                    objective_id=f"obj_{index}",
+                    quest_id="quest_1",
+                    objective_type="reach_node",
+                    target={"node_id": node},
+                )
+            )
+        assert watcher.indexed_count == 2
+
+        event_bus.emit(
+            GameEvent(
+                event_type=EventTypes.QUEST_ABANDONED,
+                data={"quest_id": "quest_1"},
+                source="test",
+            )
+        )
+        assert watcher.indexed_count == 0
+        event_bus.emit(self._moved("6_3"))
+        assert collected_events == []
+
+    def test_replacement_objectives_indexed(
+        self,
+        event_bus: EventBus,
+        quest_service: MockQuestService,
+        watcher: ObjectiveWatcher,
+        collected_events: list[GameEvent],
+    ) -> None:
+        """5. objectives_replaced 시 퀘스트 목표 재인덱싱"""
+        quest_service._objectives.append(
+            MockObjective(
+                objective_id="obj_repl",
+                quest_id="quest_1",
+                objective_type="talk_to_npc",
+                target={"npc_id": "npc_client"},
+            )
+        )
+        event_bus.emit(
+            GameEvent(
+                event_type=EventTypes.OBJECTIVES_REPLACED,
+                data={"quest_id": "quest_1", "objective_ids": ["obj_repl"]},
+                source="test",
+            )
+        )
+        event_bus.emit(
+            GameEvent(
+                event_type=EventTypes.DIALOGUE_STARTED,
+                data={"npc_id": "npc_client"},
+                source="test",
+            )
+        )
+        assert [e.data["objective_id"] for e in collected_events] == ["obj_repl"]
+
+    def test_real_quest_service_survives_duplicate_suppression(
+        self, event_bus: EventBus, collected_events: list[GameEvent]
+    ) -> None:
+        """6. 실제 QuestService: 같은 턴의 중복 차단된 활성화도 인덱싱"""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        db.add(
+            NPCModel(
+                npc_id="npc_001",
+                full_name="Test NPC",
+                given_name="Test",
+                hexaco="{}",
+                character_sheet="{}",
+                resonance_shield="{}",
+                current_node="node_001",
+                origin_type="promoted",
+                role="merchant",
+                tags="[]",
+            )
+        )
+        db.commit()
+        service = QuestService(db, event_bus)
+        watcher = ObjectiveWatcher(event_bus=event_bus, quest_service=service)
+        activated: list[GameEvent] = []
+        event_bus.subscribe(EventTypes.QUEST_ACTIVATED, activated.append)
+
+        quests = []
+        with event_bus.turn_scope():
+            for index, node in enumerate(["5_3", "6_3"]):
+                seed = QuestSeed(
+                    seed_id=f"seed_{index}",
+                    npc_id="npc_001",
+                    seed_type="personal",
+                    seed_tier=2,
+                    created_turn=1,
+                    ttl_turns=20,
+                )
+                details = {
+                    "quest_type": "investigate",
+                    "objectives_hint": [
+                        {"hint_type": "go_to", "target": {"node_id": node}}
+                    ],
+                }
+                quests.append(service.activate_quest(seed, details, current_turn=1))
+        assert len(activated) == 1  # 두 번째 발행은 중복 차단됨
+
+        assert watcher.indexed_count == 2
+        with event_bus.turn_scope():
+            event_bus.emit(self._moved("6_3"))
+        assert [e.data["quest_id"] for e in collected_events] == [quests[1].quest_id]
+        assert watcher.indexed_count == 1
+        db.close()
+        engine.dispose()
@@ -31,18 +31,28 @@ class MockObjective:
 
 
 class MockQuestService:
-    def __init__(self) -> None:
+    def __init__(self, event_bus: EventBus) -> None:
         self._objectives: list[MockObjective] = []
+        self._bus = event_bus
+        self.objectives_revision = 0
 
     def add_objective(self, obj: MockObjective) -> None:
+        """목표 추가 + quest_activated 발행 (ObjectiveWatcher 인덱스 갱신)"""
         self._objectives.append(obj)
+        self.objectives_revision += 1
+        self._bus.emit(
+            GameEvent(
+                event_type=EventTypes.QUEST_ACTIVATED,
+                data={"quest_id": obj.quest_id, "revision": self.objectives_revision},
+                source="quest_service",
+            )
+        )
 
-    def get_active_objectives_by_type(self, objective_type: str) -> list[MockObjective]:
-        return [
-            o
-            for o in self._objectives
-            if o.objective_type == objective_type and o.status == "active"
-        ]
+    def get_active_objectives(self) -> list[MockObjective]:
+        return [o for o in self._objectives if o.status == "active"]
+
+    def get_quest_objectives(self, quest_id: str) -> list[MockObjective]:
+        return [o for o in self._objectives if o.quest_id == quest_id]
 
 
 class MockCompanionService:
@@ -65,8 +75,8 @@ def event_bus() -> EventBus:
 
 
 @pytest.fixture()
-def quest_service() -> MockQuestService:
-    return MockQuestService()
+def quest_service(event_bus: EventBus) -> MockQuestService:
+    return MockQuestService(event_bus)
 
 
 @pytest.fixture()
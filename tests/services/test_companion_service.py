@@ -259,6 +259,52 @@ class TestMoveSync:
         desc = service._sync_companion_move("p1", "2_2")
         assert desc is None
 
+    def _move(self, bus: EventBus, player_id: str, to_node: str) -> None:
+        bus.emit(
+            GameEvent(
+                event_type=EventTypes.PLAYER_MOVED,
+                data={"player_id": player_id, "from_node": "0_0", "to_node": to_node},
+                source=f"test_{player_id}_{to_node}",
+            )
+        )
+
+    def test_moves_routed_only_while_companion_active(self, setup) -> None:
+        service, db, bus = setup
+        events: list = []
+        bus.subscribe(EventTypes.COMPANION_MOVED, lambda e: events.append(e))
+        with patch.object(
+            service, "get_active_companion", wraps=service.get_active_companion
+        ) as lookup:
+            self._move(bus, "p1", "0_1")
+            assert lookup.call_count == 0  # 동행 없는 이동은 핸들러 미호출
+
+        with patch(
+            "src.services.companion_service.roll_quest_companion", return_value=True
+        ):
+            service.request_quest_companion("p1", "npc1", "q1", 0.5, False, "1_1", 10)
+        self._move(bus, "p2", "5_5")
+        self._move(bus, "p1", "2_2")
+        assert [e.data["to_node"] for e in events] == ["2_2"]
+
+        service.dismiss_companion("p1", 11)
+        self._move(bus, "p1", "3_3")
+        assert len(events) == 1
+        assert bus._routes == {}
+
+    def test_routes_restored_for_existing_companions(self, setup) -> None:
+        service, db, bus = setup
+        with patch(
+            "src.services.companion_service.roll_quest_companion", return_value=True
+        ):
+            service.request_quest_companion("p1", "npc1", "q1", 0.5, False, "1_1", 10)
+
+        bus2 = EventBus()
+        CompanionService(db, bus2)
+        events: list = []
+        bus2.subscribe(EventTypes.COMPANION_MOVED, lambda e: events.append(e))
+        self._move(bus2, "p1", "2_2")
+        assert len(events) == 1
+
 
 # === 대화 보정 ===
 
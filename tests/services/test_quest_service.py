@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from src.core.event_bus import EventBus
 from src.core.event_types import EventTypes
 from src.core.quest.models import QuestSeed
+from src.core.rng import RNGProvider
 from src.db.models import Base
 from src.db.models_v2 import (
     NPCModel,
@@ -120,6 +121,26 @@ class TestSeedManagement:
         seed = service.create_seed("npc_001", current_turn=10, conversation_count=10)
         assert seed is None  # 10 - 8 = 2 < 5
 
+    def test_create_seed_derives_stream_per_call(self, setup):
+        _, db, bus = setup
+        service = QuestService(db, bus, rng=RNGProvider(7))
+        streams = []
+
+        def fake_generate(**kwargs):
+            streams.append(kwargs["rng"])
+            return None
+
+        with patch("src.services.quest_service.try_generate_seed", fake_generate):
+            service.create_seed("npc_001", current_turn=10, conversation_count=10)
+            service.create_seed("npc_001", current_turn=10, conversation_count=10)
+            service.create_seed("npc_001", current_turn=11, conversation_count=11)
+
+        # 호출마다 새 Random (스레드 간 공유 없음), 같은 (npc, turn)이면 같은 시퀀스
+        assert len({id(rng) for rng in streams}) == 3
+        first, again, later = (rng.random() for rng in streams)
+        assert first == again
+        assert first != later
+
     def test_create_seed_roll_fail(self, setup):
         service, db, bus = setup
         with patch("src.core.quest.seed_logic.roll_seed_chance", return_value=False):
@@ -319,6 +340,43 @@ class TestResultProcessing:
         assert len(replacements) >= 1
         assert replacements[0].is_replacement is True
 
+    def test_fail_objective_emits_objectives_replaced(self, setup):
+        service, db, bus = setup
+        events = []
+        bus.subscribe(EventTypes.OBJECTIVES_REPLACED, lambda e: events.append(e))
+        quest = self._setup_quest_with_objectives(service, db)
+        objs = service.get_quest_objectives(quest.quest_id)
+
+        replacements = service.fail_objective(
+            objs[0].objective_id,
+            current_turn=10,
+            fail_reason="target_dead",
+            trigger_data={},
+        )
+        assert len(events) == 1
+        assert events[0].data["quest_id"] == quest.quest_id
+        assert events[0].data["failed_objective_id"] == objs[0].objective_id
+        assert events[0].data["objective_ids"] == [r.objective_id for r in replacements]
+
+    def test_get_active_objectives_excludes_ended_quests(self, setup):
+        service, db, bus = setup
+        quest = self._setup_quest_with_objectives(service, db)
+        assert len(service.get_active_objectives()) == 1
+
+        service.abandon_quest(quest.quest_id, current_turn=6)
+        assert service.get_active_objectives() == []
+
+    def test_objective_watcher_index_follows_quest_lifecycle(self, setup):
+        from src.engine.objective_watcher import ObjectiveWatcher
+
+        service, db, bus = setup
+        watcher = ObjectiveWatcher(event_bus=bus, quest_service=service)
+        quest = self._setup_quest_with_objectives(service, db)
+        assert watcher.indexed_count == 1
+
+        service.abandon_quest(quest.quest_id, current_turn=6)
+        assert watcher.indexed_count == 0
+
 
 class TestChaining:
     """체이닝 테스트"""
@@ -0,0 +1,214 @@
+"""플레이어 액터 + 청크 잠금 테스트"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.actor import ActorRegistry, ChunkLockTable, PlayerActor
+from src.core.engine import ITWEngine
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class TestPlayerActor:
+    def test_commands_run_in_arrival_order(self):
+        actor = PlayerActor("p1")
+        gate = threading.Event()
+        order: list[int] = []
+
+        holder = threading.Thread(target=actor.call, args=(gate.wait,))
+        holder.start()
+        _wait_until(lambda: actor.busy)
+
+        threads = []
+        for i in range(5):
+            thread = threading.Thread(target=actor.call, args=(order.append, i))
+            thread.start()
+            threads.append(thread)
+            _wait_until(lambda i=i: actor.pending == i + 1)
+
+        gate.set()
+        for thread in [holder, *threads]:
+            thread.join()
+
+        assert order == [0, 1, 2, 3, 4]
+        assert actor.processed == 6
+        assert not actor.busy
+
+    def test_reentrant_call(self):
+        actor = PlayerActor("p1")
+        assert actor.call(lambda: actor.call(lambda: 42)) == 42
+        assert actor.processed == 1
+
+    def test_exception_releases_actor(self):
+        actor = PlayerActor("p1")
+        with pytest.raises(ValueError):
+            actor.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+        assert actor.call(lambda: "ok") == "ok"
+
+
+class TestActorRegistry:
+    def test_different_players_run_in_parallel(self):
+        registry = ActorRegistry()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(registry.call, f"p{i}", time.sleep, 0.1) for i in range(4)
+            ]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.3
+        assert registry.stats()["processed"] == 4
+
+    def test_same_player_is_serialized(self):
+        registry = ActorRegistry()
+        active = [0]
+        peak = [0]
+
+        def command() -> None:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            active[0] -= 1
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(registry.call, "p", command) for _ in range(8)]:
+                future.result()
+
+        assert peak[0] == 1
+
+    def test_discard_idle_actor(self):
+        registry = ActorRegistry()
+        registry.call("p", lambda: None)
+
+        assert registry.discard("p") is True
+        assert len(registry) == 0
+        assert registry.discard("p") is False
+
+
+class TestChunkLockTable:
+    def test_chunks_around(self):
+        table = ChunkLockTable(chunk_size=8)
+
+        assert table.chunks_around([(3, 3)]) == {(0, 0)}
+        assert table.chunks_around([(0, 0)], radius=1) == {
+            (-1, -1),
+            (-1, 0),
+            (0, -1),
+            (0, 0),
+        }
+
+    def test_same_chunk_blocks_other_chunk_does_not(self):
+        table = ChunkLockTable(chunk_size=8)
+        entered = threading.Event()
+        release = threading.Event()
+
+        def hold_origin() -> None:
+            with table.hold((1, 1)):
+                entered.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_origin)
+        holder.start()
+        entered.wait()
+
+        done = threading.Event()
+
+        def hold(coord: tuple[int, int]) -> None:
+            with table.hold(coord):
+                done.set()
+
+        far = threading.Thread(target=hold, args=((100, 100),))
+        far.start()
+        far.join(timeout=1)
+        assert done.is_set()
+
+        done.clear()
+        near = threading.Thread(target=hold, args=((2, 2),))
+        near.start()
+        near.join(timeout=0.1)
+        assert not done.is_set()
+
+        release.set()
+        near.join()
+        holder.join()
+        assert done.is_set()
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            ChunkLockTable(chunk_size=0)
+
+
+class TestEngineConcurrency:
+    @pytest.fixture()
+    def engine(self) -> ITWEngine:
+        return ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json", world_seed=42
+        )
+
+    def test_concurrent_moves_keep_player_consistent(self, engine: ITWEngine):
+        player = engine.register_player("racer")
+        directions = ["e", "w"] * 5
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda d: engine.move("racer", d), directions))
+
+        moved = [(r, d) for r, d in zip(results, directions) if r.success]
+        consumed = sum(r.data["supply_consumed"] for r, _ in moved)
+        expected_x = sum(1 if d == "e" else -1 for _, d in moved)
+
+        assert player.supply == 20 - consumed
+        assert player.x == expected_x
+        assert engine.actors.stats()["processed"] == 1 + len(directions)
+
+    def test_players_progress_in_parallel_during_io(self, engine: ITWEngine):
+        players = [f"p{i}" for i in range(4)]
+        for player_id in players:
+            engine.register_player(player_id)
+
+        def turn(player_id: str) -> None:
+            engine.actors.call(
+                player_id, lambda: (engine.look(player_id), time.sleep(0.1))
+            )
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(turn, players))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.3
+
+    def test_daily_tick_waits_for_world_lock(self, engine: ITWEngine):
+        engine.register_player("p")
+        entered = threading.Event()
+        release = threading.Event()
+
+        def hold_haven() -> None:
+            with engine.chunk_locks.hold((0, 0)):
+                entered.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_haven)
+        holder.start()
+        entered.wait()
+
+        ticker = threading.Thread(target=engine.daily_tick)
+        ticker.start()
+        ticker.join(timeout=0.1)
+        assert ticker.is_alive()
+
+        release.set()
+        ticker.join()
+        holder.join()
+        assert engine.tick_count == 1
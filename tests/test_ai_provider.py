@@ -2,7 +2,13 @@
 
 from unittest.mock import MagicMock, patch
 
-from src.services.ai import AIProvider, GeminiProvider, MockProvider, get_ai_provider
+from src.services.ai import (
+    AIProvider,
+    GeminiProvider,
+    HTTPProvider,
+    MockProvider,
+    get_ai_provider,
+)
 
 
 class TestMockProvider:
@@ -86,3 +92,26 @@ class TestAIProviderFactory:
 
         assert isinstance(provider, MockProvider)
         assert provider.name == "mock"
+
+    @patch("src.services.ai.factory.settings")
+    def test_factory_returns_http_with_base_url(self, mock_settings: MagicMock):
+        """Test that factory returns HTTPProvider when AI_BASE_URL is set."""
+        mock_settings.AI_PROVIDER = "http"
+        mock_settings.AI_BASE_URL = "http://127.0.0.1:8701/"
+        mock_settings.AI_MODEL = None
+        mock_settings.AI_TIMEOUT_SECONDS = 5.0
+
+        provider = get_ai_provider()
+
+        assert isinstance(provider, HTTPProvider)
+        assert provider.name == "http"
+
+    @patch("src.services.ai.factory.settings")
+    def test_factory_http_fallback_without_base_url(self, mock_settings: MagicMock):
+        """Test that factory falls back to MockProvider without AI_BASE_URL."""
+        mock_settings.AI_PROVIDER = "http"
+        mock_settings.AI_BASE_URL = None
+
+        provider = get_ai_provider()
+
+        assert isinstance(provider, MockProvider)
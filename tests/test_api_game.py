@@ -460,3 +460,75 @@ class TestActionEndpoint:
 
         assert data["success"] is False
         assert "알 수 없는 방향" in data["message"]
+
+
+class TestActionEventChain:
+    """Each action request runs in its own event chain."""
+
+    def test_repeated_actions_not_blocked_as_duplicates(self, client: TestClient):
+        received = []
+        app.state.event_bus.subscribe("action_completed", received.append)
+        client.post("/game/register", json={"player_id": "chain_player"})
+
+        for _ in range(3):
+            response = client.post(
+                "/game/action",
+                json={"player_id": "chain_player", "action": "look"},
+            )
+            assert response.status_code == 200
+
+        assert len(received) == 3
+        assert app.state.event_bus._emitted_in_chain == set()
+
+    def test_deferred_handlers_run_after_response(
+        self, client: TestClient, engine: ITWEngine
+    ):
+        bus = app.state.event_bus
+        order = []
+        actor_busy = []
+
+        def inline(event):
+            order.append("inline")
+
+        def deferred(event):
+            order.append("deferred")
+            # 응답 후에도 플레이어 액터 안에서 실행 (다음 액션과 겹치지 않음)
+            actor_busy.append(engine.actors.get("deferred_player").busy)
+
+        bus.subscribe("action_completed", inline)
+        bus.subscribe("action_completed", deferred, deferred=True)
+        client.post("/game/register", json={"player_id": "deferred_player"})
+
+        response = client.post(
+            "/game/action",
+            json={"player_id": "deferred_player", "action": "look"},
+        )
+        assert response.status_code == 200
+        assert order == ["inline", "deferred"]
+        assert actor_busy == [True]
+
+
+class TestGlobalEventFeed:
+    """Tests for GET /game/events endpoint."""
+
+    def test_feed_paginates(self, client: TestClient, engine: ITWEngine):
+        engine.register_player("p1")
+        for i in range(3):
+            engine.trigger_global_event("p1", "discovery", f"발견 {i}")
+
+        response = client.get("/game/events", params={"limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert [e["description"] for e in data["events"]] == ["발견 2", "발견 1"]
+
+        response = client.get(
+            "/game/events", params={"cursor": data["next_cursor"], "limit": 2}
+        )
+        data = response.json()
+        assert [e["description"] for e in data["events"]] == ["발견 0"]
+        assert data["next_cursor"] is None
+
+    def test_feed_empty(self, client: TestClient):
+        response = client.get("/game/events")
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "events": [], "next_cursor": None}
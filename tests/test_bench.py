@@ -0,0 +1,119 @@
+"""마이크로 벤치마크 패키지 테스트"""
+
+import json
+
+import pytest
+
+from src.bench import (
+    CASE_NAMES,
+    BenchResult,
+    compare,
+    get_cases,
+    load_baseline,
+    run_benchmark,
+    run_suite,
+    save_baseline,
+)
+from src.bench.__main__ import main
+
+
+def _result(name: str, median_us: float) -> BenchResult:
+    return BenchResult(
+        name=name,
+        number=1,
+        repeat=1,
+        mean_us=median_us,
+        median_us=median_us,
+        stdev_us=0.0,
+        min_us=median_us,
+        max_us=median_us,
+        alloc_blocks=0.0,
+        alloc_peak_kb=0.0,
+    )
+
+
+class TestCases:
+    def test_all_cases_run(self):
+        results = run_suite(get_cases(), repeat=2, number=2, warmup=0)
+
+        assert [r.name for r in results] == list(CASE_NAMES)
+        for result in results:
+            assert result.median_us > 0
+            assert result.min_us <= result.median_us <= result.max_us
+
+    def test_filter(self):
+        assert set(get_cases(["event_bus"])) == {
+            "event_bus.emit[1]",
+            "event_bus.emit[4]",
+        }
+        assert get_cases(["no_such_case"]) == {}
+
+
+class TestRunner:
+    def test_counts_retained_allocations(self):
+        retained: list[list[int]] = []
+
+        result = run_benchmark(
+            "leak", lambda: retained.append([0] * 10), repeat=2, number=50
+        )
+
+        assert result.alloc_blocks >= 1
+        assert result.alloc_peak_kb > 0
+
+    def test_autorange_number(self):
+        result = run_benchmark("noop", lambda: None, repeat=1, measure_alloc=False)
+        assert result.number >= 1000
+
+
+class TestBaseline:
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_baseline(path, [_result("a", 10.0)])
+
+        assert load_baseline(path)["a"]["median_us"] == 10.0
+
+    def test_version_mismatch(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"version": 99, "results": {}}))
+
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    def test_compare_status(self):
+        baseline = {
+            "slow": {"median_us": 10.0},
+            "fast": {"median_us": 10.0},
+            "same": {"median_us": 10.0},
+        }
+        results = [
+            _result("slow", 12.0),
+            _result("fast", 8.0),
+            _result("same", 10.5),
+            _result("added", 1.0),
+        ]
+
+        statuses = {c.name: c.status for c in compare(results, baseline, 0.10)}
+
+        assert statuses == {
+            "slow": "slower",
+            "fast": "faster",
+            "same": "same",
+            "added": "new",
+        }
+
+
+class TestCLI:
+    def test_fail_on_regression(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        args = ["-k", "player.to_dict", "--repeat", "2", "--number", "5"]
+        assert main([*args, "--save-baseline", str(path)]) == 0
+
+        # 기준선을 비현실적으로 빠르게 조작 → 회귀로 판정
+        payload = json.loads(path.read_text())
+        payload["results"]["player.to_dict"]["median_us"] = 1e-6
+        path.write_text(json.dumps(payload))
+
+        code = main([*args, "--baseline", str(path), "--fail-on-regression"])
+
+        assert code == 1
+        assert "slower" in capsys.readouterr().out
@@ -1,5 +1,7 @@
 """Tests for core_rule module."""
 
+import itertools
+import random
 from unittest.mock import patch
 
 import pytest
@@ -275,3 +277,72 @@ class TestResolutionEngine:
         assert isinstance(result.required_hits, int)
         assert isinstance(result.rolls, list)
         assert isinstance(result.narrative_hint, str)
+
+
+def _enumerate_odds(pool_size: int, difficulty: int) -> tuple[float, float, float]:
+    """모든 눈 조합을 나열한 정확한 (성공, 대성공, 대실패) 확률"""
+    success = crit_success = crit_failure = 0
+    outcomes = list(itertools.product(range(1, 7), repeat=pool_size))
+    for rolls in outcomes:
+        hits = sum(1 for r in rolls if r >= 5)
+        success += hits >= difficulty
+        crit_success += hits >= difficulty + 2
+        crit_failure += hits < difficulty and hits == 0 and 1 in rolls
+    total = len(outcomes)
+    return success / total, crit_success / total, crit_failure / total
+
+
+class TestCheckOdds:
+    """Tests for analytic check odds."""
+
+    @pytest.mark.parametrize("pool_size", [1, 2, 3, 4])
+    @pytest.mark.parametrize("difficulty", [0, 1, 2, 3])
+    def test_matches_enumeration(
+        self, engine: ResolutionEngine, pool_size: int, difficulty: int
+    ):
+        odds = engine.check_odds(pool_size, difficulty)
+        expected = _enumerate_odds(pool_size, difficulty)
+        actual = (odds.success, odds.critical_success, odds.critical_failure)
+        assert actual == pytest.approx(expected)
+
+    def test_minimum_one_die(self, engine: ResolutionEngine):
+        assert engine.check_odds(0, 1) == engine.check_odds(1, 1)
+
+
+class TestResolveChecks:
+    """Tests for batched resolution."""
+
+    def test_seeded_batch_is_reproducible(self, engine: ResolutionEngine):
+        pools, difficulties = [3] * 50, [1] * 50
+        first = engine.resolve_checks(pools, difficulties, random.Random(7))
+        second = engine.resolve_checks(pools, difficulties, random.Random(7))
+        assert first == second
+        assert len(first) == 50
+
+    def test_outcomes_consistent(self, engine: ResolutionEngine):
+        batch = engine.resolve_checks(
+            [1, 4, 8] * 100, [2, 1, 3] * 100, random.Random(1)
+        )
+        for pool, hits, tier, success, crit in zip(
+            [1, 4, 8] * 100, batch.hits, batch.tiers, batch.successes, batch.criticals
+        ):
+            assert 0 <= hits <= pool
+            assert success == (
+                tier in (CheckResultTier.SUCCESS, CheckResultTier.CRITICAL_SUCCESS)
+            )
+            assert crit == (
+                tier
+                in (CheckResultTier.CRITICAL_SUCCESS, CheckResultTier.CRITICAL_FAILURE)
+            )
+
+    def test_frequencies_match_odds(self, engine: ResolutionEngine):
+        n = 20000
+        batch = engine.resolve_checks([3] * n, [1] * n, random.Random(42))
+        odds = engine.check_odds(3, 1)
+        crit_failures = batch.tiers.count(CheckResultTier.CRITICAL_FAILURE)
+        assert sum(batch.successes) / n == pytest.approx(odds.success, abs=0.02)
+        assert crit_failures / n == pytest.approx(odds.critical_failure, abs=0.02)
+
+    def test_length_mismatch(self, engine: ResolutionEngine):
+        with pytest.raises(ValueError):
+            engine.resolve_checks([1, 2], [1])
@@ -303,7 +303,7 @@ class TestEchoManager:
     ):
         """Test Public/Hidden Echo filtering."""
         # Clear existing echoes
-        test_node.echoes = []
+        test_node.echoes.clear()
 
         # Create public echo (Combat is public)
         echo_manager.create_echo(
@@ -386,3 +386,197 @@ class TestEchoManager:
         assert templates[EchoCategory.DISCOVERY].base_difficulty == 3
         assert templates[EchoCategory.SOCIAL].base_difficulty == 2
         assert templates[EchoCategory.MYSTERY].base_difficulty == 4
+
+
+class TestEchoExpiryIndex:
+    """Tests for expiry-indexed Short Echo decay."""
+
+    def test_create_echo_precomputes_expiry(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test Short echoes carry category and expiry; Long echoes never expire."""
+        short = echo_manager.create_echo(EchoCategory.EXPLORATION, test_node)
+        long = echo_manager.create_echo(EchoCategory.BOSS, test_node)
+
+        assert short.category == EchoCategory.EXPLORATION.value
+        created = datetime.fromisoformat(short.timestamp)
+        expected = created + timedelta(days=3 + 1)
+        assert short.expires_at == (expected - datetime(1970, 1, 1)).total_seconds()
+        assert long.expires_at is None
+        assert echo_manager.pending_expiry_count == 1
+
+    def test_decay_expired_uses_category_lifetime(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test each category expires on its own schedule."""
+        social = echo_manager.create_echo(EchoCategory.SOCIAL, test_node)  # 2일
+        combat = echo_manager.create_echo(EchoCategory.COMBAT, test_node)  # 7일
+        boss = echo_manager.create_echo(EchoCategory.BOSS, test_node)
+        now = datetime.utcnow()
+
+        assert echo_manager.decay_expired(now + timedelta(days=2)) == 0
+        assert echo_manager.decay_expired(now + timedelta(days=3, seconds=1)) == 1
+        assert social not in test_node.echoes
+        assert combat in test_node.echoes
+
+        assert echo_manager.decay_expired(now + timedelta(days=30)) == 1
+        assert test_node.echoes == [boss]
+        assert echo_manager.pending_expiry_count == 0
+
+    def test_decay_expired_skips_removed_echoes(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test echoes already gone from the node are ignored (lazy deletion)."""
+        echo_manager.create_echo(EchoCategory.SOCIAL, test_node)
+        test_node.echoes.clear()
+
+        later = datetime.utcnow() + timedelta(days=10)
+        assert echo_manager.decay_expired(later) == 0
+        assert echo_manager.pending_expiry_count == 0
+
+    def test_index_node_handles_legacy_echo(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test echoes without category fall back to the legacy 7-day lifetime."""
+        old_timestamp = (datetime.utcnow() - timedelta(days=5)).isoformat()
+        legacy = Echo(
+            echo_type=EchoType.SHORT.value,
+            visibility=EchoVisibility.HIDDEN.value,
+            base_difficulty=2,
+            timestamp=old_timestamp,
+            flavor_text="Legacy echo",
+        )
+        test_node.echoes.append(legacy)
+
+        assert echo_manager.index_node(test_node) == 1
+        assert legacy.expires_at is not None
+        assert echo_manager.decay_expired() == 0
+        later = datetime.utcnow() + timedelta(days=3, seconds=1)
+        assert echo_manager.decay_expired(later) == 1
+
+    def test_template_lookup_by_value(self, echo_manager: EchoManager):
+        """Test O(1) template lookup by category value."""
+        template = echo_manager.get_template("crafting")
+        assert template is echo_manager.TEMPLATES[EchoCategory.CRAFTING]
+        assert echo_manager.get_template(None) is None
+
+
+class TestEchoCompaction:
+    """Tests for incremental compaction of repetitive echoes."""
+
+    def test_repeated_exploration_folds_into_summary(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test reaching the threshold folds the group into one counted echo."""
+        test_node.echoes.clear()
+        threshold = EchoManager.COMPACTION_THRESHOLD
+
+        for i in range(threshold - 1):
+            echo_manager.create_echo(EchoCategory.EXPLORATION, test_node, f"p{i}")
+        assert len(test_node.echoes) == threshold - 1
+
+        summary = echo_manager.create_echo(EchoCategory.EXPLORATION, test_node, "last")
+        assert test_node.echoes == [summary]
+        assert summary.count == threshold
+        assert summary.source_player_id == "last"
+        assert f"{threshold}명의 여행자" in summary.flavor_text
+
+        echo_manager.create_echo(EchoCategory.EXPLORATION, test_node)
+        assert len(test_node.echoes) == 1
+        assert summary.count == threshold + 1
+
+    def test_week_bucket_cached_on_create(
+        self, echo_manager: EchoManager, test_node: MapNode, monkeypatch
+    ):
+        """Test grouping uses the cached week bucket, not timestamp parsing."""
+        test_node.echoes.clear()
+
+        def fail(timestamp: str) -> datetime:
+            raise AssertionError(f"timestamp parsed: {timestamp}")
+
+        monkeypatch.setattr("src.core.echo_system.parse_timestamp", fail)
+        for _ in range(EchoManager.COMPACTION_THRESHOLD + 2):
+            summary = echo_manager.create_echo(EchoCategory.EXPLORATION, test_node)
+
+        year, week, _ = datetime.utcnow().isocalendar()
+        assert summary.week_bucket == year * 100 + week
+        assert test_node.echoes == [summary]
+
+    def test_groups_kept_apart(self, echo_manager: EchoManager, test_node: MapNode):
+        """Test category, difficulty and non-compactable categories are not mixed."""
+        test_node.echoes.clear()
+        for _ in range(5):
+            echo_manager.create_echo(EchoCategory.EXPLORATION, test_node)
+            echo_manager.create_echo(EchoCategory.CRAFTING, test_node)
+            echo_manager.create_echo(EchoCategory.COMBAT, test_node)
+        echo_manager.create_echo(
+            EchoCategory.EXPLORATION, test_node, difficulty_modifier=1
+        )
+
+        categories = [e.category for e in test_node.echoes if e.count > 1]
+        assert sorted(categories) == ["crafting", "exploration"]
+        assert sum(1 for e in test_node.echoes if e.category == "combat") == 5
+        assert sum(1 for e in test_node.echoes if e.category == "exploration") == 2
+
+    def test_custom_flavor_not_compacted(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test echoes with custom flavor stay individual."""
+        test_node.echoes.clear()
+        for i in range(5):
+            echo_manager.create_echo(
+                EchoCategory.EXPLORATION, test_node, custom_flavor=f"표식 {i}"
+            )
+        assert len(test_node.echoes) == 5
+
+    def test_summary_still_investigable(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test a summary keeps investigation semantics and reports its count."""
+        test_node.echoes.clear()
+        for _ in range(4):
+            summary = echo_manager.create_echo(EchoCategory.CRAFTING, test_node)
+
+        assert summary in echo_manager.get_hidden_echoes(test_node)
+        result = echo_manager.investigate(echo=summary, hits=5)
+        assert result["success"] is True
+        assert result["difficulty"] == 3
+        assert result["discovered_info"]["count"] == 4
+
+    def test_summary_expiry_follows_latest(
+        self, echo_manager: EchoManager, test_node: MapNode
+    ):
+        """Test the summary expires with its newest contribution, not its first."""
+        test_node.echoes.clear()
+        for _ in range(3):
+            summary = echo_manager.create_echo(EchoCategory.EXPLORATION, test_node)
+        first_expiry = summary.expires_at
+
+        summary.expires_at = first_expiry + 3600  # 한 시간 뒤 새 흔적이 더해진 상황
+        echo_manager.track_echo(test_node, summary)
+
+        at_first_expiry = datetime(1970, 1, 1) + timedelta(seconds=first_expiry)
+        assert echo_manager.decay_expired(at_first_expiry) == 0
+        assert summary in test_node.echoes
+        assert echo_manager.decay_expired(at_first_expiry + timedelta(hours=1)) == 1
+
+    def test_node_cap(self, echo_manager: EchoManager, test_node: MapNode):
+        """Test compactable echoes per node are capped."""
+        test_node.echoes.clear()
+        cap = EchoManager.MAX_COMPACTABLE_ECHOES_PER_NODE
+        base = datetime.utcnow()
+        for i in range(cap + 5):
+            # 서로 다른 주에 속한 Echo는 접히지 않으므로 상한으로만 제한된다
+            echo = Echo(
+                echo_type=EchoType.SHORT.value,
+                visibility=EchoVisibility.HIDDEN.value,
+                base_difficulty=2,
+                timestamp=(base - timedelta(weeks=i)).isoformat(),
+                flavor_text="발자국",
+                category=EchoCategory.EXPLORATION.value,
+                expires_at=float(i),
+            )
+            echo_manager._insert_compacted(test_node, echo)
+
+        assert len(test_node.echoes) == cap
+        assert min(e.expires_at for e in test_node.echoes) == 5.0
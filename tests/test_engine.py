@@ -466,6 +466,37 @@ class TestInvestigateAction:
         assert result.success is False
         assert "유효하지 않은" in result.message
 
+    def test_investigate_by_echo_id(
+        self, engine_with_player: tuple[ITWEngine, PlayerState]
+    ):
+        """Test investigate targets a stable echo id."""
+        engine, player = engine_with_player
+
+        node = engine.world.get_node(player.x, player.y)
+        engine.echo_manager.create_echo(EchoCategory.CRAFTING, node)
+        target = engine.echo_manager.create_echo(EchoCategory.MYSTERY, node)
+
+        result = engine.investigate(player.player_id, echo_id=target.echo_id)
+
+        assert result.data["echo_id"] == target.echo_id
+        assert result.data["check"]["difficulty"] >= target.base_difficulty
+
+    def test_investigate_missing_echo_id(
+        self, engine_with_player: tuple[ITWEngine, PlayerState]
+    ):
+        """Test investigate with an echo id that has decayed away."""
+        engine, player = engine_with_player
+
+        node = engine.world.get_node(player.x, player.y)
+        echo = engine.echo_manager.create_echo(EchoCategory.CRAFTING, node)
+        engine.echo_manager.create_echo(EchoCategory.MYSTERY, node)
+        node.echoes.remove(echo)
+
+        result = engine.investigate(player.player_id, echo_id=echo.echo_id)
+
+        assert result.success is False
+        assert "찾을 수 없습니다" in result.message
+
     def test_investigate_player_not_found(self, engine: ITWEngine):
         """Test investigate fails for non-existent player."""
         result = engine.investigate("nonexistent_player")
@@ -601,6 +632,30 @@ class TestDatabasePersistence:
             assert loaded_node.y == original_node.y
             assert loaded_node.tier == original_node.tier
 
+    def test_reload_world_does_not_duplicate_expiry_index(
+        self,
+        engine_with_player: tuple[ITWEngine, PlayerState],
+        db_session: Session,
+    ):
+        """Reloading from DB rebuilds the echo expiry index instead of appending."""
+        engine, player = engine_with_player
+        engine.debug_generate_area(0, 0, radius=1)
+        node = engine.world.get_node(0, 0)
+        engine.echo_manager.create_echo(EchoCategory.EXPLORATION, node)
+        engine.save_world_to_db(db_session)
+
+        engine.load_world_from_db(db_session)
+        engine.load_world_from_db(db_session)
+
+        expiring = [
+            echo
+            for node in engine.world.nodes.values()
+            for echo in node.echoes
+            if echo.expires_at is not None
+        ]
+        assert expiring
+        assert engine.echo_manager.pending_expiry_count == len(expiring)
+
     def test_save_players_to_db(
         self,
         engine_with_player: tuple[ITWEngine, PlayerState],
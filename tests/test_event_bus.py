@@ -1,6 +1,12 @@
 """EventBus 테스트"""
 
-from src.core.event_bus import EventBus, GameEvent, MAX_DEPTH
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.core.event_bus import EventBus, GameEvent, MAX_DEPTH, coalesce_by
 
 
 class TestSubscribeEmit:
@@ -97,6 +103,419 @@ class TestResetChain:
         assert len(received) == 2
 
 
+class TestTurnScope:
+    def test_scopes_do_not_share_duplicates(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe("re", lambda e: received.append(1))
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="re", data={}, source="s"))
+            bus.emit(GameEvent(event_type="re", data={}, source="s"))  # 같은 턴: 차단
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="re", data={}, source="s"))
+        assert len(received) == 2
+
+    def test_scope_leaves_default_chain_untouched(self):
+        bus = EventBus()
+        bus.emit(GameEvent(event_type="outer", data={}, source="s"))
+        with bus.turn_scope():
+            assert bus._emitted_in_chain == set()
+            bus.emit(GameEvent(event_type="inner", data={}, source="s"))
+        assert bus._emitted_in_chain == {"s:outer"}
+
+    def test_concurrent_turns_isolated(self):
+        """한 스레드의 체인이 진행 중이어도 다른 스레드의 같은 이벤트는 차단되지 않음"""
+        bus = EventBus()
+        inside = threading.Event()
+        release = threading.Event()
+        depths = []
+
+        def handler(event: GameEvent):
+            depths.append(event._depth)
+            if event.data["who"] == "a":
+                inside.set()
+                release.wait(timeout=5)
+
+        bus.subscribe("evt", handler)
+
+        def turn(who: str) -> None:
+            with bus.turn_scope():
+                bus.emit(GameEvent(event_type="evt", data={"who": who}, source="s"))
+
+        first = threading.Thread(target=turn, args=("a",))
+        first.start()
+        assert inside.wait(timeout=5)
+        turn("b")  # a의 체인(depth=1, "s:evt" 기록)이 열려 있는 동안
+        release.set()
+        first.join(timeout=5)
+
+        assert depths == [0, 0]
+
+
+class TestEmitAsync:
+    def test_independent_handlers_run_concurrently(self):
+        bus = EventBus()
+        running = 0
+        peak = 0
+
+        async def slow(event: GameEvent):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        for name in ("a", "b", "c"):
+            bus.subscribe("evt", slow, name=name, independent=True)
+
+        asyncio.run(bus.emit_async(GameEvent(event_type="evt", data={}, source="s")))
+        assert peak == 3
+
+    def test_independent_sync_handlers_use_threads(self):
+        bus = EventBus()
+        threads = set()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def blocking(event: GameEvent):
+            threads.add(threading.get_ident())
+            barrier.wait()  # 두 핸들러가 동시에 실행되어야 통과
+
+        bus.subscribe("evt", blocking, name="x", independent=True)
+        bus.subscribe("evt", blocking, name="y", independent=True)
+        asyncio.run(bus.emit_async(GameEvent(event_type="evt", data={}, source="s")))
+        assert len(threads) == 2
+
+    def test_default_handlers_keep_registration_order(self):
+        bus = EventBus()
+        order = []
+
+        async def first(event: GameEvent):
+            await asyncio.sleep(0.02)
+            order.append("first")
+
+        bus.subscribe("evt", first)
+        bus.subscribe("evt", lambda e: order.append("second"))
+        asyncio.run(bus.emit_async(GameEvent(event_type="evt", data={}, source="s")))
+        assert order == ["first", "second"]
+
+    def test_after_orders_dependent_handlers(self):
+        bus = EventBus()
+        order = []
+
+        async def seed(event: GameEvent):
+            await asyncio.sleep(0.03)
+            order.append("seed")
+
+        async def check(event: GameEvent):
+            order.append("check")
+
+        async def attitude(event: GameEvent):
+            order.append("attitude")
+
+        bus.subscribe("evt", check, independent=True, after=("seed",))
+        bus.subscribe("evt", seed, name="seed", independent=True)
+        bus.subscribe("evt", attitude, independent=True)
+        asyncio.run(bus.emit_async(GameEvent(event_type="evt", data={}, source="s")))
+        assert order == ["attitude", "seed", "check"]
+
+    def test_cyclic_dependencies_rejected(self):
+        bus = EventBus()
+        bus.subscribe("evt", lambda e: None, name="a", after=("b",), independent=True)
+        with pytest.raises(ValueError, match="순환"):
+            bus.subscribe(
+                "evt", lambda e: None, name="b", after=("a",), independent=True
+            )
+        assert bus.handler_count == 1
+
+    def test_timeout_skips_handler_and_releases_dependents(self):
+        bus = EventBus()
+        order = []
+
+        async def hang(event: GameEvent):
+            await asyncio.sleep(5)
+            order.append("hang")
+
+        bus.subscribe("evt", hang, name="hang", independent=True, timeout=0.02)
+        bus.subscribe(
+            "evt", lambda e: order.append("after"), independent=True, after=("hang",)
+        )
+        asyncio.run(bus.emit_async(GameEvent(event_type="evt", data={}, source="s")))
+        assert order == ["after"]
+
+    def test_timeout_applies_to_ordered_sync_handler(self):
+        bus = EventBus()
+        order = []
+        release = threading.Event()
+
+        def slow(event: GameEvent):
+            release.wait(timeout=5)
+            order.append("slow")
+
+        bus.subscribe("evt", slow, name="slow", timeout=0.02)
+        bus.subscribe("evt", lambda e: order.append("next"))
+
+        async def run() -> tuple[float, list[str]]:
+            started = time.perf_counter()
+            await bus.emit_async(GameEvent(event_type="evt", data={}, source="s"))
+            elapsed, seen = time.perf_counter() - started, list(order)
+            release.set()  # 스레드에 남은 핸들러 정리
+            return elapsed, seen
+
+        # 루프를 막지 않고 timeout 후 다음 핸들러로 (동기 핸들러는 스레드에서 계속)
+        elapsed, seen = asyncio.run(run())
+        assert elapsed < 1.0
+        assert seen == ["next"]
+
+    def test_duplicate_suppression_shared_across_branches(self):
+        bus = EventBus()
+        received = []
+
+        async def re_emit(event: GameEvent):
+            await bus.emit_async(GameEvent(event_type="child", data={}, source="same"))
+
+        bus.subscribe("evt", re_emit, name="a", independent=True)
+        bus.subscribe("evt", re_emit, name="b", independent=True)
+        bus.subscribe("child", lambda e: received.append(e._depth))
+
+        async def turn():
+            with bus.turn_scope():
+                await bus.emit_async(GameEvent(event_type="evt", data={}, source="s"))
+                assert bus._emitted_in_chain == {"s:evt", "same:child"}
+
+        asyncio.run(turn())
+        assert received == [1]
+
+    def test_depth_limit_applies(self):
+        bus = EventBus()
+        calls = 0
+
+        async def recurse(event: GameEvent):
+            nonlocal calls
+            calls += 1
+            await bus.emit_async(
+                GameEvent(event_type="chain", data={}, source=f"h{calls}")
+            )
+
+        bus.subscribe("chain", recurse)
+        asyncio.run(bus.emit_async(GameEvent(event_type="chain", data={}, source="o")))
+        assert calls == MAX_DEPTH
+
+    def test_sync_emit_runs_async_handler(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event: GameEvent):
+            await asyncio.sleep(0)
+            received.append(event.event_type)
+
+        bus.subscribe("evt", handler)
+        bus.emit(GameEvent(event_type="evt", data={}, source="s"))
+        assert received == ["evt"]
+
+
+class TestDeferred:
+    def test_delivered_at_turn_end(self):
+        bus = EventBus()
+        order = []
+        bus.subscribe("evt", lambda e: order.append("deferred"), deferred=True)
+        bus.subscribe("evt", lambda e: order.append("inline"))
+
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="evt", data={}, source="s"))
+            assert order == ["inline"]
+        assert order == ["inline", "deferred"]
+
+    def test_outside_scope_delivered_immediately(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe("evt", received.append, deferred=True)
+        bus.emit(GameEvent(event_type="evt", data={}, source="s"))
+        assert len(received) == 1
+
+    def test_coalesced_by_key_keeps_latest(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(
+            "moved",
+            lambda e: received.append((e.data["player_id"], e.data["to_node"])),
+            deferred=True,
+            coalesce=coalesce_by("player_id"),
+        )
+
+        with bus.turn_scope():
+            for player_id, to_node in [("p1", "0_1"), ("p2", "5_5"), ("p1", "0_2")]:
+                bus.emit(
+                    GameEvent(
+                        event_type="moved",
+                        data={"player_id": player_id, "to_node": to_node},
+                        source=f"api_{to_node}",
+                    )
+                )
+        assert received == [("p2", "5_5"), ("p1", "0_2")]
+
+    def test_take_and_deliver_later(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe("evt", received.append, deferred=True)
+
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="evt", data={}, source="s"))
+            batch = bus.take_deferred()
+        assert received == []
+
+        assert bus.deliver_deferred(batch) == 1
+        assert len(received) == 1
+
+    def test_delivery_keeps_original_depth(self):
+        bus = EventBus()
+        depths = []
+
+        def relay(event: GameEvent):
+            bus.emit(GameEvent(event_type="child", data={}, source="relay"))
+
+        bus.subscribe("evt", relay, deferred=True)
+        bus.subscribe("child", lambda e: depths.append(e._depth), deferred=True)
+
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="evt", data={}, source="s"))
+        # evt(depth 0) → relay는 depth 1 → child 발행 depth 1 → 전달
+        assert depths == [1]
+
+    def test_deferred_handler_errors_isolated(self):
+        bus = EventBus()
+        received = []
+
+        def bad(event: GameEvent):
+            raise RuntimeError("boom")
+
+        bus.subscribe("evt", bad, deferred=True)
+        bus.subscribe("evt", received.append, deferred=True)
+        with bus.turn_scope():
+            bus.emit(GameEvent(event_type="evt", data={}, source="s"))
+        assert len(received) == 1
+
+    def test_emit_async_defers_too(self):
+        bus = EventBus()
+        order = []
+
+        async def inline(event: GameEvent):
+            order.append("inline")
+
+        bus.subscribe("evt", lambda e: order.append("deferred"), deferred=True)
+        bus.subscribe("evt", inline)
+
+        async def turn():
+            with bus.turn_scope():
+                await bus.emit_async(GameEvent(event_type="evt", data={}, source="s"))
+                assert order == ["inline"]
+
+        asyncio.run(turn())
+        assert order == ["inline", "deferred"]
+
+
+class TestRouting:
+    def _moved(self, player_id: str, to_node: str = "1_1") -> GameEvent:
+        return GameEvent(
+            event_type="moved",
+            data={"player_id": player_id, "to_node": to_node},
+            source=f"s_{player_id}_{to_node}",
+        )
+
+    def test_only_matching_key_invoked(self):
+        bus = EventBus()
+        received = []
+        for player_id in ("p1", "p2", "p3"):
+            bus.subscribe(
+                "moved",
+                lambda e, pid=player_id: received.append(pid),
+                where={"player_id": player_id},
+            )
+
+        bus.emit(self._moved("p2"))
+        bus.emit(self._moved("p9"))
+        assert received == ["p2"]
+
+    def test_multiple_fields_all_must_match(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(
+            "moved", received.append, where={"player_id": "p1", "to_node": "2_2"}
+        )
+        bus.emit(self._moved("p1", "1_1"))
+        bus.emit(self._moved("p1", "2_2"))
+        assert [e.data["to_node"] for e in received] == ["2_2"]
+
+    def test_merged_with_broadcast_in_registration_order(self):
+        bus = EventBus()
+        order = []
+        bus.subscribe("moved", lambda e: order.append("all_1"))
+        bus.subscribe("moved", lambda e: order.append("p1"), where={"player_id": "p1"})
+        bus.subscribe("moved", lambda e: order.append("all_2"))
+        bus.subscribe("moved", lambda e: order.append("node"), where={"to_node": "1_1"})
+
+        bus.emit(self._moved("p1"))
+        assert order == ["all_1", "p1", "all_2", "node"]
+
+    def test_unsubscribe_prunes_index(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe("moved", received.append, where={"player_id": "p1"})
+        assert bus.handler_count == 1
+
+        bus.unsubscribe("moved", received.append, where={"player_id": "p1"})
+        bus.emit(self._moved("p1"))
+        assert received == []
+        assert bus.handler_count == 0
+        assert bus._routes == {}
+
+    def test_unhashable_payload_value_skipped(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe("moved", received.append, where={"player_id": "p1"})
+        bus.emit(GameEvent(event_type="moved", data={"player_id": ["p1"]}, source="s"))
+        assert received == []
+
+    def test_empty_where_rejected(self):
+        bus = EventBus()
+        with pytest.raises(ValueError):
+            bus.subscribe("moved", lambda e: None, where={})
+
+    def test_emit_async_routed(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event: GameEvent):
+            received.append(event.data["player_id"])
+
+        bus.subscribe("moved", handler, where={"player_id": "p1"})
+        asyncio.run(bus.emit_async(self._moved("p2")))
+        asyncio.run(bus.emit_async(self._moved("p1")))
+        assert received == ["p1"]
+
+    def test_subscribe_from_other_thread_during_lookup(self):
+        bus = EventBus()
+        bus.subscribe("moved", lambda e: None, where={"player_id": "p1"})
+        threads = []
+
+        class _Key:
+            def __hash__(self) -> int:
+                # 라우팅 조회 도중 다른 스레드가 새 필드로 구독
+                thread = threading.Thread(
+                    target=bus.subscribe,
+                    args=("moved", lambda e: None),
+                    kwargs={"where": {"to_node": "9_9"}},
+                )
+                thread.start()
+                thread.join(timeout=0.2)
+                threads.append(thread)
+                return 0
+
+        bus.emit(GameEvent(event_type="moved", data={"player_id": _Key()}, source="s"))
+        for thread in threads:
+            thread.join(timeout=5)
+        assert bus.handler_count == 2
+
+
 class TestHandlerError:
     def test_handler_exception_doesnt_stop_others(self):
         bus = EventBus()
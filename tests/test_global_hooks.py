@@ -0,0 +1,125 @@
+"""Tests for the expiring global-hook store and feed."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.global_hooks import GlobalHookStore
+from src.core.timeutil import to_epoch
+from src.db.models import Base, GlobalHookModel
+
+T0 = datetime(2025, 1, 1)
+HOUR = 3600.0
+
+
+class FakeClock:
+    """수동으로 진행하는 epoch 시계"""
+
+    def __init__(self) -> None:
+        self.now = to_epoch(T0)
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def session_factory():
+    """Shared in-memory SQLite session factory."""
+    eng = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=eng)
+    return sessionmaker(bind=eng, autocommit=False, autoflush=False)
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _hook(event: str = "boss_kill", hours: float = 24) -> dict:
+    return {
+        "type": "global_hook",
+        "event": event,
+        "location_hint": "어두운 동굴",
+        "description": f"{event} 발생",
+        "timestamp": T0.isoformat(),
+        "expires_in_hours": hours,
+    }
+
+
+class TestExpiry:
+    def test_add_assigns_id_and_expiry(self, clock):
+        store = GlobalHookStore(clock=clock)
+        first = store.add(_hook())
+        second = store.add(_hook())
+        assert (first["hook_id"], second["hook_id"]) == (1, 2)
+        assert first["expires_at"] == clock.now + 24 * HOUR
+
+    def test_prunes_as_time_passes(self, clock):
+        store = GlobalHookStore(clock=clock)
+        store.add(_hook(hours=1))
+        store.add(_hook(hours=24))
+        assert store.active_count == 2
+
+        clock.now += 2 * HOUR
+        assert store.active_count == 1
+        assert [h["expires_in_hours"] for h in store.active()] == [24]
+
+        clock.now += 24 * HOUR
+        assert len(store) == 0
+
+
+class TestFeed:
+    def test_pages_newest_first(self, clock):
+        store = GlobalHookStore(clock=clock)
+        for i in range(5):
+            store.add(_hook(event=f"e{i}"))
+
+        page, cursor = store.feed(limit=2)
+        assert [h["event"] for h in page] == ["e4", "e3"]
+        page, cursor = store.feed(cursor=cursor, limit=2)
+        assert [h["event"] for h in page] == ["e2", "e1"]
+        page, cursor = store.feed(cursor=cursor, limit=2)
+        assert [h["event"] for h in page] == ["e0"]
+        assert cursor is None
+
+    def test_skips_expired(self, clock):
+        store = GlobalHookStore(clock=clock)
+        store.add(_hook(event="old", hours=1))
+        store.add(_hook(event="new", hours=24))
+        store.add(_hook(event="short", hours=1))
+        clock.now += 2 * HOUR
+
+        page, cursor = store.feed()
+        assert [h["event"] for h in page] == ["new"]
+        assert cursor is None
+
+
+class TestPersistence:
+    def test_survives_restart(self, session_factory, clock):
+        store = GlobalHookStore(session_factory=session_factory, clock=clock)
+        store.add(_hook(event="boss_kill"))
+        store.add(_hook(event="discovery", hours=1))
+        clock.now += 2 * HOUR
+
+        restarted = GlobalHookStore(session_factory=session_factory, clock=clock)
+        assert restarted.load() == 1
+        assert [h["event"] for h in restarted.active()] == ["boss_kill"]
+        # 새 훅은 기존 id 이후로 발급
+        assert restarted.add(_hook())["hook_id"] == 3
+
+    def test_expired_rows_deleted_on_prune(self, session_factory, clock):
+        store = GlobalHookStore(session_factory=session_factory, clock=clock)
+        store.add(_hook(hours=1))
+        store.add(_hook(hours=24))
+        clock.now += 2 * HOUR
+        assert store.prune() == 1
+
+        with session_factory() as session:
+            assert session.query(GlobalHookModel).count() == 1
@@ -0,0 +1,118 @@
+"""HTTP 부하 테스트 하네스 + HTTPProvider 테스트"""
+
+import random
+import socket
+import threading
+
+import pytest
+
+from src.loadtest import (
+    LoadConfig,
+    LoadReport,
+    StubLLMConfig,
+    StubLLMServer,
+    UserResult,
+    VirtualUser,
+    parse_mix,
+)
+from src.services.ai import HTTPProvider
+
+
+@pytest.fixture
+def stub():
+    with StubLLMServer(StubLLMConfig(latency_ms=0, jitter_ms=0, seed=1)) as server:
+        yield server
+
+
+class TestHTTPProvider:
+    def test_generate_via_stub(self, stub):
+        provider = HTTPProvider(base_url=stub.url, timeout=5)
+
+        assert provider.name == "http"
+        assert provider.is_available() is True
+        assert "[Mock]" in provider.generate("describe this place")
+        assert stub.stats.served == 1
+
+    def test_injected_failure_raises(self):
+        config = StubLLMConfig(latency_ms=0, jitter_ms=0, failure_rate=1.0)
+        with StubLLMServer(config) as server:
+            provider = HTTPProvider(base_url=server.url, timeout=5)
+            with pytest.raises(RuntimeError, match="503"):
+                provider.generate("x")
+            assert server.stats.failed == 1
+
+    def test_unreachable_raises(self):
+        provider = HTTPProvider(base_url="http://127.0.0.1:1", timeout=1)
+        with pytest.raises(RuntimeError):
+            provider.generate("x")
+
+
+class TestStubLLM:
+    def test_concurrency_limit_rejects(self):
+        config = StubLLMConfig(latency_ms=300, jitter_ms=0, max_concurrency=1)
+        with StubLLMServer(config) as server:
+            provider = HTTPProvider(base_url=server.url, timeout=5)
+            errors: list[Exception] = []
+
+            def call() -> None:
+                try:
+                    provider.generate("x")
+                except RuntimeError as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=call) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert server.stats.peak_in_flight == 1
+            assert server.stats.rejected == len(errors) >= 1
+            assert all("429" in str(e) for e in errors)
+
+
+class TestParseMix:
+    def test_valid(self):
+        assert parse_mix("state=3, move=1") == {"state": 3, "move": 1}
+
+    @pytest.mark.parametrize("spec", ["", "fly=1", "state", "state=0", "look=-1"])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_mix(spec)
+
+
+class TestLoadReport:
+    def test_merge_counts_errors_per_label(self):
+        a, b = UserResult(), UserResult()
+        a.record("look", 0.010, 200)
+        a.record("look", 0.030, 500)
+        b.record("look", 0.020, 0)
+        b.record("state", 0.001, 200)
+
+        report = LoadReport.merge([a, b], duration=2.0)
+
+        look = report.by_label["look"]
+        assert look.count == 3
+        assert look.errors == 2
+        assert look.error_rate == pytest.approx(2 / 3)
+        assert look.p50_ms == pytest.approx(20.0)
+        assert look.statuses == {"error": 1, "200": 1, "500": 1}
+        assert report.requests == 4
+        assert report.requests_per_sec == pytest.approx(2.0)
+        assert "look" in report.format_text()
+
+
+class TestVirtualUser:
+    def test_records_transport_errors(self):
+        # 닫힌 포트로 연결 실패 유도
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        config = LoadConfig(
+            base_url=f"http://127.0.0.1:{port}", mix={"state": 1}, timeout=1
+        )
+        user = VirtualUser(config, "p", random.Random(0))
+        user.step()
+
+        assert user.result.statuses == {"state": {0: 1}}
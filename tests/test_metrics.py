@@ -0,0 +1,191 @@
+"""Tests for the Prometheus metrics registry and the /metrics endpoint."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.api.game import get_engine
+from src.api.metrics import get_optional_engine
+from src.core.engine import ITWEngine
+from src.core.event_bus import EventBus, GameEvent
+from src.core.metrics import REGISTRY, MetricsRegistry
+from src.db.database import _CODE_LABELS, DB_STATEMENT_SECONDS, instrument_engine
+from src.main import app
+from src.services.ai.mock import MockProvider
+from src.services.narrative_service import LLM_RESULTS, NarrativeService
+from src.services.narrative_types import NarrativeRequestType
+
+
+def _sample(body: str, line_prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"sample not found: {line_prefix}")
+
+
+class TestRegistry:
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs run", ("kind",))
+        counter.inc("a")
+        counter.inc("a", amount=2)
+        registry.gauge("queue_depth", "Queue depth").set(7)
+
+        body = registry.render()
+        assert "# TYPE jobs_total counter" in body
+        assert 'jobs_total{kind="a"} 3' in body
+        assert "# TYPE queue_depth gauge" in body
+        assert "queue_depth 7" in body
+        assert body.endswith("\n")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "op_seconds", "Op time", ("op",), buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "read")
+
+        body = registry.render()
+        assert 'op_seconds_bucket{op="read",le="0.1"} 2' in body
+        assert 'op_seconds_bucket{op="read",le="1"} 3' in body
+        assert 'op_seconds_bucket{op="read",le="+Inf"} 4' in body
+        assert _sample(body, 'op_seconds_sum{op="read"}') == pytest.approx(3.65)
+        assert histogram.count("read") == 4
+
+    def test_redeclare_returns_same_metric(self):
+        registry = MetricsRegistry()
+        first = registry.counter("x_total", "x")
+        assert registry.counter("x_total", "x") is first
+        with pytest.raises(TypeError):
+            registry.gauge("x_total", "x")
+
+    def test_label_values_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("odd_total", "odd", ("v",)).inc('a"b\\c\nd')
+        assert 'odd_total{v="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+    def test_label_count_checked(self):
+        counter = MetricsRegistry().counter("l_total", "l", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.inc("only_one")
+        with pytest.raises(ValueError):
+            counter.inc("a", "b", amount=-1)
+
+
+class TestInstrumentation:
+    def test_event_bus_emits_and_handler_time(self):
+        emits = REGISTRY.get("itw_event_emits_total")
+        calls = REGISTRY.get("itw_event_handler_calls_total")
+        blocked = REGISTRY.get("itw_event_blocked_total")
+        before = (
+            emits.value("metrics_probe"),
+            calls.value("metrics_probe"),
+            blocked.value("metrics_probe", "duplicate"),
+        )
+
+        bus = EventBus()
+        bus.subscribe("metrics_probe", lambda event: None)
+        bus.subscribe("metrics_probe", lambda event: None)
+        event = GameEvent(event_type="metrics_probe", data={}, source="metrics_test")
+        bus.emit(event)
+        bus.emit(event)  # 같은 체인 중복 → 차단
+
+        assert emits.value("metrics_probe") == before[0] + 1
+        assert calls.value("metrics_probe") == before[1] + 2
+        assert blocked.value("metrics_probe", "duplicate") == before[2] + 1
+
+    def test_db_statements_labelled_by_calling_module(self):
+        db_engine = create_engine("sqlite:///:memory:")
+        instrument_engine(db_engine)
+        with db_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        # 테스트 모듈은 src.* 밖이므로 "other"
+        assert DB_STATEMENT_SECONDS.count("other") >= 1
+        db_engine.dispose()
+
+    def test_db_statement_label_cached_per_call_site(self):
+        db_engine = create_engine("sqlite:///:memory:")
+        instrument_engine(db_engine)
+        namespace = {"__name__": "src.services.probe_service", "text": text}
+        exec("def run(conn):\n    conn.execute(text('SELECT 1'))\n", namespace)
+        before = DB_STATEMENT_SECONDS.count("probe_service")
+        with db_engine.connect() as conn:
+            namespace["run"](conn)
+            namespace["run"](conn)
+        assert DB_STATEMENT_SECONDS.count("probe_service") == before + 2
+        assert _CODE_LABELS[namespace["run"].__code__] == "probe_service"
+        db_engine.dispose()
+
+    def test_llm_fallback_stages_counted(self):
+        kind = NarrativeRequestType.IMPRESSION_TAG.value
+        before_primary = LLM_RESULTS.value(kind, "primary")
+        before_template = LLM_RESULTS.value(kind, "template")
+
+        NarrativeService(MockProvider()).generate_impression_tag("요약")
+        assert LLM_RESULTS.value(kind, "primary") == before_primary + 1
+
+        failing = MagicMock()
+        failing.name = "failing"
+        failing.is_available.return_value = True
+        failing.generate.side_effect = RuntimeError("down")
+        NarrativeService(failing).generate_impression_tag("요약")
+        assert failing.generate.call_count == 2
+        assert LLM_RESULTS.value(kind, "template") == before_template + 1
+        latency = REGISTRY.get("itw_llm_call_seconds")
+        assert latency.count("failing", kind, "error") == 2
+
+
+class TestEndpoint:
+    @pytest.fixture()
+    def engine(self) -> ITWEngine:
+        return ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json", world_seed=42
+        )
+
+    @pytest.fixture()
+    def client(self, engine: ITWEngine) -> TestClient:
+        app.dependency_overrides[get_engine] = lambda: engine
+        app.dependency_overrides[get_optional_engine] = lambda: engine
+        app.state.narrative_service = NarrativeService(MockProvider())
+        app.state.event_bus = EventBus()
+        yield TestClient(app)
+        app.dependency_overrides.pop(get_engine, None)
+        app.dependency_overrides.pop(get_optional_engine, None)
+
+    def test_prometheus_text_format(self, client: TestClient):
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "version=0.0.4" in response.headers["content-type"]
+        assert "# TYPE itw_action_seconds histogram" in response.text
+
+    def test_engine_gauges(self, client: TestClient, engine: ITWEngine):
+        client.post("/game/register", json={"player_id": "metrics_p1"})
+        body = client.get("/metrics").text
+        assert _sample(body, "itw_engine_players") == 1
+        assert _sample(body, 'itw_engine_nodes{state="resident"}') == len(
+            engine.world.nodes
+        )
+        assert _sample(body, 'itw_engine_nodes{state="pending"}') == 0
+
+    def test_action_latency_by_type_and_status(self, client: TestClient):
+        histogram = REGISTRY.get("itw_action_seconds")
+        looks = histogram.count("look", 200)
+        missing = histogram.count("look", 404)
+        unknown = histogram.count("other", 400)
+
+        client.post("/game/register", json={"player_id": "metrics_p2"})
+        client.post("/game/action", json={"player_id": "metrics_p2", "action": "look"})
+        client.post("/game/action", json={"player_id": "nobody", "action": "look"})
+        client.post(
+            "/game/action", json={"player_id": "metrics_p2", "action": "dance!"}
+        )
+
+        assert histogram.count("look", 200) == looks + 1
+        assert histogram.count("look", 404) == missing + 1
+        assert histogram.count("other", 400) == unknown + 1
+        body = client.get("/metrics").text
+        assert 'itw_action_seconds_count{action="look",status="200"}' in body
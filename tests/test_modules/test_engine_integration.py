@@ -5,6 +5,8 @@ ModuleManager 통합이 올바른지 검증한다.
 """
 
 from src.core.engine import ITWEngine
+from src.core.event_bus import EventBus, GameEvent
+from src.core.event_types import EventTypes
 from src.modules.module_manager import ModuleManager
 
 
@@ -38,6 +40,25 @@ class TestEngineHasModuleManager:
         assert hasattr(engine, "module_manager")
         assert isinstance(engine.module_manager, ModuleManager)
 
+    def test_module_manager_shares_event_bus(self):
+        bus = EventBus()
+        engine = ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json",
+            world_seed=42,
+            event_bus=bus,
+        )
+        assert engine.module_manager.event_bus is bus
+
+        # 서비스 버스의 아이템 이벤트가 모듈 노드 캐시를 무효화
+        bus.emit(
+            GameEvent(
+                event_type=EventTypes.ITEM_CREATED,
+                data={"owner_type": "node", "owner_id": "3_3"},
+                source="item_service",
+            )
+        )
+        assert engine.module_manager._node_cache.revision("3_3") == (1, 0)
+
     def test_geography_registered(self):
         engine = create_test_engine()
         assert "geography" in engine.module_manager.modules
@@ -1,10 +1,13 @@
 """ModuleManager 테스트"""
 
+import threading
+import time
 from unittest.mock import MagicMock
 
 from src.modules.base import GameModule, GameContext, Action
-from src.modules.module_manager import ModuleManager
+from src.modules.module_manager import ModuleManager, NodeStateCache
 from src.core.event_bus import GameEvent
+from src.core.event_types import EventTypes
 
 
 # --- 테스트용 모듈 ---
@@ -298,3 +301,417 @@ class TestModuleManagerEventBus:
 
         # process_turn 후 chain 초기화됨
         assert len(mm.event_bus._emitted_in_chain) == 0
+
+
+# --- 훅 실행 계획 / 동시 실행 ---
+
+
+class _HookModule(GameModule):
+    """on_turn만 재정의하는 설정 가능한 모듈"""
+
+    def __init__(self, name, deps=(), thread_safe=False, budget=None, work=None):
+        super().__init__()
+        self._name = name
+        self._deps = list(deps)
+        self._thread_safe = thread_safe
+        self._budget = budget
+        self._work = work
+        self.threads = []
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def dependencies(self):
+        return self._deps
+
+    @property
+    def thread_safe(self):
+        return self._thread_safe
+
+    @property
+    def hook_budget(self):
+        return self._budget
+
+    def on_enable(self):
+        pass
+
+    def on_disable(self):
+        pass
+
+    def on_turn(self, context):
+        self.threads.append(threading.current_thread().name)
+        if self._work is not None:
+            self._work(self, context)
+
+
+def _manager(*modules, **kwargs):
+    mm = ModuleManager(**kwargs)
+    for module in modules:
+        mm.register(module)
+        mm.enable(module.name)
+    return mm
+
+
+class TestHookPlan:
+    def test_only_overriding_modules_planned(self):
+        mm = _manager(_HookModule("a"), _HookModule("b", deps=["a"]))
+        assert mm.hook_plan("on_turn") == [["a"], ["b"]]
+        assert mm.hook_plan("on_node_enter") == []
+        assert mm.hook_plan("get_available_actions") == []
+        assert mm.get_all_actions(make_context()) == []
+
+    def test_layers_follow_dependency_graph(self):
+        mm = _manager(
+            _HookModule("base"),
+            _HookModule("left", deps=["base"]),
+            _HookModule("right", deps=["base"]),
+            _HookModule("top", deps=["left", "right"]),
+            _HookModule("solo"),
+        )
+        assert mm.hook_plan("on_turn") == [
+            ["base", "solo"],
+            ["left", "right"],
+            ["top"],
+        ]
+
+    def test_plan_refreshed_on_disable(self):
+        mm = _manager(_HookModule("a"), _HookModule("b", deps=["a"]))
+        mm.disable("b")
+        assert mm.hook_plan("on_turn") == [["a"]]
+
+    def test_dependency_runs_first(self):
+        order = []
+
+        def record(module, context):
+            order.append(module.name)
+            context.extra[module.name] = True
+
+        def needs_base(module, context):
+            assert context.extra.get("base") is True
+            record(module, context)
+
+        # 등록 순서는 top이 먼저지만 실행은 의존성 레이어 순
+        mm = ModuleManager()
+        mm.register(
+            _HookModule("top", deps=["base"], thread_safe=True, work=needs_base)
+        )
+        mm.register(_HookModule("base", thread_safe=True, work=record))
+        mm.enable("base")
+        mm.enable("top")
+        mm.process_turn(make_context())
+        assert order == ["base", "top"]
+
+
+class TestConcurrentHooks:
+    def test_thread_safe_modules_run_in_pool(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(module, context):
+            barrier.wait()  # 둘이 동시에 실행되지 않으면 타임아웃
+
+        a = _HookModule("a", thread_safe=True, work=meet)
+        b = _HookModule("b", thread_safe=True, work=meet)
+        mm = _manager(a, b)
+        mm.process_turn(make_context())
+        mm.shutdown()
+        assert a.threads[0].startswith("module-hook")
+        assert b.threads[0].startswith("module-hook")
+
+    def test_unsafe_modules_stay_on_caller_thread(self):
+        a = _HookModule("a")
+        b = _HookModule("b", thread_safe=True)
+        mm = _manager(a, b)
+        mm.process_turn(make_context())
+        mm.shutdown()
+        assert a.threads == [threading.current_thread().name]
+        assert b.threads[0].startswith("module-hook")
+
+    def test_single_module_layer_not_pooled(self):
+        a = _HookModule("a", thread_safe=True)
+        mm = _manager(a)
+        mm.process_turn(make_context())
+        assert a.threads == [threading.current_thread().name]
+
+    def test_hook_errors_propagate(self):
+        def boom(module, context):
+            raise RuntimeError("boom")
+
+        mm = _manager(
+            _HookModule("a", thread_safe=True, work=boom),
+            _HookModule("b", thread_safe=True),
+        )
+        try:
+            mm.process_turn(make_context())
+        except RuntimeError as exc:
+            assert str(exc) == "boom"
+        else:
+            raise AssertionError("hook error swallowed")
+        finally:
+            mm.shutdown()
+
+
+class TestHookBudgetAndStats:
+    def test_stats_recorded(self):
+        mm = _manager(_HookModule("a"))
+        mm.process_turn(make_context())
+        mm.process_turn(make_context())
+        stats = mm.hook_stats()["a"]["on_turn"]
+        assert stats["calls"] == 2
+        assert stats["max_ms"] >= 0
+        assert stats["over_budget"] == 0
+
+    def test_over_budget_counted(self):
+        def slow(module, context):
+            time.sleep(0.02)
+
+        mm = _manager(_HookModule("a", work=slow), default_budget=0.001)
+        mm.process_turn(make_context())
+        assert mm.hook_stats()["a"]["on_turn"]["over_budget"] == 1
+
+    def test_slow_concurrent_module_not_awaited(self):
+        release = threading.Event()
+
+        def stuck(module, context):
+            release.wait(5)
+
+        def act(module, context):
+            return None
+
+        slow = _HookModule("slow", thread_safe=True, budget=0.05, work=stuck)
+        fast = _HookModule("fast", thread_safe=True, work=act)
+        mm = _manager(slow, fast)
+
+        started = time.perf_counter()
+        mm.process_turn(make_context())
+        assert time.perf_counter() - started < 2
+        release.set()
+        mm.shutdown()
+        assert mm.hook_stats()["slow"]["on_turn"]["over_budget"] == 1
+        assert mm.hook_stats()["slow"]["on_turn"]["abandoned"] == 1
+
+    def test_budget_starts_when_hook_starts(self):
+        def busy(module, context):
+            time.sleep(0.1)
+
+        def quick(module, context):
+            time.sleep(0.02)
+
+        # 풀 1개: second는 first 뒤에서 0.1초 대기하지만 대기 시간은 예산에 넣지 않음
+        first = _HookModule("first", thread_safe=True, work=busy)
+        second = _HookModule("second", thread_safe=True, budget=0.08, work=quick)
+        mm = _manager(first, second, max_workers=1)
+        mm.process_turn(make_context())
+        mm.shutdown()
+        assert second.threads[0].startswith("module-hook")
+        assert mm.hook_stats()["second"]["on_turn"]["abandoned"] == 0
+
+    def test_abandoned_workers_counted_and_bypassed(self):
+        release = threading.Event()
+
+        def stuck_in_pool(module, context):
+            if threading.current_thread().name.startswith("module-hook"):
+                release.wait(5)
+
+        slow = _HookModule("slow", thread_safe=True, budget=0.05, work=stuck_in_pool)
+        fast = _HookModule("fast", thread_safe=True)
+        mm = _manager(slow, fast, max_workers=1)
+        try:
+            mm.process_turn(make_context())
+            assert mm.abandoned_workers == 1
+            # 버린 작업이 풀을 차지 → 대기 중이던 fast는 취소 후 호출 스레드에서 실행
+            assert fast.threads == [threading.current_thread().name]
+
+            # 풀이 가득 참 → 레이어 전체를 호출 스레드에서
+            mm.process_turn(make_context())
+            assert slow.threads[-1] == threading.current_thread().name
+        finally:
+            release.set()
+            mm.shutdown()
+        assert mm.abandoned_workers == 0
+
+
+# --- 노드 상태 캐시 ---
+
+
+class _NodeModule(GameModule):
+    """노드 상태를 조회하고 그 결과로 행동을 만드는 캐시 가능 모듈"""
+
+    def __init__(self, cacheable=True):
+        super().__init__()
+        self._cacheable = cacheable
+        self.queries = 0
+        self.builds = 0
+
+    @property
+    def name(self):
+        return "nodey"
+
+    @property
+    def cache_actions(self):
+        return self._cacheable
+
+    @property
+    def cache_node_state(self):
+        return self._cacheable
+
+    def on_enable(self):
+        pass
+
+    def on_disable(self):
+        pass
+
+    def on_node_enter(self, node_id, context):
+        self.queries += 1
+        context.extra[self.name] = {"query": self.queries}
+
+    def get_available_actions(self, context):
+        self.builds += 1
+        return [Action(name="poke", display_name="Poke", module_name=self.name)]
+
+
+def _node_context(node_id="n1", **extra):
+    context = make_context()
+    context.current_node_id = node_id
+    context.extra.update(extra)
+    return context
+
+
+def _emit(mm, event_type, source, **data):
+    mm.event_bus.emit(GameEvent(event_type=event_type, data=data, source=source))
+
+
+class TestNodeStateCache:
+    def test_repeat_visit_reuses_node_state_and_actions(self):
+        module = _NodeModule()
+        mm = _manager(module)
+
+        for _ in range(3):
+            context = _node_context()
+            mm.process_node_enter("n1", context)
+            actions = mm.get_all_actions(context)
+
+        assert module.queries == 1
+        assert module.builds == 1
+        assert context.extra["nodey"] == {"query": 1}
+        assert [a.name for a in actions] == ["poke"]
+        assert mm.node_cache_info()["hits"] == 4
+
+    def test_other_node_and_sub_grid_state_miss(self):
+        module = _NodeModule()
+        mm = _manager(module)
+
+        mm.get_all_actions(_node_context("n1"))
+        mm.get_all_actions(_node_context("n2"))
+        sub = {"sx": 0, "sy": 0, "sz": 0}
+        mm.get_all_actions(_node_context("n1", in_sub_grid=True, sub_position=sub))
+        mm.get_all_actions(_node_context("n1", in_sub_grid=True, sub_position=sub))
+        assert module.builds == 3
+
+    def test_item_transfer_invalidates_both_nodes(self):
+        module = _NodeModule()
+        mm = _manager(module)
+        mm.process_node_enter("n1", _node_context("n1"))
+        mm.process_node_enter("n2", _node_context("n2"))
+
+        _emit(
+            mm,
+            EventTypes.ITEM_TRANSFERRED,
+            "item_service_t1",
+            from_type="node",
+            from_id="n1",
+            to_type="player",
+            to_id="p1",
+        )
+        mm.process_node_enter("n1", _node_context("n1"))
+        mm.process_node_enter("n2", _node_context("n2"))
+        assert module.queries == 3
+
+    def test_npc_events_bump_occupancy(self):
+        module = _NodeModule()
+        mm = _manager(module)
+        mm.get_all_actions(_node_context("n1"))
+
+        _emit(mm, EventTypes.NPC_PROMOTED, "npc_service_p1", node_id="n1")
+        mm.get_all_actions(_node_context("n1"))
+        _emit(mm, EventTypes.NPC_MOVED, "npc_service_m1", from_node="n1", to_node="n2")
+        mm.get_all_actions(_node_context("n1"))
+        assert module.builds == 3
+
+    def test_unrelated_events_keep_cache(self):
+        module = _NodeModule()
+        mm = _manager(module)
+        mm.get_all_actions(_node_context("n1"))
+        _emit(
+            mm,
+            EventTypes.ITEM_TRANSFERRED,
+            "item_service_t2",
+            from_type="player",
+            from_id="p1",
+            to_type="npc",
+            to_id="npc_1",
+        )
+        mm.get_all_actions(_node_context("n1"))
+        assert module.builds == 1
+
+    def test_cached_list_not_shared(self):
+        mm = _manager(_NodeModule())
+        first = mm.get_all_actions(_node_context())
+        first.clear()
+        assert len(mm.get_all_actions(_node_context())) == 1
+
+    def test_uncacheable_module_always_called(self):
+        module = _NodeModule(cacheable=False)
+        mm = _manager(module)
+        for _ in range(2):
+            context = _node_context()
+            mm.process_node_enter("n1", context)
+            mm.get_all_actions(context)
+        assert module.queries == 2
+        assert module.builds == 2
+
+    def test_invalidate_node(self):
+        module = _NodeModule()
+        mm = _manager(module)
+        mm.get_all_actions(_node_context())
+        mm.invalidate_node("n1")
+        mm.get_all_actions(_node_context())
+        assert module.builds == 2
+
+    def test_discard_node_keeps_revision(self):
+        module = _NodeModule()
+        mm = _manager(module)
+        mm.get_all_actions(_node_context())
+        mm.discard_node("n1")
+        assert mm.node_cache_info()["entries"] == 0
+        mm.get_all_actions(_node_context())
+        assert module.builds == 2
+        assert mm.node_cache_info()["revisions"] == 0
+
+    def test_entries_bounded_least_recently_used_first(self):
+        cache = NodeStateCache(max_entries=3)
+        for node_id in ("n1", "n2", "n3"):
+            cache.put(node_id, ("k",), node_id)
+        assert cache.get("n1", ("k",)) == (True, "n1")  # n1을 최근 사용으로
+        cache.put("n4", ("k",), "n4")
+
+        assert cache.get("n2", ("k",)) == (False, None)
+        assert cache.get("n1", ("k",)) == (True, "n1")
+        assert cache.info()["entries"] == 3
+
+    def test_revision_table_bounded_without_reusing_revisions(self):
+        cache = NodeStateCache(max_revisions=2)
+        cache.bump_node("n1")
+        stale = ("hook", cache.revision("n1"))
+        cache.put("n1", stale, "old")
+        cache.bump_occupancy("n2")
+        cache.bump_node("n3")  # 표가 한도를 넘어 비워짐
+
+        assert cache.info()["revisions"] == 0
+        assert cache.revision("n1") > (1, 0)
+        assert cache.get("n1", stale) == (False, None)
+        # 비운 뒤 올린 리비전도 이전 값과 겹치지 않음
+        before = cache.revision("n9")
+        cache.bump_node("n9")
+        assert cache.revision("n9")[0] == before[0] + 1
@@ -14,6 +14,7 @@ from src.core.engine import (
 from src.core.world_generator import (
     AxiomVector,
     Echo,
+    EchoStore,
     MapNode,
     NodeTier,
     Resource,
@@ -165,24 +166,26 @@ class TestNodePersistence:
     def test_node_with_echoes(self, session: Session, sample_node: MapNode):
         """Test node with echoes save and load."""
         # Add echoes to node
-        sample_node.echoes = [
-            Echo(
-                echo_type="Short",
-                visibility="Public",
-                base_difficulty=2,
-                timestamp="2024-01-01T12:00:00",
-                flavor_text="누군가 이곳을 지나갔다",
-                source_player_id="player_abc",
-            ),
-            Echo(
-                echo_type="Long",
-                visibility="Hidden",
-                base_difficulty=3,
-                timestamp="2024-01-02T08:00:00",
-                flavor_text="오래된 전투의 흔적",
-                source_player_id=None,
-            ),
-        ]
+        sample_node.echoes = EchoStore(
+            [
+                Echo(
+                    echo_type="Short",
+                    visibility="Public",
+                    base_difficulty=2,
+                    timestamp="2024-01-01T12:00:00",
+                    flavor_text="누군가 이곳을 지나갔다",
+                    source_player_id="player_abc",
+                ),
+                Echo(
+                    echo_type="Long",
+                    visibility="Hidden",
+                    base_difficulty=3,
+                    timestamp="2024-01-02T08:00:00",
+                    flavor_text="오래된 전투의 흔적",
+                    source_player_id=None,
+                ),
+            ]
+        )
 
         # Save node
         model = _node_to_model(sample_node)
@@ -223,6 +226,57 @@ class TestNodePersistence:
         assert hidden_echo is not None
         assert hidden_echo.source_player_id is None
 
+    def test_echo_expiry_fields_roundtrip(self, session: Session, sample_node: MapNode):
+        """Test echo category/expires_at survive save and load."""
+        session.add(_node_to_model(sample_node))
+        session.flush()
+        session.add(
+            EchoModel(
+                node_coordinate=sample_node.coordinate,
+                echo_type="Short",
+                visibility="Hidden",
+                base_difficulty=2,
+                timestamp="2024-01-01T12:00:00",
+                flavor_text="발자국이 희미하게 남아있다...",
+                category="exploration",
+                expires_at=1704456000.0,
+                echo_id="echo-1",
+            )
+        )
+        session.commit()
+
+        loaded_node = _model_to_node(session.get(MapNodeModel, sample_node.coordinate))
+        echo = loaded_node.echoes.get("echo-1")
+        assert echo is not None
+        assert echo.category == "exploration"
+        assert echo.expires_at == 1704456000.0
+        assert echo.echo_id == "echo-1"
+
+    def test_legacy_echo_id_persisted(self, session: Session, sample_node: MapNode):
+        """Test an echo row without echo_id keeps the generated id across loads."""
+        session.add(_node_to_model(sample_node))
+        session.add(
+            EchoModel(
+                node_coordinate=sample_node.coordinate,
+                echo_type="Short",
+                visibility="Hidden",
+                base_difficulty=2,
+                timestamp="2024-01-01T12:00:00",
+                flavor_text="발자국",
+            )
+        )
+        session.commit()
+
+        first = _model_to_node(session.get(MapNodeModel, sample_node.coordinate))
+        session.commit()
+        session.expire_all()
+        second = _model_to_node(session.get(MapNodeModel, sample_node.coordinate))
+
+        [first_echo] = list(first.echoes)
+        [second_echo] = list(second.echoes)
+        assert first_echo.echo_id == second_echo.echo_id
+        assert session.query(EchoModel).one().echo_id == first_echo.echo_id
+
     def test_upsert_existing_node(self, session: Session, sample_node: MapNode):
         """Test updating an existing node."""
         # Initial save
@@ -0,0 +1,264 @@
+"""Tests for the slow-request sampling profiler and /admin/profiles."""
+
+import contextvars
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.background import BackgroundTask
+from starlette.responses import PlainTextResponse
+
+from src.api.admin import ADMIN_TOKEN_HEADER
+from src.api.game import get_engine
+from src.api.profiles import ProfilingMiddleware
+from src.config import settings
+from src.core.engine import ITWEngine
+from src.core.event_bus import EventBus
+from src.core.profiler import PROFILER, ProfileStore, SlowRequestProfiler, collapse
+from src.main import app
+from src.services.ai.mock import MockProvider
+from src.services.narrative_service import NarrativeService
+
+
+@pytest.fixture()
+def make_profiler(tmp_path: Path):
+    created: list[SlowRequestProfiler] = []
+
+    def make(**kwargs) -> SlowRequestProfiler:
+        options = {"enabled": True, "threshold_ms": 0.0, "interval_ms": 1.0}
+        options.update(kwargs)
+        profiler = SlowRequestProfiler(store=ProfileStore(tmp_path), **options)
+        created.append(profiler)
+        return profiler
+
+    yield make
+    for profiler in created:
+        profiler.shutdown()
+
+
+def _slow_leaf(release: threading.Event) -> None:
+    release.wait(timeout=5)
+
+
+def _run_request(profiler: SlowRequestProfiler, samples: int = 3, **tags) -> str | None:
+    """작업 스레드에서 요청 1개를 흉내 내고 samples회 수동 샘플링"""
+    record = profiler.begin("POST", "/game/action")
+    context = contextvars.copy_context()
+    started = threading.Event()
+    release = threading.Event()
+
+    def work() -> None:
+        profiler.annotate(**tags)
+        started.set()
+        _slow_leaf(release)
+
+    thread = threading.Thread(target=context.run, args=(work,))
+    thread.start()
+    started.wait(timeout=5)
+    time.sleep(0.01)  # _slow_leaf 진입 대기
+    for _ in range(samples):
+        profiler.sample()
+    release.set()
+    thread.join()
+    return profiler.end(record, 200)
+
+
+class TestProfiler:
+    def test_collapse_is_root_to_leaf(self):
+        stack = collapse(__import__("sys")._getframe())
+        frames = stack.split(";")
+        assert frames[-1].endswith(":TestProfiler.test_collapse_is_root_to_leaf")
+        assert " " not in stack
+
+    def test_slow_request_captured_with_tags(self, make_profiler):
+        profiler = make_profiler()
+        capture_id = _run_request(profiler, action="look", player_id="p1")
+        assert capture_id is not None
+
+        [meta] = profiler.store.list()
+        assert meta["id"] == capture_id
+        assert meta["action"] == "look"
+        assert meta["player_id"] == "p1"
+        assert meta["status"] == 200
+        assert meta["samples"] >= 3
+
+        lines = profiler.store.path(capture_id).read_text().splitlines()
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) >= 3
+        assert "tests.test_profiler:_slow_leaf" in stack.split(";")
+
+    def test_fast_or_unannotated_requests_not_captured(self, make_profiler):
+        profiler = make_profiler(threshold_ms=60_000)
+        assert _run_request(profiler, action="look") is None
+
+        profiler.configure(threshold_ms=0.0)
+        record = profiler.begin("GET", "/health")  # annotate 없음 → 샘플 대상 아님
+        assert profiler.sample() == 0
+        assert profiler.end(record, 200) is None
+        assert profiler.store.list() == []
+
+    def test_released_thread_not_sampled(self, make_profiler):
+        profiler = make_profiler()
+
+        def request() -> tuple[int, int, str | None]:
+            record = profiler.begin("POST", "/game/action")
+            profiler.annotate(action="look")
+            before = profiler.sample()
+            # 엔드포인트 반환 후: 같은 풀 스레드가 다른 요청을 처리해도 섞이지 않음
+            profiler.release()
+            after = profiler.sample()
+            return before, after, profiler.end(record, 200)
+
+        before, after, capture_id = contextvars.copy_context().run(request)
+        assert (before, after) == (1, 0)
+        assert capture_id is not None  # 샘플이 있으면 release 후에도 저장
+        assert profiler.store.list()[0]["samples"] >= 1
+
+    def test_rate_limit(self, make_profiler):
+        profiler = make_profiler(max_per_minute=1)
+        assert _run_request(profiler, action="look") is not None
+        assert _run_request(profiler, action="look") is None
+        settings = profiler.settings()
+        assert settings["saved"] == 1
+        assert settings["rate_limited"] == 1
+
+    def test_disabled_is_noop(self, make_profiler):
+        profiler = make_profiler(enabled=False)
+        assert profiler.begin("POST", "/game/action") is None
+        profiler.annotate(action="look")  # 요청 밖 → 무시
+
+    def test_sampler_thread(self, make_profiler):
+        profiler = make_profiler()
+        capture_id = _run_request(profiler, samples=0, action="look")
+        # 수동 샘플 없이도 백그라운드 샘플러가 수집
+        assert capture_id is not None
+        assert profiler.store.list()[0]["samples"] >= 1
+
+
+class TestProfileStore:
+    def test_bounded_by_file_count(self, tmp_path: Path):
+        store = ProfileStore(tmp_path, max_files=2)
+        ids = [store.save({"n": n}, f"a;b {n}\n") for n in range(3)]
+        assert [meta["id"] for meta in store.list()] == ids[:0:-1]
+        assert store.path(ids[0]) is None
+
+    def test_bounded_by_bytes_keeps_newest(self, tmp_path: Path):
+        store = ProfileStore(tmp_path, max_bytes=10)
+        store.save({}, "x" * 100 + " 1\n")
+        newest = store.save({}, "y" * 100 + " 1\n")
+        assert [meta["id"] for meta in store.list()] == [newest]
+
+    def test_path_rejects_traversal(self, tmp_path: Path):
+        store = ProfileStore(tmp_path)
+        assert store.path("../secrets") is None
+        assert store.path("0000000000000-0001") is None
+        assert store.clear() == 0
+
+
+class _RecordingProfiler:
+    """begin/end 호출만 기록하는 가짜 프로파일러"""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.background_done = threading.Event()
+        self.ended: list[tuple[int | None, bool, int]] = []
+
+    def begin(self, method: str, path: str) -> object:
+        return object()
+
+    def end(self, record: object, status: int | None = None) -> None:
+        self.ended.append(
+            (status, self.background_done.is_set(), threading.get_ident())
+        )
+
+
+class TestMiddleware:
+    def test_end_before_background_task_and_off_loop(self):
+        profiler = _RecordingProfiler()
+        loop_thread: list[int] = []
+        demo = FastAPI()
+        demo.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+        def background() -> None:
+            time.sleep(0.05)
+            profiler.background_done.set()
+
+        @demo.get("/demo")
+        async def endpoint() -> PlainTextResponse:
+            loop_thread.append(threading.get_ident())
+            return PlainTextResponse("ok", background=BackgroundTask(background))
+
+        assert TestClient(demo).get("/demo").text == "ok"
+        assert profiler.background_done.is_set()
+        [(status, background_finished, thread)] = profiler.ended
+        assert status == 200
+        assert not background_finished  # 백그라운드 작업은 측정에서 제외
+        assert thread != loop_thread[0]  # end()는 이벤트 루프 밖에서 실행
+
+
+class _SlowProvider(MockProvider):
+    def generate(self, prompt: str, **kwargs) -> str:
+        time.sleep(0.05)
+        return super().generate(prompt, **kwargs)
+
+
+class TestEndpoints:
+    @pytest.fixture()
+    def client(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+        engine = ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json", world_seed=42
+        )
+        app.dependency_overrides[get_engine] = lambda: engine
+        app.state.narrative_service = NarrativeService(_SlowProvider())
+        app.state.event_bus = EventBus()
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "profile-admin")
+        original = (PROFILER.store, PROFILER.settings())
+        PROFILER.configure(
+            store=ProfileStore(tmp_path),
+            enabled=True,
+            threshold_ms=20.0,
+            interval_ms=1.0,
+            max_per_minute=10,
+        )
+        yield TestClient(app, headers={ADMIN_TOKEN_HEADER: "profile-admin"})
+        app.dependency_overrides.pop(get_engine, None)
+        PROFILER.shutdown()
+        store, saved = original
+        PROFILER.configure(
+            store=store,
+            enabled=saved["enabled"],
+            threshold_ms=saved["threshold_ms"],
+            interval_ms=saved["interval_ms"],
+            max_per_minute=saved["max_per_minute"],
+        )
+
+    def test_slow_action_listed_and_downloadable(self, client: TestClient):
+        client.post("/game/register", json={"player_id": "prof_p1"})
+        response = client.post(
+            "/game/action", json={"player_id": "prof_p1", "action": "look"}
+        )
+        assert response.status_code == 200
+
+        body = client.get("/admin/profiles").json()
+        assert body["profiler"]["enabled"] is True
+        [capture] = body["captures"]  # register는 annotate하지 않음
+        assert capture["action"] == "look"
+        assert capture["player_id"] == "prof_p1"
+        assert capture["status"] == 200
+        assert capture["duration_ms"] >= 50
+
+        download = client.get(f"/admin/profiles/{capture['id']}")
+        assert download.status_code == 200
+        assert download.headers["content-type"].startswith("text/plain")
+        assert "_SlowProvider.generate" in download.text
+        for line in download.text.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert stack and int(count) >= 1
+
+        assert client.get("/admin/profiles/nope").status_code == 404
+        assert client.delete("/admin/profiles").json() == {"cleared": 1}
+        assert TestClient(app).get("/admin/profiles").status_code == 403
@@ -0,0 +1,160 @@
+"""Tests for the required_tags reachability index."""
+
+import pytest
+
+from src.core.axiom_system import AxiomLoader
+from src.core.engine import ITWEngine, PlayerState
+from src.core.reachability import ReachabilityIndex, TagBitRegistry
+from src.core.sub_grid import SubGridGenerator
+from src.core.world_generator import WorldGenerator
+
+
+@pytest.fixture()
+def axiom_loader() -> AxiomLoader:
+    """Create an AxiomLoader instance."""
+    return AxiomLoader("src/data/itw_214_divine_axioms.json")
+
+
+@pytest.fixture()
+def world(axiom_loader: AxiomLoader) -> WorldGenerator:
+    """A 5x5 generated area around the Safe Haven."""
+    world = WorldGenerator(axiom_loader, seed=42)
+    world.generate_area(0, 0, radius=2)
+    return world
+
+
+@pytest.fixture()
+def index(world: WorldGenerator) -> ReachabilityIndex:
+    return ReachabilityIndex(world)
+
+
+class TestTagBitRegistry:
+    def test_bits_are_stable_and_distinct(self):
+        registry = TagBitRegistry()
+        a = registry.bit("tag_a")
+        b = registry.bit("tag_b")
+        assert a != b
+        assert registry.bit("tag_a") == a
+        assert registry.mask(["tag_a", "tag_b"]) == a | b
+        assert registry.mask([]) == 0
+
+
+class TestMainGridReachability:
+    def test_open_area_reachable(self, index: ReachabilityIndex):
+        result = index.reachable_from(0, 0, [], radius=2)
+        assert result["0_0"] == 0
+        assert result["1_0"] == 1
+        assert result["1_1"] == 2
+        # 반경 밖은 제외
+        assert "2_1" not in result
+
+    def test_ungenerated_nodes_not_traversed(self, index: ReachabilityIndex):
+        result = index.reachable_from(0, 0, [], radius=10)
+        assert "3_0" not in result
+        assert len(result) == 25
+
+    def test_required_tags_block_path(
+        self, world: WorldGenerator, index: ReachabilityIndex
+    ):
+        # (1,0)을 태그 게이트로 만든다
+        gate = world.get_node(1, 0)
+        gate.required_tags = ["tag_key"]
+        world.notify_node_changed(gate)
+
+        without_key = index.reachable_from(0, 0, [], radius=1)
+        assert "1_0" not in without_key
+
+        with_key = index.reachable_from(0, 0, ["tag_key"], radius=1)
+        assert "1_0" in with_key
+
+    def test_results_are_memoized(self, index: ReachabilityIndex):
+        first = index.reachable_from(0, 0, [], radius=2)
+        assert index.cache_size == 1
+        # 더 작은 반경은 캐시에서 잘라서 반환
+        smaller = index.reachable_from(0, 0, [], radius=1)
+        assert index.cache_size == 1
+        assert set(smaller) <= set(first)
+        assert all(d <= 1 for d in smaller.values())
+
+    def test_node_change_invalidates_touched_regions_only(
+        self, world: WorldGenerator, index: ReachabilityIndex
+    ):
+        index.reachable_from(0, 0, [], radius=2)
+        far_key = 100 * ReachabilityIndex.REGION_SIZE
+        world.generate_node(far_key, far_key)
+        index.reachable_from(far_key, far_key, [], radius=2)
+        assert index.cache_size == 2
+
+        gate = world.get_node(1, 0)
+        gate.required_tags = ["tag_key"]
+        world.notify_node_changed(gate)
+
+        assert index.cache_size == 1
+        assert "1_0" not in index.reachable_from(0, 0, [], radius=2)
+
+    def test_new_node_extends_cached_frontier(
+        self, world: WorldGenerator, index: ReachabilityIndex
+    ):
+        before = index.reachable_from(0, 0, [], radius=3)
+        assert "3_0" not in before
+        world.generate_node(3, 0)
+        after = index.reachable_from(0, 0, [], radius=3)
+        assert after["3_0"] == 3
+
+
+class TestPlayerReachability:
+    def test_reachable_within_uses_equipped_tags(
+        self, world: WorldGenerator, index: ReachabilityIndex
+    ):
+        gate = world.get_node(0, 1)
+        gate.required_tags = ["tag_climbing_gear"]
+        world.notify_node_changed(gate)
+
+        player = PlayerState(player_id="p1")
+        assert not index.is_reachable(player, "0_1", radius=1)
+
+        player.equipped_tags = ["tag_climbing_gear"]
+        assert index.is_reachable(player, "0_1", radius=1)
+
+    def test_reachable_within_sub_grid(self, axiom_loader: AxiomLoader):
+        world = WorldGenerator(axiom_loader, seed=42)
+        sub_grid = SubGridGenerator(axiom_loader, seed=42)
+        index = ReachabilityIndex(world, sub_grid)
+
+        for sz in range(0, -4, -1):
+            sub_grid.generate_node(0, 0, 0, 0, sz, depth_tier=1)
+
+        player = PlayerState(player_id="p1", in_sub_grid=True, sub_grid_parent="0_0")
+        result = index.reachable_within(player, radius=5)
+        # sz=-3은 tag_light_source + (유효 티어 4) tag_magic_resistance 필요
+        assert "0_0_0_0_-2" in result
+        assert "0_0_0_0_-3" not in result
+
+        player.equipped_tags = ["tag_light_source"]
+        assert "0_0_0_0_-3" not in index.reachable_within(player, radius=5)
+
+        player.equipped_tags = ["tag_light_source", "tag_magic_resistance"]
+        assert "0_0_0_0_-3" in index.reachable_within(player, radius=5)
+
+    def test_sub_grid_generation_invalidates(self, axiom_loader: AxiomLoader):
+        world = WorldGenerator(axiom_loader, seed=42)
+        sub_grid = SubGridGenerator(axiom_loader, seed=42)
+        index = ReachabilityIndex(world, sub_grid)
+        sub_grid.generate_entrance(0, 0, depth_tier=1)
+
+        assert len(index.reachable_sub_grid(0, 0, 0, 0, 0, [], radius=3)) == 1
+        sub_grid.generate_node(0, 0, 1, 0, 0, depth_tier=1)
+        assert "0_0_1_0_0" in index.reachable_sub_grid(0, 0, 0, 0, 0, [], radius=3)
+
+
+class TestEngineIntegration:
+    def test_engine_exposes_reachable_nodes(self):
+        engine = ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json", world_seed=42
+        )
+        engine.register_player("p1")
+        engine.look("p1")
+        reachable = engine.get_reachable_nodes("p1", radius=1)
+        assert reachable["0_0"] == 0
+        assert len(reachable) == 5
+        assert engine.get_reachable_nodes("missing", radius=1) == {}
@@ -0,0 +1,89 @@
+"""Tests for per-session RNG streams."""
+
+import random
+import threading
+
+from src.core.axiom_system import AxiomLoader
+from src.core.engine import ITWEngine
+from src.core.rng import RNGProvider, derive_seed
+from src.core.world_generator import WorldGenerator
+
+
+def _engine(seed: int = 42) -> ITWEngine:
+    return ITWEngine(
+        axiom_data_path="src/data/itw_214_divine_axioms.json", world_seed=seed
+    )
+
+
+class TestRNGProvider:
+    def test_derived_seed_is_stable(self):
+        # 프로세스 해시 랜덤화와 무관한 값이어야 함
+        assert derive_seed(42, "player", "p1") == derive_seed(42, "player", "p1")
+        assert derive_seed(42, "player", "p1") != derive_seed(42, "player", "p2")
+        assert derive_seed(42, "tick", 1) != derive_seed(43, "tick", 1)
+
+    def test_player_stream_cached(self):
+        provider = RNGProvider(7)
+        assert provider.player("p1") is provider.player("p1")
+        assert provider.player("p1") is not provider.player("p2")
+
+    def test_streams_replay(self):
+        first = RNGProvider(7)
+        second = RNGProvider(7)
+        assert [first.player("p1").random() for _ in range(5)] == [
+            second.player("p1").random() for _ in range(5)
+        ]
+        assert first.tick(3).random() == second.tick(3).random()
+        assert first.stream("quest", 1).random() == second.stream("quest", 1).random()
+
+    def test_reset_player(self):
+        provider = RNGProvider(7)
+        head = provider.player("p1").random()
+        provider.reset_player("p1")
+        assert provider.player("p1").random() == head
+
+    def test_player_stream_created_once_under_threads(self):
+        provider = RNGProvider(7)
+        seen: list[random.Random] = []
+        threads = [
+            threading.Thread(target=lambda: seen.append(provider.player("p1")))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(rng) for rng in seen}) == 1
+
+
+class TestEngineStreams:
+    def test_world_generation_leaves_global_rng(self):
+        loader = AxiomLoader("src/data/itw_214_divine_axioms.json")
+        random.seed(1234)
+        expected = [random.random() for _ in range(3)]
+
+        random.seed(1234)
+        world = WorldGenerator(loader, seed=42)
+        world.generate_area(0, 0, radius=2)
+        assert [random.random() for _ in range(3)] == expected
+
+    def test_session_replays(self):
+        def play(engine: ITWEngine) -> list:
+            engine.register_player("p1")
+            log = []
+            for direction in ["n", "e", "e", "s"]:
+                result = engine.move("p1", direction)
+                log.append((result.success, result.message))
+            node = engine.world.get_node(1, 0)
+            log.append([(e.flavor_text, e.echo_type) for e in node.echoes])
+            engine.daily_tick()
+            log.append(
+                [
+                    r.current_amount
+                    for n in engine.world.nodes.values()
+                    for r in n.resources
+                ]
+            )
+            return log
+
+        assert play(_engine()) == play(_engine())
@@ -0,0 +1,139 @@
+"""리전 샤딩 (파티션, 워커, 멀티 프로세스 라우터, 샤드 앱) 테스트"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.shard import RegionPartitioner, ShardCommandError, ShardRouter, ShardWorker
+from src.shard.app import create_app
+
+
+class TestRegionPartitioner:
+    def test_region_and_shard_are_stable(self):
+        partitioner = RegionPartitioner(num_shards=4, region_size=16)
+
+        assert partitioner.region_of(15, -1) == (0, -1)
+        assert partitioner.shard_of(0, 0) == partitioner.shard_of(15, 15)
+        assert partitioner.shard_of(3, 4) == RegionPartitioner(4, 16).shard_of(3, 4)
+
+    def test_regions_spread_over_shards(self):
+        partitioner = RegionPartitioner(num_shards=4, region_size=1)
+        shards = {partitioner.shard_of(x, y) for x in range(8) for y in range(8)}
+        assert shards == {0, 1, 2, 3}
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RegionPartitioner(num_shards=0)
+        with pytest.raises(ValueError):
+            RegionPartitioner(num_shards=2, region_size=0)
+
+
+class TestShardWorker:
+    def test_handoff_between_workers(self):
+        source, target = ShardWorker(0), ShardWorker(1)
+        source.handle("register", "p1")
+        moved = source.handle("action", "p1", "move", {"direction": "e"})
+        assert moved["ok"] and moved["response"]["success"]
+
+        state = source.handle("export", "p1")["state"]
+        assert source.handle("state", "p1")["status"] == 404
+
+        imported = target.handle("import", state)
+        assert imported["position"] == (1, 0)
+        after = target.handle("state", "p1")["response"]["player"]
+        assert after["supply"] == moved["response"]["data"]["remaining_supply"]
+
+    def test_cross_shard_arrival_applied_on_target(self):
+        partitioner = RegionPartitioner(num_shards=2, region_size=1)
+        origin = partitioner.shard_of(0, 0)
+        steps = {"e": (1, 0), "w": (-1, 0), "n": (0, 1), "s": (0, -1)}
+        direction, (x, y) = next(
+            (d, xy) for d, xy in steps.items() if partitioner.shard_of(*xy) != origin
+        )
+        source = ShardWorker(origin, partitioner=partitioner)
+        target = ShardWorker(partitioner.shard_of(x, y), partitioner=partitioner)
+        source.handle("register", "p1")
+
+        moved = source.handle("action", "p1", "move", {"direction": direction})
+        assert moved["ok"] and moved["response"]["success"]
+        assert moved["response"]["location"] is None
+        # 출발 샤드의 사본에는 도착 흔적이 남지 않음
+        source_node = source.engine.world.get_node(x, y)
+        assert "p1" not in source_node.discovered_by
+        assert len(source_node.echoes) == 0
+
+        state = source.handle("export", "p1")["state"]
+        arrival = target.handle("import", state, True)
+        assert arrival["location"] is not None
+        target_node = target.engine.world.get_node(x, y)
+        assert "p1" in target_node.discovered_by
+        assert [e.echo_type for e in target_node.echoes] == ["Short"]
+        player = target.engine.get_player("p1")
+        assert f"{x}_{y}" in player.discovered_nodes
+
+    def test_unsupported_action(self):
+        worker = ShardWorker(0)
+        worker.handle("register", "p1")
+
+        reply = worker.handle("action", "p1", "talk", {"npc_id": "n"})
+
+        assert reply == {
+            "ok": False,
+            "status": 400,
+            "detail": "Action not supported in sharded mode: talk",
+        }
+
+
+@pytest.fixture(scope="module")
+def shard_router():
+    # region_size=1: 한 칸 이동마다 리전이 바뀌어 핸드오프가 자주 일어남
+    with ShardRouter(num_shards=2, region_size=1) as router:
+        yield router
+
+
+class TestShardRouter:
+    def test_player_follows_region_owner(self, shard_router: ShardRouter):
+        shard_router.register("walker")
+        partitioner = shard_router.partitioner
+        supply = 20
+
+        for _ in range(6):
+            response = shard_router.action("walker", "move", {"direction": "e"})
+            assert response["success"]
+            # 핸드오프 이동도 대상 샤드가 만든 위치 뷰를 돌려줌
+            assert response["location"] is not None
+            supply = response["data"]["remaining_supply"]
+
+        state = shard_router.state("walker")["player"]
+        assert (state["x"], state["y"]) == (6, 0)
+        assert state["supply"] == supply
+        assert shard_router.owner_of("walker") == partitioner.shard_of(6, 0)
+        assert shard_router.handoffs > 0
+
+        stats = shard_router.stats()
+        assert sum(shard["players"] for shard in stats["shards"]) == stats["players"]
+
+    def test_unknown_player(self, shard_router: ShardRouter):
+        with pytest.raises(ShardCommandError) as exc:
+            shard_router.action("ghost", "look")
+        assert exc.value.status == 404
+
+    def test_app_forwards_to_router(self, shard_router: ShardRouter):
+        with TestClient(create_app(shard_router)) as client:
+            assert client.post("/game/register", json={"player_id": "api"}).is_success
+
+            response = client.post(
+                "/game/action",
+                json={
+                    "player_id": "api",
+                    "action": "move",
+                    "params": {"direction": "n"},
+                },
+            )
+            assert response.status_code == 200
+            assert response.json()["action"] == "move"
+
+            unsupported = client.post(
+                "/game/action", json={"player_id": "api", "action": "talk"}
+            )
+            assert unsupported.status_code == 400
+            assert client.get("/game/state/nobody").status_code == 404
@@ -0,0 +1,86 @@
+"""Tests for the headless simulation harness."""
+
+import json
+import random
+
+import pytest
+
+from src.sim import (
+    SimConfig,
+    SimReport,
+    VirtualPlayer,
+    WorkerResult,
+    build_environment,
+    run_simulation,
+    run_worker,
+)
+from src.sim.__main__ import main
+from src.sim.report import percentile
+
+
+class TestReport:
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    def test_merge_workers(self):
+        a = WorkerResult(worker_index=0, players=2, turns=3, elapsed=1.0)
+        b = WorkerResult(worker_index=1, players=2, turns=3, elapsed=2.0)
+        a.record("move", 0.001, ok=True)
+        a.record("move", 0.003, ok=False)
+        b.record("look", 0.002, ok=True)
+        b.record("look", 0.004, ok=True, rejected=True)
+        a.db_statements, b.db_statements = 4, 2
+
+        report = SimReport.merge([a, b], loop_seconds=2.0)
+        assert report.players == 4
+        assert report.actions == 4
+        assert report.errors == 1
+        assert report.rejected == 1
+        assert report.by_action["look"].rejected == 1
+        assert report.by_action["look"].errors == 0
+        assert report.actions_per_sec == pytest.approx(2.0)
+        assert report.db_statements_per_action == pytest.approx(1.5)
+        assert report.by_action["move"].max_ms == pytest.approx(3.0)
+
+
+class TestHarness:
+    def test_worker_drives_all_services(self):
+        result = run_worker(SimConfig(players=3, turns=15, seed=7))
+        assert result.actions > 0
+        assert result.errors == {}
+        assert result.db_statements > 0
+        assert result.world["players"] == 3
+        # 대화/거래 루프가 서비스까지 도달
+        assert {"move", "look", "talk", "say", "end_talk"} <= set(result.latencies)
+
+    def test_deferred_events_delivered_after_timing(self):
+        env = build_environment(seed=3)
+        try:
+            delivered = []
+            env.state.event_bus.subscribe(
+                "action_completed", delivered.append, deferred=True
+            )
+            player = VirtualPlayer(env, "sim_deferred", random.Random(1))
+            player.setup(env.prototype_ids)
+            result = WorkerResult(worker_index=0, players=1, turns=1, elapsed=0.0)
+
+            assert player._act(result, "look") is not None
+            assert [event.data["player_id"] for event in delivered] == ["sim_deferred"]
+        finally:
+            env.close()
+
+    def test_simulation_report(self):
+        report = run_simulation(SimConfig(players=2, turns=5))
+        assert report.workers == 1
+        assert report.actions == sum(s.count for s in report.by_action.values())
+        assert "actions/s" in report.format_text()
+
+    def test_cli_json(self, capsys):
+        main(["--players", "1", "--turns", "3", "--json"])
+        data = json.loads(capsys.readouterr().out)
+        assert data["players"] == 1
+        assert data["actions"] > 0
@@ -0,0 +1,223 @@
+"""Tests for the binary engine snapshot (src/core/snapshot.py)."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import ITWEngine
+from src.core.snapshot import (
+    SNAPSHOT_MAGIC,
+    LazyNodeStore,
+    SnapshotError,
+    SnapshotReader,
+    write_snapshot,
+)
+from src.core.world_generator import NodeTier
+
+AXIOM_PATH = "src/data/itw_214_divine_axioms.json"
+
+
+def _engine(seed: int = 42) -> ITWEngine:
+    return ITWEngine(axiom_data_path=AXIOM_PATH, world_seed=seed)
+
+
+@pytest.fixture()
+def populated() -> ITWEngine:
+    """플레이어 2명, 5x5 영역, Echo/훅/서브 그리드 인스턴스가 있는 엔진"""
+    engine = _engine()
+    engine.register_player("p1")
+    engine.register_player("p2")
+    engine.debug_generate_area(0, 0, radius=2)
+
+    engine.move("p1", "n")
+    engine.trigger_global_event("p1", "boss_kill", "거대한 골렘 처치")
+    engine.players["p1"].supply = 7
+    engine.players["p1"].equipped_tags = ["torch"]
+
+    node = engine.world.get_node(1, 0)
+    node.tier = NodeTier.UNCOMMON
+    node.required_tags = ["rope"]
+    engine.debug_teleport("p2", 1, 0)
+    assert engine.enter_depth("p2").success
+    for _ in range(3):
+        engine.daily_tick()
+    return engine
+
+
+@pytest.fixture()
+def snapshot_path(tmp_path) -> str:
+    return str(tmp_path / "world.snap")
+
+
+class TestRoundTrip:
+    def test_full_state_restored(self, populated, snapshot_path):
+        written = populated.save_snapshot(snapshot_path)
+        assert written == os.path.getsize(snapshot_path)
+
+        restored = _engine()
+        count = restored.load_snapshot(snapshot_path)
+
+        assert count == len(populated.world.nodes)
+        assert restored.tick_count == 3
+        assert set(restored.players) == {"p1", "p2"}
+        assert restored.players["p1"].to_dict() == populated.players["p1"].to_dict()
+        assert restored.players["p2"].in_sub_grid
+
+        for coord, node in populated.world.nodes.items():
+            assert restored.world.nodes[coord].to_dict() == node.to_dict()
+        assert restored.world.get_node(1, 0).required_tags == ["rope"]
+
+    def test_global_hooks_and_sub_grid(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+
+        hooks = restored.get_active_hooks()
+        assert [hook["description"] for hook in hooks] == ["거대한 골렘 처치"]
+        restored.trigger_global_event("p1", "discovery", "새 유적")
+        assert restored.get_active_hooks()[-1]["hook_id"] == hooks[0]["hook_id"] + 1
+
+        parent = "1_0"
+        assert restored.sub_grid_generator.is_instance_resident(parent)
+        assert restored.sub_grid_instances.occupants(parent) == {"p2"}
+        assert len(restored.sub_grid_generator.get_instance_nodes(parent)) == len(
+            populated.sub_grid_generator.get_instance_nodes(parent)
+        )
+        assert restored.exit_depth("p2").success
+
+    def test_game_continues_after_restore(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+
+        assert restored.look("p1").success
+        assert restored.move("p1", "s").success
+        restored.daily_tick()
+        assert restored.tick_count == 4
+
+    def test_resave_keeps_untouched_nodes(self, populated, snapshot_path, tmp_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+        restored.world.get_node(0, 0).development_level = 5
+
+        second = str(tmp_path / "second.snap")
+        restored.save_snapshot(second)
+        again = _engine()
+        again.load_snapshot(second)
+
+        assert again.world.get_node(0, 0).development_level == 5
+        for coord, node in populated.world.nodes.items():
+            if coord != "0_0":
+                assert again.world.nodes[coord].to_dict() == node.to_dict()
+
+    def test_async_save(self, populated, snapshot_path):
+        future = populated.save_snapshot_async(snapshot_path)
+        # 캡처 이후의 변경은 기록되지 않음
+        populated.players["p1"].supply = 0
+        assert future.result(timeout=10) == os.path.getsize(snapshot_path)
+
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+        assert restored.players["p1"].supply == 7
+
+
+class TestLazyMaterialisation:
+    def test_nodes_restored_on_access(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        total = restored.load_snapshot(snapshot_path)
+
+        nodes = restored.world.nodes
+        assert isinstance(nodes, LazyNodeStore)
+        assert nodes.pending_count == total
+        assert "2_2" in nodes and len(nodes) == total
+
+        restored.world.get_node(2, 2)
+        assert nodes.pending_count == total - 1
+        assert nodes.materialize_all() == total - 1
+        assert nodes.pending_count == 0
+
+    def test_echoes_indexed_on_materialise(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+        assert restored.echo_manager.pending_expiry_count == 0
+
+        boss_node = restored.world.get_node(0, 1)
+        assert len(boss_node.echoes) == len(populated.world.get_node(0, 1).echoes)
+        expiring = [echo for echo in boss_node.echoes if echo.expires_at is not None]
+        assert expiring  # 이동 흔적 (보스 Echo는 소멸하지 않음)
+        assert restored.echo_manager.pending_expiry_count == len(expiring)
+
+    def test_daily_tick_keeps_nodes_pending(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        total = restored.load_snapshot(snapshot_path)
+
+        restored.daily_tick()
+        restored.daily_tick()
+        assert restored.world.nodes.pending_count == total
+
+    def test_resource_decay_caught_up_on_materialise(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+        for engine in (populated, restored):
+            engine.daily_tick()
+            engine.daily_tick()
+
+        # 상주 중 갱신된 노드와 복원 시 몰아서 갱신된 노드의 자원이 같아야 함
+        for coord, node in populated.world.nodes.items():
+            lazy = restored.world.nodes[coord]
+            assert lazy.resource_tick == node.resource_tick == 5
+            assert [r.to_dict() for r in lazy.resources] == [
+                r.to_dict() for r in node.resources
+            ]
+
+    def test_new_nodes_generated_alongside(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        restored = _engine()
+        restored.load_snapshot(snapshot_path)
+
+        before = len(restored.world.nodes)
+        restored.world.generate_node(10, 10)
+        assert len(restored.world.nodes) == before + 1
+        assert "10_10" in restored.world.nodes
+
+
+class TestValidation:
+    def test_seed_mismatch_rejected(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        other = _engine(seed=7)
+        with pytest.raises(SnapshotError, match="seed"):
+            other.load_snapshot(snapshot_path)
+        assert not isinstance(other.world.nodes, LazyNodeStore)
+
+    def test_truncated_file_rejected(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        with open(snapshot_path, "r+b") as f:
+            f.truncate(os.path.getsize(snapshot_path) - 10)
+        with pytest.raises(SnapshotError, match="Truncated"):
+            SnapshotReader(snapshot_path)
+
+    def test_foreign_file_rejected(self, snapshot_path):
+        with open(snapshot_path, "wb") as f:
+            f.write(b"not a snapshot at all, definitely not" * 4)
+        with pytest.raises(SnapshotError, match="Not an ITW snapshot"):
+            SnapshotReader(snapshot_path)
+
+    def test_failed_write_keeps_previous_file(self, populated, snapshot_path):
+        populated.save_snapshot(snapshot_path)
+        original = Path(snapshot_path).read_bytes()
+
+        snapshot = populated.capture_snapshot()
+        snapshot.nodes.append(("bad", None))  # 기록 중 실패 유도
+        with pytest.raises(TypeError):
+            write_snapshot(snapshot, snapshot_path)
+
+        assert Path(snapshot_path).read_bytes() == original
+        assert original.startswith(SNAPSHOT_MAGIC)
+        leftovers = os.listdir(os.path.dirname(snapshot_path))
+        assert leftovers == [os.path.basename(snapshot_path)]
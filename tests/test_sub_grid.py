@@ -1,5 +1,11 @@
 """Tests for sub-grid system."""
 
+import json
+import os
+import random
+import subprocess
+import sys
+
 import pytest
 
 from src.core.axiom_system import AxiomLoader
@@ -145,6 +151,140 @@ class TestSubGridGenerator:
         assert entrance.is_entrance is True
 
 
+class TestGenerateFloor:
+    """Tests for whole-floor batch generation."""
+
+    FLOOR_CELLS = (2 * SubGridGenerator.GRID_RADIUS + 1) ** 2
+
+    def test_generates_whole_floor(self, sub_grid_generator: SubGridGenerator):
+        """Test all cells of a floor are created in one call."""
+        floor = sub_grid_generator.generate_floor(1, 2, -1, depth_tier=1)
+
+        assert len(floor.cells) == self.FLOOR_CELLS
+        assert len(sub_grid_generator.nodes) == self.FLOOR_CELLS
+        assert {node.tier for node in floor.cells.values()} == {"Uncommon"}
+        assert sub_grid_generator.get_node(1, 2, 5, -5, -1) is floor.get_cell(5, -5)
+
+    def test_floor_is_cached(self, sub_grid_generator: SubGridGenerator):
+        """Test floor is generated once and reused."""
+        floor = sub_grid_generator.generate_floor(1, 2, 0, depth_tier=1)
+        assert sub_grid_generator.generate_floor(1, 2, 0, depth_tier=1) is floor
+        assert sub_grid_generator.get_floor(1, 2, 0) is floor
+        assert sub_grid_generator.get_floor(1, 2, -1) is None
+
+    def test_adjacency_bounded_by_grid(self, sub_grid_generator: SubGridGenerator):
+        """Test precomputed adjacency respects grid radius."""
+        radius = SubGridGenerator.GRID_RADIUS
+        floor = sub_grid_generator.generate_floor(0, 0, 0, depth_tier=1)
+
+        assert len(floor.adjacency[(0, 0)]) == 4
+        assert len(floor.adjacency[(radius, radius)]) == 2
+        assert floor.is_connected((0, 0), (0, 1))
+        assert not floor.is_connected((radius, 0), (radius + 1, 0))
+
+    def test_exits_placed(self, sub_grid_generator: SubGridGenerator):
+        """Test each floor has exits that are not the entrance."""
+        shallow = sub_grid_generator.generate_floor(0, 0, 0, depth_tier=1)
+        deep = sub_grid_generator.generate_floor(0, 0, -2, depth_tier=1)
+
+        assert len(shallow.exits) == 1
+        assert len(deep.exits) == 2
+        for pos in shallow.exits:
+            assert shallow.cells[pos].is_exit
+            assert not shallow.cells[pos].is_entrance
+
+    def test_existing_cells_preserved(self, sub_grid_generator: SubGridGenerator):
+        """Test pre-existing cells are not overwritten by floor generation."""
+        entrance = sub_grid_generator.generate_entrance(3, 3, depth_tier=1)
+        floor = sub_grid_generator.generate_floor(3, 3, 0, depth_tier=1)
+        assert floor.get_cell(0, 0) is entrance
+
+    def test_deterministic(self, axiom_loader: AxiomLoader):
+        """Test same seed produces the same floor."""
+        a = SubGridGenerator(axiom_loader, seed=7).generate_floor(2, 2, -1, 2)
+        b = SubGridGenerator(axiom_loader, seed=7).generate_floor(2, 2, -1, 2)
+
+        assert a.exits == b.exits
+        for pos, node in a.cells.items():
+            assert node.axiom_vector == b.cells[pos].axiom_vector
+            assert node.sensory_data == b.cells[pos].sensory_data
+
+    def test_deterministic_across_processes(self, axiom_loader: AxiomLoader):
+        """Test the floor does not depend on the per-process hash seed."""
+        script = (
+            "import json\n"
+            "from src.core.axiom_system import AxiomLoader\n"
+            "from src.core.sub_grid import SubGridGenerator\n"
+            "loader = AxiomLoader('src/data/itw_214_divine_axioms.json')\n"
+            "generator = SubGridGenerator(loader, seed=3)\n"
+            "floor = generator.generate_floor(3, 4, -1, 2)\n"
+            "print(json.dumps({'seed': generator._get_floor_seed(3, 4, -1),"
+            " 'exits': sorted(floor.exits),"
+            " 'sensory': floor.get_cell(0, 0).sensory_data}))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": "random"},
+        ).stdout
+
+        generator = SubGridGenerator(axiom_loader, seed=3)
+        floor = generator.generate_floor(3, 4, -1, 2)
+        assert json.loads(output) == {
+            "seed": generator._get_floor_seed(3, 4, -1),
+            "exits": [list(pos) for pos in sorted(floor.exits)],
+            "sensory": floor.get_cell(0, 0).sensory_data,
+        }
+
+    def test_global_rng_untouched(self, sub_grid_generator: SubGridGenerator):
+        """Test generation does not reseed the global RNG."""
+        random.seed(1234)
+        expected = [random.random() for _ in range(3)]
+
+        random.seed(1234)
+        sub_grid_generator.generate_floor(0, 0, -1, depth_tier=1)
+        sub_grid_generator.generate_node(9, 9, 0, 0, 0, depth_tier=1)
+        assert [random.random() for _ in range(3)] == expected
+
+    def test_travel_reuses_floor(self, engine: ITWEngine):
+        """Test horizontal travel inside a floor generates nothing new."""
+        generator = engine.sub_grid_generator
+        generator.generate_floor(0, 0, -1, depth_tier=1)
+        before = len(generator.nodes)
+
+        result = engine.navigator.travel_sub_grid(
+            0, 0, 0, 0, -1, Direction.NORTH, depth_tier=1, current_supply=10
+        )
+
+        assert result.success
+        assert len(generator.nodes) == before
+
+    def test_listeners_notified_once_per_floor(
+        self, sub_grid_generator: SubGridGenerator
+    ):
+        """Test a floor notifies listeners once, not once per cell."""
+        changed: list[str] = []
+        sub_grid_generator.add_node_listener(
+            lambda node: changed.append(node.parent_coordinate)
+        )
+        sub_grid_generator.generate_floor(5, 5, 0, depth_tier=1)
+        sub_grid_generator.generate_floor(5, 5, -1, depth_tier=1)
+        assert changed == ["5_5", "5_5"]
+
+        nodes = sub_grid_generator.evict_instance("5_5")
+        changed.clear()
+        assert sub_grid_generator.load_instance(nodes) == 2 * self.FLOOR_CELLS
+        assert changed == ["5_5"]
+
+    def test_evict_instance_drops_floors(self, sub_grid_generator: SubGridGenerator):
+        """Test evicting an instance also drops its cached floors."""
+        sub_grid_generator.generate_floor(4, 4, 0, depth_tier=1)
+        sub_grid_generator.evict_instance("4_4")
+        assert sub_grid_generator.get_floor(4, 4, 0) is None
+
+
 class TestDirectionUpDown:
     """Tests for UP/DOWN direction support."""
 
@@ -0,0 +1,339 @@
+"""Tests for instance-scoped sub-grid persistence and eviction."""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.axiom_system import AxiomLoader
+from src.core.engine import ITWEngine
+from src.core.sub_grid import SubGridGenerator
+from src.core.sub_grid_store import SubGridInstanceManager
+from src.core.world_generator import NodeTier
+from src.db.models import Base, SubGridInstanceModel, SubGridNodeModel
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def session_factory():
+    """Shared in-memory SQLite session factory."""
+    eng = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=eng)
+    return sessionmaker(bind=eng, autocommit=False, autoflush=False)
+
+
+@pytest.fixture()
+def generator() -> SubGridGenerator:
+    return SubGridGenerator(AxiomLoader("src/data/itw_214_divine_axioms.json"), seed=42)
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def manager(generator, session_factory, clock) -> SubGridInstanceManager:
+    return SubGridInstanceManager(
+        generator, session_factory=session_factory, idle_evict_seconds=60, clock=clock
+    )
+
+
+def _dig(generator: SubGridGenerator, floors: int = 3) -> None:
+    for sz in range(0, -floors, -1):
+        generator.generate_node(1, 2, 0, 0, sz, depth_tier=1)
+
+
+class TestGeneratorInstanceIndex:
+    def test_cells_grouped_by_parent(self, generator: SubGridGenerator):
+        _dig(generator)
+        generator.generate_entrance(5, 5, depth_tier=1)
+        assert len(generator.get_instance_nodes("1_2")) == 3
+        assert sorted(generator.get_resident_instances()) == ["1_2", "5_5"]
+
+    def test_evict_and_reload(self, generator: SubGridGenerator):
+        _dig(generator)
+        evicted = generator.evict_instance("1_2")
+        assert len(evicted) == 3
+        assert not generator.is_instance_resident("1_2")
+        assert generator.get_node(1, 2, 0, 0, 0) is None
+
+        assert generator.load_instance(evicted) == 3
+        assert generator.get_node(1, 2, 0, 0, -1) in evicted
+        # 이미 있는 셀은 덮어쓰지 않음
+        assert generator.load_instance(evicted) == 0
+
+
+class TestInstanceLifecycle:
+    def test_occupied_instance_not_evicted(self, manager, generator, clock):
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        clock.now = 1000
+        assert manager.evict_idle() == []
+        assert generator.is_instance_resident("1_2")
+
+    def test_evicted_after_idle_timeout(self, manager, generator, clock):
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        manager.leave("1_2", "p1")
+
+        clock.now = 59
+        assert manager.evict_idle() == []
+        clock.now = 60
+        assert manager.evict_idle() == ["1_2"]
+        assert not generator.is_instance_resident("1_2")
+
+    def test_last_occupant_starts_timer(self, manager, generator, clock):
+        manager.enter("1_2", "p1")
+        manager.enter("1_2", "p2")
+        _dig(generator)
+        manager.leave("1_2", "p1")
+        clock.now = 100
+        assert manager.evict_idle() == []
+        manager.leave("1_2", "p2")
+        clock.now = 200
+        assert manager.evict_idle() == ["1_2"]
+
+    def test_bulk_written_on_eviction(self, manager, generator, session_factory, clock):
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        manager.leave("1_2", "p1")
+        clock.now = 60
+        manager.evict_idle()
+
+        with session_factory() as session:
+            rows = session.query(SubGridNodeModel).filter_by(parent_coordinate="1_2")
+            assert rows.count() == 3
+            instance = session.get(SubGridInstanceModel, "1_2")
+            assert instance.cell_count == 3
+            assert instance.last_exit_at is not None
+
+    def test_flush_failure_keeps_instance(
+        self, manager, generator, session_factory, clock, monkeypatch
+    ):
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        manager.leave("1_2", "p1")
+        clock.now = 60
+
+        def broken_session():
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(manager, "session_factory", broken_session)
+        assert manager.evict_idle() == []
+        assert generator.is_instance_resident("1_2")
+
+        # 다음 주기에 재시도
+        monkeypatch.setattr(manager, "session_factory", session_factory)
+        assert manager.evict_idle() == ["1_2"]
+        with session_factory() as session:
+            assert session.get(SubGridInstanceModel, "1_2").cell_count == 3
+
+    def test_lazy_reload_on_enter(self, manager, generator, clock):
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        original = generator.get_node(1, 2, 0, 0, -2).to_dict()
+        manager.leave("1_2", "p1")
+        clock.now = 60
+        manager.evict_idle()
+
+        assert manager.enter("1_2", "p1") == 3
+        assert generator.get_node(1, 2, 0, 0, -2).to_dict() == original
+
+    def test_survives_restart(self, session_factory, clock):
+        loader = AxiomLoader("src/data/itw_214_divine_axioms.json")
+        first = SubGridGenerator(loader, seed=42)
+        manager = SubGridInstanceManager(first, session_factory=session_factory)
+        manager.enter("1_2", "p1")
+        _dig(first)
+        first.nodes["1_2_0_0_-1"].is_exit = True
+        manager.flush_all()
+
+        second = SubGridGenerator(loader, seed=42)
+        restarted = SubGridInstanceManager(second, session_factory=session_factory)
+        assert restarted.enter("1_2", "p1") == 3
+        assert second.get_node(1, 2, 0, 0, -1).is_exit
+
+    def test_unchanged_instance_not_rewritten(
+        self, manager, generator, session_factory, clock
+    ):
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        assert manager.flush("1_2") == 3
+        assert manager.flush("1_2") == 0
+
+    def test_without_store_evicts_only(self, generator, clock):
+        manager = SubGridInstanceManager(generator, idle_evict_seconds=0, clock=clock)
+        manager.enter("1_2", "p1")
+        _dig(generator)
+        manager.leave("1_2", "p1")
+        assert manager.evict_idle() == ["1_2"]
+        assert manager.enter("1_2", "p1") == 0
+
+
+class TestEngineIntegration:
+    def _engine_at_depth(self, session_factory) -> tuple[ITWEngine, str]:
+        engine = ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json",
+            world_seed=42,
+            session_factory=session_factory,
+            sub_grid_idle_evict_seconds=0,
+        )
+        engine.register_player("p1")
+        engine.debug_generate_area(0, 0, radius=1)
+        node = engine.world.get_node(1, 0)
+        node.tier = NodeTier.UNCOMMON  # depth 보유 노드로 고정
+        engine.debug_teleport("p1", 1, 0)
+        return engine, node.coordinate
+
+    def test_idle_sweep_evicts_and_persists(self, session_factory):
+        engine, parent = self._engine_at_depth(session_factory)
+        assert engine.enter_depth("p1").success
+        assert engine.sub_grid_instances.occupants(parent) == {"p1"}
+
+        # 퇴장 명령은 저장/축출하지 않고 주기 스윕이 처리
+        assert engine.exit_depth("p1").success
+        assert engine.sub_grid_generator.is_instance_resident(parent)
+        # 셀 위치별 모듈 캐시 항목 (부모 노드 키)
+        engine.module_manager._node_cache.put(parent, ("cell", 0, 0, -1), [])
+        assert engine.evict_idle_sub_grids() == 1
+        assert not engine.sub_grid_generator.is_instance_resident(parent)
+        assert engine.module_manager.node_cache_info()["entries"] == 0
+        assert engine.get_world_stats()["sub_grid"]["resident_instances"] == 0
+
+        with session_factory() as session:
+            # 입구층 전체가 일괄 생성되어 저장됨
+            floor_cells = (2 * SubGridGenerator.GRID_RADIUS + 1) ** 2
+            assert session.get(SubGridInstanceModel, parent).cell_count == floor_cells
+
+        assert engine.enter_depth("p1").success
+        assert engine.sub_grid_generator.is_instance_resident(parent)
+
+    def test_flush_failure_does_not_fail_commands(self, session_factory, monkeypatch):
+        engine, parent = self._engine_at_depth(session_factory)
+        assert engine.enter_depth("p1").success
+
+        def broken_session():
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(
+            engine.sub_grid_instances, "session_factory", broken_session
+        )
+        assert engine.exit_depth("p1").success
+        assert engine.evict_idle_sub_grids() == 0
+        assert engine.sub_grid_generator.is_instance_resident(parent)
+        assert engine.enter_depth("p1").success
+
+    def test_missing_entrance_fails_and_releases(self, session_factory, monkeypatch):
+        engine, parent = self._engine_at_depth(session_factory)
+        original = engine.sub_grid_generator.generate_floor
+
+        def broken_floor(*args, **kwargs):
+            floor = original(*args, **kwargs)
+            monkeypatch.setattr(floor, "get_cell", lambda x, y: None)
+            return floor
+
+        monkeypatch.setattr(engine.sub_grid_generator, "generate_floor", broken_floor)
+        result = engine.enter_depth("p1")
+        assert not result.success
+        assert engine.sub_grid_instances.occupants(parent) == set()
+        assert not engine.get_player("p1").in_sub_grid
+
+    def test_concurrent_players_share_instance_state(self, session_factory):
+        engine = ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json",
+            world_seed=42,
+            session_factory=session_factory,
+            sub_grid_idle_evict_seconds=0,
+        )
+        # 서로 다른 청크 → 청크 잠금은 겹치지 않고 서브 그리드 상태만 공유
+        parents = []
+        for index in range(4):
+            player_id, x = f"p{index}", index * 20
+            engine.register_player(player_id)
+            engine.debug_generate_area(x, 0, radius=1)
+            engine.world.get_node(x, 0).tier = NodeTier.UNCOMMON
+            engine.debug_teleport(player_id, x, 0)
+            parents.append(f"{x}_0")
+
+        # 생성기 변경 메서드가 서로 겹쳐 실행되는지 기록 (구간을 넓히려고 잠시 대기)
+        generator = engine.sub_grid_generator
+        active, peak = [0], [0]
+        guard = threading.Lock()
+
+        def exclusive(method):
+            def wrapper(*args, **kwargs):
+                with guard:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                try:
+                    time.sleep(0.001)
+                    return method(*args, **kwargs)
+                finally:
+                    with guard:
+                        active[0] -= 1
+
+            return wrapper
+
+        for name in ("generate_floor", "load_instance", "evict_instance"):
+            setattr(generator, name, exclusive(getattr(generator, name)))
+
+        errors: list[BaseException] = []
+        start = threading.Barrier(len(parents))
+
+        def play(player_id: str) -> None:
+            try:
+                start.wait()
+                for _ in range(15):
+                    assert engine.enter_depth(player_id).success
+                    assert engine.get_reachable_nodes(player_id, 3)
+                    assert engine.exit_depth(player_id).success
+            except BaseException as e:  # 스레드 밖으로 전달
+                errors.append(e)
+
+        done = threading.Event()
+
+        def sweep() -> None:
+            while not done.is_set():
+                engine.evict_idle_sub_grids()
+                time.sleep(0.001)
+
+        threads = [
+            threading.Thread(target=play, args=(f"p{i}",)) for i in range(len(parents))
+        ]
+        sweeper = threading.Thread(target=sweep)
+        sweeper.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        sweeper.join()
+        engine.evict_idle_sub_grids()
+
+        assert errors == []
+        assert peak[0] == 1
+        # 모두 퇴장 → 전부 축출되고 색인/셀/층이 함께 비어 있어야 함
+        assert generator.get_resident_instances() == []
+        assert generator.nodes == {} and generator.floors == {}
+        floor_cells = (2 * SubGridGenerator.GRID_RADIUS + 1) ** 2
+        with session_factory() as session:
+            for parent in parents:
+                instance = session.get(SubGridInstanceModel, parent)
+                assert instance.cell_count == floor_cells
@@ -0,0 +1,265 @@
+"""Tests for sampled turn tracing and the /traces endpoints."""
+
+import contextvars
+import random
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.api.admin import ADMIN_TOKEN_HEADER
+from src.api.game import get_engine
+from src.config import settings
+from src.core.engine import ITWEngine
+from src.core.event_bus import EventBus, GameEvent
+from src.core.tracing import TRACER, Tracer, current_span, traced
+from src.db.database import instrument_engine
+from src.main import app
+from src.services.ai.mock import MockProvider
+from src.services.narrative_service import NarrativeService
+
+
+def _spans(tracer: Tracer) -> list[dict]:
+    [summary] = tracer.traces()
+    return tracer.get(summary["trace_id"])["spans"]
+
+
+class TestTracer:
+    def test_unsampled_trace_is_noop(self):
+        tracer = Tracer(sample_rate=0.0)
+        with tracer.trace("action:look") as span:
+            assert span is None
+            assert current_span() is None
+            with tracer.span("inner", "service") as inner:
+                assert inner is None
+        assert tracer.traces() == []
+
+    def test_force_and_nesting(self):
+        tracer = Tracer()
+        with tracer.trace("action:look", force=True, player_id="p1") as root:
+            with tracer.span("a", "service") as a:
+                with tracer.span("b", "db"):
+                    pass
+            assert current_span() is root
+        assert current_span() is None
+
+        spans = {s["name"]: s for s in _spans(tracer)}
+        assert spans["action:look"]["parent_id"] is None
+        assert spans["action:look"]["attrs"] == {"player_id": "p1"}
+        assert spans["a"]["parent_id"] == root.span_id
+        assert spans["b"]["parent_id"] == a.span_id
+
+    def test_sample_rate(self):
+        tracer = Tracer(sample_rate=0.5, rng=random.Random(7))
+        for _ in range(200):
+            with tracer.trace("t"):
+                pass
+        assert 60 < len(tracer.traces()) < 140
+
+    def test_ring_buffer_and_min_duration(self):
+        tracer = Tracer(capacity=3)
+        for index in range(5):
+            with tracer.trace(f"t{index}", force=True):
+                pass
+        assert [t["name"] for t in tracer.traces()] == ["t4", "t3", "t2"]
+
+        tracer.configure(min_duration_ms=5.0)
+        with tracer.trace("fast", force=True):
+            pass
+        with tracer.trace("slow", force=True):
+            time.sleep(0.01)
+        assert tracer.traces()[0]["name"] == "slow"
+        assert [t["name"] for t in tracer.traces(min_duration_ms=5.0)] == ["slow"]
+        assert tracer.clear() == 3
+
+    def test_configure_validates(self):
+        tracer = Tracer()
+        with pytest.raises(ValueError):
+            tracer.configure(sample_rate=1.5)
+        with pytest.raises(ValueError):
+            tracer.configure(capacity=0)
+        assert tracer.configure(capacity=10)["capacity"] == 10
+
+    def test_error_recorded(self):
+        tracer = Tracer()
+        with pytest.raises(KeyError):
+            with tracer.trace("t", force=True):
+                raise KeyError("boom")
+        assert tracer.traces()[0]["error"] == "KeyError: 'boom'"
+
+    def test_critical_path_follows_slowest_child(self):
+        tracer = Tracer()
+        with tracer.trace("root", force=True):
+            with tracer.span("fast", "service"):
+                pass
+            with tracer.span("slow", "service"):
+                with tracer.span("sql:SELECT", "db"):
+                    time.sleep(0.01)
+        trace = tracer.get(tracer.traces()[0]["trace_id"])
+        assert [step["name"] for step in trace["critical_path"]] == [
+            "root",
+            "slow",
+            "sql:SELECT",
+        ]
+        assert trace["critical_path"][-1]["self_ms"] >= 9
+
+    def test_span_limit_counts_dropped(self):
+        tracer = Tracer(max_spans=3)
+        with tracer.trace("root", force=True):
+            for _ in range(5):
+                with tracer.span("s", "service"):
+                    pass
+        summary = tracer.traces()[0]
+        assert summary["span_count"] == 3
+        assert summary["dropped_spans"] == 3
+
+    def test_copied_context_keeps_parent_in_thread(self):
+        tracer = Tracer()
+        with tracer.trace("root", force=True) as root:
+            context = contextvars.copy_context()
+
+            def work() -> None:
+                with tracer.span("worker", "module"):
+                    pass
+
+            thread = threading.Thread(target=context.run, args=(work,))
+            thread.start()
+            thread.join()
+        worker = [s for s in _spans(tracer) if s["name"] == "worker"][0]
+        assert worker["parent_id"] == root.span_id
+        assert worker["thread"] != threading.current_thread().name
+
+
+class TestInstrumentation:
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        TRACER.clear()
+        yield
+        TRACER.clear()
+
+    def test_traced_wraps_public_methods(self):
+        @traced
+        class Service:
+            def public(self) -> int:
+                return self._private() + 1
+
+            def _private(self) -> int:
+                return 1
+
+        assert Service().public() == 2  # 트레이스 밖에서도 동작
+        with TRACER.trace("root", force=True):
+            Service().public()
+        names = [s["name"] for s in _spans(TRACER)]
+        assert names == ["root", "Service.public"]
+
+    def test_event_emit_and_handlers_keep_depth(self):
+        bus = EventBus()
+        bus.subscribe(
+            "trace_outer",
+            lambda event: bus.emit(
+                GameEvent(event_type="trace_inner", data={}, source="trace_handler")
+            ),
+        )
+        bus.subscribe("trace_inner", lambda event: None)
+        with TRACER.trace("root", force=True):
+            bus.emit(GameEvent(event_type="trace_outer", data={}, source="trace_test"))
+
+        spans = _spans(TRACER)
+        by_id = {s["span_id"]: s for s in spans}
+        inner_emit = [s for s in spans if s["name"] == "emit:trace_inner"][0]
+        handler = by_id[inner_emit["parent_id"]]
+        assert handler["kind"] == "handler"
+        assert handler["attrs"]["event_type"] == "trace_outer"
+        assert by_id[handler["parent_id"]]["name"] == "emit:trace_outer"
+        assert inner_emit["attrs"]["depth"] == 1
+
+    def test_sql_statement_spans(self):
+        db_engine = create_engine("sqlite:///:memory:")
+        instrument_engine(db_engine)
+        with TRACER.trace("root", force=True):
+            with db_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                with pytest.raises(OperationalError):
+                    conn.execute(text("SELECT * FROM missing_table"))
+        db_engine.dispose()
+
+        sql = [s for s in _spans(TRACER) if s["kind"] == "db"]
+        assert [s["name"] for s in sql] == ["sql:SELECT", "sql:SELECT"]
+        assert sql[0]["error"] is None
+        assert "missing_table" in sql[1]["error"]
+
+
+class TestEndpoints:
+    @pytest.fixture()
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+        engine = ITWEngine(
+            axiom_data_path="src/data/itw_214_divine_axioms.json", world_seed=42
+        )
+        app.dependency_overrides[get_engine] = lambda: engine
+        app.state.narrative_service = NarrativeService(MockProvider())
+        app.state.event_bus = EventBus()
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "trace-admin")
+        TRACER.clear()
+        yield TestClient(app, headers={ADMIN_TOKEN_HEADER: "trace-admin"})
+        app.dependency_overrides.pop(get_engine, None)
+        TRACER.clear()
+
+    def test_forced_action_trace_exported(self, client: TestClient):
+        client.post("/game/register", json={"player_id": "trace_p1"})
+        client.post("/game/action", json={"player_id": "trace_p1", "action": "look"})
+        assert client.get("/traces").json()["traces"] == []  # 샘플링 꺼짐
+
+        client.post(
+            "/game/action",
+            json={"player_id": "trace_p1", "action": "look"},
+            headers={"X-ITW-Trace": "1"},
+        )
+        body = client.get("/traces").json()
+        assert body["sampling"]["sample_rate"] == 0.0
+        [summary] = body["traces"]
+        assert summary["name"] == "action:look"
+        assert summary["attrs"] == {"player_id": "trace_p1", "status": 200}
+
+        trace = client.get(f"/traces/{summary['trace_id']}").json()
+        kinds = {span["kind"] for span in trace["spans"]}
+        assert {"action", "service", "llm"} <= kinds
+        assert trace["critical_path"][0]["name"] == "action:look"
+
+    def test_sampling_controls(self, client: TestClient):
+        original = TRACER.settings()
+        try:
+            response = client.put("/traces/sampling", json={"sample_rate": 1.0})
+            assert response.status_code == 200
+            assert response.json()["sample_rate"] == 1.0
+            assert (
+                client.put("/traces/sampling", json={"sample_rate": 2}).status_code
+                == 422
+            )
+
+            client.post("/game/register", json={"player_id": "trace_p2"})
+            client.post(
+                "/game/action", json={"player_id": "trace_p2", "action": "look"}
+            )
+            assert len(client.get("/traces?limit=5").json()["traces"]) == 1
+            assert client.delete("/traces").json() == {"cleared": 1}
+            assert client.get("/traces/unknown").status_code == 404
+        finally:
+            TRACER.configure(**original)
+
+    def test_admin_gate(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        assert (
+            client.get("/traces", headers={ADMIN_TOKEN_HEADER: "x"}).status_code == 403
+        )
+        anonymous = TestClient(app)
+        assert anonymous.get("/traces").status_code == 403
+
+        # 토큰 미설정: DEBUG일 때만 노출
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+        monkeypatch.setattr(settings, "DEBUG", False)
+        assert anonymous.get("/traces").status_code == 404
+        assert anonymous.delete("/traces").status_code == 404
+        monkeypatch.setattr(settings, "DEBUG", True)
+        assert anonymous.get("/traces").status_code == 200
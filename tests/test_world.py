@@ -3,7 +3,13 @@
 import pytest
 
 from src.core.axiom_system import AxiomLoader
-from src.core.world_generator import NodeTier, WorldGenerator
+from src.core.world_generator import (
+    Echo,
+    EchoStore,
+    MapNode,
+    NodeTier,
+    WorldGenerator,
+)
 
 
 @pytest.fixture()
@@ -202,3 +208,67 @@ class TestWorldGenerator:
         assert stats["tier_distribution"]["COMMON"] >= 0
         assert stats["tier_distribution"]["UNCOMMON"] >= 0
         assert stats["tier_distribution"]["RARE"] >= 0
+
+
+def _echo(visibility: str, category: str | None = None) -> Echo:
+    return Echo(
+        echo_type="Short",
+        visibility=visibility,
+        base_difficulty=2,
+        timestamp="2024-01-01T12:00:00",
+        flavor_text="흔적",
+        category=category,
+    )
+
+
+class TestEchoStore:
+    """Tests for the partitioned per-node echo store."""
+
+    def test_partitions_by_visibility_and_category(self):
+        public = _echo("Public", "combat")
+        hidden = _echo("Hidden", "exploration")
+        store = EchoStore([public, hidden])
+
+        assert store.by_visibility("Public") == [public]
+        assert store.by_visibility("Hidden") == [hidden]
+        assert store.by_category("exploration") == [hidden]
+        assert store.count_visibility("Hidden") == 1
+
+    def test_stable_ids(self):
+        first = _echo("Hidden")
+        second = _echo("Hidden")
+        store = EchoStore([first, second])
+
+        assert first.echo_id != second.echo_id
+        store.discard(first.echo_id)
+        assert store.get(second.echo_id) is second
+        assert store.get(first.echo_id) is None
+        assert store.by_visibility("Hidden") == [second]
+
+    def test_list_compatibility(self):
+        a, b = _echo("Public"), _echo("Hidden")
+        store = EchoStore()
+        store.append(a)
+        store.append(b)
+
+        assert len(store) == 2
+        assert list(store) == [a, b]
+        assert store == [a, b]
+        assert b in store
+        store.remove(a)
+        assert a not in store
+        with pytest.raises(ValueError):
+            store.remove(a)
+
+    def test_node_roundtrip_builds_store(self, world: WorldGenerator):
+        node = world.get_node(0, 0)
+        echo = _echo("Public")
+        node.add_echo(echo)
+
+        restored = MapNode.from_dict(node.to_dict())
+        assert isinstance(restored.echoes, EchoStore)
+        assert restored.get_public_echoes() == [echo]
+
+    def test_echo_id_roundtrip(self):
+        echo = _echo("Hidden", "crafting")
+        assert Echo.from_dict(echo.to_dict()).echo_id == echo.echo_id